@@ -212,9 +212,21 @@ function extractFlags(input) {
 
 /**
  * Obtiene los datos de configuración (dietas, normativas, etc.).
+ * Con fecha, las tarifas son las vigentes ese día (ver tarifas.js).
+ * @param {string} [fecha] - Fecha de ida del desplazamiento
  */
-function getDatos() {
-  return (typeof window !== 'undefined' && window.__sgtriDatos) || null;
+function getDatos(fecha) {
+  if (typeof window === 'undefined') return null;
+  if (fecha && window.tarifas) return window.tarifas.resolver(fecha) || window.__sgtriDatos || null;
+  return window.__sgtriDatos || null;
+}
+
+/**
+ * Fecha que fija las tarifas de un input: la de ida del desplazamiento
+ * completo (los tramos internacionales la heredan en fechaTarifa).
+ */
+function getFechaTarifa(input) {
+  return input?.fechaTarifa || input?.fechaIda || '';
 }
 
 /**
@@ -230,9 +242,9 @@ function getNormativa(tipoProyecto) {
 /**
  * Obtiene precios de manutención y alojamiento según país y normativa.
  */
-function getPrecios(paisIndex, pais, normativa) {
+function getPrecios(paisIndex, pais, normativa, fecha) {
   const defaults = { manutencion: 50.55, noche: 98.88 };
-  const datos = getDatos();
+  const datos = getDatos(fecha);
 
   if (!datos || !datos.dietasPorPais || !Array.isArray(datos.dietasPorPais.paises)) {
     return defaults;
@@ -258,9 +270,9 @@ function getPrecios(paisIndex, pais, normativa) {
 /**
  * Obtiene límites IRPF según país.
  */
-function getLimitesIRPF(paisIndex, pais) {
+function getLimitesIRPF(paisIndex, pais, fecha) {
   const defaults = [26.67, 53.34];
-  const datos = getDatos();
+  const datos = getDatos(fecha);
 
   if (!datos || !datos.limitesIRPF) return { limites: defaults, source: 'default' };
 
@@ -276,9 +288,9 @@ function getLimitesIRPF(paisIndex, pais) {
   // Por nombre de país
   const paisesArr = datos.dietasPorPais?.paises || [];
   let idx = paisesArr.indexOf(pais || '');
-  if (idx === -1) {
-    const normalize = s => (s?.normalize?.('NFD') || s || '').replace(/[\u0300-\u036f]/g, '').toLowerCase();
-    idx = paisesArr.findIndex(p => normalize(p) === normalize(pais));
+  if (idx === -1 && window.utils?.getIndicePaises) {
+    // Índice precompilado sin acentos ("Mejico" → México)
+    idx = window.utils.getIndicePaises().resolver(pais);
   }
 
   const isSpain = idx === 0;
@@ -332,124 +344,145 @@ function validateInput(parsed, flags) {
 }
 
 /**
- * Construye resultado vacío (para inputs inválidos).
+ * Campos del input que el resultado expone por compatibilidad (el resultado
+ * ya no copia el input: los lee de result.input bajo demanda).
  */
-function buildEmptyResult(input, kmAmount, precioKm) {
+const CAMPOS_INPUT_RESULTADO = [
+  'fechaIda', 'horaIda', 'fechaRegreso', 'horaRegreso', 'fechaTarifa',
+  'cruceIda', 'cruceVuelta', 'pais', 'paisIndex', 'ticketCena', 'tipoProyecto',
+  'normativa', 'kmTarifa', 'excludeManutencion', 'justificarPernocta',
+  'excludeAlojamiento', '_segmentMode', '_isLastIntlSegment', '_forceAllNights',
+  '_comesFromPreviousDay', '_forceZeroNights', '_lastNightAmbiguousByHour',
+  '_lastNightJustified'
+];
+
+/**
+ * Prototipo común de los resultados del motor: getters de los campos del
+ * input y toJSON con la forma plana de siempre ({...input, ...resultado}).
+ */
+const PROTO_RESULTADO = {
+  toJSON() {
+    const plano = { ...this.input };
+    Object.keys(this).forEach(k => {
+      if (k !== 'input' && this[k] !== null) plano[k] = this[k];
+    });
+    return plano;
+  }
+};
+CAMPOS_INPUT_RESULTADO.forEach(campo => {
+  Object.defineProperty(PROTO_RESULTADO, campo, {
+    get() { return this.input[campo]; },
+    enumerable: false
+  });
+});
+
+/**
+ * Crea un resultado del motor con todos sus campos a cero.
+ * Todos los resultados tienen la misma forma (mismos campos en el mismo
+ * orden, sin propiedades añadidas después), y el input se guarda por
+ * referencia en lugar de copiarse.
+ */
+function crearResultado(input) {
   return {
-    ...input,
+    __proto__: PROTO_RESULTADO,
+    input,
+    valido: false,
     manutenciones: 0,
     manutencionesAmount: 0,
+    manutencionesAmountBase: 0,  // Importe sin factor (para mostrar en UI)
     precioManutencion: 0,
     precioNoche: 0,
+    precioKm: 0,
     noches: 0,
     nochesAmount: 0,
+    nochesAmountBase: 0,  // Importe sin factor (para mostrar en UI)
     nochesBase: 0,
     nochesIfCounted: 0,
     nochesIfNotCounted: 0,
     nochesAmountIfCounted: 0,
     nochesAmountIfNotCounted: 0,
     nochesAmbiguous: false,
+    nochesAmbiguousFrom: null,
+    nochesAmbiguousTo: null,
+    km: 0,
+    kmAmount: 0,
     alojamiento: 0,
     alojamientoMaxAmount: 0,
-    km: parseNumber(input.km),
-    kmAmount: kmAmount,
-    precioKm: precioKm,
-    irpf: { sujeto: 0, breakdown: [], limitesUsed: [26.67, 53.34] }
+    residenciaEventual: false,  // Flag para indicar si aplica reducción del 80%
+    factorResidencia: 1,        // Factor aplicado (0.8 o 1)
+    irpf: null,
+    irpfSource: null,
+    // Título y país del tramo (los rellena calculateSegments)
+    segTitle: null,
+    segPais: null
   };
 }
 
+/**
+ * Construye resultado vacío (para inputs inválidos).
+ */
+function buildEmptyResult(input, kmAmount, precioKm) {
+  const result = crearResultado(input);
+  result.km = parseNumber(input.km);
+  result.kmAmount = kmAmount;
+  result.precioKm = precioKm;
+  result.irpf = { sujeto: 0, breakdown: [], limitesUsed: [26.67, 53.34] };
+  return result;
+}
+
 // -----------------------------------------------------------------------------
 // 1.5 Cálculo de manutenciones
 // -----------------------------------------------------------------------------
 
 /**
- * Constantes de tiempo (en minutos).
+ * Reglas compiladas de manutención y pernocta (ver reglasDietas.js) de una
+ * normativa, en la versión de datos vigente en la fecha.
  */
-const HORA_COMIDA = 14 * 60;      // 14:00
-const HORA_FIN_COMIDA = 16 * 60;  // 16:00
-const HORA_CENA = 22 * 60;        // 22:00
-const HORA_PERNOCTA_MIN = 1 * 60; // 01:00
-const HORA_PERNOCTA_MAX = 7 * 60; // 07:00
+function getReglas(normativa, fecha) {
+  return window.reglasDietas.obtener(normativa, getDatos(fecha));
+}
 
 /**
  * Calcula manutenciones para un viaje de un solo día.
+ * @param {Object} reglas - Reglas compiladas de la normativa (getReglas)
  * @param {boolean} isLastIntlSegment - Si es el último tramo de un viaje internacional,
- *   no se requiere volver después de las 16:00 para media manutención (basta con >14:00).
+ *   la comida se evalúa con la tabla regresoComidaUltimoTramoIntl.
  */
-function calcManutencionesSameDay(tDep, tRet, dtIda, dtVuelta, normativa, ticketCena, isLastIntlSegment = false) {
+function calcManutencionesSameDay(tDep, tRet, dtIda, dtVuelta, reglas, ticketCena, isLastIntlSegment = false) {
   if (tDep === null || tRet === null) return 0;
 
-  const durationHours = (dtVuelta.getTime() - dtIda.getTime()) / 3600000;
-
-  // Media manutención por cena (depende de normativa y ticket)
-  const cenaCuenta = (normativa === 'rd') ? (tRet > HORA_CENA && ticketCena) : (tRet > HORA_CENA);
-  const retHalf = cenaCuenta ? 0.5 : 0;
-
-  // Para RD: si duración < 5h, solo cuenta la cena
-  if (normativa === 'rd' && durationHours < 5) {
-    return retHalf;
-  }
-
-  // Media manutención por comida
-  // En el último tramo internacional, basta con volver estrictamente después de las 14:00
-  const horaFinComidaEfectiva = isLastIntlSegment ? HORA_COMIDA : HORA_FIN_COMIDA;
-  const comidaCuenta = (tDep < HORA_COMIDA && tRet > horaFinComidaEfectiva);
-  const depHalf = comidaCuenta ? 0.5 : 0;
-
-  return depHalf + retHalf;
+  const duracionMin = (dtVuelta.getTime() - dtIda.getTime()) / 60000;
+  return window.reglasDietas.manutencionesMismoDia(reglas, tDep, tRet, duracionMin, !!ticketCena, isLastIntlSegment);
 }
 
 /**
  * Calcula manutenciones para un viaje de varios días.
- * @param {boolean} isLastIntlSegment - Si es el último tramo de un viaje internacional,
- *   basta con volver estrictamente después de las 14:00 para sumar media manutención.
+ * @param {Object} reglas - Reglas compiladas de la normativa (getReglas)
  */
-function calcManutencionesSeveralDays(tDep, tRet, diasIntermedios, normativa, ticketCena, isLastIntlSegment = false) {
-  let total = 0;
+function calcManutencionesSeveralDays(tDep, tRet, diasIntermedios, reglas, ticketCena) {
+  const { unidadesIda, unidadesRegreso } = window.reglasDietas;
 
-  // Día de ida
-  if (tDep !== null) {
-    if (tDep < HORA_COMIDA) {
-      total += 1;
-    } else if (tDep < HORA_CENA) {
-      total += 0.5;
-    }
-  }
-
-  // Días intermedios (1 manutención completa cada uno)
-  total += diasIntermedios;
-
-  // Día de regreso
-  // En el último tramo internacional, basta con >14:00 para media manutención
-  if (tRet !== null) {
-    const cenaCuenta = (normativa === 'rd') ? (tRet > HORA_CENA && ticketCena) : (tRet > HORA_CENA);
-    if (cenaCuenta) {
-      total += 1;
-    } else if (tRet > HORA_COMIDA) {
-      // En este cálculo de varios días se aplica umbral estricto > 14:00
-      total += 0.5;
-    }
-  }
-
-  return total;
+  // Día de ida + días intermedios (1 manutención completa cada uno) + día de regreso
+  return unidadesIda(reglas, tDep) + diasIntermedios + unidadesRegreso(reglas, tRet, !!ticketCena);
 }
 
 /**
  * Calcula el número total de manutenciones.
+ * @param {Object} reglas - Reglas compiladas de la normativa (getReglas)
  * @param {boolean} isLastIntlSegment - Si es el último tramo de un viaje internacional.
  */
-function calcManutenciones(parsed, normativa, ticketCena, isLastIntlSegment = false) {
+function calcManutenciones(parsed, reglas, ticketCena, isLastIntlSegment = false) {
   const { fechaIda, fechaRegreso, horaIda, horaRegreso, dtIda, dtRegreso } = parsed;
   const tDep = toMinutes(horaIda);
   const tRet = toMinutes(horaRegreso);
 
   if (isSameDay(fechaIda, fechaRegreso)) {
-    return calcManutencionesSameDay(tDep, tRet, dtIda, dtRegreso, normativa, ticketCena, isLastIntlSegment);
+    return calcManutencionesSameDay(tDep, tRet, dtIda, dtRegreso, reglas, ticketCena, isLastIntlSegment);
   }
 
   const dias = daysBetween(fechaIda, fechaRegreso);
   const diasIntermedios = Math.max(0, dias - 1);
-  return calcManutencionesSeveralDays(tDep, tRet, diasIntermedios, normativa, ticketCena, isLastIntlSegment);
+  return calcManutencionesSeveralDays(tDep, tRet, diasIntermedios, reglas, ticketCena);
 }
 
 // -----------------------------------------------------------------------------
@@ -475,30 +508,20 @@ function nochesResult(noches, nochesIfCounted, nochesIfNotCounted, ambiguous) {
 /**
  * Determina si una hora de regreso (en minutos) cuenta como pernocta.
  * 
- * Reglas de pernoctación:
- * - <= 01:00 (HORA_PERNOCTA_MIN): NO pernocta
- * - >= 07:00 (HORA_PERNOCTA_MAX): SÍ pernocta
- * - Entre 01:01 y 06:59: Zona AMBIGUA
+ * Las franjas salen de la tabla reglasDietas.pernocta de datos.json
+ * (actualmente: hasta 01:00 NO pernocta, desde 07:00 SÍ, en medio AMBIGUA).
  * 
  * @param {number|null} tRet - Hora de regreso en minutos desde medianoche
  * @param {boolean} justified - Si está justificada la última noche
+ * @param {Object} [reglas] - Reglas compiladas (getReglas)
  * @returns {{ counts: boolean, ambiguous: boolean }}
  */
-function evalLastNightByHour(tRet, justified = false) {
+function evalLastNightByHour(tRet, justified = false, reglas = getReglas('decreto')) {
   // Sin hora → conservador: NO pernocta
-  if (tRet === null) {
-    return { counts: false, ambiguous: false };
-  }
-  // >= 07:00 → SÍ pernocta
-  if (tRet >= HORA_PERNOCTA_MAX) {
-    return { counts: true, ambiguous: false };
-  }
-  // <= 01:00 → NO pernocta
-  if (tRet <= HORA_PERNOCTA_MIN) {
-    return { counts: false, ambiguous: false };
-  }
-  // Zona ambigua (01:01-06:59): depende de justificación
-  return { counts: justified, ambiguous: true };
+  const clase = window.reglasDietas.pernocta(reglas, tRet);
+  // Zona ambigua: depende de justificación
+  if (clase === 'ambigua') return { counts: justified, ambiguous: true };
+  return { counts: clase === 'si', ambiguous: false };
 }
 
 /**
@@ -527,9 +550,10 @@ function evalLastNightByHour(tRet, justified = false) {
  * 
  * @param {Object} parsed - Datos parseados con fechaIda, fechaRegreso, horaRegreso
  * @param {Object} flags - Flags de control para casos especiales
+ * @param {Object} [reglas] - Reglas compiladas (getReglas)
  * @returns {NochesResult}
  */
-function calcNoches(parsed, flags = {}) {
+function calcNoches(parsed, flags = {}, reglas = getReglas('decreto')) {
   const { fechaIda, fechaRegreso, horaRegreso } = parsed;
   const { 
     forceAllNights, 
@@ -558,7 +582,7 @@ function calcNoches(parsed, flags = {}) {
     if (lastNightAmbiguousByHour && nochesBase > 0) {
       const [hh, mm] = lastNightAmbiguousByHour.split(':').map(Number);
       const tRet = hh * 60 + mm;
-      const { counts, ambiguous } = evalLastNightByHour(tRet, lastNightJustified);
+      const { counts, ambiguous } = evalLastNightByHour(tRet, lastNightJustified, reglas);
       
       const nochesIfCounted = nochesBase;
       const nochesIfNotCounted = Math.max(0, nochesBase - 1);
@@ -576,7 +600,7 @@ function calcNoches(parsed, flags = {}) {
   // ─────────────────────────────────────────────────────────────────────────
   if (diasEntre <= 0 && comesFromPreviousDay) {
     const tRet = toMinutes(horaRegreso);
-    const { counts, ambiguous } = evalLastNightByHour(tRet, false);
+    const { counts, ambiguous } = evalLastNightByHour(tRet, false, reglas);
     const noches = counts ? 1 : 0;
     return nochesResult(noches, 1, 0, ambiguous);
   }
@@ -602,7 +626,7 @@ function calcNoches(parsed, flags = {}) {
     return nochesResult(nochesBase, nochesIfCounted, nochesIfNotCounted, false);
   }
 
-  const { counts, ambiguous } = evalLastNightByHour(tRet, false);
+  const { counts, ambiguous } = evalLastNightByHour(tRet, false, reglas);
   const noches = counts ? nochesIfCounted : nochesIfNotCounted;
   
   return nochesResult(noches, nochesIfCounted, nochesIfNotCounted, ambiguous);
@@ -615,7 +639,7 @@ function calcNoches(parsed, flags = {}) {
 /**
  * Obtiene las unidades de manutención por día para el cálculo de IRPF.
  */
-function getPerDayManutencionUnits(parsed, normativa, ticketCena, manutencionesSameDay) {
+function getPerDayManutencionUnits(parsed, reglas, ticketCena, manutencionesSameDay) {
   const { fechaIda, fechaRegreso, horaIda, horaRegreso } = parsed;
   const tDep = toMinutes(horaIda);
   const tRet = toMinutes(horaRegreso);
@@ -627,12 +651,7 @@ function getPerDayManutencionUnits(parsed, normativa, ticketCena, manutencionesS
   const units = [];
 
   // Día de ida
-  let depUnits = 0;
-  if (tDep !== null) {
-    if (tDep < HORA_COMIDA) depUnits = 1;
-    else if (tDep < HORA_CENA) depUnits = 0.5;
-  }
-  units.push(depUnits);
+  units.push(window.reglasDietas.unidadesIda(reglas, tDep));
 
   // Días intermedios
   const dias = daysBetween(fechaIda, fechaRegreso);
@@ -641,13 +660,7 @@ function getPerDayManutencionUnits(parsed, normativa, ticketCena, manutencionesS
   }
 
   // Día de regreso
-  let retUnits = 0;
-  if (tRet !== null) {
-    const cenaCuenta = (normativa === 'rd') ? (tRet > HORA_CENA && ticketCena) : (tRet > HORA_CENA);
-    if (cenaCuenta) retUnits = 1;
-    else if (tRet > HORA_COMIDA) retUnits = 0.5;
-  }
-  units.push(retUnits);
+  units.push(window.reglasDietas.unidadesRegreso(reglas, tRet, !!ticketCena));
 
   return units;
 }
@@ -655,10 +668,10 @@ function getPerDayManutencionUnits(parsed, normativa, ticketCena, manutencionesS
 /**
  * Calcula el IRPF sujeto por día y el total.
  */
-function calcIRPF(parsed, manutenciones, precioManutencion, normativa, ticketCena, input, residMul = 1) {
-  const { limites, source } = getLimitesIRPF(input.paisIndex, input.pais);
+function calcIRPF(parsed, manutenciones, precioManutencion, reglas, ticketCena, input, residMul = 1) {
+  const { limites, source } = getLimitesIRPF(input.paisIndex, input.pais, getFechaTarifa(input));
 
-  const perDayUnits = getPerDayManutencionUnits(parsed, normativa, ticketCena, manutenciones);
+  const perDayUnits = getPerDayManutencionUnits(parsed, reglas, ticketCena, manutenciones);
   const tRet = toMinutes(parsed?.horaRegreso);
 
   // Si no ha pernoctado la última noche, el penúltimo día natural usa límite bajo.
@@ -688,14 +701,14 @@ function calcIRPF(parsed, manutenciones, precioManutencion, normativa, ticketCen
   if (perDayUnits.length >= 2) {
     if (isIntlSegment) {
       if (lastNightRefTime !== null) {
-        const { counts } = evalLastNightByHour(lastNightRefTime, justificaPernocta);
+        const { counts } = evalLastNightByHour(lastNightRefTime, justificaPernocta, reglas);
         noPernoctaUltimaNoche = !counts;
       }
     } else {
       noPernoctaUltimaNoche = (
         tRet !== null &&
         tRet >= 0 &&
-        tRet < HORA_PERNOCTA_MAX &&
+        window.reglasDietas.pernocta(reglas, tRet) !== 'si' &&
         !justificaPernocta
       );
     }
@@ -775,6 +788,7 @@ function applyExcludeManutencionToIRPF(result) {
  */
 function calculateDesplazamiento(input) {
   if (!input) return null;
+  const traza = window.trazas?.inicio();
 
   // Extraer flags
   const flags = extractFlags(input);
@@ -806,16 +820,20 @@ function calculateDesplazamiento(input) {
 
   const validation = validateInput(parsed, flags);
   if (!validation.valid) {
+    window.trazas?.fin('calculo.desplazamiento', traza);
     return buildEmptyResult(input, kmAmount, precioKm);
   }
 
-  // Obtener configuración
-  const normativa = getNormativa(input.tipoProyecto);
-  const precios = getPrecios(input.paisIndex, input.pais, normativa);
+  // Obtener configuración (input.normativa permite forzarla en simulaciones)
+  const normativa = (input.normativa === 'rd' || input.normativa === 'decreto')
+    ? input.normativa
+    : getNormativa(input.tipoProyecto);
+  const precios = getPrecios(input.paisIndex, input.pais, normativa, getFechaTarifa(input));
   const ticketCena = input.ticketCena;
+  const reglas = getReglas(normativa, getFechaTarifa(input));
 
   // Calcular manutenciones (pasar flag de último tramo internacional)
-  let manutenciones = calcManutenciones(parsed, normativa, ticketCena, flags.isLastIntlSegment);
+  let manutenciones = calcManutenciones(parsed, reglas, ticketCena, flags.isLastIntlSegment);
   if (flags.excludeManutencion) {
     manutenciones = 0;
   }
@@ -827,7 +845,7 @@ function calculateDesplazamiento(input) {
     forceZeroNights: flags.forceZeroNights,
     lastNightAmbiguousByHour: flags.lastNightAmbiguousByHour,
     lastNightJustified: flags.lastNightJustified
-  });
+  }, reglas);
 
   // Calcular importes base (sin factor de residencia eventual)
   const manutencionesAmountBase = round2(manutenciones * precios.manutencion);
@@ -854,30 +872,29 @@ function calculateDesplazamiento(input) {
   const alojamientoNum = parseNumber(input.alojamiento);
 
   // Construir resultado base
-  const result = {
-    ...input,
-    manutenciones,
-    manutencionesAmount,
-    manutencionesAmountBase,  // Importe sin factor (para mostrar en UI)
-    precioManutencion: precios.manutencion,
-    precioNoche: precios.noche,
-    precioKm,
-    noches: nochesCalc.noches,
-    nochesAmount,
-    nochesAmountBase,  // Importe sin factor (para mostrar en UI)
-    nochesBase: daysBetween(fechaIda, fechaRegreso),
-    nochesIfCounted: nochesCalc.nochesIfCounted,
-    nochesIfNotCounted: nochesCalc.nochesIfNotCounted,
-    nochesAmountIfCounted,
-    nochesAmountIfNotCounted,
-    nochesAmbiguous: nochesCalc.ambiguous,
-    km: kmNum,
-    kmAmount,
-    alojamiento: alojamientoNum,
-    alojamientoMaxAmount: nochesAmount,
-    residenciaEventual,  // Flag para indicar si aplica reducción del 80%
-    factorResidencia     // Factor aplicado (0.8 o 1)
-  };
+  const result = crearResultado(input);
+  result.valido = true;
+  result.manutenciones = manutenciones;
+  result.manutencionesAmount = manutencionesAmount;
+  result.manutencionesAmountBase = manutencionesAmountBase;
+  result.precioManutencion = precios.manutencion;
+  result.precioNoche = precios.noche;
+  result.precioKm = precioKm;
+  result.noches = nochesCalc.noches;
+  result.nochesAmount = nochesAmount;
+  result.nochesAmountBase = nochesAmountBase;
+  result.nochesBase = daysBetween(fechaIda, fechaRegreso);
+  result.nochesIfCounted = nochesCalc.nochesIfCounted;
+  result.nochesIfNotCounted = nochesCalc.nochesIfNotCounted;
+  result.nochesAmountIfCounted = nochesAmountIfCounted;
+  result.nochesAmountIfNotCounted = nochesAmountIfNotCounted;
+  result.nochesAmbiguous = nochesCalc.ambiguous;
+  result.km = kmNum;
+  result.kmAmount = kmAmount;
+  result.alojamiento = alojamientoNum;
+  result.alojamientoMaxAmount = nochesAmount;
+  result.residenciaEventual = residenciaEventual;
+  result.factorResidencia = factorResidencia;
 
   // Añadir fechas de ambigüedad si aplica
   if (nochesCalc.ambiguous && fechaRegreso) {
@@ -889,7 +906,7 @@ function calculateDesplazamiento(input) {
   }
 
   // Calcular IRPF
-  result.irpf = calcIRPF(parsed, manutenciones, precios.manutencion, normativa, ticketCena, input, factorResidencia);
+  result.irpf = calcIRPF(parsed, manutenciones, precios.manutencion, reglas, ticketCena, input, factorResidencia);
   result.irpfSource = result.irpf.source;
 
   // Aplicar flags post-cálculo
@@ -905,6 +922,7 @@ function calculateDesplazamiento(input) {
     applyExcludeManutencionToIRPF(result);
   }
 
+  window.trazas?.fin('calculo.desplazamiento', traza);
   return result;
 }
 
@@ -949,12 +967,13 @@ window.calculoDesp._daysBetween = daysBetween;
   }
 
   /**
-   * Obtiene la tarifa de km según el tipo de vehículo seleccionado.
+   * Obtiene la tarifa de km según el tipo de vehículo seleccionado,
+   * vigente en la fecha indicada (por defecto, la actual de datos.json).
    */
-  function getKmTarifa() {
+  function getKmTarifa(fecha) {
     const veh = document.querySelector('input[name="vehiculo-tipo"]:checked');
     const tipoVeh = veh?.value || 'coche';
-    const datos = window.__sgtriDatos;
+    const datos = getDatos(fecha);
     return datos?.kmTarifas?.[tipoVeh] || 0.26;
   }
 
@@ -973,16 +992,20 @@ window.calculoDesp._daysBetween = daysBetween;
 
   /**
    * Crea un input de segmento para el motor de cálculo.
-   * Incluye flags especiales para el cálculo de noches en viajes internacionales.
+   * `base` lleva los campos comunes del viaje y `tramo` las fechas, el país y
+   * los flags especiales del cálculo de noches en viajes internacionales; se
+   * leen por separado en lugar de mezclarlos en un objeto intermedio.
    */
-  function createSegmentInput(opts) {
-    const { fechaIda, horaIda, fechaRegreso, horaRegreso, pais, paisIndex, ticketCena, tipoProyecto, kmTarifa, excludeManutencion, excludeAlojamiento, isLastIntlSegment, forceAllNights, comesFromPreviousDay, forceZeroNights, lastNightAmbiguousByHour, lastNightJustified, justificarPernocta } = opts;
+  function createSegmentInput(base, tramo) {
+    const { fechaTarifa, tipoProyecto, normativa, kmTarifa, excludeManutencion, excludeAlojamiento } = base;
+    const { fechaIda, horaIda, fechaRegreso, horaRegreso, pais, paisIndex, ticketCena, isLastIntlSegment, forceAllNights, comesFromPreviousDay, forceZeroNights, lastNightAmbiguousByHour, lastNightJustified, justificarPernocta } = tramo;
 
     return {
       fechaIda: formatDateStr(fechaIda),
       horaIda,
       fechaRegreso: formatDateStr(fechaRegreso),
       horaRegreso,
+      fechaTarifa: fechaTarifa || '',
       cruceIda: '',
       cruceVuelta: '',
       pais,
@@ -991,6 +1014,7 @@ window.calculoDesp._daysBetween = daysBetween;
       alojamiento: 0,
       ticketCena,
       tipoProyecto,
+      normativa: normativa || null,
       kmTarifa,
       excludeManutencion,
       justificarPernocta: !!justificarPernocta,  // Pasar el valor real
@@ -1044,12 +1068,15 @@ window.calculoDesp._daysBetween = daysBetween;
    * └─────────────────────────────────────────────────────────────────────────┘
    */
   function buildSegmentInputs(data, baseInput) {
+    const traza = window.trazas?.inicio();
     const segments = [];
-    const normativa = getWrapperNormativa(data.tipoProyecto);
+    const normativa = data.normativa || getWrapperNormativa(data.tipoProyecto);
     const nonFinalAssumeCena = (normativa === 'decreto');
 
     const baseOpts = {
+      fechaTarifa: baseInput.fechaIda,
       tipoProyecto: data.tipoProyecto,
+      normativa: data.normativa || null,
       kmTarifa: baseInput.kmTarifa,
       excludeManutencion: baseInput.excludeManutencion,
       excludeAlojamiento: baseInput.excludeAlojamiento
@@ -1068,8 +1095,7 @@ window.calculoDesp._daysBetween = daysBetween;
     // ─────────────────────────────────────────────────────────────────────────
     if (salidaAntesDeCruceIda) {
       segments.push({
-        input: createSegmentInput({
-          ...baseOpts,
+        input: createSegmentInput(baseOpts, {
           fechaIda: data.fechaIda,
           horaIda: formatTimeStr(data.horaIda),
           fechaRegreso: data.cruceIda,
@@ -1095,8 +1121,7 @@ window.calculoDesp._daysBetween = daysBetween;
       if (regresoMismoDiaQueCruceVuelta) {
         // CASO A: La noche ambigua pertenece a ESTE tramo
         segments.push({
-          input: createSegmentInput({
-            ...baseOpts,
+          input: createSegmentInput(baseOpts, {
             fechaIda: data.cruceIda,
             horaIda: horaInicioIntl,
             fechaRegreso: data.cruceVuelta,
@@ -1114,8 +1139,7 @@ window.calculoDesp._daysBetween = daysBetween;
       } else {
         // CASO B: Todas las noches cuentan (sin ambigüedad aquí)
         segments.push({
-          input: createSegmentInput({
-            ...baseOpts,
+          input: createSegmentInput(baseOpts, {
             fechaIda: data.cruceIda,
             horaIda: horaInicioIntl,
             fechaRegreso: data.cruceVuelta,
@@ -1138,8 +1162,7 @@ window.calculoDesp._daysBetween = daysBetween;
       if (regresoMismoDiaQueCruceVuelta) {
         // CASO A: 0 noches aquí (la noche ambigua está en el tramo extranjero)
         segments.push({
-          input: createSegmentInput({
-            ...baseOpts,
+          input: createSegmentInput(baseOpts, {
             fechaIda: data.cruceVuelta,
             horaIda: '00:00',
             fechaRegreso: data.fechaRegreso,
@@ -1156,8 +1179,7 @@ window.calculoDesp._daysBetween = daysBetween;
       } else {
         // CASO B: La noche ambigua pertenece a ESTE tramo
         segments.push({
-          input: createSegmentInput({
-            ...baseOpts,
+          input: createSegmentInput(baseOpts, {
             fechaIda: data.cruceVuelta,
             horaIda: '00:00',
             fechaRegreso: data.fechaRegreso,
@@ -1175,6 +1197,7 @@ window.calculoDesp._daysBetween = daysBetween;
       }
     }
 
+    window.trazas?.fin('calculo.segmentos', traza);
     return segments;
   }
 
@@ -1357,7 +1380,9 @@ window.calculoDesp._daysBetween = daysBetween;
           ? round2(totals.alojamientoMax / totals.noches) 
           : (canonical.precioNoche || 0),
         residenciaEventual: esResidenciaEventual,
-        factorResidencia
+        factorResidencia,
+        // Normativa aplicada (destino de los enlaces "§" a los artículos)
+        normativa: data.normativa || getWrapperNormativa(data.tipoProyecto)
       },
 
       // Estado de exclusiones
@@ -1372,27 +1397,70 @@ window.calculoDesp._daysBetween = daysBetween;
     };
   }
 
+  /**
+   * Vista de serialización de un desplazamiento (detalles del registro de
+   * totales). No copia nada al calcular: cada campo se lee de salidaData al
+   * serializar, y los segmentos se construyen una sola vez al pedirlos.
+   */
+  const PROTO_DETALLES = {
+    // Manutención
+    get numManutenciones() { return this._salida.detalles?.manutenciones || 0; },
+    get precioManutencion() { return this._salida.detalles?.precioManutencion || 0; },
+    get importeManutencion() { return this._salida.totales.manutencion || 0; },
+    // Alojamiento
+    get numNoches() { return this._salida.totales.noches || 0; },
+    get precioNoche() { return this._salida.ui?.precioNocheMedio || 0; },
+    get importeMaxAlojamiento() { return this._salida.totales.alojamientoMax || 0; },
+    get excedeMaxAlojamiento() { return this._salida.ui?.alojamientoExcedeMax || false; },
+    // Kilometraje
+    get precioPorKm() { return this._salida.detalles?.precioKm || this._salida._canonical?.precioKm || 0.26; },
+    get importeKm() { return this._salida.totales.km || 0; },
+    // Residencia eventual
+    get residenciaEventual() { return this._salida.ui?.residenciaEventual || false; },
+    // IRPF
+    get irpfSujeto() { return this._salida.totales.irpfSujeto || 0; },
+    // Total del desplazamiento
+    get importeTotal() { return this._salida.totales.total || 0; },
+    // Segmentos (solo para desplazamientos internacionales)
+    get segmentos() {
+      if (this._segmentos === undefined) {
+        const segs = this._salida.segmentos;
+        this._segmentos = segs ? segs.map(seg => ({
+          titulo: seg.titulo || '',
+          pais: seg.pais || '',
+          numManutenciones: seg.manutenciones || 0,
+          precioManutencion: seg.precioManutencion || 0,
+          importeManutencion: seg.manutencionAmount || 0,
+          numNoches: seg.noches || 0,
+          precioNoche: seg.precioNoche || 0,
+          importeMaxAlojamiento: seg.nochesAmount || 0
+        })) : null;
+      }
+      return this._segmentos;
+    },
+    toJSON() {
+      const plano = {};
+      CAMPOS_DETALLES.forEach(k => { plano[k] = this[k]; });
+      return plano;
+    }
+  };
+
+  const CAMPOS_DETALLES = Object.keys(Object.getOwnPropertyDescriptors(PROTO_DETALLES))
+    .filter(k => k !== 'toJSON');
+
+  function crearDetallesSerializacion(salidaData) {
+    return { __proto__: PROTO_DETALLES, _salida: salidaData, _segmentos: undefined };
+  }
+
   // ---------------------------------------------------------------------------
   // 2.4 Función principal del wrapper
   // ---------------------------------------------------------------------------
 
   /**
-   * Calcula los importes de un desplazamiento a partir de su ficha DOM.
+   * Construye el input del motor a partir de los datos recolectados de una ficha.
    */
-  function calculaDesplazamientoFicha(despEl) {
-    // 1. Recolectar datos normalizados del DOM
-    const collectFn = window.cogeDatosDesp?.collectDataFromFicha;
-    if (!collectFn) {
-      console.warn('[calculoDesp] cogeDatosDesp.collectDataFromFicha no disponible');
-      return null;
-    }
-
-    const data = collectFn(despEl);
-    if (!data) return null;
-
-    // 2. Construir input para el motor
-    const kmTarifa = getKmTarifa();
-    const calcInput = {
+  function buildCalcInput(data, kmTarifa) {
+    return {
       fechaIda: data.raw.fechaIda,
       horaIda: data.raw.horaIda,
       fechaRegreso: data.raw.fechaRegreso,
@@ -1410,6 +1478,25 @@ window.calculoDesp._daysBetween = daysBetween;
       justificarPernocta: data.justificarPernocta,
       excludeAlojamiento: data.dtInvalid
     };
+  }
+
+  /**
+   * Calcula los importes de un desplazamiento a partir de su ficha DOM.
+   */
+  function calculaDesplazamientoFicha(despEl) {
+    // 1. Recolectar datos normalizados del DOM
+    const collectFn = window.cogeDatosDesp?.collectDataFromFicha;
+    if (!collectFn) {
+      console.warn('[calculoDesp] cogeDatosDesp.collectDataFromFicha no disponible');
+      return null;
+    }
+
+    const data = collectFn(despEl);
+    if (!data) return null;
+
+    // 2. Construir input para el motor
+    const kmTarifa = getKmTarifa(data.raw.fechaIda);
+    const calcInput = buildCalcInput(data, kmTarifa);
 
     // 3. Ejecutar motor de cálculo
     let canonical = calculateDesplazamiento(calcInput);
@@ -1479,44 +1566,15 @@ window.calculoDesp._daysBetween = daysBetween;
     window.salidaDesp?.renderSalida?.(despEl, salidaData);
 
     // 9. Registrar totales en el registro centralizado
+    // (los detalles para serialización se derivan de salidaData al leerlos)
     if (window.resultadoLiquidacion?.registrarDesplazamiento) {
-      // Construir detalles adicionales para serialización
-      const detallesSerializacion = {
-        // Manutención
-        numManutenciones: salidaData.detalles?.manutenciones || 0,
-        precioManutencion: salidaData.detalles?.precioManutencion || 0,
-        importeManutencion: salidaData.totales.manutencion || 0,
-        // Alojamiento
-        numNoches: salidaData.totales.noches || 0,
-        precioNoche: salidaData.ui?.precioNocheMedio || 0,
-        importeMaxAlojamiento: salidaData.totales.alojamientoMax || 0,
-        excedeMaxAlojamiento: salidaData.ui?.alojamientoExcedeMax || false,
-        // Kilometraje
-        precioPorKm: salidaData.detalles?.precioKm || salidaData._canonical?.precioKm || 0.26,
-        importeKm: salidaData.totales.km || 0,
-        // Residencia eventual
-        residenciaEventual: salidaData.ui?.residenciaEventual || false,
-        // IRPF
-        irpfSujeto: salidaData.totales.irpfSujeto || 0,
-        // Total del desplazamiento
-        importeTotal: salidaData.totales.total || 0,
-        // Segmentos (solo para desplazamientos internacionales)
-        segmentos: salidaData.segmentos ? salidaData.segmentos.map(seg => ({
-          titulo: seg.titulo || '',
-          pais: seg.pais || '',
-          numManutenciones: seg.manutenciones || 0,
-          precioManutencion: seg.precioManutencion || 0,
-          importeManutencion: seg.manutencionAmount || 0,
-          numNoches: seg.noches || 0,
-          precioNoche: seg.precioNoche || 0,
-          importeMaxAlojamiento: seg.nochesAmount || 0
-        })) : null
-      };
-      window.resultadoLiquidacion.registrarDesplazamiento(data.id, salidaData.totales, detallesSerializacion);
+      window.resultadoLiquidacion.registrarDesplazamiento(
+        data.id, salidaData.totales, crearDetallesSerializacion(salidaData)
+      );
     }
 
-    // 10. Actualizar resultado de la liquidación
-    window.resultadoLiquidacion?.renderResultado?.();
+    // 10. Propagar el cambio al resultado (solo si cambian sus entradas)
+    window.resultadoLiquidacion?.actualizarResultado?.();
 
     // 11. Devolver resultado
     return {
@@ -1537,7 +1595,244 @@ window.calculoDesp._daysBetween = daysBetween;
   }
 
   // ---------------------------------------------------------------------------
-  // 2.5 Exportación API del Wrapper
+  // 2.5 Comparador de escenarios (país × normativa)
+  // ---------------------------------------------------------------------------
+  //
+  // Evalúa un mismo desplazamiento en todos los países de dietasPorPais y con
+  // ambas normativas. Todo salvo la fila de tarifas es común, así que el motor
+  // se ejecuta una sola vez por normativa (tramo nacional + plantilla de tramos
+  // internacionales) y para cada país solo se re-valoran las unidades
+  // (manutenciones, noches, unidades diarias de IRPF) con su precio.
+
+  const NORMATIVAS_COMPARADOR = ['rd', 'decreto'];
+
+  /**
+   * Recalcula el IRPF sujeto de un tramo con otro precio de manutención.
+   * Reproduce calcIRPF + applyResidenciaEventualToSegmentIRPF sobre el desglose.
+   */
+  function repreciarIrpfSujeto(irpf, precioManutencion, factor) {
+    if (!irpf || !Array.isArray(irpf.breakdown)) return 0;
+    let sujetoTotal = 0;
+    irpf.breakdown.forEach(b => {
+      const brutoOriginal = round2((Number(b.units) || 0) * precioManutencion);
+      const bruto = round2(brutoOriginal * factor);
+      sujetoTotal += round2(Math.max(0, bruto - (Number(b.exento) || 0)));
+    });
+    return round2(sujetoTotal);
+  }
+
+  /**
+   * Construye una fila de la tabla comparativa.
+   */
+  function filaComparativa(pais, paisIndex, normativa, valores) {
+    const manutencion = round2(valores.manutencion);
+    const alojamientoMax = round2(valores.alojamientoMax);
+    const km = round2(valores.km);
+    return {
+      pais,
+      paisIndex,
+      normativa,
+      manutenciones: valores.manutenciones,
+      manutencion,
+      noches: valores.noches,
+      alojamientoMax,
+      km,
+      irpfSujeto: round2(valores.irpfSujeto),
+      total: round2(manutencion + alojamientoMax + km),
+      residenciaEventual: !!valores.residenciaEventual
+    };
+  }
+
+  /**
+   * Calcula la plantilla de tramos internacionales para una normativa.
+   * Se usa un país extranjero de referencia; solo el tramo extranjero se
+   * re-valora después con la tarifa de cada país.
+   */
+  function calcularPlantillaInternacional(base, normativa, paisRefIndex, paisRef) {
+    const fechaIda = parseDate(base.fechaIda);
+    const fechaRegreso = parseDate(base.fechaRegreso);
+    const horaIda = parseTime(base.horaIda);
+    const horaRegreso = parseTime(base.horaRegreso);
+    // Sin cruces informados se asume que todo el viaje transcurre en el extranjero
+    const cruceIda = parseDate(base.cruceIda) || fechaIda;
+    const cruceVuelta = parseDate(base.cruceVuelta) || fechaRegreso;
+
+    const calcInput = {
+      ...base,
+      cruceIda: formatDateStr(cruceIda),
+      cruceVuelta: formatDateStr(cruceVuelta),
+      pais: paisRef,
+      paisIndex: paisRefIndex,
+      normativa
+    };
+
+    const canonical = calculateDesplazamiento(calcInput);
+    if (!canonical || !canonical.valido) {
+      // Input inválido para el motor (buildEmptyResult): sin importes
+      return { segmentos: [], kmAmount: Number(canonical?.kmAmount) || 0, residenciaEventual: false };
+    }
+
+    const data = {
+      tipoProyecto: base.tipoProyecto,
+      normativa,
+      fechaIda, fechaRegreso, horaIda, horaRegreso, cruceIda, cruceVuelta,
+      pais: paisRef,
+      paisIndex: paisRefIndex,
+      ticketCena: !!base.ticketCena,
+      justificarPernocta: !!base.justificarPernocta
+    };
+
+    const segmentos = calculateSegments(buildSegmentInputs(data, calcInput));
+    const residenciaEventual = isResidenciaEventual(fechaIda, fechaRegreso, false);
+    if (residenciaEventual) applyResidenciaEventualToSegmentIRPF(segmentos, 0.8);
+
+    return { segmentos, kmAmount: Number(canonical.kmAmount) || 0, residenciaEventual };
+  }
+
+  /**
+   * Evalúa un desplazamiento en todos los países y ambas normativas.
+   *
+   * El input tiene la misma forma que el que recibe calculateDesplazamiento
+   * (fechas dd/mm/aa, horas hh:mm, flags). País y normativa se ignoran: se
+   * recorren todos. Para España se usa el cálculo nacional; para el resto,
+   * la segmentación internacional con los cruces del input (o fechas de ida
+   * y regreso si no hay cruces).
+   *
+   * @param {Object} input - Input normalizado del motor
+   * @param {Object} [opciones]
+   * @param {Array<string>} [opciones.normativas] - Subconjunto de 'rd' / 'decreto'
+   * @param {string} [opciones.ordenarPor] - Campo de ordenación de las filas
+   * @param {boolean} [opciones.descendente=false]
+   * @returns {Array<Object>} Filas { pais, paisIndex, normativa, manutenciones,
+   *   manutencion, noches, alojamientoMax, km, irpfSujeto, total, residenciaEventual }
+   */
+  function compararEscenarios(input, opciones = {}) {
+    if (!input) return [];
+
+    const datos = window.__sgtriDatos;
+    const paises = datos?.dietasPorPais?.paises || [];
+    if (paises.length === 0) return [];
+
+    const normativas = (opciones.normativas || NORMATIVAS_COMPARADOR)
+      .filter(n => NORMATIVAS_COMPARADOR.includes(n));
+    const base = {
+      ...input,
+      cruceIda: input.cruceIda || '',
+      cruceVuelta: input.cruceVuelta || ''
+    };
+
+    const filas = [];
+
+    normativas.forEach(normativa => {
+      // España: cálculo nacional completo (una ejecución del motor)
+      const nacional = calculateDesplazamiento({
+        ...base,
+        cruceIda: '',
+        cruceVuelta: '',
+        pais: paises[0],
+        paisIndex: 0,
+        normativa
+      });
+      if (nacional) {
+        filas.push(filaComparativa(paises[0], 0, normativa, {
+          manutenciones: Number(nacional.manutenciones) || 0,
+          manutencion: Number(nacional.manutencionesAmount) || 0,
+          noches: Number(nacional.noches) || 0,
+          alojamientoMax: Number(nacional.nochesAmount) || 0,
+          km: Number(nacional.kmAmount) || 0,
+          irpfSujeto: nacional.irpf?.sujeto || 0,
+          residenciaEventual: !!nacional.residenciaEventual
+        }));
+      }
+
+      if (paises.length < 2) return;
+
+      // Extranjero: tramos calculados una vez, re-valorados por país
+      const plantilla = calcularPlantillaInternacional(base, normativa, 1, paises[1]);
+      const factor = plantilla.residenciaEventual ? 0.8 : 1;
+
+      // Parte fija (tramos en España) y unidades del tramo extranjero
+      let manutencionFija = 0, alojamientoFijo = 0, irpfFijo = 0;
+      let manutencionesTotal = 0, nochesTotal = 0;
+      const extranjeros = [];
+      plantilla.segmentos.forEach(seg => {
+        manutencionesTotal += Number(seg.manutenciones) || 0;
+        nochesTotal += Number(seg.noches) || 0;
+        if (seg.paisIndex > 0) {
+          extranjeros.push(seg);
+        } else {
+          manutencionFija += Number(seg.manutencionesAmount) || 0;
+          alojamientoFijo += Number(seg.nochesAmount) || 0;
+          irpfFijo += seg.irpf?.sujeto || 0;
+        }
+      });
+
+      for (let i = 1; i < paises.length; i++) {
+        const precios = getPrecios(i, paises[i], normativa, input.fechaIda);
+        let manutencionBase = manutencionFija;
+        let alojamientoBase = alojamientoFijo;
+        let irpfSujeto = irpfFijo;
+
+        extranjeros.forEach(seg => {
+          manutencionBase += round2((Number(seg.manutenciones) || 0) * precios.manutencion);
+          alojamientoBase += round2((Number(seg.noches) || 0) * precios.noche);
+          if (!seg.excludeManutencion) {
+            irpfSujeto += repreciarIrpfSujeto(seg.irpf, precios.manutencion, factor);
+          }
+        });
+
+        filas.push(filaComparativa(paises[i], i, normativa, {
+          manutenciones: manutencionesTotal,
+          manutencion: round2(manutencionBase * factor),
+          noches: nochesTotal,
+          alojamientoMax: round2(alojamientoBase * factor),
+          km: plantilla.kmAmount,
+          irpfSujeto,
+          residenciaEventual: plantilla.residenciaEventual
+        }));
+      }
+    });
+
+    if (opciones.ordenarPor) {
+      return ordenarComparativa(filas, opciones.ordenarPor, opciones.descendente);
+    }
+    return filas;
+  }
+
+  /**
+   * Ordena (copia) las filas de la tabla comparativa por un campo.
+   * Los campos de texto se comparan con localeCompare('es').
+   * @param {Array<Object>} filas
+   * @param {string} campo - p.ej. 'total', 'manutencion', 'pais'
+   * @param {boolean} [descendente=false]
+   * @returns {Array<Object>}
+   */
+  function ordenarComparativa(filas, campo, descendente = false) {
+    const signo = descendente ? -1 : 1;
+    return (filas || []).slice().sort((a, b) => {
+      const va = a[campo];
+      const vb = b[campo];
+      const cmp = (typeof va === 'string' || typeof vb === 'string')
+        ? String(va || '').localeCompare(String(vb || ''), 'es')
+        : (Number(va) || 0) - (Number(vb) || 0);
+      return cmp * signo || a.paisIndex - b.paisIndex;
+    });
+  }
+
+  /**
+   * Ejecuta el comparador con los datos de una ficha DOM.
+   * @param {HTMLElement} despEl
+   * @param {Object} [opciones] - Ver compararEscenarios
+   * @returns {Array<Object>}
+   */
+  function compararFicha(despEl, opciones = {}) {
+    const data = window.cogeDatosDesp?.collectDataFromFicha?.(despEl);
+    if (!data) return [];
+    return compararEscenarios(buildCalcInput(data, getKmTarifa(data.raw.fechaIda)), opciones);
+  }
+
+  // ---------------------------------------------------------------------------
+  // 2.6 Exportación API del Wrapper
   // ---------------------------------------------------------------------------
 
   window.calculoDesp = window.calculoDesp || {};
@@ -1556,6 +1851,11 @@ window.calculoDesp._daysBetween = daysBetween;
 
   window.calculoDesp.parseNumericLoose = window.calculoDesp.parseNumber;
 
+  // Comparador de escenarios (país × normativa)
+  window.calculoDesp.compararEscenarios = compararEscenarios;
+  window.calculoDesp.compararFicha = compararFicha;
+  window.calculoDesp.ordenarComparativa = ordenarComparativa;
+
   // Exponer helpers para testing
   window.calculoDesp._buildSalidaData = buildSalidaData;
   window.calculoDesp._buildSegmentInputs = buildSegmentInputs;
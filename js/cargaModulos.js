@@ -0,0 +1,182 @@
+/**
+ * cargaModulos.js
+ * ===============
+ * Carga bajo demanda de los módulos propios de cada tipo de liquidación.
+ *
+ * Los módulos que solo usa un modo (AECC, desplazamiento especial) no se
+ * incluyen en index.html: tipoLiquidacion los pide al aplicar el modo y se
+ * insertan como <script> clásicos (conservan sus globales y su init propio).
+ * En tiempo ocioso se precargan en la caché HTTP, sin ejecutarlos, los del
+ * modo que probablemente se elija a continuación.
+ *
+ * @module cargaModulos
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // CONFIGURACIÓN
+  // =========================================================================
+
+  /**
+   * Módulos cargables bajo demanda.
+   * src: ruta del script; global: objeto que exporta al ejecutarse.
+   */
+  const MODULOS = {
+    uiDesplazamientoAecc: { src: 'js/uiDesplazamientoAecc.js', global: 'uiDesplazamientoAecc' },
+    uiDesplazamientoEspecial: { src: 'js/uiDesplazamientoEspecial.js', global: 'uiDesplazamientoEspecial' }
+  };
+
+  /** Módulos bajo demanda que necesita cada tipo de liquidación. */
+  const MODULOS_POR_TIPO = {
+    DESPL: [],
+    CONGR: [],
+    HONOR: [],
+    AECC: ['uiDesplazamientoAecc'],
+    GNRAL: ['uiDesplazamientoEspecial']
+  };
+
+  /** Clave de localStorage con el último tipo elegido (modo probable). */
+  const CLAVE_ULTIMO_TIPO = 'sgtri.ultimoTipoLiquidacion';
+
+  // =========================================================================
+  // ESTADO
+  // =========================================================================
+
+  /** nombre → Promise de carga (se reutiliza en llamadas sucesivas) */
+  const cargas = new Map();
+  /** URLs ya pedidas con <link rel="prefetch"> */
+  const precargados = new Set();
+
+  // =========================================================================
+  // CARGA
+  // =========================================================================
+
+  /**
+   * Carga un módulo insertando su <script>. Si ya está cargado (o su global
+   * existe porque index.html lo incluye) resuelve sin volver a pedirlo.
+   * La carga se traza como 'modulo.<nombre>' ('.precargado' si se pidió antes
+   * con prefetch).
+   * @param {string} nombre - Clave de MODULOS
+   * @returns {Promise<Object>} Objeto global del módulo
+   */
+  function cargar(nombre) {
+    const mod = MODULOS[nombre];
+    if (!mod) return Promise.reject(new Error(`[cargaModulos] Módulo desconocido: ${nombre}`));
+    if (global[mod.global]) return Promise.resolve(global[mod.global]);
+    if (cargas.has(nombre)) return cargas.get(nombre);
+
+    const traza = global.trazas?.inicio();
+    const promesa = new Promise((resolve, reject) => {
+      const script = document.createElement('script');
+      script.src = mod.src;
+      script.async = false;
+      script.onload = () => {
+        global.trazas?.fin(`modulo.${nombre}${precargados.has(mod.src) ? '.precargado' : ''}`, traza);
+        resolve(global[mod.global]);
+      };
+      script.onerror = () => {
+        cargas.delete(nombre);
+        reject(new Error(`[cargaModulos] No se pudo cargar ${mod.src}`));
+      };
+      document.head.appendChild(script);
+    });
+
+    cargas.set(nombre, promesa);
+    return promesa;
+  }
+
+  /**
+   * Carga los módulos que necesita un tipo de liquidación.
+   * @param {string} tipo - Tipo normalizado (DESPL, CONGR, HONOR, AECC, GNRAL)
+   * @returns {Promise<string[]>} Nombres de los módulos del tipo
+   */
+  function cargarTipo(tipo) {
+    const nombres = MODULOS_POR_TIPO[tipo] || [];
+    return Promise.all(nombres.map(cargar)).then(() => nombres);
+  }
+
+  /**
+   * Indica si un módulo ya está disponible.
+   * @param {string} nombre
+   * @returns {boolean}
+   */
+  function estaCargado(nombre) {
+    const mod = MODULOS[nombre];
+    return !!(mod && global[mod.global]);
+  }
+
+  // =========================================================================
+  // PRECARGA EN TIEMPO OCIOSO
+  // =========================================================================
+
+  function enOcio(fn) {
+    if (typeof global.requestIdleCallback === 'function') {
+      global.requestIdleCallback(fn, { timeout: 2000 });
+    } else {
+      setTimeout(fn, 200);
+    }
+  }
+
+  /**
+   * Descarga (sin ejecutar) los módulos de un tipo para que su carga
+   * posterior salga de la caché.
+   * @param {string} tipo
+   */
+  function precargarTipo(tipo) {
+    (MODULOS_POR_TIPO[tipo] || []).forEach(nombre => {
+      const mod = MODULOS[nombre];
+      if (estaCargado(nombre) || cargas.has(nombre) || precargados.has(mod.src)) return;
+      const link = document.createElement('link');
+      link.rel = 'prefetch';
+      link.as = 'script';
+      link.href = mod.src;
+      document.head.appendChild(link);
+      precargados.add(mod.src);
+    });
+  }
+
+  /**
+   * Programa la precarga del tipo probable en el próximo periodo ocioso.
+   * @param {string} [tipo] - Por defecto, el último tipo elegido
+   */
+  function precargarEnOcio(tipo) {
+    const probable = tipo || getUltimoTipo();
+    if (!probable) return;
+    enOcio(() => precargarTipo(probable));
+  }
+
+  function getUltimoTipo() {
+    try {
+      return global.localStorage?.getItem(CLAVE_ULTIMO_TIPO) || null;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  /**
+   * Recuerda el tipo elegido como modo probable de la próxima sesión.
+   * @param {string} tipo
+   */
+  function recordarTipo(tipo) {
+    try {
+      global.localStorage?.setItem(CLAVE_ULTIMO_TIPO, tipo);
+    } catch (e) { /* almacenamiento no disponible */ }
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.cargaModulos = {
+    MODULOS,
+    MODULOS_POR_TIPO,
+    cargar,
+    cargarTipo,
+    estaCargado,
+    precargarTipo,
+    precargarEnOcio,
+    recordarTipo
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,330 @@
+/**
+ * estadoFormulario.js
+ * ===================
+ * Estado normalizado del formulario en memoria.
+ *
+ * Cada sección de la liquidación (beneficiario, pago, proyecto, cada ficha de
+ * desplazamiento...) se guarda ya recopilada. Los eventos de edición y los
+ * cambios estructurales del DOM solo marcan como sucia la sección afectada;
+ * al leer, se vuelven a recopilar únicamente las secciones sucias. Así la
+ * exportación, la validación y el PDF cuestan O(cambios) en lugar de recorrer
+ * el formulario entero.
+ *
+ * Las secciones no cacheadas (cache: false) se leen siempre de su fuente: son
+ * las que ya viven en memoria (imputación, resultado) o las que otros módulos
+ * escriben por código sin disparar eventos (evento/congreso).
+ *
+ * Los valores devueltos se comparten entre lecturas: no deben modificarse.
+ *
+ * @module estadoFormulario
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // ESTADO
+  // =========================================================================
+
+  /** nombre → { recopilar, cache, depende, valor, sucio } */
+  const secciones = new Map();
+
+  /**
+   * Colección de fichas de desplazamiento.
+   * fichas: id → { campos, sucio, calculados, valor }
+   */
+  const coleccion = {
+    definicion: null,
+    orden: null,
+    fichas: new Map(),
+    valor: null
+  };
+
+  const estadisticas = { lecturas: 0, recopilaciones: {} };
+
+  function contar(nombre) {
+    estadisticas.recopilaciones[nombre] = (estadisticas.recopilaciones[nombre] || 0) + 1;
+  }
+
+  // =========================================================================
+  // REGISTRO DE SECCIONES
+  // =========================================================================
+
+  /**
+   * Registra una sección.
+   * @param {string} nombre - Clave en la estructura de recopilarTodo()
+   * @param {Function} recopilar - () → valor de la sección
+   * @param {Object} [opciones]
+   * @param {boolean} [opciones.cache=true] - false: se recopila en cada lectura
+   * @param {string[]} [opciones.depende=[]] - Secciones cuyo cambio también la ensucia
+   */
+  function registrarSeccion(nombre, recopilar, opciones = {}) {
+    secciones.set(nombre, {
+      recopilar,
+      cache: opciones.cache !== false,
+      depende: opciones.depende || [],
+      valor: undefined,
+      sucio: true
+    });
+  }
+
+  /**
+   * Registra la colección de fichas de desplazamiento.
+   * @param {string} nombre - Clave en la estructura de recopilarTodo()
+   * @param {Object} definicion
+   * @param {Function} definicion.listarIds - () → ids en orden de pantalla
+   * @param {Function} definicion.recopilarCampos - (id) → campos editables de la ficha
+   * @param {Function} definicion.calculados - (id) → objeto de cálculo actual (por referencia)
+   * @param {Function} definicion.componer - (id, campos, calculados) → entrada serializada
+   */
+  function registrarColeccion(nombre, definicion) {
+    coleccion.definicion = { nombre, ...definicion };
+    coleccion.orden = null;
+    coleccion.fichas.clear();
+    coleccion.valor = null;
+  }
+
+  // =========================================================================
+  // INVALIDACIÓN
+  // =========================================================================
+
+  /**
+   * Marca como sucia una sección, una ficha ('ficha:<id>') o el orden de
+   * fichas ('orden').
+   * @param {string} clave
+   */
+  function invalidar(clave) {
+    if (clave === 'orden') {
+      coleccion.orden = null;
+      return;
+    }
+    if (clave.indexOf('ficha:') === 0) {
+      const ficha = coleccion.fichas.get(clave.slice(6));
+      if (ficha) ficha.sucio = true;
+      return;
+    }
+    const seccion = secciones.get(clave);
+    if (!seccion) return;
+    seccion.sucio = true;
+    secciones.forEach((otra, nombre) => {
+      if (otra.depende.includes(clave) && !otra.sucio) invalidar(nombre);
+    });
+  }
+
+  /** Marca todo como sucio (restauración, limpieza, cambio de modo). */
+  function invalidarTodo() {
+    secciones.forEach(s => { s.sucio = true; });
+    coleccion.orden = null;
+    coleccion.fichas.forEach(f => { f.sucio = true; });
+  }
+
+  // =========================================================================
+  // LECTURA
+  // =========================================================================
+
+  /**
+   * Lee una sección recopilándola solo si está sucia.
+   * @param {string} nombre
+   * @returns {*}
+   */
+  function leer(nombre) {
+    if (coleccion.definicion && coleccion.definicion.nombre === nombre) {
+      return leerColeccion();
+    }
+    const seccion = secciones.get(nombre);
+    if (!seccion) return undefined;
+    if (!seccion.cache) {
+      contar(nombre);
+      return seccion.recopilar();
+    }
+    if (seccion.sucio) {
+      seccion.valor = seccion.recopilar();
+      seccion.sucio = false;
+      contar(nombre);
+    }
+    return seccion.valor;
+  }
+
+  /**
+   * Lee la colección de fichas. Cada entrada se recompone solo si cambian
+   * sus campos o su objeto de cálculo, y el array se conserva si ninguna
+   * entrada ha cambiado.
+   * @returns {Array}
+   */
+  function leerColeccion() {
+    const def = coleccion.definicion;
+    if (!coleccion.orden) {
+      coleccion.orden = def.listarIds().map(String);
+      contar('orden');
+      coleccion.fichas.forEach((_, id) => {
+        if (!coleccion.orden.includes(id)) coleccion.fichas.delete(id);
+      });
+    }
+
+    let cambia = !coleccion.valor || coleccion.valor.length !== coleccion.orden.length;
+    const valor = coleccion.orden.map((id, i) => {
+      let ficha = coleccion.fichas.get(id);
+      if (!ficha) {
+        ficha = { campos: null, sucio: true, calculados: undefined, valor: null };
+        coleccion.fichas.set(id, ficha);
+      }
+      let recompone = false;
+      if (ficha.sucio) {
+        ficha.campos = def.recopilarCampos(id);
+        ficha.sucio = false;
+        recompone = true;
+        contar('ficha');
+      }
+      const calculados = def.calculados(id);
+      if (calculados !== ficha.calculados) {
+        ficha.calculados = calculados;
+        recompone = true;
+      }
+      if (recompone || !ficha.valor) {
+        ficha.valor = def.componer(id, ficha.campos, calculados);
+      }
+      if (!cambia && coleccion.valor[i] !== ficha.valor) cambia = true;
+      return ficha.valor;
+    });
+
+    if (cambia) coleccion.valor = valor;
+    return coleccion.valor;
+  }
+
+  /**
+   * Todas las secciones registradas en un objeto nuevo (las secciones en sí
+   * se reutilizan si no han cambiado).
+   * @returns {Object}
+   */
+  function instantanea() {
+    estadisticas.lecturas++;
+    const resultado = {};
+    secciones.forEach((_, nombre) => { resultado[nombre] = leer(nombre); });
+    if (coleccion.definicion) resultado[coleccion.definicion.nombre] = leerColeccion();
+    return resultado;
+  }
+
+  // =========================================================================
+  // SEGUIMIENTO DE CAMBIOS EN EL DOM
+  // =========================================================================
+
+  /** Sección por id de campo (prefijo o id exacto) */
+  const SECCION_POR_ID = [
+    ['nombre-benef', 'beneficiario'], ['dni', 'beneficiario'], ['entidad', 'beneficiario'], ['categoria', 'beneficiario'],
+    ['tipo-pago', 'pago'], ['iban', 'pago'], ['iban-ext', 'pago'], ['swift', 'pago'], ['numero-tarjeta', 'pago'],
+    ['tipoProyecto', 'proyecto'], ['responsable', 'proyecto'], ['organica', 'proyecto'], ['referencia', 'proyecto'],
+    ['honorarios-', 'honorarios'],
+    ['evento-', 'evento'], ['descuento-manut-congreso', 'evento'],
+    ['financiacion-maxima', 'ajustes'],
+    ['fecha-firma-', 'fechaFirma'],
+    ['aecc-', 'desplazamientoAECC']
+  ];
+
+  /** Sección por contenedor (el más cercano gana) */
+  const SECCION_POR_CONTENEDOR = [
+    ['.desplazamiento-especial', () => 'desplazamientoEspecial'],
+    ['.desplazamiento-grupo', el => `ficha:${el.dataset.desplazamientoId}`],
+    ['#vehiculo-particular-container', () => 'vehiculo'],
+    ['#otros-descuentos-container', () => 'ajustes'],
+    ['#form-aecc-desplazamiento', () => 'desplazamientoAECC'],
+    ['#imputacion-section', () => 'imputacion'],
+    ['#fecha-firma-section', () => 'fechaFirma']
+  ];
+
+  /**
+   * Clave de la sección a la que pertenece un elemento, o null.
+   * @param {Element} el
+   * @returns {string|null}
+   */
+  function claveDeElemento(el) {
+    if (!el || el.nodeType !== 1) return null;
+    for (const [selector, clave] of SECCION_POR_CONTENEDOR) {
+      const cont = el.closest(selector);
+      if (cont) return clave(cont);
+    }
+    const id = el.id || el.name || '';
+    for (const [prefijo, seccion] of SECCION_POR_ID) {
+      if (id === prefijo || (prefijo.endsWith('-') && id.indexOf(prefijo) === 0)) return seccion;
+    }
+    return null;
+  }
+
+  /**
+   * Invalida la sección de un elemento cuyo valor se ha cambiado por código.
+   * @param {Element} el
+   */
+  function invalidarElemento(el) {
+    const clave = claveDeElemento(el);
+    if (clave) invalidar(clave); else invalidarTodo();
+  }
+
+  /** input/change/focusout: el formateo al salir del campo también cambia valores */
+  function onEdicion(e) {
+    const clave = claveDeElemento(e.target);
+    if (clave) {
+      invalidar(clave);
+    } else if (e.target && /^(INPUT|SELECT|TEXTAREA)$/.test(e.target.tagName)) {
+      // Campo sin sección conocida: invalidar todo es lo seguro
+      invalidarTodo();
+    }
+  }
+
+  /** Altas y bajas de fichas, líneas de gastos, descuentos, etc. */
+  function onMutaciones(registros) {
+    registros.forEach(r => {
+      if (r.target.id === 'desplazamientos-container') {
+        // Alta/baja de fichas normales o del desplazamiento especial.
+        // Un id puede reutilizarse tras resetCounter(): se olvida la ficha.
+        invalidar('orden');
+        invalidar('desplazamientoEspecial');
+        [...r.addedNodes, ...r.removedNodes].forEach(n => {
+          const id = n.dataset?.desplazamientoId;
+          if (id) coleccion.fichas.delete(String(id));
+        });
+        return;
+      }
+      const clave = claveDeElemento(r.target);
+      if (clave) invalidar(clave);
+    });
+  }
+
+  function iniciarSeguimiento() {
+    ['input', 'change', 'focusout'].forEach(tipo => {
+      document.addEventListener(tipo, onEdicion, true);
+    });
+    if (typeof MutationObserver === 'function' && document.body) {
+      new MutationObserver(onMutaciones).observe(document.body, { childList: true, subtree: true });
+    }
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', iniciarSeguimiento);
+  } else {
+    iniciarSeguimiento();
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.estadoFormulario = {
+    registrarSeccion,
+    registrarColeccion,
+    invalidar,
+    invalidarTodo,
+    invalidarElemento,
+    leer,
+    instantanea,
+    getEstadisticas: () => ({
+      lecturas: estadisticas.lecturas,
+      recopilaciones: { ...estadisticas.recopilaciones }
+    }),
+    resetEstadisticas: () => {
+      estadisticas.lecturas = 0;
+      estadisticas.recopilaciones = {};
+    },
+
+    // Para testing
+    _claveDeElemento: claveDeElemento
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -7,6 +7,7 @@
  * @module formLogic
  * @requires limpiaDatos
  * @requires validaciones
+ * @requires validacionDatos
  * @requires confirmDialog
  * @requires uiPagos
  * @requires uiDesplazamientos
@@ -37,7 +38,9 @@ document.addEventListener('DOMContentLoaded', () => {
   // CARGA DE DATOS JSON
   // =========================================================================
 
-  fetch('assets/data/datos.json')
+  // utils.cargarDatos() ya está en curso desde que se ejecutó utils.js (y el
+  // navegador lo precarga en paralelo al análisis de los scripts)
+  const cargarDatos = window.utils?.cargarDatos || (() => fetch('assets/data/datos.json')
     .then(response => {
       if (!response.ok) throw new Error('No se pudo cargar el JSON');
       return response.json();
@@ -45,39 +48,28 @@ document.addEventListener('DOMContentLoaded', () => {
     .then(data => {
       // Exponer datos globalmente para otros módulos
       try { window.__sgtriDatos = data; } catch (e) { /* ignore */ }
+      return data;
+    }));
+  const llenarSelect = window.utils?.llenarSelect;
 
-      // 1️⃣ Rellenar "En calidad de"
-      if (categoriaSelect && data.categorias) {
-        data.categorias.forEach(([text, value], index) => {
-          const option = document.createElement('option');
-          option.value = value;
-          option.textContent = text;
-          if (index === 0) option.selected = true;
-          categoriaSelect.appendChild(option);
-        });
-      }
-
-      // 2️⃣ Rellenar "Pago en"
-      if (tipoPagoSelect && data.pagos) {
-        data.pagos.forEach(([text, value], index) => {
-          const option = document.createElement('option');
-          option.value = value;
-          option.textContent = text;
-          if (index === 0) option.selected = true;
-          tipoPagoSelect.appendChild(option);
-        });
-      }
-
-      // 3️⃣ Rellenar "Tipo de proyecto"
-      if (tipoProyecto && data.tiposProyecto) {
-        data.tiposProyecto.forEach(([text, value], index) => {
-          const option = document.createElement('option');
-          option.value = value;
-          option.textContent = text;
-          if (index === 0) option.selected = true;
-          tipoProyecto.appendChild(option);
-        });
-      }
+  cargarDatos()
+    .then(data => {
+      // 1️⃣-3️⃣ Rellenar "En calidad de", "Pago en" y "Tipo de proyecto"
+      //    (un fragmento por select: una sola inserción en el DOM)
+      [
+        [categoriaSelect, data.categorias],
+        [tipoPagoSelect, data.pagos],
+        [tipoProyecto, data.tiposProyecto]
+      ].forEach(([select, opciones]) => {
+        if (!select || !opciones) return;
+        if (llenarSelect) {
+          llenarSelect(select, opciones);
+        } else {
+          opciones.forEach(([text, value]) => select.appendChild(new Option(text, value)));
+        }
+        select.selectedIndex = 0;
+      });
+      window.trazas?.arranque('selectsPoblados');
 
       // 4️⃣ Texto informativo inicial
       actualizarTextoDecreto(tipoProyecto ? tipoProyecto.value : '');
@@ -202,6 +194,8 @@ document.addEventListener('DOMContentLoaded', () => {
           });
         });
       }
+
+      window.trazas?.arranque('interactivo');
     })
     .catch(error => console.error('Error cargando datos del JSON:', error));
 
@@ -249,102 +243,22 @@ document.addEventListener('DOMContentLoaded', () => {
   // =========================================================================
 
   /**
-   * Calcula el descuento por comidas incluidas en inscripción de congreso.
+   * Lee los campos del congreso y propaga el descuento por comidas incluidas
+   * en la inscripción. El cálculo lo hace el grafo de resultadoLiquidacion:
+   * solo se recalculan los nodos afectados (descuento, IRPF del desplazamiento
+   * asociado, resultado e imputación).
    */
   function computeDescuentoManutencion() {
+    const rl = window.resultadoLiquidacion;
+    if (!rl || typeof rl.actualizarCongreso !== 'function') return;
     try {
-      const numEl = document.getElementById('evento-num-comidas');
-      const hidden = document.getElementById('descuento-manut-congreso');
-      const msg = document.getElementById('descuento-manut-message');
-      const msgAmount = document.getElementById('descuento-manut-amount');
-
-      if (!numEl || !hidden) return;
-
-      const n = Number(numEl.value) || 0;
-      if (n <= 0) {
-        hidden.value = '0.00';
-        if (msg) msg.style.display = 'none';
-        if (msgAmount) msgAmount.textContent = '0,00 €';
-        return;
-      }
-
-      const desplazamientos = Array.from(document.querySelectorAll('.desplazamiento-grupo'));
-      if (desplazamientos.length === 0) {
-        hidden.value = '0.00';
-        if (msg) msg.style.display = '';
-        if (msgAmount) msgAmount.textContent = '0,00 €';
-        return;
-      }
-
-      let paisIndex = 0;
-      if (desplazamientos.length === 1) {
-        const paisSelect = desplazamientos[0].querySelector('select[id^="pais-destino"]');
-        if (paisSelect) paisIndex = paisSelect.selectedIndex >= 0 ? paisSelect.selectedIndex : 0;
-      } else {
-        const eventoSelect = document.getElementById('evento-asociado');
-        if (!eventoSelect) { 
-          hidden.value = '0.00'; 
-          if (msg) msg.style.display = '';
-          if (msgAmount) msgAmount.textContent = '0,00 €';
-          return; 
-        }
-        const valSel = eventoSelect.value || '';
-        const m = valSel.match(/^desp(\d+)$/);
-        if (!m) { 
-          hidden.value = '0.00'; 
-          if (msg) msg.style.display = '';
-          if (msgAmount) msgAmount.textContent = '0,00 €';
-          return; 
-        }
-        const idx = parseInt(m[1], 10) - 1;
-        const target = desplazamientos[idx];
-        if (!target) { 
-          hidden.value = '0.00'; 
-          if (msg) msg.style.display = '';
-          if (msgAmount) msgAmount.textContent = '0,00 €';
-          return; 
-        }
-        const paisSelect = target.querySelector('select[id^="pais-destino"]');
-        if (paisSelect) paisIndex = paisSelect.selectedIndex >= 0 ? paisSelect.selectedIndex : 0;
-      }
-
-      // Obtener precio de manutención según normativa y país
-      const tipoProj = (document.getElementById('tipoProyecto') || {}).value || '';
-      const datos = window.__sgtriDatos;
-      
-      if (!datos || !datos.dietasPorPais) {
-        hidden.value = '0.00';
-        if (msg) msg.style.display = '';
-        if (msgAmount) msgAmount.textContent = '0,00 €';
-        return;
-      }
-
-      // Determinar normativa
-      const rdList = datos.normativasPorTipoProyecto?.rd || [];
-      const normativa = rdList.includes(tipoProj) ? 'rd' : 'decreto';
-      
-      // Obtener tabla de precios según normativa
-      const tablas = normativa === 'rd'
-        ? datos.dietasPorPais.rd462_2002
-        : datos.dietasPorPais.decreto42_2025;
-      
-      if (!tablas || !tablas.manutencion) {
-        hidden.value = '0.00';
-        if (msg) msg.style.display = '';
-        if (msgAmount) msgAmount.textContent = '0,00 €';
-        return;
-      }
-
-      // Obtener precio de manutención para el país
-      const precio = Number(tablas.manutencion[paisIndex]) || 50.55;
-      const descuento = Math.round((precio * 0.5 * n + Number.EPSILON) * 100) / 100;
-      hidden.value = descuento.toFixed(2);
-      
-      // Mostrar mensaje siempre que n > 0 (ya verificado arriba)
-      const txt = descuento.toFixed(2).replace('.', ',') + ' €';
-      if (msgAmount) msgAmount.textContent = txt;
-      if (msg) msg.style.display = '';
-    } catch (e) { 
+      rl.actualizarCongreso({
+        comidas: (document.getElementById('evento-num-comidas') || {}).value,
+        asociado: (document.getElementById('evento-asociado') || {}).value,
+        tipoProyecto: (document.getElementById('tipoProyecto') || {}).value,
+        revisar: true
+      });
+    } catch (e) {
       console.warn('[computeDescuentoManutencion] Error:', e);
     }
   }
@@ -353,37 +267,25 @@ document.addEventListener('DOMContentLoaded', () => {
   window.computeDescuentoManutencion = computeDescuentoManutencion;
 
   /**
-   * Recalcula todos los desplazamientos (para actualizar IRPF tras cambio en congreso).
+   * Propaga el cambio de un único campo del congreso.
+   * @param {Object} cambios - Ver resultadoLiquidacion.actualizarCongreso
    */
-  function recalcularTodosDesplazamientos() {
-    if (!window.calculoDesp || typeof window.calculoDesp.calculaDesplazamientoFicha !== 'function') return;
-    
-    const desplazamientos = document.querySelectorAll('.desplazamiento-grupo');
-    desplazamientos.forEach(desp => {
-      try {
-        window.calculoDesp.calculaDesplazamientoFicha(desp);
-      } catch (e) { /* ignore */ }
-    });
+  function actualizarCongreso(cambios) {
+    window.resultadoLiquidacion?.actualizarCongreso?.(cambios);
   }
 
   // Listeners para campos de congreso
   const eventoNumEl = document.getElementById('evento-num-comidas');
   if (eventoNumEl) {
-    eventoNumEl.addEventListener('input', () => {
-      computeDescuentoManutencion();
-      recalcularTodosDesplazamientos();
-    });
-    eventoNumEl.addEventListener('change', () => {
-      computeDescuentoManutencion();
-      recalcularTodosDesplazamientos();
-    });
+    const onComidas = () => actualizarCongreso({ comidas: eventoNumEl.value });
+    eventoNumEl.addEventListener('input', onComidas);
+    eventoNumEl.addEventListener('change', onComidas);
   }
 
   const eventoSel = document.getElementById('evento-asociado');
   if (eventoSel) {
     eventoSel.addEventListener('change', () => {
-      computeDescuentoManutencion();
-      recalcularTodosDesplazamientos();
+      actualizarCongreso({ asociado: eventoSel.value });
       // Revalidar fechas del evento al cambiar desplazamiento asociado
       if (typeof validarFechasEvento === 'function') {
         validarFechasEvento();
@@ -393,202 +295,520 @@ document.addEventListener('DOMContentLoaded', () => {
 
   // Listener para tipo de proyecto (afecta precio de manutención)
   if (tipoProyecto) {
-    tipoProyecto.addEventListener('change', computeDescuentoManutencion);
-    tipoProyecto.addEventListener('input', computeDescuentoManutencion);
+    const onTipoProyecto = () => actualizarCongreso({ tipoProyecto: tipoProyecto.value });
+    tipoProyecto.addEventListener('change', onTipoProyecto);
+    tipoProyecto.addEventListener('input', onTipoProyecto);
   }
 
   // Cálculo inicial
   try { computeDescuentoManutencion(); } catch (e) { /* ignore */ }
 
   // =========================================================================
-  // DELEGACIÓN GLOBAL DE EVENTOS DE INPUT
+  // REGISTRO DE COMPORTAMIENTO DE CAMPOS
   // =========================================================================
+  //
+  // Cada tipo de campo declara sus manejadores por evento (input, blur,
+  // focusin, keydown) en CAMPOS. El tipo se lee del atributo data-field; si
+  // el elemento no lo declara se deduce una sola vez de su id/clases
+  // (REGLAS_CAMPO) y se anota en data-field. Así cada evento se resuelve con
+  // una búsqueda directa en vez de recorrer una cadena de comprobaciones.
+
+  const applyWithCaret = ld.applyWithCaretPreserved || ((inp, fn) => { inp.value = fn(inp.value); });
+
+  // -------------------------------------------------------------------------
+  // Validadores (validacionDatos)
+  // -------------------------------------------------------------------------
+
+  const vd = window.validacionDatos || {};
+
+  /** Validadores ya avisados como ausentes (un error por validador) */
+  const validadoresAusentes = new Set();
 
   /**
-   * Handler delegado para sanitización de inputs en tiempo real.
+   * Registra en consola que falta un validador de validacionDatos. Sin él no
+   * se comprueba nada: no debe pasar inadvertido.
+   * @param {string} nombre
    */
-  document.addEventListener('input', (e) => {
-    const el = e.target;
-    if (!el || el.tagName !== 'INPUT') return;
-
-    const applyWithCaret = ld.applyWithCaretPreserved || ((inp, fn) => { inp.value = fn(inp.value); });
+  function avisarValidadorAusente(nombre) {
+    if (validadoresAusentes.has(nombre)) return;
+    validadoresAusentes.add(nombre);
+    console.error(`[formLogic] validacionDatos.${nombre} no está disponible: el campo no se valida.`);
+  }
 
-    // Nombre beneficiario
-    if (el.id === 'nombre-benef') {
-      const v = ld.sanitizeGeneralText ? ld.sanitizeGeneralText(el.value, 70) : el.value;
-      if (v !== el.value) el.value = v;
-      return;
+  /**
+   * Muestra u oculta el aviso de un campo y marca/desmarca field-error.
+   * @param {HTMLElement} el
+   * @param {HTMLElement|null} warnWrapper
+   * @param {boolean} esValida
+   */
+  function marcarValidez(el, warnWrapper, esValida) {
+    if (warnWrapper) {
+      warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
+    }
+    if (esValida) {
+      el.classList.remove('field-error');
+    } else {
+      el.classList.add('field-error');
     }
+  }
 
-    // Entidad contratante
-    if (el.id === 'entidad') {
-      const v = ld.sanitizeGeneralText ? ld.sanitizeGeneralText(el.value, 50) : el.value;
+  // -------------------------------------------------------------------------
+  // Formateadores en vivo (input)
+  // -------------------------------------------------------------------------
+
+  /**
+   * Sanitizador de texto general con longitud máxima (sin preservar cursor).
+   * @param {number} max
+   * @returns {Function} Manejador (el) => void
+   */
+  function textoGeneral(max) {
+    return (el) => {
+      const v = ld.sanitizeGeneralText ? ld.sanitizeGeneralText(el.value, max) : el.value;
       if (v !== el.value) el.value = v;
-      return;
-    }
+    };
+  }
 
-    // DNI
-    if (el.id === 'dni') {
-      if (ld.sanitizeDNI) applyWithCaret(el, (v) => ld.sanitizeDNI(v, 20));
-      return;
-    }
+  function inputDNI(el) {
+    if (ld.sanitizeDNI) applyWithCaret(el, (v) => ld.sanitizeDNI(v, 20));
+  }
 
-    // IBAN
-    if (el.id === 'iban' || el.id === 'iban-ext' || el.classList.contains('iban')) {
-      applyWithCaret(el, (valIban, selStart) => {
-        const v = valIban || '';
-        const attrMax = parseInt(el.getAttribute('data-raw-max')) || parseInt(el.getAttribute('maxlength')) || 34;
-        if (selStart > 0 && v[selStart - 1] === ' ') {
-          const cleaned = v.replace(/[^A-Za-z0-9 ]/g, '').toUpperCase();
-          const onlyAlnum = cleaned.replace(/[^A-Za-z0-9]/g, '');
-          const limitedAlnum = onlyAlnum.slice(0, attrMax);
-          if (onlyAlnum.length <= attrMax) return cleaned.toUpperCase();
-          let result = '';
-          let taken = 0;
-          for (let ch of cleaned) {
-            if (/[A-Za-z0-9]/.test(ch)) {
-              if (taken < limitedAlnum.length) { result += ch; taken++; } else break;
-            } else {
-              result += ch;
-            }
+  function inputIBAN(el) {
+    applyWithCaret(el, (valIban, selStart) => {
+      const v = valIban || '';
+      const attrMax = parseInt(el.getAttribute('data-raw-max')) || parseInt(el.getAttribute('maxlength')) || 34;
+      if (selStart > 0 && v[selStart - 1] === ' ') {
+        const cleaned = v.replace(/[^A-Za-z0-9 ]/g, '').toUpperCase();
+        const onlyAlnum = cleaned.replace(/[^A-Za-z0-9]/g, '');
+        const limitedAlnum = onlyAlnum.slice(0, attrMax);
+        if (onlyAlnum.length <= attrMax) return cleaned.toUpperCase();
+        let result = '';
+        let taken = 0;
+        for (let ch of cleaned) {
+          if (/[A-Za-z0-9]/.test(ch)) {
+            if (taken < limitedAlnum.length) { result += ch; taken++; } else break;
+          } else {
+            result += ch;
           }
-          return result.toUpperCase();
         }
-        const raw = v.replace(/[^A-Za-z0-9]/g, '').toUpperCase().slice(0, attrMax);
-        const parts = raw.match(/.{1,4}/g) || [];
-        return parts.join(' ').toUpperCase();
-      });
-      return;
-    }
+        return result.toUpperCase();
+      }
+      const raw = v.replace(/[^A-Za-z0-9]/g, '').toUpperCase().slice(0, attrMax);
+      const parts = raw.match(/.{1,4}/g) || [];
+      return parts.join(' ').toUpperCase();
+    });
+  }
 
-    // SWIFT/BIC
-    if (el.id === 'swift' || el.classList.contains('swift')) {
-      applyWithCaret(el, (valSwift) => {
-        return String(valSwift || '').replace(/[^A-Za-z0-9]/g, '').toUpperCase().slice(0, 11);
-      });
-      return;
-    }
+  function inputSWIFT(el) {
+    applyWithCaret(el, (valSwift) => {
+      return String(valSwift || '').replace(/[^A-Za-z0-9]/g, '').toUpperCase().slice(0, 11);
+    });
+  }
 
-    // Número de tarjeta
-    if (el.id === 'numero-tarjeta' || el.classList.contains('card-number')) {
-      if (ld.processGroupedInput) {
-        ld.processGroupedInput(el, { groupSize: 4, sep: ' ', maxRawLen: 19, validPattern: '\\d' });
-      }
-      return;
+  function inputTarjeta(el) {
+    if (ld.processGroupedInput) {
+      ld.processGroupedInput(el, { groupSize: 4, sep: ' ', maxRawLen: 19, validPattern: '\\d' });
     }
+  }
 
-    // Responsables
-    if (el.classList.contains('responsable') || /^responsable-/.test(el.name || '')) {
-      const v = ld.sanitizeGeneralText ? ld.sanitizeGeneralText(el.value, 70) : el.value;
-      if (v !== el.value) el.value = v;
-      return;
-    }
+  function inputTextoGeneral(el) {
+    if (ld.sanitizeGeneralText) applyWithCaret(el, (v) => ld.sanitizeGeneralText(v, 90));
+  }
 
-    // Campos de texto general
-    if (el.classList.contains('general-text')) {
-      if (ld.sanitizeGeneralText) applyWithCaret(el, (v) => ld.sanitizeGeneralText(v, 90));
-      return;
-    }
+  function inputTextoExtendido(el) {
+    if (ld.sanitizeExtendedText) applyWithCaret(el, (v) => ld.sanitizeExtendedText(v, 90));
+  }
 
-    // Campos de texto extendido (permite puntuación adicional)
-    if (el.classList.contains('extended-text')) {
-      if (ld.sanitizeExtendedText) applyWithCaret(el, (v) => ld.sanitizeExtendedText(v, 90));
-      return;
-    }
+  function inputOrganica(el) {
+    applyWithCaret(el, (valOrg, selStart) => {
+      const v = valOrg || '';
+      if (selStart > 0 && v[selStart - 1] === '.') {
+        return v.replace(/[^A-Za-z0-9.]/g, '').toUpperCase().slice(0, 20);
+      }
+      const only = v.replace(/[^A-Za-z0-9]/g, '').slice(0, 14).toUpperCase();
+      const parts = only.match(/.{1,2}/g) || [];
+      return parts.join('.');
+    });
+  }
 
-    // Orgánica
-    if (el.classList.contains('organica') || el.id === 'organica' || /^organica-/.test(el.id || '')) {
-      applyWithCaret(el, (valOrg, selStart) => {
-        const v = valOrg || '';
-        if (selStart > 0 && v[selStart - 1] === '.') {
-          return v.replace(/[^A-Za-z0-9.]/g, '').toUpperCase().slice(0, 20);
+  function inputReferencia(el) {
+    if (ld.sanitizeReferencia) applyWithCaret(el, (v) => ld.sanitizeReferencia(v, 50));
+  }
+
+  function inputFecha(el) {
+    applyWithCaret(el, (valFecha, selStart) => {
+      const v = valFecha || '';
+      const cleaned = v.replace(/[^0-9\/]/g, '');
+      if (selStart > 0 && v[selStart - 1] === '/') {
+        const single = cleaned.replace(/\/{2,}/g, '/').replace(/^\//, '');
+        if (single.endsWith('/') && single.length > 1) {
+          const parts = single.split('/');
+          if (parts.length >= 2) {
+            const prev = parts[parts.length - 2] || '';
+            if (prev.length === 1) {
+              parts[parts.length - 2] = prev.padStart(2, '0');
+              return parts.join('/').slice(0, 8);
+            }
+          }
         }
-        const only = v.replace(/[^A-Za-z0-9]/g, '').slice(0, 14).toUpperCase();
-        const parts = only.match(/.{1,2}/g) || [];
-        return parts.join('.');
-      });
-      return;
+        return single.slice(0, 8);
+      }
+      const digits = cleaned.replace(/[^0-9]/g, '');
+      let out = '';
+      if (digits.length <= 2) out = digits;
+      else if (digits.length <= 4) out = digits.slice(0, 2) + '/' + digits.slice(2);
+      else out = digits.slice(0, 2) + '/' + digits.slice(2, 4) + '/' + digits.slice(4, 6);
+      return out.slice(0, 8);
+    });
+  }
+
+  function inputHora(el) {
+    applyWithCaret(el, (valHora) => {
+      const v = valHora || '';
+      const cleaned = v.replace(/[^0-9:]/g, '');
+      const single = cleaned.replace(/:{2,}/g, ':').replace(/^:/, '');
+      const digits = single.replace(/[^0-9]/g, '');
+      if (digits.length <= 2) return digits.slice(0, 2);
+      const hh = digits.slice(0, 2);
+      const mm = digits.slice(2, 4);
+      return (hh + ':' + mm).slice(0, 5);
+    });
+  }
+
+  function inputKm(el) {
+    // Solo permitir dígitos (km es siempre entero)
+    applyWithCaret(el, (valKm) => (valKm || '').replace(/[^0-9]/g, ''));
+  }
+
+  function inputAlojamiento(el) {
+    applyWithCaret(el, (valAloj) => {
+      let s = (valAloj || '').replace(/\./g, ',').replace(/[^0-9,]/g, '');
+      const parts = s.split(',');
+      if (parts.length > 2) s = parts[0] + ',' + parts.slice(1).join('');
+      return s;
+    });
+  }
+
+  function inputDosDigitos(el) {
+    let v = String(el.value || '').replace(/[^0-9]/g, '');
+    if (v.length > 2) v = v.slice(0, 2);
+    el.value = v;
+  }
+
+  // -------------------------------------------------------------------------
+  // Validación y formato al salir (blur)
+  // -------------------------------------------------------------------------
+
+  function blurFecha(el, e) {
+    if (val.handleFechaBlur) val.handleFechaBlur(e);
+    // Después del formateo, validar fechas del evento si corresponde
+    if (el.id === 'evento-del' || el.id === 'evento-al') {
+      validarFechasEvento();
     }
+  }
+
+  function blurHora(el, e) {
+    if (val.handleHoraBlur) val.handleHoraBlur(e);
+  }
+
+  function blurKm(el) {
+    // Formatear con separador de miles
+    const cleaned = (el.value || '').toString().replace(/[^0-9]/g, '');
+    const num = cleaned ? parseInt(cleaned, 10) : NaN;
+    el.value = isNaN(num) ? '' : num.toLocaleString('de-DE') + ' km';
+  }
+
+  function blurAlojamiento(el) {
+    const raw = (el.value || '').toString();
+    if (raw.trim() === '') { el.value = ''; return; }
+    const cleaned = raw.replace(/[^0-9,\.]/g, '').replace(/,/g, '.');
+    const num = parseFloat(cleaned || '0');
+    if (isNaN(num) || num === 0) { el.value = ''; return; }
+    const parts = num.toFixed(2).split('.');
+    parts[0] = Number(parts[0]).toLocaleString('de-DE');
+    el.value = parts[0] + ',' + parts[1] + ' €';
+  }
+
+  function blurDosDigitos(el) {
+    const min = (el.min !== undefined && el.min !== '') ? Number(el.min) : null;
+    const max = (el.max !== undefined && el.max !== '') ? Number(el.max) : null;
+    let v = el.value === '' ? '' : Number(el.value);
+    if (v === '' || isNaN(v)) { el.value = ''; return; }
+    if (min !== null && v < min) v = min;
+    if (max !== null && v > max) v = max;
+    el.value = String(v);
+  }
 
-    // Referencia proyecto
-    if (el.classList.contains('referencia-proyecto') || /^referencia-/.test(el.name || '')) {
-      if (ld.sanitizeReferencia) applyWithCaret(el, (v) => ld.sanitizeReferencia(v, 50));
+  /**
+   * Orgánica del proyecto: 2-7 pares de 2 caracteres separados por puntos,
+   * empezando por "18.".
+   */
+  function blurOrganica(el) {
+    const warnWrapper = document.querySelector('.organica-warn');
+    let valor = (el.value || '').trim();
+    // Si está vacío o incompleto, restaurar a "18."
+    if (valor === '' || valor === '18') {
+      el.value = '18.';
+      valor = '18.';
+    }
+    // Si es solo "18.", no marcar error (el usuario lo completará)
+    if (valor === '18.' || !vd.validarOrganica) {
+      marcarValidez(el, warnWrapper, true);
       return;
     }
+    marcarValidez(el, warnWrapper, vd.validarOrganica(valor));
+  }
 
-    // Fecha (live)
-    if (el.classList.contains('input-fecha')) {
-      applyWithCaret(el, (valFecha, selStart) => {
-        const v = valFecha || '';
-        const cleaned = v.replace(/[^0-9\/]/g, '');
-        if (selStart > 0 && v[selStart - 1] === '/') {
-          const single = cleaned.replace(/\/{2,}/g, '/').replace(/^\//, '');
-          if (single.endsWith('/') && single.length > 1) {
-            const parts = single.split('/');
-            if (parts.length >= 2) {
-              const prev = parts[parts.length - 2] || '';
-              if (prev.length === 1) {
-                parts[parts.length - 2] = prev.padStart(2, '0');
-                return parts.join('/').slice(0, 8);
-              }
-            }
-          }
-          return single.slice(0, 8);
-        }
-        const digits = cleaned.replace(/[^0-9]/g, '');
-        let out = '';
-        if (digits.length <= 2) out = digits;
-        else if (digits.length <= 4) out = digits.slice(0, 2) + '/' + digits.slice(2);
-        else out = digits.slice(0, 2) + '/' + digits.slice(2, 4) + '/' + digits.slice(4, 6);
-        return out.slice(0, 8);
-      });
+  /**
+   * Crea un manejador de blur que valida el valor sin espacios (en
+   * mayúsculas) con un validador de validacionDatos. Vacío no es error.
+   * @param {string} selectorAviso - Selector del aviso asociado
+   * @param {string} nombreValidador - Función de validacionDatos
+   * @returns {Function}
+   */
+  function blurValidado(selectorAviso, nombreValidador) {
+    return (el) => {
+      const validador = vd[nombreValidador];
+      const warnWrapper = document.querySelector(selectorAviso);
+      const valor = (el.value || '').replace(/\s/g, '').toUpperCase();
+      if (!validador) avisarValidadorAusente(nombreValidador);
+      marcarValidez(el, warnWrapper, valor === '' || !validador || validador(valor));
+    };
+  }
+
+  /** IBAN español: 20 dígitos CCC o 24 caracteres IBAN. */
+  const blurIBANEspanol = blurValidado('.iban-warn', 'validarCuentaEspanola');
+  const blurIBANInternacional = blurValidado('.iban-ext-warn', 'validarIBANInternacional');
+  const blurSWIFT = blurValidado('.swift-warn', 'validarSWIFT');
+  const blurTarjeta = blurValidado('.tarjeta-warn', 'validarTarjeta');
+
+  /**
+   * DNI español: valida formato y letra de control. Si empieza por letra es
+   * pasaporte u otro documento y no se valida.
+   */
+  function blurDNI(el) {
+    const warnWrapper = document.querySelector('.dni-warn');
+    const valor = (el.value || '').trim().toUpperCase();
+    if (valor !== '' && !vd.validarDNIEspanol) avisarValidadorAusente('validarDNIEspanol');
+    if (valor === '' || !/^\d/.test(valor) || !vd.validarDNIEspanol) {
+      marcarValidez(el, warnWrapper, true);
       return;
     }
 
-    // Hora (live)
-    if (el.classList.contains('input-hora')) {
-      applyWithCaret(el, (valHora) => {
-        const v = valHora || '';
-        const cleaned = v.replace(/[^0-9:]/g, '');
-        const single = cleaned.replace(/:{2,}/g, ':').replace(/^:/, '');
-        const digits = single.replace(/[^0-9]/g, '');
-        if (digits.length <= 2) return digits.slice(0, 2);
-        const hh = digits.slice(0, 2);
-        const mm = digits.slice(2, 4);
-        return (hh + ':' + mm).slice(0, 5);
-      });
-      return;
+    const resultado = vd.validarDNIEspanol(valor);
+    // Actualizar el campo con el DNI formateado (con ceros)
+    if (resultado.valido) {
+      el.value = resultado.formateado;
     }
+    marcarValidez(el, warnWrapper, resultado.valido);
+  }
 
-    // Km (solo números enteros, sin decimales)
-    if (el.classList.contains('format-km')) {
-      applyWithCaret(el, (valKm) => {
-        // Solo permitir dígitos (km es siempre entero)
-        return (valKm || '').replace(/[^0-9]/g, '');
-      });
-      return;
+  /**
+   * Blur de campos sin tipo registrado: quitar field-error si hay contenido.
+   */
+  function blurGenerico(el) {
+    if (el.classList && el.classList.contains('field-error')) {
+      const valor = (el.value || '').trim();
+      if (valor !== '' && valor !== '18.') {
+        el.classList.remove('field-error');
+      }
     }
+  }
 
-    // Alojamiento
-    if (el.classList.contains('format-alojamiento')) {
-      applyWithCaret(el, (valAloj) => {
-        let s = (valAloj || '').replace(/\./g, ',').replace(/[^0-9,]/g, '');
-        const parts = s.split(',');
-        if (parts.length > 2) s = parts[0] + ',' + parts.slice(1).join('');
-        return s;
-      });
-      return;
+  // -------------------------------------------------------------------------
+  // Entrada al campo (focusin) y teclado
+  // -------------------------------------------------------------------------
+
+  function cursorAlFinal(el) {
+    try { el.setSelectionRange(el.value.length, el.value.length); } catch (err) { /* ignore */ }
+  }
+
+  function focusinKm(el) {
+    const v = (el.value || '').toString().trim();
+    if (v.endsWith(' km')) {
+      el.value = v.slice(0, -3).replace(/\./g, '');
+      cursorAlFinal(el);
     }
+  }
 
-    // Limit 2 digits
-    if (el.classList.contains('limit-2digits')) {
-      let v = String(el.value || '').replace(/[^0-9]/g, '');
-      if (v.length > 2) v = v.slice(0, 2);
-      el.value = v;
+  function focusinAlojamiento(el) {
+    const v = (el.value || '').toString().trim();
+    let core = v.replace(/\s*€\s*$/, '').replace(/\./g, '').replace(/[^0-9,]/g, '');
+    const parts = core.split(',');
+    if (parts.length > 2) core = parts[0] + ',' + parts.slice(1).join('');
+    if (core !== el.value) el.value = core;
+    cursorAlFinal(el);
+  }
+
+  function focusinOrganica(el) {
+    setTimeout(() => cursorAlFinal(el), 0);
+  }
+
+  function keydownHora(el, e) {
+    if (val.handleHoraKeydown) val.handleHoraKeydown(e);
+  }
+
+  /** Pausa (ms) tras la que se empieza una búsqueda nueva en los países. */
+  const PAUSA_BUSQUEDA_PAIS = 900;
+
+  /** select → { texto, hasta } con lo tecleado hasta ahora */
+  const busquedasPais = new WeakMap();
+
+  /**
+   * Búsqueda al teclear en los selects de país: acumula las teclas y salta
+   * al primer país cuyo nombre (o una de sus palabras) empieza por el texto,
+   * sin acentos ("mejico" → México, "paises b" → Países Bajos).
+   * @param {HTMLSelectElement} el
+   * @param {KeyboardEvent} e
+   */
+  function keydownPais(el, e) {
+    if (e.ctrlKey || e.metaKey || e.altKey || !window.utils?.getIndicePaises) return;
+
+    const t = Date.now();
+    const previa = busquedasPais.get(el);
+    let texto = previa && previa.hasta > t ? previa.texto : '';
+
+    if (e.key === 'Backspace' && texto) {
+      texto = texto.slice(0, -1);
+    } else if (e.key.length === 1 && (e.key !== ' ' || texto)) {
+      texto += e.key;
+    } else {
       return;
     }
+    e.preventDefault();
+    busquedasPais.set(el, { texto, hasta: t + PAUSA_BUSQUEDA_PAIS });
+
+    const [indice] = window.utils.getIndicePaises().buscar(texto, 1);
+    if (indice === undefined || indice === el.selectedIndex || indice >= el.options.length) return;
+    el.selectedIndex = indice;
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+  }
+
+  // -------------------------------------------------------------------------
+  // Registro
+  // -------------------------------------------------------------------------
+
+  /** Comportamiento por tipo de campo (data-field). */
+  const CAMPOS = {
+    'nombre-benef':     { input: textoGeneral(70) },
+    'entidad':          { input: textoGeneral(50) },
+    'dni':              { input: inputDNI, blur: blurDNI },
+    'iban':             { input: inputIBAN, blur: blurIBANEspanol },
+    'iban-ext':         { input: inputIBAN, blur: blurIBANInternacional },
+    'swift':            { input: inputSWIFT, blur: blurSWIFT },
+    'tarjeta':          { input: inputTarjeta, blur: blurTarjeta },
+    'responsable':      { input: textoGeneral(70) },
+    'texto-general':    { input: inputTextoGeneral },
+    'texto-extendido':  { input: inputTextoExtendido },
+    'organica':         { input: inputOrganica, blur: blurOrganica, focusin: focusinOrganica },
+    'organica-linea':   { input: inputOrganica },
+    'referencia':       { input: inputReferencia },
+    'fecha':            { input: inputFecha, blur: blurFecha },
+    'hora':             { input: inputHora, blur: blurHora, keydown: keydownHora },
+    'km':               { input: inputKm, blur: blurKm, focusin: focusinKm },
+    'alojamiento':      { input: inputAlojamiento, blur: blurAlojamiento, focusin: focusinAlojamiento },
+    'dos-digitos':      { input: inputDosDigitos, blur: blurDosDigitos },
+    'pais':             { keydown: keydownPais }
+  };
+
+  /**
+   * Deducción del tipo para elementos sin data-field, por prioridad.
+   * Solo se evalúa la primera vez que un elemento recibe un evento.
+   */
+  const REGLAS_CAMPO = [
+    ['nombre-benef', (el) => el.id === 'nombre-benef'],
+    ['entidad', (el) => el.id === 'entidad'],
+    ['dni', (el) => el.id === 'dni'],
+    ['iban-ext', (el) => el.id === 'iban-ext'],
+    ['iban', (el) => el.id === 'iban' || el.classList.contains('iban')],
+    ['swift', (el) => el.id === 'swift' || el.classList.contains('swift')],
+    ['tarjeta', (el) => el.id === 'numero-tarjeta' || el.classList.contains('card-number')],
+    ['responsable', (el) => el.classList.contains('responsable') || /^responsable-/.test(el.name || '')],
+    ['texto-general', (el) => el.classList.contains('general-text')],
+    ['texto-extendido', (el) => el.classList.contains('extended-text')],
+    ['organica', (el) => el.id === 'organica'],
+    ['organica-linea', (el) => el.classList.contains('organica') || /^organica-/.test(el.id || '')],
+    ['referencia', (el) => el.classList.contains('referencia-proyecto') || /^referencia-/.test(el.name || '')],
+    ['fecha', (el) => el.classList.contains('input-fecha')],
+    ['hora', (el) => el.classList.contains('input-hora')],
+    ['km', (el) => el.classList.contains('format-km')],
+    ['alojamiento', (el) => el.classList.contains('format-alojamiento')],
+    ['dos-digitos', (el) => el.classList.contains('limit-2digits')],
+    ['pais', (el) => el.tagName === 'SELECT' && (/^pais-destino-/.test(el.id) || el.id === 'aecc-pais-destino')]
+  ];
+
+  /** Elementos ya examinados sin tipo (evita repetir la deducción). */
+  const sinTipo = new WeakSet();
+
+  /**
+   * Devuelve el tipo de campo de un elemento ('' si no tiene comportamiento).
+   * @param {HTMLElement} el
+   * @returns {string}
+   */
+  function tipoCampo(el) {
+    if (!el || !el.classList || !el.dataset) return '';
+    const declarado = el.dataset.field;
+    if (declarado && CAMPOS[declarado]) return declarado;
+    if (sinTipo.has(el)) return '';
+
+    const regla = REGLAS_CAMPO.find(([, coincide]) => coincide(el));
+    if (!regla) {
+      sinTipo.add(el);
+      return '';
+    }
+    el.dataset.field = regla[0];
+    return regla[0];
+  }
+
+  /**
+   * Despacha un evento al manejador registrado para el tipo del campo.
+   * @param {string} evento - 'input' | 'blur' | 'focusin' | 'keydown'
+   * @param {Event} e
+   * @param {Function} [porDefecto] - Manejador si el campo no tiene uno propio
+   */
+  function despachar(evento, e, porDefecto) {
+    const traza = window.trazas?.inicio();
+    const el = e.target;
+    const tipo = tipoCampo(el);
+    const manejador = tipo ? CAMPOS[tipo][evento] : null;
+    if (manejador) {
+      manejador(el, e);
+    } else if (porDefecto && el) {
+      porDefecto(el, e);
+    }
+    window.trazas?.fin(`evento.${evento}`, traza);
+  }
+
+  // -------------------------------------------------------------------------
+  // Listeners delegados
+  // -------------------------------------------------------------------------
+
+  document.addEventListener('input', (e) => {
+    const el = e.target;
+    if (!el || el.tagName !== 'INPUT') return;
+    despachar('input', e);
   });
 
+  // Remover la clase field-error cuando el usuario hace focus en un campo erróneo.
+  // Usar captura para asegurar que se ejecute antes que otros listeners
+  document.addEventListener('focus', (e) => {
+    const traza = window.trazas?.inicio();
+    const el = e.target;
+    if (el && el.classList && el.classList.contains('field-error')) {
+      el.classList.remove('field-error');
+    }
+    window.trazas?.fin('evento.focus', traza);
+  }, true);
+
+  // Nota: blur no burbujea, necesitar usar true para capturar en la fase de captura
+  document.addEventListener('blur', (e) => despachar('blur', e, blurGenerico), true);
+
+  document.addEventListener('keydown', (e) => despachar('keydown', e));
+
+  document.addEventListener('focusin', (e) => despachar('focusin', e));
+
+  window.formLogic = window.formLogic || {};
+  window.formLogic._tipoCampo = tipoCampo;
+
   // =========================================================================
   // VALIDACIÓN DE FECHAS DE EVENTO (CONGRESO)
   // =========================================================================
@@ -704,504 +924,6 @@ document.addEventListener('DOMContentLoaded', () => {
     }
   }
 
-  // =========================================================================
-  // DELEGACIÓN GLOBAL DE EVENTOS DE FOCUS
-  // =========================================================================
-  /**
-   * Remover la clase field-error cuando el usuario hace focus en un campo erróneo.
-   */
-  document.addEventListener('focus', (e) => {
-    const el = e.target;
-    if (el && el.classList && el.classList.contains('field-error')) {
-      el.classList.remove('field-error');
-    }
-  }, true); // Usar captura para asegurar que se ejecute antes que otros listeners
-
-  // =========================================================================
-  // DELEGACIÓN GLOBAL DE EVENTOS DE BLUR
-  // =========================================================================
-  // LISTENERS DE BLUR (validaciones, formatos)
-  // =========================================================================
-  // Nota: blur no burbujea, necesitar usar true para capturar en la fase de captura
-  document.addEventListener('blur', (e) => {
-    const el = e.target;
-    if (!el) return;
-
-    // Fecha blur
-    if (el.classList && el.classList.contains('input-fecha')) {
-      if (val.handleFechaBlur) val.handleFechaBlur(e);
-      // Después del formateo, validar fechas del evento si corresponde
-      if (el.id === 'evento-del' || el.id === 'evento-al') {
-        validarFechasEvento();
-      }
-      return;
-    }
-
-    // Hora blur
-    if (el.classList && el.classList.contains('input-hora')) {
-      if (val.handleHoraBlur) val.handleHoraBlur(e);
-      return;
-    }
-
-    // Km blur (formatear con separador de miles)
-    if (el.classList && el.classList.contains('format-km')) {
-      const raw = (el.value || '').toString();
-      if (!raw) { el.value = ''; return; }
-      // Solo dígitos
-      const cleaned = raw.replace(/[^0-9]/g, '');
-      if (!cleaned) { el.value = ''; return; }
-      const num = parseInt(cleaned, 10);
-      if (isNaN(num)) { el.value = ''; return; }
-      el.value = num.toLocaleString('de-DE') + ' km';
-      return;
-    }
-
-    // Alojamiento blur
-    if (el.classList && el.classList.contains('format-alojamiento')) {
-      const raw = (el.value || '').toString();
-      if (raw.trim() === '') { el.value = ''; return; }
-      const cleaned = raw.replace(/[^0-9,\.]/g, '').replace(/,/g, '.');
-      const num = parseFloat(cleaned || '0');
-      if (isNaN(num) || num === 0) { el.value = ''; return; }
-      const parts = num.toFixed(2).split('.');
-      parts[0] = Number(parts[0]).toLocaleString('de-DE');
-      el.value = parts[0] + ',' + parts[1] + ' €';
-      return;
-    }
-
-    // Limit 2 digits blur
-    if (el.classList && el.classList.contains('limit-2digits')) {
-      const min = (el.min !== undefined && el.min !== '') ? Number(el.min) : null;
-      const max = (el.max !== undefined && el.max !== '') ? Number(el.max) : null;
-      let v = el.value === '' ? '' : Number(el.value);
-      if (v === '' || isNaN(v)) { el.value = ''; return; }
-      if (min !== null && v < min) v = min;
-      if (max !== null && v > max) v = max;
-      el.value = String(v);
-      return;
-    }
-
-    // Orgánica blur: validar formato (2-7 pares de 2 caracteres separados por puntos, empezando por "18.")
-    if (el.id === 'organica') {
-      const warnWrapper = document.querySelector('.organica-warn');
-      let val = (el.value || '').trim();
-      // Si está vacío o incompleto, restaurar a "18."
-      if (val === '' || val === '18') {
-        el.value = '18.';
-        val = '18.';
-      }
-      // Si es solo "18.", no marcar error (el usuario lo completará)
-      if (val === '18.') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-      // Regex: 2 a 7 pares de exactamente 2 caracteres alfanuméricos separados por puntos
-      const regexOrganica = /^[A-Za-z0-9]{2}(\.[A-Za-z0-9]{2}){1,6}$/;
-      const esValida = val.startsWith('18.') && regexOrganica.test(val);
-      if (warnWrapper) {
-        warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
-      }
-      if (esValida) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // Número de tarjeta blur: validar formato (15-19 dígitos, con Luhn)
-    if (el.id === 'numero-tarjeta' || el.classList.contains('card-number')) {
-      // Buscar el warning - está en el label anterior al input
-      const allWarnings = document.querySelectorAll('.tarjeta-warn');
-      let warnWrapper = null;
-      if (allWarnings.length > 0) {
-        // Usar el primer/último warning encontrado si existe
-        warnWrapper = allWarnings[0];
-      }
-      
-      const val = (el.value || '').replace(/\s/g, ''); // Eliminar espacios
-      
-      // Si está vacío, no marcar error
-      if (val === '') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-      
-      // Validar: solo dígitos y longitud entre 15 y 19
-      let esValida = /^\d{15,19}$/.test(val);
-      
-      // Aplicar algoritmo de Luhn a todos los números válidos
-      if (esValida) {
-        let suma = 0;
-        // Iterar desde la derecha hacia la izquierda
-        for (let i = 0; i < val.length; i++) {
-          let digito = parseInt(val[val.length - 1 - i], 10);
-          // Duplicar cada segundo dígito desde la derecha
-          if (i % 2 === 1) {
-            digito *= 2;
-            if (digito > 9) digito -= 9;
-          }
-          suma += digito;
-        }
-        esValida = (suma % 10 === 0);
-      }
-      
-      if (warnWrapper) {
-        warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
-      }
-      if (esValida) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // IBAN español blur: validar formato (20 dígitos CCC o 24 caracteres IBAN)
-    if (el.id === 'iban' || (el.classList.contains('iban') && el.id !== 'iban-ext')) {
-      const warnWrapper = document.querySelector('.iban-warn');
-      const val = (el.value || '').replace(/\s/g, '').toUpperCase(); // Eliminar espacios
-      // Si está vacío, no marcar error
-      if (val === '') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-
-      /**
-       * Calcula el dígito de control CCC usando módulo 11.
-       * @param {string} digits - 10 dígitos a validar
-       * @returns {number} Dígito de control (0-10, donde 10 se convierte en 0)
-       */
-      function calcularDigitoControlCCC(digits) {
-        const pesos = [1, 2, 4, 8, 5, 10, 9, 7, 3, 6];
-        let suma = 0;
-        for (let i = 0; i < 10; i++) {
-          suma += parseInt(digits[i], 10) * pesos[i];
-        }
-        const resto = suma % 11;
-        const digito = 11 - resto;
-        return digito === 11 ? 0 : (digito === 10 ? 1 : digito);
-      }
-
-      /**
-       * Valida los dígitos de control del CCC (20 dígitos).
-       * @param {string} ccc - 20 dígitos del CCC
-       * @returns {boolean} true si es válido
-       */
-      function validarCCC(ccc) {
-        if (!/^\d{20}$/.test(ccc)) return false;
-        const entidad = ccc.substring(0, 4);
-        const oficina = ccc.substring(4, 8);
-        const dc1 = parseInt(ccc[8], 10);
-        const dc2 = parseInt(ccc[9], 10);
-        const cuenta = ccc.substring(10, 20);
-
-        // Primer dígito de control: sobre "00" + entidad + oficina
-        const dc1Calc = calcularDigitoControlCCC('00' + entidad + oficina);
-        if (dc1 !== dc1Calc) return false;
-
-        // Segundo dígito de control: sobre número de cuenta
-        const dc2Calc = calcularDigitoControlCCC(cuenta);
-        if (dc2 !== dc2Calc) return false;
-
-        return true;
-      }
-
-      /**
-       * Valida el IBAN español (ES + 2 dígitos + 20 dígitos CCC).
-       * @param {string} iban - 24 caracteres del IBAN
-       * @returns {boolean} true si es válido
-       */
-      function validarIBANEspanol(iban) {
-        if (!/^ES\d{22}$/.test(iban)) return false;
-        const ccc = iban.substring(4, 24);
-        
-        // Primero validar el CCC
-        if (!validarCCC(ccc)) return false;
-
-        // Validar dígitos de control del IBAN (módulo 97)
-        // Mover los 4 primeros caracteres al final y convertir letras a números
-        const reordenado = iban.substring(4) + iban.substring(0, 4);
-        let numerico = '';
-        for (const char of reordenado) {
-          if (/\d/.test(char)) {
-            numerico += char;
-          } else {
-            // A=10, B=11, ..., Z=35
-            numerico += (char.charCodeAt(0) - 55).toString();
-          }
-        }
-        // Calcular módulo 97 (en partes para evitar overflow)
-        let resto = 0;
-        for (let i = 0; i < numerico.length; i++) {
-          resto = (resto * 10 + parseInt(numerico[i], 10)) % 97;
-        }
-        return resto === 1;
-      }
-
-      let esValida = false;
-      if (val.length === 20) {
-        // CCC de 20 dígitos
-        esValida = validarCCC(val);
-      } else if (val.length === 24) {
-        // IBAN español de 24 caracteres
-        esValida = validarIBANEspanol(val);
-      }
-      // Cualquier otra longitud es inválida
-
-      if (warnWrapper) {
-        warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
-      }
-      if (esValida) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // IBAN internacional blur: validar formato (módulo 97)
-    if (el.id === 'iban-ext') {
-      const warnWrapper = document.querySelector('.iban-ext-warn');
-      const val = (el.value || '').replace(/\s/g, '').toUpperCase(); // Eliminar espacios
-      // Si está vacío, no marcar error
-      if (val === '') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-
-      /**
-       * Valida un IBAN internacional usando módulo 97 (ISO 13616).
-       * @param {string} iban - IBAN sin espacios
-       * @returns {boolean} true si es válido
-       */
-      function validarIBANInternacional(iban) {
-        // Mínimo 15 caracteres, máximo 34
-        if (iban.length < 15 || iban.length > 34) return false;
-        // Los dos primeros deben ser letras (código país)
-        if (!/^[A-Z]{2}/.test(iban)) return false;
-        // Los siguientes dos deben ser dígitos (dígitos de control)
-        if (!/^[A-Z]{2}\d{2}/.test(iban)) return false;
-        // El resto debe ser alfanumérico
-        if (!/^[A-Z]{2}\d{2}[A-Z0-9]+$/.test(iban)) return false;
-
-        // Mover los 4 primeros caracteres al final y convertir letras a números
-        const reordenado = iban.substring(4) + iban.substring(0, 4);
-        let numerico = '';
-        for (const char of reordenado) {
-          if (/\d/.test(char)) {
-            numerico += char;
-          } else {
-            // A=10, B=11, ..., Z=35
-            numerico += (char.charCodeAt(0) - 55).toString();
-          }
-        }
-        // Calcular módulo 97 (en partes para evitar overflow)
-        let resto = 0;
-        for (let i = 0; i < numerico.length; i++) {
-          resto = (resto * 10 + parseInt(numerico[i], 10)) % 97;
-        }
-        return resto === 1;
-      }
-
-      const esValida = validarIBANInternacional(val);
-
-      if (warnWrapper) {
-        warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
-      }
-      if (esValida) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // SWIFT/BIC blur: validar formato (8 u 11 caracteres)
-    if (el.id === 'swift' || el.classList.contains('swift')) {
-      const warnWrapper = document.querySelector('.swift-warn');
-      const val = (el.value || '').replace(/\s/g, '').toUpperCase(); // Eliminar espacios
-      // Si está vacío, no marcar error
-      if (val === '') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-
-      /**
-       * Valida el formato de un código SWIFT/BIC (ISO 9362).
-       * @param {string} swift - Código SWIFT sin espacios
-       * @returns {boolean} true si el formato es válido
-       */
-      function validarSWIFT(swift) {
-        // Debe tener 8 u 11 caracteres
-        if (swift.length !== 8 && swift.length !== 11) return false;
-        // Posiciones 1-4: código del banco (4 letras)
-        if (!/^[A-Z]{4}/.test(swift)) return false;
-        // Posiciones 5-6: código del país (2 letras)
-        if (!/^[A-Z]{4}[A-Z]{2}/.test(swift)) return false;
-        // Posiciones 7-8: código de localización (2 alfanuméricos)
-        if (!/^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}/.test(swift)) return false;
-        // Posiciones 9-11 (opcional): código de sucursal (3 alfanuméricos)
-        if (swift.length === 11) {
-          if (!/^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}[A-Z0-9]{3}$/.test(swift)) return false;
-        }
-        return true;
-      }
-
-      const esValida = validarSWIFT(val);
-
-      if (warnWrapper) {
-        warnWrapper.style.display = esValida ? 'none' : 'inline-flex';
-      }
-      if (esValida) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // DNI español blur: validar formato y letra de control
-    if (el.id === 'dni') {
-      const warnWrapper = document.querySelector('.dni-warn');
-      let val = (el.value || '').trim().toUpperCase();
-      // Si está vacío, no marcar error
-      if (val === '') {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-
-      // Solo validar si empieza por número (DNI español)
-      // Si empieza por letra, es pasaporte u otro documento, no validamos
-      if (!/^\d/.test(val)) {
-        if (warnWrapper) warnWrapper.style.display = 'none';
-        el.classList.remove('field-error');
-        return;
-      }
-
-      /**
-       * Valida un DNI español.
-       * @param {string} dni - DNI introducido
-       * @returns {{valido: boolean, formateado: string}} Resultado de validación y DNI formateado
-       */
-      function validarDNIEspanol(dni) {
-        // Extraer solo dígitos y la letra final
-        const soloDigitos = dni.replace(/[^\d]/g, '');
-        const letras = dni.replace(/[^A-Z]/g, '');
-        
-        // Debe tener al menos 1 dígito y exactamente 1 letra al final
-        if (soloDigitos.length === 0 || soloDigitos.length > 8) {
-          return { valido: false, formateado: dni };
-        }
-        if (letras.length !== 1) {
-          return { valido: false, formateado: dni };
-        }
-        
-        // La letra debe estar al final
-        const letraUsuario = letras[0];
-        const posLetra = dni.lastIndexOf(letraUsuario);
-        const posUltimoDigito = dni.search(/\d[^\d]*$/);
-        if (posLetra < posUltimoDigito) {
-          return { valido: false, formateado: dni };
-        }
-
-        // Completar con ceros a la izquierda hasta 8 dígitos
-        const numeroCompleto = soloDigitos.padStart(8, '0');
-        
-        // Tabla de letras de control
-        const letrasControl = 'TRWAGMYFPDXBNJZSQVHLCKE';
-        const resto = parseInt(numeroCompleto, 10) % 23;
-        const letraCorrecta = letrasControl[resto];
-        
-        const formateado = numeroCompleto + letraCorrecta;
-        return { 
-          valido: letraUsuario === letraCorrecta, 
-          formateado: formateado 
-        };
-      }
-
-      const resultado = validarDNIEspanol(val);
-      
-      // Actualizar el campo con el DNI formateado (con ceros)
-      if (resultado.valido) {
-        el.value = resultado.formateado;
-      }
-
-      if (warnWrapper) {
-        warnWrapper.style.display = resultado.valido ? 'none' : 'inline-flex';
-      }
-      if (resultado.valido) {
-        el.classList.remove('field-error');
-      } else {
-        el.classList.add('field-error');
-      }
-      return;
-    }
-
-    // Handler genérico: quitar field-error si el campo tiene contenido
-    if (el.classList && el.classList.contains('field-error')) {
-      const valor = (el.value || '').trim();
-      if (valor !== '' && valor !== '18.') {
-        el.classList.remove('field-error');
-      }
-    }
-  }, true);
-
-  // =========================================================================
-  // DELEGACIÓN GLOBAL DE EVENTOS DE KEYDOWN
-  // =========================================================================
-
-  document.addEventListener('keydown', (e) => {
-    const el = e.target;
-    if (el && el.classList && el.classList.contains('input-hora')) {
-      if (val.handleHoraKeydown) val.handleHoraKeydown(e);
-    }
-  });
-
-  // =========================================================================
-  // DELEGACIÓN GLOBAL DE EVENTOS DE FOCUSIN
-  // =========================================================================
-
-  document.addEventListener('focusin', (e) => {
-    const el = e.target;
-
-    // Km focusin
-    if (el && el.classList && el.classList.contains('format-km')) {
-      const v = (el.value || '').toString().trim();
-      if (v.endsWith(' km')) {
-        const core = v.slice(0, -3).replace(/\./g, '');
-        el.value = core;
-        try { el.setSelectionRange(el.value.length, el.value.length); } catch (err) { /* ignore */ }
-      }
-      return;
-    }
-
-    // Alojamiento focusin
-    if (el && el.classList && el.classList.contains('format-alojamiento')) {
-      const v = (el.value || '').toString().trim();
-      let core = v.replace(/\s*€\s*$/, '').replace(/\./g, '').replace(/[^0-9,]/g, '');
-      const parts = core.split(',');
-      if (parts.length > 2) core = parts[0] + ',' + parts.slice(1).join('');
-      if (core !== el.value) el.value = core;
-      try { el.setSelectionRange(el.value.length, el.value.length); } catch (err) { /* ignore */ }
-      return;
-    }
-
-    // Orgánica focusin: posicionar cursor al final
-    if (el && el.id === 'organica') {
-      setTimeout(() => {
-        try { el.setSelectionRange(el.value.length, el.value.length); } catch (err) { /* ignore */ }
-      }, 0);
-      return;
-    }
-  });
-
   // =========================================================================
   // WARN TOOLTIP HANDLERS
   // =========================================================================
@@ -1303,191 +1025,26 @@ document.addEventListener('DOMContentLoaded', () => {
   // COMPROBACIÓN DE DATOS OBLIGATORIOS
   // =========================================================================
 
-  /**
-   * Expande una sección si está plegada.
-   * @param {HTMLElement} section - Elemento .form-section
-   */
-  function expandirSeccion(section) {
-    if (!section) return;
-    const toggle = section.querySelector('.toggle-section');
-    const wrapper = section.querySelector('.section-content-wrapper');
-    if (toggle && !toggle.classList.contains('open')) {
-      toggle.classList.add('open');
-      if (wrapper) {
-        wrapper.style.maxHeight = wrapper.scrollHeight + 'px';
-        wrapper.style.opacity = '1';
-      }
-    }
-  }
-
-  /**
-   * Marca un campo como error y expande su sección.
-   * @param {HTMLElement} campo - Elemento input/select/textarea
-   * @returns {boolean} true si se marcó error
-   */
-  function marcarCampoError(campo) {
-    if (!campo) return false;
-    const valor = (campo.value || '').trim();
-    if (valor === '' || valor === '18.') {
-      campo.classList.add('field-error');
-      const seccion = campo.closest('.form-section');
-      if (seccion) expandirSeccion(seccion);
-      return true;
-    }
-    return false;
-  }
-
-  /**
-   * Comprueba todos los datos obligatorios del formulario.
-   */
   /**
    * Valida datos obligatorios sin mostrar mensaje.
+   * Recopila el estado del formulario, lo valida con validacionDatos (sin
+   * tocar el DOM) y marca todos los errores en una sola pasada.
+   * Si falta validacionDatos o la serialización no se puede validar nada y
+   * se devuelve true: el PDF pide confirmación en lugar de darlo por bueno.
    * @returns {boolean} true si hay errores, false si todo está correcto
    */
   function validarDatos() {
-    let hayErrores = false;
-    const tipoActual = window.tipoLiquidacion?.getTipoActual?.() || window.__sgtriTipoLiquidacion || '';
-    const esModoAecc = String(tipoActual).toUpperCase() === 'AECC';
-
-    // ---- SECCIÓN 1: Datos del beneficiario ----
-    const camposBeneficiario = ['nombre-benef', 'dni', 'entidad', 'categoria', 'tipo-pago'];
-    camposBeneficiario.forEach(id => {
-      const campo = document.getElementById(id);
-      if (marcarCampoError(campo)) hayErrores = true;
-    });
-
-    // Campos de pago según tipo seleccionado
-    const tipoPago = document.getElementById('tipo-pago');
-    if (tipoPago) {
-      const tipo = tipoPago.value;
-      if (tipo === 'CE' || tipo === 'CuentaEsp' || tipo === 'Cuenta Española') {
-        const iban = document.getElementById('iban');
-        if (marcarCampoError(iban)) hayErrores = true;
-      } else if (tipo === 'CI' || tipo === 'CuentaExtranjera' || tipo === 'Cuenta Extranjera') {
-        const ibanExt = document.getElementById('iban-ext');
-        const swift = document.getElementById('swift');
-        if (marcarCampoError(ibanExt)) hayErrores = true;
-        if (marcarCampoError(swift)) hayErrores = true;
-      } else if (tipo === 'TJ' || tipo === 'TarjetaUEx' || tipo === 'Tarjeta UEx') {
-        const tarjeta = document.getElementById('numero-tarjeta');
-        if (marcarCampoError(tarjeta)) hayErrores = true;
-      }
-    }
-
-    // ---- SECCIÓN 2: Datos del proyecto ----
-    const camposProyecto = ['tipoProyecto', 'responsable', 'organica', 'referencia'];
-    camposProyecto.forEach(id => {
-      const campo = document.getElementById(id);
-      if (marcarCampoError(campo)) hayErrores = true;
-    });
-
-    // ---- SECCIÓN 3: Desplazamientos ----
-    const desplazamientosNormales = document.querySelectorAll('.desplazamiento-grupo:not(.desplazamiento-especial)');
-    let hayKilometraje = false;
-
-    desplazamientosNormales.forEach(desp => {
-      const id = desp.getAttribute('data-desplazamiento-id');
-      
-      // Campos obligatorios de cada desplazamiento
-      const camposDesp = [
-        `fecha-ida-${id}`, `hora-ida-${id}`,
-        `fecha-regreso-${id}`, `hora-regreso-${id}`,
-        `origen-${id}`, `destino-${id}`,
-        `pais-destino-${id}`, `motivo-${id}`
-      ];
-      
-      camposDesp.forEach(campoId => {
-        const campo = document.getElementById(campoId);
-        if (marcarCampoError(campo)) hayErrores = true;
-      });
-
-      // Verificar si el país es diferente de España
-      const paisDestino = document.getElementById(`pais-destino-${id}`);
-      if (paisDestino && paisDestino.value && paisDestino.value !== 'España' && paisDestino.value !== 'ES') {
-        const cruceIda = document.getElementById(`cruce-ida-${id}`);
-        const cruceVuelta = document.getElementById(`cruce-vuelta-${id}`);
-        if (marcarCampoError(cruceIda)) hayErrores = true;
-        if (marcarCampoError(cruceVuelta)) hayErrores = true;
-      }
-
-      // Verificar kilometraje
-      const kmField = document.getElementById(`km-${id}`);
-      if (kmField) {
-        const kmVal = (kmField.value || '').replace(/[^0-9]/g, '');
-        if (kmVal && parseInt(kmVal, 10) > 0) {
-          hayKilometraje = true;
-        }
-      }
-    });
-
-    // Si hay kilometraje, los datos del vehículo son obligatorios
-    if (hayKilometraje) {
-      const vehiculoContainer = document.getElementById('vehiculo-particular-container');
-      if (vehiculoContainer && vehiculoContainer.innerHTML.trim() !== '') {
-        const camposVehiculo = ['veh-marca', 'veh-modelo', 'veh-matricula'];
-        camposVehiculo.forEach(id => {
-          const campo = document.getElementById(id);
-          if (marcarCampoError(campo)) hayErrores = true;
-        });
-      }
-    }
-
-    // ---- SECCIÓN 3 (modo AECC): Desplazamiento AECC ----
-    if (esModoAecc) {
-      const camposAecc = [
-        'aecc-fecha-ida',
-        'aecc-hora-ida',
-        'aecc-fecha-regreso',
-        'aecc-hora-regreso',
-        'aecc-origen',
-        'aecc-destino',
-        'aecc-motivo'
-      ];
-
-      camposAecc.forEach(id => {
-        const campo = document.getElementById(id);
-        if (marcarCampoError(campo)) hayErrores = true;
-      });
-    }
-
-    // ---- SECCIÓN 4: Asistencia a congresos ----
-    const eventGastos = document.getElementById('evento-gastos');
-    if (eventGastos) {
-      const gastosVal = (eventGastos.value || '').replace(/[^0-9,\.]/g, '').replace(',', '.');
-      const gastosNum = parseFloat(gastosVal) || 0;
-      if (gastosNum > 0) {
-        const camposCongreso = ['evento-nombre', 'evento-lugar', 'evento-del', 'evento-al'];
-        camposCongreso.forEach(id => {
-          const campo = document.getElementById(id);
-          if (marcarCampoError(campo)) hayErrores = true;
-        });
-      }
-    }
-
-    // ---- SECCIÓN 5: Honorarios ----
-    const honorariosImporte = document.getElementById('honorarios-importe');
-    if (honorariosImporte) {
-      const importeVal = (honorariosImporte.value || '').replace(/[^0-9,\.]/g, '').replace(',', '.');
-      const importeNum = parseFloat(importeVal) || 0;
-      if (importeNum > 0) {
-        const camposHonorarios = ['honorarios-importe', 'honorarios-beneficiario', 'honorarios-situacion', 'honorarios-domicilio', 'honorarios-concepto'];
-        camposHonorarios.forEach(id => {
-          const campo = document.getElementById(id);
-          if (marcarCampoError(campo)) hayErrores = true;
-        });
-      }
+    if (!vd.validar || !serializar.recopilarTodo) {
+      console.error('[formLogic] validacionDatos o serializacionDatos no está cargado: no se pueden validar los datos.');
+      return true;
     }
 
-    // ---- SECCIÓN 7: Imputación ----
-    const lineasImputacion = document.querySelectorAll('#imputacion-container .imputacion-linea');
-    lineasImputacion.forEach(linea => {
-      const organicaInput = linea.querySelector('.imputacion-organica');
-      const responsableInput = linea.querySelector('.imputacion-responsable');
-      if (marcarCampoError(organicaInput)) hayErrores = true;
-      if (marcarCampoError(responsableInput)) hayErrores = true;
-    });
+    const datos = serializar.recopilarTodo();
+    // Los formatos (IBAN, DNI...) ya se señalan al salir de cada campo
+    const { errores } = vd.validar(datos, { formatos: false });
 
-    return hayErrores;
+    // Solo cuentan los errores con campo visible en el formulario
+    return vd.marcarErrores(errores) > 0;
   }
 
   function comprobarDatosObligatorios() {
@@ -1547,6 +1104,9 @@ document.addEventListener('DOMContentLoaded', () => {
         break;
     }
 
+    // Los campos se han vaciado por código: el estado en memoria no lo ve
+    window.estadoFormulario?.invalidarTodo();
+
     // Recalcular resultado
     if (window.resultadoLiquidacion?.renderResultado) {
       window.resultadoLiquidacion.renderResultado();
@@ -1653,6 +1213,11 @@ document.addEventListener('DOMContentLoaded', () => {
    * Limpia la sección de desplazamientos.
    */
   function limpiarSeccionDesplazamientos() {
+    // Retirar los listeners de las fichas antes de quitarlas del DOM
+    if (uiDesp.liberarTodos) {
+      uiDesp.liberarTodos();
+    }
+
     // Eliminar todos los desplazamientos normales
     const container = document.getElementById('desplazamientos-container');
     if (container) {
@@ -1666,6 +1231,9 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // Ocultar ficha de vehículo
+    if (uiDesp.liberarFichaVehiculo) {
+      uiDesp.liberarFichaVehiculo();
+    }
     const vehiculoContainer = document.getElementById('vehiculo-particular-container');
     if (vehiculoContainer) {
       vehiculoContainer.innerHTML = '';
@@ -1871,6 +1439,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // 5. Limpiar residuos de mapeo temporal
     delete window.__tempMapeoDesplazamientos;
+    window.estadoFormulario?.invalidarTodo();
 
     // 6. Renderizar resultado vacío
     if (window.resultadoLiquidacion?.renderResultado) {
@@ -0,0 +1,313 @@
+/**
+ * grafoDependencias.js
+ * ====================
+ * Grafo reactivo mínimo para propagar cambios entre importes dependientes.
+ *
+ * Cada nodo declara sus entradas. Al fijar una fuente solo se marcan como
+ * sucios los nodos que dependen de ella, y al estabilizar se recalculan en
+ * orden topológico (por rango). Si un nodo recalculado conserva su valor, la
+ * propagación se corta ahí.
+ *
+ * Una entrada puede ser un nodo completo ('fichas') o una clave de su valor
+ * ('fichas/3'): en ese caso el dependiente solo se marca cuando cambia esa
+ * clave concreta, de modo que un cambio en un desplazamiento no arrastra a
+ * los demás.
+ *
+ * @module grafoDependencias
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // COMPARACIÓN DE VALORES
+  // =========================================================================
+
+  /**
+   * Igualdad superficial: primitivos con Object.is, objetos y arrays por
+   * claves de primer nivel.
+   * @param {*} a
+   * @param {*} b
+   * @returns {boolean}
+   */
+  function igualesSuperficial(a, b) {
+    if (Object.is(a, b)) return true;
+    if (!a || !b || typeof a !== 'object' || typeof b !== 'object') return false;
+    if (Array.isArray(a) !== Array.isArray(b)) return false;
+    const claves = Object.keys(a);
+    if (claves.length !== Object.keys(b).length) return false;
+    return claves.every(k => Object.prototype.hasOwnProperty.call(b, k) && Object.is(a[k], b[k]));
+  }
+
+  /**
+   * Separa una entrada 'nodo/clave' en sus partes.
+   * @param {string} entrada
+   * @returns {{nodo: string, clave: string|null}}
+   */
+  function parsearEntrada(entrada) {
+    const i = entrada.indexOf('/');
+    return i === -1
+      ? { nodo: entrada, clave: null }
+      : { nodo: entrada.slice(0, i), clave: entrada.slice(i + 1) };
+  }
+
+  function leerClave(valor, clave) {
+    return clave === null ? valor : (valor == null ? undefined : valor[clave]);
+  }
+
+  // =========================================================================
+  // GRAFO
+  // =========================================================================
+
+  /**
+   * Crea un grafo vacío.
+   * @param {string} [nombre='grafo'] - Nombre para los mensajes de consola
+   * @returns {Object} API del grafo
+   */
+  function crearGrafo(nombre = 'grafo') {
+    /** @type {Map<string, Object>} nombre → nodo */
+    const nodos = new Map();
+    /** Nodos pendientes de recálculo, agrupados por rango */
+    const pendientes = [];
+    /** Nodos cuyo efecto debe ejecutarse aunque su valor no cambie */
+    const forzados = new Set();
+    let estabilizando = false;
+
+    const estadisticas = { pasadas: 0, recalculos: {}, ultimaPasada: [] };
+
+    function obtener(nodoNombre) {
+      const nodo = nodos.get(nodoNombre);
+      if (!nodo) throw new Error(`[${nombre}] Nodo desconocido: ${nodoNombre}`);
+      return nodo;
+    }
+
+    function marcar(nodo) {
+      if (!nodo.calcular || nodo.sucio) return;
+      nodo.sucio = true;
+      (pendientes[nodo.rango] || (pendientes[nodo.rango] = new Set())).add(nodo);
+    }
+
+    /**
+     * Marca los dependientes afectados por el cambio de valor de un nodo.
+     */
+    function propagar(nodo, anterior, nuevo) {
+      nodo.dependientes.forEach(({ destino, clave }) => {
+        if (clave === null || !Object.is(leerClave(anterior, clave), leerClave(nuevo, clave))) {
+          marcar(destino);
+        }
+      });
+    }
+
+    /**
+     * Declara un nodo fuente (valor fijado desde fuera).
+     * @param {string} nodoNombre
+     * @param {*} valorInicial
+     * @param {Object} [opciones]
+     * @param {Function} [opciones.iguales] - Comparador de valores
+     */
+    function fuente(nodoNombre, valorInicial, opciones = {}) {
+      if (nodos.has(nodoNombre)) throw new Error(`[${nombre}] Nodo duplicado: ${nodoNombre}`);
+      nodos.set(nodoNombre, {
+        nombre: nodoNombre,
+        rango: 0,
+        valor: valorInicial,
+        entradas: [],
+        dependientes: [],
+        iguales: opciones.iguales || igualesSuperficial,
+        calcular: null,
+        efecto: null,
+        sucio: false
+      });
+    }
+
+    /**
+     * Declara un nodo derivado. Sus entradas deben existir ya.
+     * @param {string} nodoNombre
+     * @param {string[]} entradas - Nombres 'nodo' o 'nodo/clave'
+     * @param {Function} calcular - (...valoresEntradas) → valor
+     * @param {Object} [opciones]
+     * @param {Function} [opciones.efecto] - (nuevo, anterior) tras cada cambio
+     * @param {Function} [opciones.iguales] - Comparador de valores
+     */
+    function derivado(nodoNombre, entradas, calcular, opciones = {}) {
+      if (nodos.has(nodoNombre)) throw new Error(`[${nombre}] Nodo duplicado: ${nodoNombre}`);
+      const refs = entradas.map(e => {
+        const { nodo, clave } = parsearEntrada(e);
+        return { origen: obtener(nodo), clave };
+      });
+      const nodo = {
+        nombre: nodoNombre,
+        rango: 1 + Math.max(0, ...refs.map(r => r.origen.rango)),
+        valor: undefined,
+        entradas: refs,
+        dependientes: [],
+        iguales: opciones.iguales || igualesSuperficial,
+        calcular,
+        efecto: opciones.efecto || null,
+        sucio: false,
+        calculado: false
+      };
+      refs.forEach(r => r.origen.dependientes.push({ destino: nodo, clave: r.clave }));
+      nodos.set(nodoNombre, nodo);
+      marcar(nodo);
+    }
+
+    /**
+     * Elimina un nodo sin dependientes.
+     * @param {string} nodoNombre
+     */
+    function eliminar(nodoNombre) {
+      const nodo = nodos.get(nodoNombre);
+      if (!nodo) return;
+      if (nodo.dependientes.length > 0) {
+        throw new Error(`[${nombre}] ${nodoNombre} tiene dependientes`);
+      }
+      nodo.entradas.forEach(r => {
+        r.origen.dependientes = r.origen.dependientes.filter(d => d.destino !== nodo);
+      });
+      if (nodo.sucio) pendientes[nodo.rango]?.delete(nodo);
+      forzados.delete(nodo);
+      nodos.delete(nodoNombre);
+    }
+
+    /**
+     * Fija el valor de una fuente y marca sus dependientes afectados.
+     * No recalcula: eso ocurre en estabilizar().
+     * @param {string} nodoNombre
+     * @param {*} valor
+     * @returns {boolean} true si el valor ha cambiado
+     */
+    function fijar(nodoNombre, valor) {
+      const nodo = obtener(nodoNombre);
+      if (nodo.calcular) throw new Error(`[${nombre}] ${nodoNombre} no es una fuente`);
+      if (nodo.iguales(nodo.valor, valor)) return false;
+      const anterior = nodo.valor;
+      nodo.valor = valor;
+      propagar(nodo, anterior, valor);
+      return true;
+    }
+
+    /**
+     * Fuerza el recálculo de un nodo derivado y la ejecución de su efecto en
+     * la próxima estabilización, aunque su valor no cambie.
+     * @param {string} nodoNombre
+     */
+    function invalidar(nodoNombre) {
+      const nodo = obtener(nodoNombre);
+      forzados.add(nodo);
+      marcar(nodo);
+    }
+
+    /**
+     * Recalcula los nodos pendientes en orden de rango.
+     * @returns {string[]} Nombres de los nodos recalculados
+     */
+    function estabilizar() {
+      if (estabilizando) return [];
+      estabilizando = true;
+      const recalculados = [];
+      try {
+        for (let r = 0; r < pendientes.length; r++) {
+          const nivel = pendientes[r];
+          if (!nivel || nivel.size === 0) continue;
+          const lote = Array.from(nivel);
+          nivel.clear();
+          lote.forEach(nodo => {
+            nodo.sucio = false;
+            const anterior = nodo.valor;
+            const nuevo = nodo.calcular(...nodo.entradas.map(e => leerClave(e.origen.valor, e.clave)));
+            const forzado = forzados.delete(nodo);
+            const cambia = !nodo.calculado || !nodo.iguales(anterior, nuevo);
+            nodo.calculado = true;
+            recalculados.push(nodo.nombre);
+            estadisticas.recalculos[nodo.nombre] = (estadisticas.recalculos[nodo.nombre] || 0) + 1;
+            if (cambia) {
+              nodo.valor = nuevo;
+              propagar(nodo, anterior, nuevo);
+            }
+            if ((cambia || forzado) && nodo.efecto) {
+              try {
+                nodo.efecto(nodo.valor, anterior);
+              } catch (e) {
+                console.warn(`[${nombre}] Error en efecto de ${nodo.nombre}:`, e);
+              }
+            }
+          });
+        }
+      } finally {
+        estabilizando = false;
+      }
+      if (recalculados.length > 0) {
+        estadisticas.pasadas++;
+        estadisticas.ultimaPasada = recalculados;
+      }
+      return recalculados;
+    }
+
+    /**
+     * Ejecuta varias asignaciones y estabiliza una sola vez al final.
+     * @param {Function} fn
+     * @returns {string[]} Nombres de los nodos recalculados
+     */
+    function lote(fn) {
+      fn();
+      return estabilizar();
+    }
+
+    /**
+     * Valor actual de un nodo (estabiliza antes si hay pendientes).
+     * @param {string} nodoNombre
+     * @returns {*}
+     */
+    function valor(nodoNombre) {
+      const nodo = obtener(nodoNombre);
+      if (nodo.sucio) estabilizar();
+      return nodo.valor;
+    }
+
+    function existe(nodoNombre) {
+      return nodos.has(nodoNombre);
+    }
+
+    /**
+     * Estadísticas de recálculo: número de pasadas, recálculos por nodo y
+     * nodos tocados en la última pasada.
+     */
+    function getEstadisticas() {
+      return {
+        pasadas: estadisticas.pasadas,
+        recalculos: { ...estadisticas.recalculos },
+        ultimaPasada: estadisticas.ultimaPasada.slice()
+      };
+    }
+
+    function resetEstadisticas() {
+      estadisticas.pasadas = 0;
+      estadisticas.recalculos = {};
+      estadisticas.ultimaPasada = [];
+    }
+
+    return {
+      fuente,
+      derivado,
+      eliminar,
+      fijar,
+      invalidar,
+      estabilizar,
+      lote,
+      valor,
+      existe,
+      getEstadisticas,
+      resetEstadisticas
+    };
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.grafoDependencias = {
+    crearGrafo,
+    igualesSuperficial
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,412 @@
+/**
+ * liquidacionGrupo.js
+ * ===================
+ * Modo de liquidación de grupo: un equipo que viaja junto genera N
+ * liquidaciones casi idénticas. Los datos del viaje (proyecto,
+ * desplazamientos, vehículo, evento, honorarios...) se introducen una vez
+ * en el formulario y se capturan como base; cada miembro solo aporta sus
+ * diferencias (beneficiario, pago, imputación y ajustes).
+ *
+ * Los desplazamientos se calculan una sola vez (los de la base, ya
+ * registrados en window.__sgtriTotales) y sus resultados se reparten a todos
+ * los miembros. El resultado de la liquidación se recalcula por miembro sobre
+ * una copia del registro, cacheado por ajustes idénticos.
+ *
+ * Usa la estructura de serializacionDatos.recopilarTodo(). En el formulario
+ * se maneja con el panel del botón "Grupo" de la barra de acciones: crear
+ * el grupo con el formulario actual, añadir miembros tras cambiar sus datos
+ * y generar los PDF en lote.
+ *
+ * @module liquidacionGrupo
+ * @requires serializacionDatos
+ * @requires resultadoLiquidacion
+ * @requires pdfGen
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // CONFIGURACIÓN
+  // =========================================================================
+
+  /** Secciones de recopilarTodo() que varían entre miembros del grupo. */
+  const CAMPOS_MIEMBRO = ['beneficiario', 'pago', 'imputacion', 'ajustes'];
+
+  // =========================================================================
+  // UTILIDADES
+  // =========================================================================
+
+  function parseNumber(value) {
+    if (global.utils?.parseNumber) return global.utils.parseNumber(value);
+    const n = parseFloat(String(value ?? '').replace(/[^0-9,\-]/g, '').replace(',', '.'));
+    return isNaN(n) ? 0 : n;
+  }
+
+  function round2(n) {
+    if (global.utils?.round2) return global.utils.round2(n);
+    return Math.round((Number(n) || 0) * 100) / 100;
+  }
+
+  /**
+   * Copia profunda de datos planos (objetos serializables).
+   * @param {*} valor
+   * @returns {*}
+   */
+  function copiar(valor) {
+    return valor === undefined ? undefined : JSON.parse(JSON.stringify(valor));
+  }
+
+  // =========================================================================
+  // CREACIÓN DEL GRUPO
+  // =========================================================================
+
+  /**
+   * Crea un grupo a partir de unos datos base.
+   * Sin argumentos captura el formulario actual (datos del viaje ya calculados).
+   * @param {Object} [datosBase] - Objeto con la estructura de recopilarTodo()
+   * @returns {Object|null} Grupo { base, registroBase, datosEspecial, miembros, _cacheResultados }
+   */
+  function crearGrupo(datosBase) {
+    const base = datosBase || global.serializacionDatos?.recopilarTodo?.();
+    if (!base) {
+      console.warn('[liquidacionGrupo] No hay datos base para crear el grupo');
+      return null;
+    }
+
+    // Instantánea del registro de totales: los desplazamientos ya calculados
+    // se reutilizan para todos los miembros sin volver a ejecutar el motor
+    const registroBase = copiar(global.__sgtriTotales || {
+      desplazamientos: {},
+      honorarios: 0,
+      gastosInscripcion: 0,
+      descuentoCongreso: 0,
+      financiacionMaxima: 0,
+      descuentosAjustes: []
+    });
+    const datosEspecial = copiar(global.uiDesplazamientoEspecial?.getDatosParaLiquidacion?.() || null);
+
+    const grupo = {
+      base: copiar(base),
+      registroBase,
+      datosEspecial,
+      miembros: [],
+      _cacheResultados: new Map()
+    };
+
+    // El propio beneficiario de la base es el primer miembro
+    anadirMiembro(grupo, base);
+    return grupo;
+  }
+
+  /**
+   * Extrae las secciones propias de un miembro.
+   * @param {Object} datos - Objeto con (al menos) las secciones de CAMPOS_MIEMBRO
+   * @returns {Object}
+   */
+  function extraerMiembro(datos) {
+    const miembro = {};
+    CAMPOS_MIEMBRO.forEach(campo => {
+      if (datos && datos[campo] !== undefined) miembro[campo] = copiar(datos[campo]);
+    });
+    return miembro;
+  }
+
+  /**
+   * Añade un miembro al grupo.
+   * Acepta un objeto completo de recopilarTodo() (p.ej. un archivo importado):
+   * solo se toman las secciones propias del miembro.
+   * @param {Object} grupo
+   * @param {Object} datosMiembro
+   * @returns {number} Índice del miembro añadido
+   */
+  function anadirMiembro(grupo, datosMiembro) {
+    if (!grupo) return -1;
+    grupo.miembros.push(extraerMiembro(datosMiembro));
+    return grupo.miembros.length - 1;
+  }
+
+  /**
+   * Captura las secciones propias del miembro desde el formulario actual
+   * (el usuario edita beneficiario, pago, imputación y ajustes entre capturas).
+   * @param {Object} grupo
+   * @returns {number} Índice del miembro añadido
+   */
+  function capturarMiembroDesdeFormulario(grupo) {
+    const datos = global.serializacionDatos?.recopilarTodo?.();
+    if (!datos) return -1;
+    return anadirMiembro(grupo, datos);
+  }
+
+  /**
+   * Actualiza las secciones de un miembro existente.
+   * @param {Object} grupo
+   * @param {number} indice
+   * @param {Object} cambios - Secciones a sustituir
+   */
+  function actualizarMiembro(grupo, indice, cambios) {
+    if (!grupo || !grupo.miembros[indice]) return;
+    Object.assign(grupo.miembros[indice], extraerMiembro(cambios));
+  }
+
+  /**
+   * Elimina un miembro del grupo.
+   * @param {Object} grupo
+   * @param {number} indice
+   */
+  function eliminarMiembro(grupo, indice) {
+    if (!grupo || indice < 0 || indice >= grupo.miembros.length) return;
+    grupo.miembros.splice(indice, 1);
+  }
+
+  // =========================================================================
+  // RESULTADO POR MIEMBRO
+  // =========================================================================
+
+  /**
+   * Convierte los ajustes serializados al formato del registro de totales.
+   * @param {Object} ajustes - { financiacionMaxima, descuentos: [{ tipo, motivo, importe }] }
+   * @returns {{financiacionMaxima: number, descuentosAjustes: Array}}
+   */
+  function ajustesARegistro(ajustes) {
+    const descuentos = (ajustes?.descuentos || [])
+      .map(d => ({
+        tipo: d.tipo,
+        tipoLabel: d.tipo,
+        motivo: d.motivo || '',
+        importe: round2(parseNumber(d.importe))
+      }))
+      .filter(d => d.importe > 0);
+
+    return {
+      financiacionMaxima: round2(parseNumber(ajustes?.financiacionMaxima)),
+      descuentosAjustes: descuentos
+    };
+  }
+
+  /**
+   * Calcula el resultado de la liquidación de un miembro.
+   * Los totales de desplazamientos son los de la base; solo cambian los
+   * ajustes. Miembros con ajustes idénticos comparten el cálculo.
+   * @param {Object} grupo
+   * @param {Object} miembro
+   * @returns {{totalLiquidacion: number, irpfTotal: number}}
+   */
+  function calcularResultadoMiembro(grupo, miembro) {
+    const ajustesRegistro = ajustesARegistro(miembro.ajustes || grupo.base.ajustes);
+    const clave = JSON.stringify(ajustesRegistro);
+
+    if (!grupo._cacheResultados.has(clave)) {
+      let resultado = { totalLiquidacion: 0, irpfTotal: 0 };
+      const calc = global.resultadoLiquidacion?.calcularResultadoDesde;
+      if (typeof calc === 'function') {
+        const registro = { ...grupo.registroBase, ...ajustesRegistro };
+        const r = calc(registro, grupo.datosEspecial);
+        resultado = { totalLiquidacion: r.totalLiquidacion || 0, irpfTotal: r.irpfTotal || 0 };
+      }
+      grupo._cacheResultados.set(clave, resultado);
+    }
+    return { ...grupo._cacheResultados.get(clave) };
+  }
+
+  /**
+   * Compone los datos completos (estructura de recopilarTodo) de un miembro:
+   * base compartida + secciones propias + resultado recalculado.
+   * @param {Object} grupo
+   * @param {number} indice
+   * @returns {Object|null}
+   */
+  function componerDatosMiembro(grupo, indice) {
+    const miembro = grupo?.miembros[indice];
+    if (!miembro) return null;
+
+    // La base se comparte por referencia: es de solo lectura para el PDF
+    return {
+      ...grupo.base,
+      ...miembro,
+      resultadoLiquidacion: calcularResultadoMiembro(grupo, miembro)
+    };
+  }
+
+  /**
+   * Compone los datos de todos los miembros del grupo.
+   * @param {Object} grupo
+   * @returns {Array<Object>}
+   */
+  function componerTodos(grupo) {
+    if (!grupo) return [];
+    return grupo.miembros.map((_, i) => componerDatosMiembro(grupo, i));
+  }
+
+  // =========================================================================
+  // GENERACIÓN DE PDF EN LOTE
+  // =========================================================================
+
+  /**
+   * Nombre de fichero por miembro: referencia del proyecto + DNI/nombre.
+   * @param {Object} datos
+   * @param {number} indice
+   * @returns {string}
+   */
+  function nombreArchivoMiembro(datos, indice) {
+    const ref = datos.proyecto?.referencia || 'borrador';
+    const id = String(datos.beneficiario?.dni || datos.beneficiario?.nombre || indice + 1)
+      .trim()
+      .replace(/[^0-9A-Za-z\u00C0-\u017F_-]+/g, '_');
+    return `Liquidacion_${ref}_${id}.pdf`;
+  }
+
+  /**
+   * Genera los PDF de todos los miembros en un único lote.
+   * Las secciones del viaje se maquetan una vez y se reutilizan.
+   * @param {Object} grupo
+   * @returns {Promise<number>} Número de PDF generados
+   */
+  async function generarPdfs(grupo) {
+    if (!global.pdfGen?.generarLote) {
+      console.error('[liquidacionGrupo] pdfGen.generarLote no disponible');
+      return 0;
+    }
+    return global.pdfGen.generarLote(componerTodos(grupo), {
+      compartirSecciones: true,
+      nombreArchivo: nombreArchivoMiembro
+    });
+  }
+
+  // =========================================================================
+  // PANEL DEL GRUPO
+  // =========================================================================
+
+  /** Grupo que se edita desde el panel */
+  let grupoActual = null;
+  let panel = null;
+
+  function escaparHtml(texto) {
+    return String(texto)
+      .replace(/&/g, '&amp;')
+      .replace(/</g, '&lt;')
+      .replace(/>/g, '&gt;')
+      .replace(/"/g, '&quot;');
+  }
+
+  function crearPanel() {
+    panel = document.createElement('div');
+    panel.id = 'panel-grupo';
+    panel.className = 'panel-grupo';
+    panel.setAttribute('role', 'dialog');
+    panel.setAttribute('aria-label', 'Liquidación de grupo');
+    panel.hidden = true;
+    panel.innerHTML = `
+      <div class="panel-grupo-cabecera">
+        <strong>Liquidación de grupo</strong>
+        <button type="button" data-accion="cerrar" aria-label="Cerrar">×</button>
+      </div>
+      <div class="panel-grupo-estado" aria-live="polite"></div>
+      <ol class="panel-grupo-miembros"></ol>
+      <div class="panel-grupo-acciones">
+        <button type="button" data-accion="crear">Crear con este formulario</button>
+        <button type="button" data-accion="anadir">Añadir miembro</button>
+        <button type="button" data-accion="pdf">Generar PDF</button>
+      </div>`;
+
+    panel.addEventListener('click', async (e) => {
+      const boton = e.target.closest('[data-accion]');
+      switch (boton?.dataset.accion) {
+        case 'cerrar':
+          ocultarPanel();
+          break;
+        case 'crear':
+          if (grupoActual && grupoActual.miembros.length > 1) {
+            const reemplazar = await global.showConfirm(
+              '¿Crear un grupo nuevo? Se descartan los miembros añadidos.',
+              { confirmText: 'Crear', icon: '👥' }
+            );
+            if (!reemplazar) return;
+          }
+          grupoActual = crearGrupo();
+          break;
+        case 'anadir':
+          capturarMiembroDesdeFormulario(grupoActual);
+          break;
+        case 'quitar':
+          eliminarMiembro(grupoActual, Number(boton.dataset.indice));
+          break;
+        case 'pdf':
+          boton.disabled = true;
+          try {
+            await generarPdfs(grupoActual);
+          } finally {
+            boton.disabled = false;
+          }
+          break;
+        default:
+          return;
+      }
+      pintarPanel();
+    });
+    panel.addEventListener('keydown', (e) => {
+      if (e.key === 'Escape') ocultarPanel();
+    });
+    document.body.appendChild(panel);
+  }
+
+  function pintarPanel() {
+    if (!panel) return;
+    const miembros = grupoActual?.miembros || [];
+    panel.querySelector('.panel-grupo-estado').textContent = grupoActual
+      ? `${miembros.length} miembro${miembros.length === 1 ? '' : 's'}. Para añadir otro, cambie beneficiario, ` +
+        'pago, imputación y ajustes en el formulario y pulse "Añadir miembro".'
+      : 'Rellene el viaje y el primer beneficiario y pulse "Crear con este formulario".';
+    panel.querySelector('.panel-grupo-miembros').innerHTML = miembros.map((m, i) => `
+      <li>
+        <span>${escaparHtml(m.beneficiario?.nombre || '(sin nombre)')} · ${escaparHtml(m.beneficiario?.dni || 'sin DNI')}</span>
+        <button type="button" data-accion="quitar" data-indice="${i}" aria-label="Quitar miembro">×</button>
+      </li>`).join('');
+    panel.querySelector('[data-accion="anadir"]').disabled = !grupoActual;
+    panel.querySelector('[data-accion="pdf"]').disabled = miembros.length === 0;
+  }
+
+  function mostrarPanel() {
+    if (!panel) crearPanel();
+    pintarPanel();
+    panel.hidden = false;
+  }
+
+  function ocultarPanel() {
+    if (panel) panel.hidden = true;
+  }
+
+  function alternarPanel() {
+    if (panel && !panel.hidden) ocultarPanel(); else mostrarPanel();
+  }
+
+  if (typeof document !== 'undefined') {
+    document.addEventListener('click', (e) => {
+      if (e.target.closest?.('#btn-grupo')) alternarPanel();
+    });
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.liquidacionGrupo = {
+    CAMPOS_MIEMBRO,
+    crearGrupo,
+    anadirMiembro,
+    capturarMiembroDesdeFormulario,
+    actualizarMiembro,
+    eliminarMiembro,
+    componerDatosMiembro,
+    componerTodos,
+    generarPdfs,
+    getGrupoActual: () => grupoActual,
+    mostrarPanel,
+    ocultarPanel,
+    alternarPanel,
+
+    // Para testing
+    _ajustesARegistro: ajustesARegistro,
+    _calcularResultadoMiembro: calcularResultadoMiembro
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -190,6 +190,18 @@
         delete desp.dataset.dtInvalid;
       }
 
+      // Avisar de fechas solapadas con otras fichas o con el historial
+      // (también con fechas no válidas, para retirar avisos anteriores)
+      try {
+        global.solapesDesp?.comprobarFormulario();
+      } catch (e) { /* ignore */ }
+
+      // El descuento del congreso usa las tarifas de la fecha de ida de la
+      // ficha asociada: releerla (el grafo solo propaga si cambia)
+      try {
+        global.computeDescuentoManutencion?.();
+      } catch (e) { /* ignore */ }
+
       // Validar cruces de fronteras
       try { 
         validateCrucesForFicha(id); 
@@ -291,7 +303,7 @@
       const hh = parseInt(m[1], 10);
       const mm = parseInt(m[2], 10);
       if (isNaN(hh) || isNaN(mm) || hh < 0 || hh > 23 || mm < 0 || mm > 59) return false;
-      return (hh * 60 + mm) > (22 * 60);
+      return global.reglasDietas.muestraTicketCena('rd', hh * 60 + mm);
     } catch (e) { 
       return false; 
     }
@@ -303,7 +315,8 @@
       const m = horaRegreso.match(/^(\d{1,2}):(\d{2})$/);
       if (!m) return false;
       const hh = parseInt(m[1], 10);
-      return hh >= 1 && hh < 7;
+      const mm = parseInt(m[2], 10);
+      return global.reglasDietas.pernoctaAmbigua(hh * 60 + mm);
     } catch (e) { 
       return false; 
     }
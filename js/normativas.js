@@ -0,0 +1,595 @@
+/**
+ * normativas.js
+ * =============
+ * Búsqueda sin conexión en el texto de las normativas (Decreto 42/2025 y
+ * R.D. 462/2002) y enlaces "§" de las explicaciones del cálculo al artículo
+ * que aplica cada regla.
+ *
+ * El índice (assets/data/normativas/indice.json) lo genera
+ * tools/build_normativas.py a partir de los PDF de Normativas/: fragmentos
+ * por artículo, disposición y anexo, e índice invertido de términos sin
+ * acentos ni mayúsculas. Se descarga la primera vez que hace falta (al
+ * pasar por un enlace "§" o al abrir el panel) y las búsquedas se resuelven
+ * en memoria, sin red: intersección de listas de términos y puntuación
+ * BM25; el último término se busca también como prefijo para buscar
+ * mientras se escribe.
+ *
+ * La tokenización (plegar/terminos) debe coincidir con la del script de
+ * generación.
+ *
+ * Uso:
+ *   await normativas.cargar();
+ *   normativas.buscar('catorce horas', { norma: 'decreto' });
+ *   normativas.abrirRegla('residenciaEventual', 'rd');
+ *
+ * @module normativas
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // CONFIGURACIÓN
+  // =========================================================================
+
+  /** Índice generado por tools/build_normativas.py */
+  const RUTA_INDICE = 'assets/data/normativas/indice.json';
+
+  /** Resultados por búsqueda (por defecto) */
+  const LIMITE_RESULTADOS = 20;
+
+  /** Términos del índice que se aceptan como ampliación de un prefijo */
+  const MAX_PREFIJOS = 40;
+
+  /** Caracteres de contexto alrededor de la primera coincidencia */
+  const CONTEXTO_EXTRACTO = 90;
+
+  /** Parámetros de BM25 */
+  const BM25_K1 = 1.2;
+  const BM25_B = 0.75;
+
+  /** Palabras vacías (las mismas que en la generación del índice) */
+  const PALABRAS_VACIAS = new Set((
+    'a al algo algun alguna algunas alguno algunos ante antes aquel aquella aquellas aquellos ' +
+    'asi aun cada como con contra cual cuales cuando de del desde donde dos durante e el ella ' +
+    'ellas ellos en entre era es esa esas ese eso esos esta estas este esto estos fue ha han ' +
+    'hasta la las le les lo los mas mediante mismo misma mismos mismas muy ni no nos o otra ' +
+    'otras otro otros para pero por que quien se segun ser si sido sin sobre su sus tal tambien ' +
+    'tanto todo todos toda todas tras un una unas uno unos y ya'
+  ).split(' '));
+
+  // =========================================================================
+  // ESTADO
+  // =========================================================================
+
+  let indice = null;
+  let promesaIndice = null;
+
+  /** Términos del índice en orden (para buscar prefijos por bisección) */
+  let terminosOrdenados = [];
+  let longitudMedia = 1;
+
+  /** Texto plegado de cada fragmento (se calcula al resaltarlo por primera vez) */
+  let textosPlegados = [];
+
+  // =========================================================================
+  // TEXTO
+  // =========================================================================
+
+  const DIACRITICOS = /[\u0300-\u036f]/g;
+
+  /**
+   * Minúsculas sin diacríticos (á → a, ñ → n, ü → u).
+   * @param {string} texto
+   * @returns {string}
+   */
+  function plegar(texto) {
+    return String(texto || '').toLowerCase().normalize('NFD').replace(DIACRITICOS, '');
+  }
+
+  /**
+   * Como plegar(), pero conservando la longitud: la posición de cada
+   * carácter coincide con la del texto original (para resaltar).
+   */
+  function plegarPosiciones(texto) {
+    let resultado = '';
+    for (const c of texto) {
+      const p = plegar(c);
+      resultado += p.length === c.length ? p : c;
+    }
+    return resultado;
+  }
+
+  /**
+   * Términos indexables de un texto.
+   * @param {string} texto
+   * @returns {string[]}
+   */
+  function terminos(texto) {
+    return (plegar(texto).match(/[a-z0-9]+/g) || [])
+      .filter(t => !PALABRAS_VACIAS.has(t) && (t.length > 1 || /\d/.test(t)));
+  }
+
+  /**
+   * Adapta la forma de escribir horas y porcentajes a la de las normas:
+   * "22:00" → "22 horas", "80%" → "80 por 100".
+   */
+  function normalizarConsulta(consulta) {
+    return String(consulta || '')
+      .replace(/\b(\d{1,2})[:.]00\s*h?\b/gi, '$1 horas')
+      .replace(/\b(\d{1,2})\s*h\b/gi, '$1 horas')
+      .replace(/(\d+)\s*%/g, '$1 por 100');
+  }
+
+  function escaparHtml(texto) {
+    return String(texto)
+      .replace(/&/g, '&amp;')
+      .replace(/</g, '&lt;')
+      .replace(/>/g, '&gt;')
+      .replace(/"/g, '&quot;');
+  }
+
+  // =========================================================================
+  // CARGA DEL ÍNDICE
+  // =========================================================================
+
+  /**
+   * Descarga el índice una sola vez. Todas las llamadas devuelven la misma
+   * promesa; si falla, la siguiente llamada lo reintenta.
+   * @returns {Promise<Object>}
+   */
+  function cargar() {
+    if (!promesaIndice) {
+      promesaIndice = fetch(RUTA_INDICE)
+        .then(response => {
+          if (!response.ok) throw new Error('No se pudo cargar el índice de normativas');
+          return response.json();
+        })
+        .then(usarIndice)
+        .catch(error => {
+          promesaIndice = null;
+          throw error;
+        });
+    }
+    return promesaIndice;
+  }
+
+  /** Adelanta la descarga del índice (al pasar por un enlace o el botón). */
+  function precargar() {
+    if (!indice) cargar().catch(() => {});
+  }
+
+  /**
+   * Prepara un índice ya descargado (también sirve para usarlo sin fetch).
+   * @param {Object} datos - Contenido de indice.json
+   * @returns {Object}
+   */
+  function usarIndice(datos) {
+    indice = datos;
+    terminosOrdenados = Object.keys(datos.terminos).sort();
+    textosPlegados = new Array(datos.fragmentos.length);
+    const total = datos.longitudes.reduce((s, n) => s + n, 0);
+    longitudMedia = total / Math.max(1, datos.longitudes.length) || 1;
+    return datos;
+  }
+
+  function estaCargado() {
+    return !!indice;
+  }
+
+  // =========================================================================
+  // BÚSQUEDA
+  // =========================================================================
+
+  /**
+   * Términos del índice que empiezan por `prefijo` (bisección sobre la
+   * lista ordenada).
+   */
+  function terminosConPrefijo(prefijo) {
+    let bajo = 0;
+    let alto = terminosOrdenados.length;
+    while (bajo < alto) {
+      const medio = (bajo + alto) >> 1;
+      if (terminosOrdenados[medio] < prefijo) bajo = medio + 1; else alto = medio;
+    }
+    const encontrados = [];
+    for (let i = bajo; i < terminosOrdenados.length && encontrados.length < MAX_PREFIJOS; i++) {
+      if (!terminosOrdenados[i].startsWith(prefijo)) break;
+      encontrados.push(terminosOrdenados[i]);
+    }
+    return encontrados;
+  }
+
+  /**
+   * Variantes con las que se busca cada término de la consulta: el propio
+   * término, sus sinónimos (14 → catorce) y, para el último, los términos
+   * que empiezan por él.
+   */
+  function variantesConsulta(consulta) {
+    const normalizada = normalizarConsulta(consulta);
+    const lista = terminos(normalizada);
+    const ultimoAbierto = !/\s$/.test(normalizada);
+    return lista.map((termino, i) => {
+      const variantes = new Set([termino]);
+      (indice.sinonimos[termino] || []).forEach(s => variantes.add(s));
+      if (i === lista.length - 1 && ultimoAbierto && !/^\d+$/.test(termino)) {
+        terminosConPrefijo(termino).forEach(t => variantes.add(t));
+      }
+      return Array.from(variantes).filter(v => indice.terminos[v]);
+    });
+  }
+
+  /**
+   * Puntuación BM25 de un término de la consulta por fragmento (la mejor
+   * de sus variantes).
+   * @returns {Map<number, number>} fragmento → puntuación
+   */
+  function puntuarTermino(variantes, norma) {
+    const total = indice.fragmentos.length;
+    const puntuaciones = new Map();
+    variantes.forEach(variante => {
+      const lista = indice.terminos[variante];
+      const df = lista.length / 2;
+      const idf = Math.log(1 + (total - df + 0.5) / (df + 0.5));
+      for (let i = 0; i < lista.length; i += 2) {
+        const frag = lista[i];
+        if (norma && indice.fragmentos[frag][0] !== norma) continue;
+        const tf = lista[i + 1];
+        const longitud = indice.longitudes[frag] / longitudMedia;
+        const puntos = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * longitud));
+        if (puntos > (puntuaciones.get(frag) || 0)) puntuaciones.set(frag, puntos);
+      }
+    });
+    return puntuaciones;
+  }
+
+  /**
+   * Busca en las normativas. Requiere el índice cargado (cargar()).
+   *
+   * Se devuelven los fragmentos que contienen todos los términos; si no hay
+   * ninguno, los que contienen alguno (parcial: true).
+   *
+   * @param {string} consulta
+   * @param {Object} [opciones]
+   * @param {string} [opciones.norma] - 'decreto' o 'rd' (por defecto, ambas)
+   * @param {number} [opciones.limite] - Máximo de resultados
+   * @returns {{resultados: Array, total: number, parcial: boolean, ms: number}}
+   */
+  function buscar(consulta, opciones = {}) {
+    const t0 = performance.now();
+    const vacio = { resultados: [], total: 0, parcial: false, ms: 0 };
+    if (!indice) return vacio;
+
+    const variantes = variantesConsulta(consulta);
+    if (variantes.length === 0) return vacio;
+
+    const porTermino = variantes.map(v => puntuarTermino(v, opciones.norma));
+    const sumar = (frags) => frags.map(frag => ({
+      frag,
+      puntos: porTermino.reduce((s, p) => s + (p.get(frag) || 0), 0)
+    }));
+
+    // Intersección empezando por el término con menos fragmentos
+    const ordenados = porTermino.slice().sort((a, b) => a.size - b.size);
+    let candidatos = Array.from(ordenados[0].keys())
+      .filter(frag => ordenados.every(p => p.has(frag)));
+    let parcial = false;
+    if (candidatos.length === 0 && porTermino.length > 1) {
+      const union = new Set();
+      porTermino.forEach(p => p.forEach((_, frag) => union.add(frag)));
+      candidatos = Array.from(union);
+      parcial = candidatos.length > 0;
+    }
+
+    const puntuados = sumar(candidatos).sort((a, b) => b.puntos - a.puntos || a.frag - b.frag);
+    const resaltar = variantes.flat();
+    const resultados = puntuados.slice(0, opciones.limite || LIMITE_RESULTADOS).map(({ frag, puntos }) => {
+      const [norma, id, titulo, pagina] = indice.fragmentos[frag];
+      return {
+        fragmento: frag, norma, id, titulo, pagina,
+        puntos: Math.round(puntos * 1000) / 1000,
+        extracto: extracto(frag, resaltar)
+      };
+    });
+
+    return { resultados, total: puntuados.length, parcial, ms: performance.now() - t0, resaltar };
+  }
+
+  // =========================================================================
+  // RESALTADO
+  // =========================================================================
+
+  /** Texto plegado (con las mismas posiciones) de un fragmento. */
+  function textoPlegado(fragmento) {
+    if (textosPlegados[fragmento] === undefined) {
+      textosPlegados[fragmento] = plegarPosiciones(indice.fragmentos[fragmento][4]);
+    }
+    return textosPlegados[fragmento];
+  }
+
+  /**
+   * Rangos [inicio, fin) de las palabras del texto que empiezan por alguno
+   * de los términos (plegados) o que contienen la frase indicada.
+   * @param {string} plegado - Texto plegado con plegarPosiciones()
+   */
+  function rangosCoincidencias(plegado, terminosResaltar = [], frase = '') {
+    const rangos = [];
+    if (terminosResaltar.length > 0) {
+      const patron = new RegExp(`(^|[^a-z0-9])(${terminosResaltar.join('|')})[a-z0-9]*`, 'g');
+      let m;
+      while ((m = patron.exec(plegado)) !== null) {
+        const inicio = m.index + m[1].length;
+        rangos.push([inicio, m.index + m[0].length]);
+      }
+    }
+    if (frase) {
+      const fraseplegada = plegarPosiciones(frase);
+      let desde = plegado.indexOf(fraseplegada);
+      while (desde !== -1) {
+        rangos.push([desde, desde + fraseplegada.length]);
+        desde = plegado.indexOf(fraseplegada, desde + fraseplegada.length);
+      }
+    }
+    return rangos.sort((a, b) => a[0] - b[0]);
+  }
+
+  /**
+   * HTML escapado de texto[desde, hasta) con los rangos en <mark>.
+   */
+  function marcar(texto, rangos, desde = 0, hasta = texto.length) {
+    let html = '';
+    let pos = desde;
+    rangos.forEach(([inicio, fin]) => {
+      if (fin <= pos || inicio >= hasta) return;
+      const a = Math.max(inicio, pos);
+      const b = Math.min(fin, hasta);
+      html += escaparHtml(texto.slice(pos, a)) + `<mark>${escaparHtml(texto.slice(a, b))}</mark>`;
+      pos = b;
+    });
+    return html + escaparHtml(texto.slice(pos, hasta));
+  }
+
+  /**
+   * Extracto HTML alrededor de la primera coincidencia.
+   */
+  function extracto(fragmento, terminosResaltar) {
+    const texto = indice.fragmentos[fragmento][4];
+    const rangos = rangosCoincidencias(textoPlegado(fragmento), terminosResaltar);
+    const centro = rangos.length ? rangos[0][0] : 0;
+    let desde = Math.max(0, centro - CONTEXTO_EXTRACTO);
+    let hasta = Math.min(texto.length, centro + CONTEXTO_EXTRACTO * 2);
+    // Cortar en espacios para no partir palabras
+    if (desde > 0) desde = texto.indexOf(' ', desde) + 1 || desde;
+    if (hasta < texto.length) hasta = texto.lastIndexOf(' ', hasta) > desde ? texto.lastIndexOf(' ', hasta) : hasta;
+    return (desde > 0 ? '… ' : '') +
+      marcar(texto, rangos, desde, hasta).replace(/\n/g, ' ') +
+      (hasta < texto.length ? ' …' : '');
+  }
+
+  // =========================================================================
+  // REGLAS DEL CÁLCULO
+  // =========================================================================
+
+  /**
+   * Artículo que regula una regla del cálculo en una normativa.
+   * @param {string} regla - 'manutencion', 'cena', 'alojamiento', 'extranjero',
+   *   'residenciaEventual', 'kilometraje', 'cuantiasNacional', 'cuantiasExtranjero'
+   * @param {string} normativa - 'decreto' o 'rd'
+   * @returns {{fragmento: number, titulo: string, pagina: number, frase: string}|null}
+   */
+  function getRegla(regla, normativa) {
+    const destino = indice?.reglas[regla]?.[normativa];
+    if (!destino) return null;
+    const [fragmento, frase] = destino;
+    const [, , titulo, pagina] = indice.fragmentos[fragmento];
+    return { fragmento, titulo, pagina, frase };
+  }
+
+  // =========================================================================
+  // PANEL
+  // =========================================================================
+
+  let panel = null;
+  let ultimaBusqueda = null;
+
+  function crearPanel() {
+    panel = document.createElement('div');
+    panel.id = 'panel-normativa';
+    panel.className = 'panel-normativa';
+    panel.setAttribute('role', 'dialog');
+    panel.setAttribute('aria-label', 'Normativa');
+    panel.hidden = true;
+    panel.innerHTML = `
+      <div class="panel-normativa-cabecera">
+        <strong>Normativa</strong>
+        <button type="button" data-accion="cerrar" aria-label="Cerrar">×</button>
+      </div>
+      <div class="panel-normativa-busqueda">
+        <select data-campo="norma" aria-label="Normativa">
+          <option value="">Todas</option>
+          <option value="decreto">Decreto 42/2025</option>
+          <option value="rd">R.D. 462/2002</option>
+        </select>
+        <input type="search" data-campo="consulta" autocomplete="off"
+          placeholder="Buscar: catorce horas, residencia eventual, 22:00…" aria-label="Buscar en la normativa" />
+      </div>
+      <div class="panel-normativa-estado" aria-live="polite"></div>
+      <div class="panel-normativa-contenido"></div>`;
+
+    panel.addEventListener('click', (e) => {
+      const boton = e.target.closest('[data-accion]');
+      const accion = boton?.dataset.accion;
+      if (accion === 'cerrar') ocultarPanel();
+      else if (accion === 'abrir') mostrarFragmento(Number(boton.dataset.fragmento), { terminos: ultimaBusqueda?.resaltar });
+      else if (accion === 'volver') pintarResultados();
+    });
+    panel.querySelector('[data-campo="consulta"]').addEventListener('input', pintarResultados);
+    panel.querySelector('[data-campo="norma"]').addEventListener('change', pintarResultados);
+    panel.addEventListener('keydown', (e) => {
+      if (e.key === 'Escape') ocultarPanel();
+    });
+    document.body.appendChild(panel);
+  }
+
+  function campo(nombre) {
+    return panel.querySelector(`[data-campo="${nombre}"]`);
+  }
+
+  function pintarEstado(texto) {
+    panel.querySelector('.panel-normativa-estado').textContent = texto;
+  }
+
+  function pintarResultados() {
+    if (!panel) return;
+    const contenido = panel.querySelector('.panel-normativa-contenido');
+    if (!indice) {
+      pintarEstado('Cargando índice…');
+      cargar().then(pintarResultados, () => pintarEstado('No se pudo cargar el índice de normativas.'));
+      return;
+    }
+
+    const consulta = campo('consulta').value;
+    if (!consulta.trim()) {
+      ultimaBusqueda = null;
+      pintarEstado(`${indice.fragmentos.length} artículos y anexos indexados`);
+      contenido.innerHTML = '';
+      return;
+    }
+
+    const busqueda = buscar(consulta, { norma: campo('norma').value || undefined });
+    ultimaBusqueda = busqueda;
+    const { resultados, total, parcial, ms } = busqueda;
+    pintarEstado(`${total} resultado${total === 1 ? '' : 's'}${parcial ? ' (sin todos los términos)' : ''} · ${ms.toFixed(1)} ms`);
+    contenido.innerHTML = resultados.map(r => `
+      <button type="button" class="resultado-normativa" data-accion="abrir" data-fragmento="${r.fragmento}">
+        <span class="resultado-normativa-titulo">${escaparHtml(r.titulo)}</span>
+        <span class="resultado-normativa-norma">${escaparHtml(indice.normas[r.norma].nombre)} · pág. ${r.pagina}</span>
+        <span class="resultado-normativa-extracto">${r.extracto}</span>
+      </button>`).join('');
+  }
+
+  /**
+   * Muestra un fragmento completo en el panel.
+   * @param {number} fragmento - Posición en indice.fragmentos
+   * @param {Object} [resaltado] - { terminos: [...], frase: '...' }
+   */
+  function mostrarFragmento(fragmento, resaltado = {}) {
+    const [norma, , titulo, pagina, texto] = indice.fragmentos[fragmento];
+    const { nombre, archivo } = indice.normas[norma];
+    const rangos = rangosCoincidencias(textoPlegado(fragmento), resaltado.terminos || [], resaltado.frase || '');
+    const parrafos = [];
+    let inicio = 0;
+    texto.split('\n').forEach(linea => {
+      const fin = inicio + linea.length;
+      parrafos.push(`<p>${marcar(texto, rangos, inicio, fin)}</p>`);
+      inicio = fin + 1;
+    });
+
+    pintarEstado('');
+    const contenido = panel.querySelector('.panel-normativa-contenido');
+    contenido.innerHTML = `
+      <div class="articulo-normativa">
+        <button type="button" class="btn-volver-normativa" data-accion="volver">← Resultados</button>
+        <h4>${escaparHtml(titulo)}</h4>
+        <div class="articulo-normativa-meta">
+          ${escaparHtml(nombre)} · pág. ${pagina} ·
+          <a href="${encodeURI(archivo)}#page=${pagina}" target="_blank" rel="noopener">Abrir PDF (pág. ${pagina})</a>
+        </div>
+        <div class="articulo-normativa-texto">${parrafos.join('')}</div>
+      </div>`;
+    contenido.scrollTop = 0;
+    contenido.querySelector('mark')?.scrollIntoView({ block: 'center' });
+  }
+
+  function mostrarPanel() {
+    if (!panel) crearPanel();
+    panel.hidden = false;
+    pintarResultados();
+    campo('consulta').focus();
+  }
+
+  function ocultarPanel() {
+    if (panel) panel.hidden = true;
+  }
+
+  function alternarPanel() {
+    if (panel && !panel.hidden) ocultarPanel(); else mostrarPanel();
+  }
+
+  /**
+   * Abre en el panel el artículo que regula una regla del cálculo, con la
+   * frase correspondiente resaltada.
+   * @param {string} regla - Ver getRegla()
+   * @param {string} [normativa='decreto']
+   * @returns {Promise<void>}
+   */
+  async function abrirRegla(regla, normativa = 'decreto') {
+    if (!panel) crearPanel();
+    panel.hidden = false;
+    if (!indice) pintarEstado('Cargando índice…');
+    try {
+      await cargar();
+    } catch (e) {
+      pintarEstado('No se pudo cargar el índice de normativas.');
+      return;
+    }
+    const destino = getRegla(regla, normativa);
+    if (!destino) {
+      pintarResultados();
+      return;
+    }
+    campo('norma').value = normativa;
+    mostrarFragmento(destino.fragmento, { frase: destino.frase });
+  }
+
+  // =========================================================================
+  // INICIALIZACIÓN
+  // =========================================================================
+
+  if (typeof document !== 'undefined') {
+    // Enlaces "§" de los resultados del cálculo: la normativa sale del
+    // bloque de resultado (data-normativa)
+    document.addEventListener('click', (e) => {
+      const enlace = e.target.closest?.('.enlace-normativa[data-regla]');
+      if (enlace) {
+        e.preventDefault();
+        const normativa = enlace.closest('[data-normativa]')?.dataset.normativa || 'decreto';
+        abrirRegla(enlace.dataset.regla, normativa);
+        return;
+      }
+      if (e.target.closest?.('#btn-normativa')) alternarPanel();
+    });
+
+    // Precarga del índice al acercarse a un enlace o al botón
+    document.addEventListener('pointerover', (e) => {
+      if (!indice && e.target.closest?.('.enlace-normativa, #btn-normativa')) precargar();
+    });
+    document.addEventListener('focusin', (e) => {
+      if (!indice && e.target.closest?.('.enlace-normativa, #btn-normativa')) precargar();
+    });
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.normativas = {
+    cargar,
+    precargar,
+    estaCargado,
+    buscar,
+    getRegla,
+    abrirRegla,
+    mostrarPanel,
+    ocultarPanel,
+    alternarPanel,
+
+    // Para testing
+    _usarIndice: usarIndice,
+    _plegar: plegar,
+    _terminos: terminos,
+    _normalizarConsulta: normalizarConsulta,
+    _plegarPosiciones: plegarPosiciones,
+    _rangosCoincidencias: rangosCoincidencias
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -50,14 +50,8 @@
       bold: 'HelveticaNeue-Bold',
       italics: 'HelveticaNeue-Italic',
       bolditalics: 'HelveticaNeue-BoldItalic'
-    },
-    // Roboto viene incluida en vfs_fonts.js del CDN
-    'Roboto': {
-      normal: 'Roboto-Regular.ttf',
-      bold: 'Roboto-Medium.ttf',
-      italics: 'Roboto-Italic.ttf',
-      bolditalics: 'Roboto-MediumItalic.ttf'
     }
+    // Roboto (vfs_fonts.js) no se registra: las plantillas no la usan
   });
 
 })(typeof window !== 'undefined' ? window : this);
@@ -34,7 +34,7 @@
   /**
    * Calcula la altura del pie de página en función de los datos.
    *  - Base: 152 pt
-   *  - +4 pt por cada elemento en imputacion[]
+   *  - +12 pt por cada responsable distinto en imputacion[]
    *  - +6 pt si se muestran logos (proyecto.tipo === 'G24' o 'I24')
    * @param {Object} datos - Datos del formulario
    * @returns {number} Altura en puntos
@@ -42,7 +42,9 @@
   function calcularAlturaFooter(datos) {
     let h = PDF_CONFIG.footer.baseHeight;
     const imputacion = datos.imputacion || [];
-    h += imputacion.length * 12;
+    // El pie solo lista responsables únicos (puede haber decenas de líneas)
+    const responsables = new Set(imputacion.map(imp => imp.responsable).filter(Boolean));
+    h += Math.max(1, responsables.size) * 12;
     const tipo = datos.proyecto?.tipo;
     if (tipo === 'G24' || tipo === 'I24') {
       h += 14;
@@ -212,6 +214,249 @@
     return await response.text();
   }
 
+  let recursosPromise = null;
+
+  /**
+   * Carga los recursos gráficos del documento (logo, separador y logos GR24).
+   * Se cargan una sola vez y se reutilizan en generaciones posteriores; si no
+   * se pudo obtener el logo, el siguiente intento vuelve a cargarlos.
+   * @returns {Promise<{logoData: string|null, isSVG: boolean, separadorSVG: string|null, logosGr24Base64: string|null}>}
+   */
+  function cargarRecursos() {
+    if (recursosPromise) return recursosPromise;
+
+    recursosPromise = (async () => {
+      // Intentar cargar como SVG primero
+      let logoData = null;
+      let isSVG = false;
+      try {
+        logoData = await loadSVG('assets/img/logouex.svg');
+        isSVG = true;
+      } catch (svgError) {
+        console.warn('[pdfGen] No se pudo cargar SVG, intentando PNG...');
+        try {
+          logoData = await loadImageAsBase64('assets/img/logo-uex.png');
+        } catch (pngError) {
+          console.error('[pdfGen] No se pudo cargar ningún logo');
+        }
+      }
+
+      // Cargar separador SVG
+      let separadorSVG = null;
+      try {
+        separadorSVG = await loadSVG('assets/img/separador.svg');
+      } catch (e) {
+        console.warn('[pdfGen] No se pudo cargar el separador SVG');
+      }
+
+      // Cargar logos GR24 (para pie de página)
+      let logosGr24Base64 = null;
+      try {
+        logosGr24Base64 = await loadImageAsBase64('assets/img/logos_gr24.png');
+      } catch (e) {
+        console.warn('[pdfGen] No se pudo cargar logos_gr24.png');
+      }
+
+      if (!logoData) recursosPromise = null;
+      return { logoData, isSVG, separadorSVG, logosGr24Base64 };
+    })();
+
+    return recursosPromise;
+  }
+
+  /**
+   * Copia profunda de un nodo de pdfmake.
+   * pdfmake anota los nodos durante el maquetado, así que las secciones
+   * reutilizadas entre documentos deben clonarse. Las funciones (layouts)
+   * se comparten por referencia.
+   * @param {*} nodo
+   * @returns {*}
+   */
+  function clonarNodo(nodo) {
+    if (Array.isArray(nodo)) return nodo.map(clonarNodo);
+    if (nodo && typeof nodo === 'object') {
+      const copia = {};
+      Object.keys(nodo).forEach(k => { copia[k] = clonarNodo(nodo[k]); });
+      return copia;
+    }
+    return nodo;
+  }
+
+  // =========================================================================
+  // CONTEXTO DE FUENTES
+  // =========================================================================
+
+  /**
+   * Fuentes y VFS ya decodificados, compartidos por todos los documentos.
+   * pdfmake lee cada fuente del VFS en cada createPdf(); si la entrada es una
+   * cadena base64 la decodifica de nuevo, mientras que con bytes solo copia.
+   * @type {{fuentes: Object, vfs: Object}|null}
+   */
+  let contextoFuentes = null;
+
+  function base64ABytes(b64) {
+    const binario = atob(b64);
+    const bytes = new Uint8Array(binario.length);
+    for (let i = 0; i < binario.length; i++) bytes[i] = binario.charCodeAt(i);
+    return bytes;
+  }
+
+  /**
+   * Crea (una sola vez) el contexto de fuentes: decodifica los ficheros del
+   * VFS que usan las familias registradas y omite las familias sin datos en
+   * el VFS (p. ej. Roboto cuando no se incluye vfs_fonts.js). La
+   * decodificación se traza como 'pdf.fuentes'.
+   * @returns {{fuentes: Object, vfs: Object}}
+   */
+  function getContextoFuentes() {
+    if (contextoFuentes) return contextoFuentes;
+
+    const traza = global.trazas?.inicio();
+    const origenFuentes = pdfMake.fonts || {};
+    const origenVfs = pdfMake.vfs || {};
+    const fuentes = {};
+    const vfs = {};
+
+    Object.keys(origenFuentes).forEach(familia => {
+      const variantes = origenFuentes[familia];
+      const archivos = Object.values(variantes);
+      if (!archivos.every(a => typeof a === 'string' && origenVfs[a])) return;
+      fuentes[familia] = { ...variantes };
+      archivos.forEach(a => {
+        if (!vfs[a]) {
+          vfs[a] = typeof origenVfs[a] === 'string' ? base64ABytes(origenVfs[a]) : origenVfs[a];
+        }
+      });
+    });
+
+    contextoFuentes = { fuentes, vfs };
+    global.trazas?.fin('pdf.fuentes', traza);
+    return contextoFuentes;
+  }
+
+  /**
+   * pdfMake.createPdf() sobre el contexto de fuentes persistente.
+   * Con las trazas activas, la maquetación y escritura del PDF (getBuffer,
+   * por el que pasan download/open/getBlob) se mide como 'pdf.render'.
+   * @param {Object} docDefinition
+   * @returns {Object} Documento de pdfmake
+   */
+  function crearPdf(docDefinition) {
+    const { fuentes, vfs } = getContextoFuentes();
+    const documento = pdfMake.createPdf(docDefinition, null, fuentes, vfs);
+    if (global.trazas?.estaActivo()) {
+      const getBuffer = documento.getBuffer;
+      documento.getBuffer = function (callback, opciones) {
+        const traza = global.trazas.inicio();
+        return getBuffer.call(this, (buffer) => {
+          global.trazas.fin('pdf.render', traza);
+          callback(buffer);
+        }, opciones);
+      };
+    }
+    return documento;
+  }
+
+  // =========================================================================
+  // MEMOIZACIÓN DE SECCIONES
+  // =========================================================================
+
+  /**
+   * Secciones memoizables: constructor y claves de `datos` de las que depende.
+   * Una sección solo se reconstruye si cambia el hash de su porción de datos.
+   */
+  const SECCIONES = {
+    beneficiario: { construir: buildTablaBeneficiario, claves: ['beneficiario', 'pago', 'vehiculo'] },
+    proyecto: { construir: buildTablaProyecto, claves: ['proyecto', 'imputacion', 'tipoLiquidacion', 'desplazamientoAECC'] },
+    honorarios: { construir: buildTablaHonorarios, claves: ['honorarios'] },
+    desplazamientos: { construir: buildTablasDesplazamientos, claves: ['desplazamientos', 'evento'] },
+    aecc: { construir: buildTablaDesplazamientoAECC, claves: ['desplazamientoAECC'] },
+    especial: { construir: buildTablaDesplazamientoEspecial, claves: ['desplazamientoEspecial'] },
+    congresos: { construir: buildTablaCongresos, claves: ['evento'] },
+    resultado: { construir: buildTablaResultadoLiquidacion, claves: ['ajustes', 'evento', 'resultadoLiquidacion'] },
+    irpf: { construir: buildTablaIRPF, claves: ['resultadoLiquidacion'] },
+    declaracionHonorarios: { construir: buildTablaDeclaracionHonorarios, claves: ['honorarios', 'beneficiario'] },
+    footer: { construir: buildFooterPrincipal, claves: ['imputacion', 'beneficiario', 'proyecto', 'fechaFirma'] }
+  };
+
+  /** nombre → { refs, hash, extras, nodos } de la última construcción */
+  const cacheSecciones = new Map();
+
+  /**
+   * Serializa un valor con las claves ordenadas, de modo que dos objetos con
+   * el mismo contenido dan la misma cadena aunque difiera el orden de claves.
+   * @param {*} valor
+   * @returns {string}
+   */
+  function serializarEstable(valor) {
+    if (valor === undefined) return 'u';
+    if (valor === null || typeof valor !== 'object') return JSON.stringify(valor);
+    if (Array.isArray(valor)) return '[' + valor.map(serializarEstable).join(',') + ']';
+    return '{' + Object.keys(valor).sort()
+      .map(k => JSON.stringify(k) + ':' + serializarEstable(valor[k]))
+      .join(',') + '}';
+  }
+
+  /**
+   * Hash estructural (FNV-1a doble de 32 bits sobre la serialización estable).
+   * @param {*} valor
+   * @returns {string}
+   */
+  function hashEstructural(valor) {
+    const s = serializarEstable(valor);
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193 ^ s.length;
+    for (let i = 0; i < s.length; i++) {
+      const c = s.charCodeAt(i);
+      h1 = Math.imul(h1 ^ c, 0x01000193);
+      h2 = Math.imul(h2 ^ c, 0x5bd1e995);
+    }
+    return (h1 >>> 0).toString(36) + '-' + (h2 >>> 0).toString(36);
+  }
+
+  /**
+   * Devuelve los nodos de una sección, reconstruyéndolos solo si su porción
+   * de datos ha cambiado desde la última vez. Se entrega siempre una copia:
+   * pdfmake anota los nodos al maquetar y la versión en caché debe quedar limpia.
+   * @param {string} nombre - Clave de SECCIONES
+   * @param {Object} datos - Datos de la liquidación
+   * @param {...*} extras - Argumentos adicionales del constructor (se comparan por identidad)
+   * @returns {*} Nodos de pdfmake
+   */
+  function seccion(nombre, datos, ...extras) {
+    const def = SECCIONES[nombre];
+    const traza = global.trazas?.inicio();
+    const refs = def.claves.map(k => datos[k]);
+    const previa = cacheSecciones.get(nombre);
+    const mismosExtras = !!previa && previa.extras.length === extras.length &&
+      previa.extras.every((e, i) => Object.is(e, extras[i]));
+    // estadoFormulario conserva la referencia de las secciones sin cambios:
+    // si todas coinciden no hace falta ni calcular el hash
+    const mismasRefs = mismosExtras && refs.every((r, i) => Object.is(r, previa.refs[i]));
+    const hash = mismasRefs ? previa.hash : hashEstructural(refs);
+    const reutilizada = mismosExtras && previa.hash === hash;
+
+    let nodos;
+    if (reutilizada) {
+      nodos = previa.nodos;
+    } else {
+      nodos = def.construir(datos, ...extras);
+    }
+    cacheSecciones.set(nombre, { refs, hash, extras, nodos });
+    const copia = clonarNodo(nodos);
+    // Las reutilizadas se trazan aparte para no mezclar sus tiempos
+    global.trazas?.fin(`pdf.seccion.${nombre}${reutilizada ? '.cache' : ''}`, traza);
+
+    return copia;
+  }
+
+  /**
+   * Vacía la caché de secciones.
+   */
+  function resetCacheSecciones() {
+    cacheSecciones.clear();
+  }
+
   // =========================================================================
   // REFERENCIA AL MÓDULO DE SERIALIZACIÓN
   // =========================================================================
@@ -242,12 +487,15 @@
    * @param {boolean} logoIsSVG - true si el logo es SVG
    * @param {string} separadorSVG - Contenido SVG del separador
    * @param {string|null} logosGr24Base64 - Imagen logos_gr24 en Base64 (para pie de página)
+   * @param {Array|null} [seccionesCompartidas] - Resultado de buildSeccionesCompartidas()
+   *   para reutilizar entre documentos con los mismos desplazamientos
    */
-  function buildDocDefinition(datos, logoBase64, logoIsSVG = false, separadorSVG = null, logosGr24Base64 = null) {
+  function buildDocDefinition(datos, logoBase64, logoIsSVG = false, separadorSVG = null, logosGr24Base64 = null, seccionesCompartidas = null) {
     const margin = PDF_CONFIG.page.margin;
+    const traza = global.trazas?.inicio();
     const footerHeight = calcularAlturaFooter(datos);
 
-    return {
+    const documento = {
       // ─────────────────────────────────────────────────────────────────────
       // INFORMACIÓN DEL DOCUMENTO
       // ─────────────────────────────────────────────────────────────────────
@@ -272,7 +520,7 @@
       // ─────────────────────────────────────────────────────────────────────
       // PIE DE PÁGINA (sección principal)
       // ─────────────────────────────────────────────────────────────────────
-      footer: buildFooterPrincipal(datos, logosGr24Base64),
+      footer: seccion('footer', datos, logosGr24Base64),
 
       // ─────────────────────────────────────────────────────────────────────
       // ESTILOS
@@ -397,47 +645,58 @@
         // ═══════════════════════════════════════════════════════════════════
         
         // Tabla: Datos del beneficiario
-        { unbreakable: true, stack: buildTablaBeneficiario(datos) },
+        { unbreakable: true, stack: seccion('beneficiario', datos) },
 
         // Espaciador entre tablas
         { text: '', margin: [0, PDF_CONFIG.espacioTablas, 0, 0] },
 
         // Tabla: Datos del proyecto
-        { unbreakable: true, stack: buildTablaProyecto(datos) },
+        { unbreakable: true, stack: seccion('proyecto', datos) },
 
         // Tabla de honorarios (si existe)
-        ...buildTablaHonorarios(datos),
-
-        // Tablas de desplazamientos
-        ...buildTablasDesplazamientos(datos),
-
-        // Tabla de desplazamiento AECC (si existe)
-        ...buildTablaDesplazamientoAECC(datos),
+        ...seccion('honorarios', datos),
 
-        // Tabla de desplazamiento especial (si existe)
-        ...buildTablaDesplazamientoEspecial(datos),
-
-        // Tabla de congresos (si existe y no está asociada a ningún desplazamiento)
-        ...(() => {
-          const evento = datos.evento || {};
-          const desplazamientoAsociado = evento.desplazamientoAsociado;
-          if (!desplazamientoAsociado) {
-            return buildTablaCongresos(datos);
-          }
-          return [];
-        })(),
+        // Desplazamientos, AECC, especial y congresos
+        ...(seccionesCompartidas ? clonarNodo(seccionesCompartidas) : buildSeccionesCompartidas(datos)),
 
         // Tabla de resultado de liquidación (si hay descuentos o financiación)
-        ...buildTablaResultadoLiquidacion(datos),
+        ...seccion('resultado', datos),
 
         // Tabla de IRPF
-        ...buildTablaIRPF(datos),
+        ...seccion('irpf', datos),
 
         // Tabla de declaración responsable de honorarios (si existe)
-        ...buildTablaDeclaracionHonorarios(datos)
+        ...seccion('declaracionHonorarios', datos)
 
       ]
     };
+
+    global.trazas?.fin('pdf.documento', traza);
+    return documento;
+  }
+
+  /**
+   * Construye las secciones que dependen solo de los datos del viaje
+   * (desplazamientos, AECC, especial y congresos), comunes a todos los
+   * miembros de una liquidación de grupo.
+   * @param {Object} datos - Datos de la liquidación
+   * @returns {Array} Nodos de contenido para pdfmake
+   */
+  function buildSeccionesCompartidas(datos) {
+    const evento = datos.evento || {};
+    return [
+      // Tablas de desplazamientos
+      ...seccion('desplazamientos', datos),
+
+      // Tabla de desplazamiento AECC (si existe)
+      ...seccion('aecc', datos),
+
+      // Tabla de desplazamiento especial (si existe)
+      ...seccion('especial', datos),
+
+      // Tabla de congresos (si existe y no está asociada a ningún desplazamiento)
+      ...(!evento.desplazamientoAsociado ? seccion('congresos', datos) : [])
+    ];
   }
 
   // =========================================================================
@@ -2050,50 +2309,13 @@
     try {
       console.log('[pdfGen] Datos del formulario:', d);
       console.log('[pdfGen] Tipo de liquidación:', d.tipoLiquidacion || 'GNRAL');
-      console.log('[pdfGen] Cargando logo...');
-
-      // Intentar cargar como SVG primero
-      let logoData;
-      let isSVG = false;
-
-      try {
-        logoData = await loadSVG('assets/img/logouex.svg');
-        isSVG = true;
-        console.log('[pdfGen] Logo SVG cargado');
-      } catch (svgError) {
-        console.warn('[pdfGen] No se pudo cargar SVG, intentando PNG...');
-        try {
-          logoData = await loadImageAsBase64('assets/img/logo-uex.png');
-          console.log('[pdfGen] Logo PNG cargado');
-        } catch (pngError) {
-          console.error('[pdfGen] No se pudo cargar ningún logo');
-          // Continuar sin logo
-          logoData = null;
-        }
-      }
-
-      // Cargar separador SVG
-      let separadorSVG = null;
-      try {
-        separadorSVG = await loadSVG('assets/img/separador.svg');
-        console.log('[pdfGen] Separador SVG cargado');
-      } catch (e) {
-        console.warn('[pdfGen] No se pudo cargar el separador SVG');
-      }
-
-      // Cargar logos GR24 (para pie de página)
-      let logosGr24Base64 = null;
-      try {
-        logosGr24Base64 = await loadImageAsBase64('assets/img/logos_gr24.png');
-        console.log('[pdfGen] Logos GR24 cargado');
-      } catch (e) {
-        console.warn('[pdfGen] No se pudo cargar logos_gr24.png');
-      }
+      console.log('[pdfGen] Cargando recursos...');
+      const { logoData, isSVG, separadorSVG, logosGr24Base64 } = await cargarRecursos();
 
       console.log('[pdfGen] Generando PDF...');
       const docDefinition = buildDocDefinition(d, logoData, isSVG, separadorSVG, logosGr24Base64);
 
-      pdfMake.createPdf(docDefinition).download(`Liquidacion_${d.proyecto?.referencia || 'borrador'}.pdf`);
+      crearPdf(docDefinition).download(`Liquidacion_${d.proyecto?.referencia || 'borrador'}.pdf`);
       console.log('[pdfGen] PDF generado correctamente');
 
     } catch (error) {
@@ -2122,38 +2344,10 @@
     }
 
     try {
-      let logoData;
-      let isSVG = false;
-
-      try {
-        logoData = await loadSVG('assets/img/logouex.svg');
-        isSVG = true;
-      } catch {
-        try {
-          logoData = await loadImageAsBase64('assets/img/logo-uex.png');
-        } catch {
-          logoData = null;
-        }
-      }
-
-      // Cargar separador SVG
-      let separadorSVG = null;
-      try {
-        separadorSVG = await loadSVG('assets/img/separador.svg');
-      } catch {
-        // Continuar sin separador
-      }
-
-      // Cargar logos GR24 (para pie de página)
-      let logosGr24Base64 = null;
-      try {
-        logosGr24Base64 = await loadImageAsBase64('assets/img/logos_gr24.png');
-      } catch {
-        // Continuar sin logos
-      }
+      const { logoData, isSVG, separadorSVG, logosGr24Base64 } = await cargarRecursos();
 
       const docDefinition = buildDocDefinition(d, logoData, isSVG, separadorSVG, logosGr24Base64);
-      pdfMake.createPdf(docDefinition).open();
+      crearPdf(docDefinition).open();
 
     } catch (error) {
       console.error('[pdfGen] Error:', error);
@@ -2161,6 +2355,57 @@
     }
   }
 
+  /**
+   * Genera y descarga en lote los PDF de varias liquidaciones.
+   * Los recursos gráficos se cargan una vez y, si las liquidaciones comparten
+   * los desplazamientos (modo grupo), sus secciones se construyen una sola vez.
+   * @param {Array<Object>} listaDatos - Datos de cada liquidación
+   * @param {Object} [opciones]
+   * @param {boolean} [opciones.compartirSecciones=false] - Reutilizar las secciones del viaje del primer elemento
+   * @param {Function} [opciones.nombreArchivo] - (datos, indice) => nombre del fichero
+   * @returns {Promise<number>} Número de PDF generados
+   */
+  async function generarLote(listaDatos, opciones = {}) {
+    const lista = (listaDatos || []).filter(Boolean);
+    if (lista.length === 0) return 0;
+
+    if (typeof pdfMake === 'undefined') {
+      console.error('[pdfGen] pdfMake no está cargado');
+      alert('Error: La librería pdfMake no está disponible.');
+      return 0;
+    }
+
+    if (!pdfMake.fonts || !pdfMake.fonts['HelveticaNeue-MediumCondensed']) {
+      console.error('[pdfGen] Fuentes personalizadas no cargadas. Asegúrate de incluir pdfFonts.js');
+      alert('Error: Las fuentes no están cargadas. Verifica pdfFonts.js');
+      return 0;
+    }
+
+    const nombreArchivo = typeof opciones.nombreArchivo === 'function'
+      ? opciones.nombreArchivo
+      : (d, i) => `Liquidacion_${d.proyecto?.referencia || 'borrador'}_${i + 1}.pdf`;
+
+    let generados = 0;
+    try {
+      const { logoData, isSVG, separadorSVG, logosGr24Base64 } = await cargarRecursos();
+      const compartidas = opciones.compartirSecciones ? buildSeccionesCompartidas(lista[0]) : null;
+
+      for (let i = 0; i < lista.length; i++) {
+        // Tipo por defecto sin modificar los datos recibidos
+        const d = lista[i].tipoLiquidacion ? lista[i] : { ...lista[i], tipoLiquidacion: 'GNRAL' };
+        const docDefinition = buildDocDefinition(d, logoData, isSVG, separadorSVG, logosGr24Base64, compartidas);
+        // Secuencial: cada descarga termina antes de maquetar la siguiente
+        await new Promise(resolve => crearPdf(docDefinition).download(nombreArchivo(d, i), resolve));
+        generados++;
+      }
+      console.log(`[pdfGen] Lote generado: ${generados} PDF`);
+    } catch (error) {
+      console.error('[pdfGen] Error generando lote de PDF:', error);
+      alert('Error generando los PDF: ' + error.message);
+    }
+    return generados;
+  }
+
   // =========================================================================
   // INICIALIZACIÓN
   // =========================================================================
@@ -2217,9 +2462,16 @@
   global.pdfGen = {
     init,
     generar,
+    generarLote,
     preview,
     PDF_CONFIG,
-    obtenerDatosFormulario
+    obtenerDatosFormulario,
+    resetCacheSecciones,
+
+    getContextoFuentes,
+
+    // Para testing
+    _hashEstructural: hashEstructural
   };
 
   // Auto-inicializar
@@ -0,0 +1,348 @@
+/**
+ * reglasDietas.js
+ * ===============
+ * Reglas de manutención y pernocta por normativa como tablas de decisión.
+ *
+ * Las reglas se declaran como datos (clave reglasDietas de datos.json): cada
+ * tabla es una lista de tramos [desde 'HH:MM', valor] que rige hasta el
+ * siguiente tramo. Al compilarlas se expanden a una entrada por minuto del
+ * día, de modo que evaluar una regla es un acceso a un array tipado:
+ *
+ *   ida               Unidades del día de salida según la hora de ida
+ *   regreso           Unidades del día de regreso si no cuenta la cena
+ *   cena              1 si la hora de regreso da derecho a cena
+ *   mismoDia          Viajes de un día: media comida si se sale antes de
+ *                     salidaComida y se vuelve después de regresoComida
+ *                     (regresoComidaUltimoTramoIntl en el último tramo
+ *                     internacional) y el viaje dura al menos
+ *                     duracionMinimaComida
+ *   ticketCena        Si la cena exige ticket (y se pregunta en la ficha)
+ *   pernocta (común)  'no' | 'ambigua' | 'si' según la hora de regreso
+ *
+ * Un cambio de umbral o una normativa nueva es un cambio en datos.json; el
+ * corpus de assets/data/reglasDietas.corpus.json fija el comportamiento
+ * esperado y se comprueba con reglasDietas.verificarCorpus().
+ *
+ * @module reglasDietas
+ */
+(function (global) {
+  'use strict';
+
+  const MINUTOS_DIA = 1440;
+
+  const RUTA_CORPUS = 'assets/data/reglasDietas.corpus.json';
+
+  /** Códigos de pernocta en la tabla compilada */
+  const PERNOCTA = { no: 0, si: 1, ambigua: 2 };
+  const NOMBRE_PERNOCTA = ['no', 'si', 'ambigua'];
+
+  /**
+   * Reglas de referencia, usadas si datos.json no trae reglasDietas.
+   * Deben coincidir con las de datos.json.
+   */
+  const REGLAS_REFERENCIA = {
+    pernocta: [['00:00', 'no'], ['01:01', 'ambigua'], ['07:00', 'si']],
+    rd: {
+      ticketCena: true,
+      duracionMinimaComida: '05:00',
+      ida: [['00:00', 1], ['14:00', 0.5], ['22:00', 0]],
+      regreso: [['00:00', 0], ['14:01', 0.5]],
+      cena: [['00:00', 0], ['22:01', 1]],
+      mismoDia: {
+        salidaComida: [['00:00', 1], ['14:00', 0]],
+        regresoComida: [['00:00', 0], ['16:01', 1]],
+        regresoComidaUltimoTramoIntl: [['00:00', 0], ['14:01', 1]]
+      }
+    },
+    decreto: {
+      ticketCena: false,
+      duracionMinimaComida: null,
+      ida: [['00:00', 1], ['14:00', 0.5], ['22:00', 0]],
+      regreso: [['00:00', 0], ['14:01', 0.5]],
+      cena: [['00:00', 0], ['22:01', 1]],
+      mismoDia: {
+        salidaComida: [['00:00', 1], ['14:00', 0]],
+        regresoComida: [['00:00', 0], ['16:01', 1]],
+        regresoComidaUltimoTramoIntl: [['00:00', 0], ['14:01', 1]]
+      }
+    }
+  };
+
+  // =========================================================================
+  // COMPILACIÓN
+  // =========================================================================
+
+  function minutosDe(hhmm) {
+    const m = String(hhmm || '').match(/^(\d{1,2}):(\d{2})$/);
+    if (!m) return null;
+    const t = (+m[1]) * 60 + (+m[2]);
+    return (t >= 0 && t < MINUTOS_DIA) ? t : null;
+  }
+
+  /**
+   * Expande una lista de tramos a una tabla por minuto.
+   * @param {Array<[string, *]>} tramos
+   * @param {Function} codificar - valor → entero 0..255
+   * @param {string} nombre - Para los mensajes de error
+   * @returns {Uint8Array}
+   */
+  function expandir(tramos, codificar, nombre) {
+    if (!Array.isArray(tramos) || tramos.length === 0) {
+      throw new Error(`Tabla ${nombre} vacía`);
+    }
+    const tabla = new Uint8Array(MINUTOS_DIA);
+    let previo = -1;
+    tramos.forEach(([desde, valor], i) => {
+      const inicio = minutosDe(desde);
+      if (inicio === null || inicio <= previo || (i === 0 && inicio !== 0)) {
+        throw new Error(`Tabla ${nombre}: tramo '${desde}' fuera de orden (el primero debe ser 00:00)`);
+      }
+      const codigo = codificar(valor);
+      if (!Number.isInteger(codigo) || codigo < 0 || codigo > 255) {
+        throw new Error(`Tabla ${nombre}: valor no válido ${JSON.stringify(valor)}`);
+      }
+      const fin = i + 1 < tramos.length ? minutosDe(tramos[i + 1][0]) : MINUTOS_DIA;
+      tabla.fill(codigo, inicio, fin === null ? MINUTOS_DIA : fin);
+      previo = inicio;
+    });
+    return tabla;
+  }
+
+  /** Unidades de manutención (múltiplos de 0,5) → medias */
+  const enMedias = v => Math.round(Number(v) * 2);
+  const booleano = v => (v ? 1 : 0);
+
+  /**
+   * Compila las reglas de una normativa.
+   * @param {Object} reglas - reglasDietas[normativa]
+   * @param {Array} tramosPernocta - reglasDietas.pernocta
+   * @param {string} nombre
+   * @returns {Object} Tablas compiladas
+   */
+  function compilarNormativa(reglas, tramosPernocta, nombre) {
+    const ida = expandir(reglas.ida, enMedias, `${nombre}.ida`);
+    const regresoBase = expandir(reglas.regreso, enMedias, `${nombre}.regreso`);
+    const cena = expandir(reglas.cena, booleano, `${nombre}.cena`);
+    const md = reglas.mismoDia || {};
+    const salidaComida = expandir(md.salidaComida, booleano, `${nombre}.mismoDia.salidaComida`);
+    const regresoComida = expandir(md.regresoComida, booleano, `${nombre}.mismoDia.regresoComida`);
+    const regresoComidaIntl = expandir(
+      md.regresoComidaUltimoTramoIntl || md.regresoComida, booleano,
+      `${nombre}.mismoDia.regresoComidaUltimoTramoIntl`
+    );
+    const pernocta = expandir(tramosPernocta, v => PERNOCTA[v], 'pernocta');
+
+    // Cena efectiva según ticket: [sin ticket, con ticket]
+    const ticketCena = !!reglas.ticketCena;
+    const cenaSinTicket = ticketCena ? new Uint8Array(MINUTOS_DIA) : cena;
+    // Día de regreso: 1 si cuenta la cena; si no, la tabla de regreso
+    const regresoCon = regresoBase.map((v, t) => (cena[t] ? 2 : v));
+    const regresoSin = ticketCena ? regresoBase : regresoCon;
+
+    const duracion = minutosDe(reglas.duracionMinimaComida);
+
+    return {
+      normativa: nombre,
+      ticketCena,
+      duracionMinimaComida: duracion === null ? -Infinity : duracion,
+      ida,
+      cena,
+      mediaCena: [cenaSinTicket, cena],
+      regreso: [regresoSin, regresoCon],
+      salidaComida,
+      regresoComida: [regresoComida, regresoComidaIntl],
+      pernocta
+    };
+  }
+
+  /** Objeto reglasDietas → { normativa → tablas compiladas } */
+  const compiladas = new WeakMap();
+
+  /**
+   * Compila todas las normativas de un objeto reglasDietas (con caché).
+   * @param {Object} reglas
+   * @returns {Object}
+   */
+  function compilar(reglas) {
+    let c = compiladas.get(reglas);
+    if (c) return c;
+    c = {};
+    Object.keys(reglas).forEach(nombre => {
+      if (nombre === 'pernocta') return;
+      c[nombre] = compilarNormativa(reglas[nombre], reglas.pernocta || REGLAS_REFERENCIA.pernocta, nombre);
+    });
+    compiladas.set(reglas, c);
+    return c;
+  }
+
+  /**
+   * Tablas compiladas de una normativa.
+   * @param {string} normativa - 'rd' | 'decreto'
+   * @param {Object} [datos] - datos.json (o la versión de tarifas de la fecha)
+   * @returns {Object}
+   */
+  function obtener(normativa, datos) {
+    const reglas = (datos || global.__sgtriDatos)?.reglasDietas;
+    if (reglas) {
+      try {
+        const c = compilar(reglas);
+        if (c[normativa]) return c[normativa];
+      } catch (e) {
+        if (!compiladas.has(reglas)) {
+          compiladas.set(reglas, {});
+          console.warn('[reglasDietas] reglasDietas de datos.json no válidas, se usan las de referencia:', e.message);
+        }
+      }
+    }
+    const ref = compilar(REGLAS_REFERENCIA);
+    return ref[normativa] || ref.decreto;
+  }
+
+  // =========================================================================
+  // EVALUACIÓN
+  // =========================================================================
+
+  /** Minuto del día acotado a la tabla */
+  const minuto = t => (t < 0 ? 0 : t >= MINUTOS_DIA ? MINUTOS_DIA - 1 : t);
+
+  /**
+   * Unidades de manutención del día de salida (viajes de varios días).
+   * @param {Object} c - Tablas de obtener()
+   * @param {number|null} tDep - Minutos desde medianoche
+   * @returns {number}
+   */
+  function unidadesIda(c, tDep) {
+    return tDep === null ? 0 : c.ida[minuto(tDep)] / 2;
+  }
+
+  /**
+   * Unidades de manutención del día de regreso (viajes de varios días).
+   * @param {Object} c
+   * @param {number|null} tRet
+   * @param {boolean} ticketCena
+   * @returns {number}
+   */
+  function unidadesRegreso(c, tRet, ticketCena) {
+    return tRet === null ? 0 : c.regreso[ticketCena ? 1 : 0][minuto(tRet)] / 2;
+  }
+
+  /**
+   * Manutenciones de un viaje que empieza y acaba el mismo día.
+   * @param {Object} c
+   * @param {number|null} tDep
+   * @param {number|null} tRet
+   * @param {number} duracionMin - Duración del viaje en minutos
+   * @param {boolean} ticketCena
+   * @param {boolean} ultimoTramoIntl
+   * @returns {number}
+   */
+  function manutencionesMismoDia(c, tDep, tRet, duracionMin, ticketCena, ultimoTramoIntl) {
+    if (tDep === null || tRet === null) return 0;
+    const salida = minuto(tDep);
+    const regreso = minuto(tRet);
+    const cena = c.mediaCena[ticketCena ? 1 : 0][regreso];
+    const comida = c.salidaComida[salida] &
+      c.regresoComida[ultimoTramoIntl ? 1 : 0][regreso] &
+      (duracionMin < c.duracionMinimaComida ? 0 : 1);
+    return (cena + comida) / 2;
+  }
+
+  /**
+   * Clase de pernocta de la última noche según la hora de regreso.
+   * @param {Object} c
+   * @param {number|null} tRet
+   * @returns {'no'|'si'|'ambigua'|null} null sin hora
+   */
+  function pernocta(c, tRet) {
+    return tRet === null ? null : NOMBRE_PERNOCTA[c.pernocta[minuto(tRet)]];
+  }
+
+  /**
+   * Si la ficha debe preguntar por el ticket de cena.
+   * @param {string} normativa
+   * @param {number|null} tRet
+   * @returns {boolean}
+   */
+  function muestraTicketCena(normativa, tRet) {
+    const c = obtener(normativa);
+    return c.ticketCena && tRet !== null && c.cena[minuto(tRet)] === 1;
+  }
+
+  /**
+   * Si la hora de regreso cae en la franja en la que la última noche
+   * necesita justificación.
+   * @param {number|null} tRet
+   * @returns {boolean}
+   */
+  function pernoctaAmbigua(tRet) {
+    return pernocta(obtener('decreto'), tRet) === 'ambigua';
+  }
+
+  // =========================================================================
+  // CORPUS DE REFERENCIA
+  // =========================================================================
+
+  /**
+   * Comprueba las reglas vigentes contra el corpus de referencia.
+   * Desde consola: `await reglasDietas.verificarCorpus()`.
+   * @param {Object} [corpus] - Si se omite, se descarga assets/data/reglasDietas.corpus.json
+   * @param {Object} [datos] - Datos cuyas reglas se comprueban (por defecto datos.json)
+   * @returns {Promise<{casos: number, fallos: Array}>}
+   */
+  async function verificarCorpus(corpus, datos) {
+    if (!corpus) corpus = await fetch(RUTA_CORPUS).then(r => r.json());
+    const fallos = [];
+    let casos = 0;
+    const comprobar = (tipo, caso, obtenido) => {
+      casos++;
+      const esperado = caso[caso.length - 1];
+      if (obtenido !== esperado) fallos.push({ tipo, caso, obtenido });
+    };
+
+    (corpus.ida || []).forEach(caso => {
+      const [normativa, hora] = caso;
+      comprobar('ida', caso, unidadesIda(obtener(normativa, datos), minutosDe(hora)));
+    });
+    (corpus.regreso || []).forEach(caso => {
+      const [normativa, ticket, hora] = caso;
+      comprobar('regreso', caso, unidadesRegreso(obtener(normativa, datos), minutosDe(hora), ticket));
+    });
+    (corpus.mismoDia || []).forEach(caso => {
+      const [normativa, ticket, ultimoIntl, ida, regreso] = caso;
+      const tDep = minutosDe(ida);
+      const tRet = minutosDe(regreso);
+      comprobar('mismoDia', caso,
+        manutencionesMismoDia(obtener(normativa, datos), tDep, tRet, tRet - tDep, ticket, ultimoIntl));
+    });
+    (corpus.pernocta || []).forEach(caso => {
+      comprobar('pernocta', caso, pernocta(obtener('decreto', datos), minutosDe(caso[0])));
+    });
+
+    if (fallos.length) {
+      console.warn(`[reglasDietas] ${fallos.length} de ${casos} casos no coinciden con el corpus`, fallos.slice(0, 20));
+    }
+    return { casos, fallos };
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.reglasDietas = {
+    REGLAS_REFERENCIA,
+    compilar,
+    obtener,
+    unidadesIda,
+    unidadesRegreso,
+    manutencionesMismoDia,
+    pernocta,
+    muestraTicketCena,
+    pernoctaAmbigua,
+    verificarCorpus,
+
+    // Para testing
+    _minutosDe: minutosDe,
+    _expandir: expandir
+  };
+
+})(typeof window !== 'undefined' ? window : this);
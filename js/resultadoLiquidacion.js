@@ -7,7 +7,12 @@
  * Usa un registro centralizado (window.__sgtriTotales) que es actualizado por
  * cada módulo cuando recalcula sus valores, evitando lecturas del DOM.
  *
+ * Las dependencias entre descuento de congreso, resultado e imputación se
+ * declaran en un grafo reactivo (grafoDependencias): cada cambio recalcula
+ * solo los nodos afectados.
+ *
  * @module resultadoLiquidacion
+ * @requires grafoDependencias
  */
 (function (global) {
   'use strict';
@@ -69,6 +74,7 @@
       // Detalles adicionales para serialización
       detalles: detalles || null
     };
+    grafo.fijar('fichas', { ...reg.desplazamientos });
   }
 
   /**
@@ -78,6 +84,7 @@
   function eliminarDesplazamiento(id) {
     const reg = getRegistro();
     delete reg.desplazamientos[String(id)];
+    grafo.fijar('fichas', { ...reg.desplazamientos });
   }
 
   /**
@@ -86,6 +93,7 @@
    */
   function registrarHonorarios(importe) {
     getRegistro().honorarios = round2(importe || 0);
+    grafo.fijar('honorarios', getRegistro().honorarios);
   }
 
   /**
@@ -94,6 +102,7 @@
    */
   function registrarGastosInscripcion(importe) {
     getRegistro().gastosInscripcion = round2(importe || 0);
+    grafo.fijar('gastosInscripcion', getRegistro().gastosInscripcion);
   }
 
   /**
@@ -110,6 +119,7 @@
    */
   function registrarFinanciacionMaxima(importe) {
     getRegistro().financiacionMaxima = round2(importe || 0);
+    grafo.fijar('financiacionMaxima', getRegistro().financiacionMaxima);
   }
 
   /**
@@ -123,6 +133,7 @@
       motivo: d.motivo || '',
       importe: round2(d.importe || 0)
     }));
+    grafo.fijar('descuentosAjustes', getRegistro().descuentosAjustes);
   }
 
   // =========================================================================
@@ -199,10 +210,10 @@
 
   /**
    * Suma los totales de todos los desplazamientos desde el registro.
+   * @param {Object} [reg] - Registro a sumar (por defecto, el global)
    * @returns {Object} { manutencion, alojamiento, kilometraje, otrosGastos, irpfSujeto }
    */
-  function sumarTotalesDesplazamientos() {
-    const reg = getRegistro();
+  function sumarTotalesDesplazamientos(reg = getRegistro()) {
     let totalManutencion = 0;
     let totalAlojamiento = 0;
     let totalKilometraje = 0;
@@ -228,42 +239,47 @@
 
   /**
    * Obtiene el descuento por comidas de congreso desde el registro.
+   * @param {Object} [reg] - Registro (por defecto, el global)
    * @returns {number}
    */
-  function getDescuentoCongreso() {
-    return getRegistro().descuentoCongreso || 0;
+  function getDescuentoCongreso(reg = getRegistro()) {
+    return reg.descuentoCongreso || 0;
   }
 
   /**
    * Obtiene los descuentos de ajustes desde el registro.
+   * @param {Object} [reg] - Registro (por defecto, el global)
    * @returns {Array<{tipo: string, tipoLabel: string, motivo: string, importe: number}>}
    */
-  function getDescuentosAjustes() {
-    return getRegistro().descuentosAjustes || [];
+  function getDescuentosAjustes(reg = getRegistro()) {
+    return reg.descuentosAjustes || [];
   }
 
   /**
    * Obtiene la financiación máxima desde el registro.
+   * @param {Object} [reg] - Registro (por defecto, el global)
    * @returns {number}
    */
-  function getFinanciacionMaxima() {
-    return getRegistro().financiacionMaxima || 0;
+  function getFinanciacionMaxima(reg = getRegistro()) {
+    return reg.financiacionMaxima || 0;
   }
 
   /**
    * Obtiene el importe de honorarios desde el registro.
+   * @param {Object} [reg] - Registro (por defecto, el global)
    * @returns {number}
    */
-  function getHonorarios() {
-    return getRegistro().honorarios || 0;
+  function getHonorarios(reg = getRegistro()) {
+    return reg.honorarios || 0;
   }
 
   /**
    * Obtiene los gastos de inscripción desde el registro.
+   * @param {Object} [reg] - Registro (por defecto, el global)
    * @returns {number}
    */
-  function getGastosInscripcion() {
-    return getRegistro().gastosInscripcion || 0;
+  function getGastosInscripcion(reg = getRegistro()) {
+    return reg.gastosInscripcion || 0;
   }
 
   // =========================================================================
@@ -356,16 +372,28 @@
    * @returns {Object} Datos completos para renderizar
    */
   function calcularResultado() {
-    const totales = sumarTotalesDesplazamientos();
-    const descuentoCongreso = getDescuentoCongreso();
-    const descuentosAjustes = getDescuentosAjustes();
+    const datosEspecial = global.uiDesplazamientoEspecial?.getDatosParaLiquidacion?.() || null;
+    return calcularResultadoDesde(getRegistro(), datosEspecial);
+  }
+
+  /**
+   * Calcula el resultado a partir de un registro de totales arbitrario.
+   * Permite evaluar variantes (p.ej. liquidaciones de grupo con ajustes
+   * distintos por miembro) sin tocar window.__sgtriTotales.
+   * @param {Object} registro - Misma estructura que getRegistro()
+   * @param {Object|null} [datosEspecial] - Datos del desplazamiento especial
+   * @returns {Object} Datos completos para renderizar
+   */
+  function calcularResultadoDesde(registro, datosEspecial = null) {
+    const totales = sumarTotalesDesplazamientos(registro);
+    const descuentoCongreso = getDescuentoCongreso(registro);
+    const descuentosAjustes = getDescuentosAjustes(registro);
     const descuentosAgrupados = agruparDescuentosPorTipo(descuentosAjustes);
-    const financiacionMaxima = getFinanciacionMaxima();
-    const honorarios = getHonorarios();
-    const gastosInscripcion = getGastosInscripcion();
+    const financiacionMaxima = getFinanciacionMaxima(registro);
+    const honorarios = getHonorarios(registro);
+    const gastosInscripcion = getGastosInscripcion(registro);
 
-    // Obtener datos del desplazamiento especial (si existe)
-    const datosEspecial = global.uiDesplazamientoEspecial?.getDatosParaLiquidacion?.() || null;
+    // Datos del desplazamiento especial (si existe)
     const totalEspecial = datosEspecial?.total || 0;
     const irpfEspecial = datosEspecial?.irpf || 0;
 
@@ -501,12 +529,34 @@
 
   /**
    * Renderiza la sección de resultado de la liquidación.
+   * Fuerza el recálculo del resultado y de la imputación aunque el grafo no
+   * tenga cambios pendientes (p.ej. tras restaurar o limpiar el formulario).
    */
   function renderResultado() {
+    const traza = global.trazas?.inicio();
+    grafo.invalidar('resultado');
+    grafo.invalidar('imputacion');
+    grafo.estabilizar();
+    global.trazas?.fin('resultado.render', traza);
+  }
+
+  /**
+   * Propaga los cambios pendientes del registro: recalcula el resultado y la
+   * imputación solo si alguna de sus entradas ha cambiado.
+   * @returns {string[]} Nodos recalculados
+   */
+  function actualizarResultado() {
+    return grafo.estabilizar();
+  }
+
+  /**
+   * Pinta el resultado ya calculado en su contenedor.
+   * @param {Object} datos - Resultado de calcularResultado()
+   */
+  function pintarResultado(datos) {
     const container = document.getElementById('resultado-liquidacion-container');
     if (!container) return;
 
-    const datos = calcularResultado();
     const lines = [];
 
     // --- Líneas del desplazamiento especial (al principio, sin total) ---
@@ -592,11 +642,6 @@
     lines.push(lineaIrpf(datos.irpfTotal));
 
     container.innerHTML = lines.join('\n');
-
-    // Actualizar sección de imputación
-    if (global.uiImputacion && typeof global.uiImputacion.actualizar === 'function') {
-      global.uiImputacion.actualizar();
-    }
   }
 
   /**
@@ -613,6 +658,202 @@
     return nombres[tipo] || tipo;
   }
 
+  // =========================================================================
+  // GRAFO DE DEPENDENCIAS
+  // =========================================================================
+  //
+  // Fuentes: datos del congreso (comidas, desplazamiento asociado, tipo de
+  // proyecto), orden de los desplazamientos, totales registrados por ficha y
+  // ajustes. Derivados:
+  //
+  //   congreso.ficha      ← fichas.orden, congreso.asociado
+  //   congreso.pais       ← congreso.ficha, congreso.revision
+  //   congreso.fecha      ← congreso.ficha, congreso.revision
+  //   congreso.descuento  ← congreso.comidas, congreso.ficha, congreso.pais,
+  //                         proyecto.tipo, congreso.fecha, congreso.revision
+  //   resultado           ← fichas, congreso.descuento/importe, honorarios,
+  //                         gastosInscripcion, financiacionMaxima,
+  //                         descuentosAjustes
+  //   imputacion          ← resultado/totalLiquidacion
+  //
+  // Cambiar el número de comidas recalcula el descuento, el resultado (cuyo
+  // IRPF ya resta el descuento) y, si cambia el total, la imputación.
+  // Ninguna ficha vuelve a pasar por el motor.
+
+  /** Precio de manutención si la tabla no tiene el país. */
+  const PRECIO_MANUTENCION_DEFECTO = 50.55;
+
+  /**
+   * Resuelve el id del desplazamiento al que se asocia el congreso.
+   * Con un único desplazamiento es ese; con varios, el elegido en el select
+   * (valores 'despN', N = posición 1-based entre los desplazamientos normales).
+   * @param {string[]} orden - Ids de los desplazamientos normales en orden
+   * @param {string} asociado - Valor del select evento-asociado
+   * @returns {string|null}
+   */
+  function resolverFichaAsociada(orden, asociado) {
+    if (!orden || orden.length === 0) return null;
+    if (orden.length === 1) return orden[0];
+    const m = String(asociado || '').match(/^desp(\d+)$/);
+    if (!m) return null;
+    return orden[parseInt(m[1], 10) - 1] || null;
+  }
+
+  /**
+   * Índice del país de destino de un desplazamiento (0 = España).
+   * Solo consulta el select de la ficha asociada.
+   * @param {string|null} id
+   * @returns {number}
+   */
+  function leerPaisFicha(id) {
+    if (id === null) return 0;
+    const select = document.getElementById(`pais-destino-${id}`);
+    return select && select.selectedIndex >= 0 ? select.selectedIndex : 0;
+  }
+
+  /**
+   * Fecha de ida de un desplazamiento (fija las tarifas del descuento).
+   * @param {string|null} id
+   * @returns {string}
+   */
+  function leerFechaFicha(id) {
+    if (id === null) return '';
+    return document.getElementById(`fecha-ida-${id}`)?.value || '';
+  }
+
+  /**
+   * Calcula el descuento por comidas incluidas en la inscripción del congreso:
+   * 50% del precio de manutención del país por comida.
+   * @param {number} comidas - Número de comidas incluidas
+   * @param {number} paisIndex - Índice del país en las tablas de dietas
+   * @param {string} tipoProyecto - Determina la normativa (RD o decreto)
+   * @param {string} [fechaIda] - Fecha de ida: tarifas vigentes ese día (tarifas.js)
+   * @returns {number}
+   */
+  function calcularDescuentoCongreso(comidas, paisIndex, tipoProyecto, fechaIda) {
+    const datos = (fechaIda && global.tarifas?.resolver(fechaIda)) || global.__sgtriDatos;
+    if (!(comidas > 0) || !datos || !datos.dietasPorPais) return 0;
+
+    const rdList = datos.normativasPorTipoProyecto?.rd || [];
+    const tablas = rdList.includes(tipoProyecto)
+      ? datos.dietasPorPais.rd462_2002
+      : datos.dietasPorPais.decreto42_2025;
+    if (!tablas || !tablas.manutencion) return 0;
+
+    const precio = Number(tablas.manutencion[paisIndex]) || PRECIO_MANUTENCION_DEFECTO;
+    return round2(precio * 0.5 * comidas);
+  }
+
+  /**
+   * Refleja el descuento en el campo oculto y en el mensaje del congreso.
+   * @param {{comidas: number, importe: number}} descuento
+   */
+  function pintarDescuentoCongreso(descuento) {
+    const hidden = document.getElementById('descuento-manut-congreso');
+    const msg = document.getElementById('descuento-manut-message');
+    const msgAmount = document.getElementById('descuento-manut-amount');
+    const importe = descuento.importe.toFixed(2);
+
+    if (hidden) hidden.value = importe;
+    if (msgAmount) msgAmount.textContent = importe.replace('.', ',') + ' €';
+    if (msg) msg.style.display = descuento.comidas > 0 ? '' : 'none';
+  }
+
+  function actualizarImputacion() {
+    if (global.uiImputacion && typeof global.uiImputacion.actualizar === 'function') {
+      global.uiImputacion.actualizar();
+    }
+  }
+
+  /**
+   * Construye el grafo de la liquidación.
+   * @returns {Object} Grafo de grafoDependencias
+   */
+  function crearGrafoLiquidacion() {
+    const g = global.grafoDependencias.crearGrafo('resultadoLiquidacion');
+
+    g.fuente('congreso.comidas', 0);
+    g.fuente('congreso.asociado', '');
+    g.fuente('congreso.revision', 0);
+    g.fuente('proyecto.tipo', '');
+    g.fuente('fichas.orden', []);
+    g.fuente('fichas', {});
+    g.fuente('honorarios', 0);
+    g.fuente('gastosInscripcion', 0);
+    g.fuente('financiacionMaxima', 0);
+    g.fuente('descuentosAjustes', []);
+
+    g.derivado('congreso.ficha', ['fichas.orden', 'congreso.asociado'], resolverFichaAsociada);
+
+    g.derivado('congreso.pais', ['congreso.ficha', 'congreso.revision'], id => leerPaisFicha(id));
+
+    g.derivado('congreso.fecha', ['congreso.ficha', 'congreso.revision'], id => leerFechaFicha(id));
+
+    g.derivado('congreso.descuento',
+      ['congreso.comidas', 'congreso.ficha', 'congreso.pais', 'proyecto.tipo', 'congreso.fecha',
+        'congreso.revision'],
+      (comidas, ficha, paisIndex, tipoProyecto, fecha) => ({
+        comidas,
+        importe: ficha === null ? 0 : calcularDescuentoCongreso(comidas, paisIndex, tipoProyecto, fecha)
+      }),
+      {
+        efecto: descuento => {
+          registrarDescuentoCongreso(descuento.importe);
+          pintarDescuentoCongreso(descuento);
+        }
+      });
+
+    g.derivado('resultado',
+      ['fichas', 'congreso.descuento/importe', 'honorarios', 'gastosInscripcion',
+        'financiacionMaxima', 'descuentosAjustes'],
+      () => calcularResultado(),
+      { efecto: pintarResultado });
+
+    g.derivado('imputacion', ['resultado/totalLiquidacion'], total => total,
+      { efecto: actualizarImputacion });
+
+    return g;
+  }
+
+  const grafo = crearGrafoLiquidacion();
+
+  /**
+   * Actualiza las entradas del descuento de congreso y propaga el cambio.
+   * @param {Object} cambios
+   * @param {number} [cambios.comidas] - Número de comidas incluidas
+   * @param {string} [cambios.asociado] - Valor del select evento-asociado
+   * @param {string} [cambios.tipoProyecto] - Tipo de proyecto
+   * @param {boolean} [cambios.revisar] - Releer país y tablas aunque no cambie nada
+   * @returns {string[]} Nodos recalculados
+   */
+  function actualizarCongreso(cambios = {}) {
+    return grafo.lote(() => {
+      if (cambios.comidas !== undefined) grafo.fijar('congreso.comidas', Number(cambios.comidas) || 0);
+      if (cambios.asociado !== undefined) grafo.fijar('congreso.asociado', cambios.asociado || '');
+      if (cambios.tipoProyecto !== undefined) grafo.fijar('proyecto.tipo', cambios.tipoProyecto || '');
+      if (cambios.revisar) grafo.fijar('congreso.revision', grafo.valor('congreso.revision') + 1);
+    });
+  }
+
+  /**
+   * Registra el orden de los desplazamientos normales (para resolver 'despN').
+   * @param {Array<string|number>} ids
+   */
+  function registrarOrdenDesplazamientos(ids) {
+    grafo.fijar('fichas.orden', (ids || []).map(String));
+  }
+
+  /**
+   * Estadísticas de recálculo del grafo (nodos tocados por pasada).
+   */
+  function getEstadisticasGrafo() {
+    return grafo.getEstadisticas();
+  }
+
+  function resetEstadisticasGrafo() {
+    grafo.resetEstadisticas();
+  }
+
   // =========================================================================
   // INICIALIZACIÓN Y EVENT LISTENERS
   // =========================================================================
@@ -640,11 +881,6 @@
     renderResultado();
   }
 
-  function onDescuentoCongresoChange() {
-    actualizarDescuentoCongreso();
-    renderResultado();
-  }
-
   /**
    * Inicializa los event listeners para actualizar el resultado.
    */
@@ -663,15 +899,8 @@
       honorarios.addEventListener('blur', onHonorariosChange);
     }
 
-    // Listener para descuento de congreso (campo hidden, cambios programáticos)
-    const descCongreso = document.getElementById('descuento-manut-congreso');
-    if (descCongreso) {
-      // Usar MutationObserver para detectar cambios en value
-      const observer = new MutationObserver(onDescuentoCongresoChange);
-      observer.observe(descCongreso, { attributes: true, attributeFilter: ['value'] });
-      // También escuchar evento change por si acaso
-      descCongreso.addEventListener('change', onDescuentoCongresoChange);
-    }
+    // El descuento de congreso no se observa en el campo oculto: lo calcula
+    // el grafo (actualizarCongreso) y él mismo escribe el campo
 
     // Listener para contenedor de descuentos (delegación de eventos)
     const descContainer = document.getElementById('otros-descuentos-container');
@@ -711,6 +940,12 @@
       financiacionMaxima: 0,
       descuentosAjustes: []
     };
+    grafo.fijar('fichas', {});
+    grafo.fijar('honorarios', 0);
+    grafo.fijar('gastosInscripcion', 0);
+    grafo.fijar('financiacionMaxima', 0);
+    grafo.fijar('descuentosAjustes', []);
+    grafo.fijar('congreso.comidas', 0);
   }
 
   // =========================================================================
@@ -737,9 +972,19 @@
     actualizarDescuentosAjustes,
     actualizarFinanciacionMaxima,
     
+    // Grafo de dependencias
+    actualizarCongreso,
+    registrarOrdenDesplazamientos,
+    calcularDescuentoCongreso,
+    getEstadisticasGrafo,
+    resetEstadisticasGrafo,
+
     // Renderizado
     renderResultado,
+    actualizarResultado,
     calcularResultado,
+    calcularResultadoDesde,
+    agruparDescuentosPorTipo,
     
     // Reset
     resetTotales,
@@ -5,6 +5,8 @@
 //   - Templates: funciones puras que generan fragmentos HTML
 //   - Render: funciones puras que componen el HTML completo
 //   - Mount: funciones que interactúan con el DOM (insertar, eventos)
+//   - Patch: reconciliación por claves (data-key) del bloque ya montado, de
+//     modo que un recálculo solo toca los textos y filas que cambian
 
 (function () {
   'use strict';
@@ -45,63 +47,26 @@
     });
   }
 
-  /**
-   * Obtiene el descuento por comidas de congreso para un desplazamiento específico.
-   * Solo devuelve el descuento si el desplazamiento es el asociado al congreso.
-   * @param {string|number} despId - ID del desplazamiento
-   * @returns {number} Descuento en euros (0 si no aplica a este desplazamiento)
-   */
-  function getDescuentoCongreso(despId) {
-    const hidden = document.getElementById('descuento-manut-congreso');
-    if (!hidden) return 0;
-    
-    const descuento = Number(hidden.value) || 0;
-    if (descuento <= 0) return 0;
-    
-    // Determinar a qué desplazamiento aplica el descuento
-    const desplazamientos = document.querySelectorAll('.desplazamiento-grupo');
-    
-    if (desplazamientos.length === 1) {
-      // Si solo hay un desplazamiento, el descuento aplica a ese
-      return descuento;
-    }
-    
-    // Si hay varios, verificar cuál está seleccionado en evento-asociado
-    const eventoAsociado = document.getElementById('evento-asociado');
-    if (!eventoAsociado) return 0;
-    
-    const valSel = eventoAsociado.value || '';
-    const match = valSel.match(/^desp(\d+)$/);
-    if (!match) return 0;
-    
-    const despAsociado = match[1];
-    // Solo aplicar el descuento si coincide con el desplazamiento actual
-    return String(despId) === String(despAsociado) ? descuento : 0;
-  }
-
-  /**
-   * Calcula el IRPF ajustado restando el descuento por congreso.
-   * El resultado nunca será negativo.
-   * @param {number} irpfBase - IRPF calculado sin ajustes
-   * @param {string|number} despId - ID del desplazamiento
-   * @returns {number} IRPF ajustado (>= 0)
-   */
-  function calcIrpfAjustado(irpfBase, despId) {
-    const descuento = getDescuentoCongreso(despId);
-    return Math.max(0, (irpfBase || 0) - descuento);
-  }
-
   // =========================================================================
   // TEMPLATES (funciones puras → HTML string)
   // =========================================================================
 
   const templates = {
+    /**
+     * Enlace "§" al artículo de la normativa que regula una regla del
+     * cálculo (lo atiende normativas.js; la normativa sale del data-normativa
+     * del bloque de resultado).
+     */
+    enlaceNormativa(regla) {
+      return `<button type="button" class="enlace-normativa" data-regla="${regla}" title="Ver el artículo de la normativa" aria-label="Ver el artículo de la normativa">§</button>`;
+    },
+
     /**
      * Línea de concepto con líder de puntos.
      */
     lineaConcepto(label, amount, amountClass = '') {
       const cls = amountClass ? ` ${amountClass}` : '';
-      return `<div class="calc-line">
+      return `<div class="calc-line" data-key="${amountClass || label}">
         <span class="label">${label}</span>
         <span class="leader" aria-hidden="true"></span>
         <span class="amount${cls}">${fmt(amount)} €</span>
@@ -115,8 +80,8 @@
     lineaManutencion({ manutenciones, precioManutencion, amount, residenciaEventual = false }) {
       const factorStr = residenciaEventual ? ' × 80%' : '';
       const label = `Manutención: ${manutenciones} × ${fmt(precioManutencion)} €${factorStr}`;
-      return `<div class="calc-line">
-        <span class="label">${label}</span>
+      return `<div class="calc-line" data-key="manut">
+        <span class="label">${label} ${templates.enlaceNormativa('manutencion')}</span>
         <span class="leader" aria-hidden="true"></span>
         <span class="amount manut">${fmt(amount)} €</span>
       </div>`;
@@ -126,8 +91,8 @@
      * Línea de kilometraje: km × precio = total
      */
     lineaKilometraje(km, precioKm, totalKm) {
-      return `<div class="calc-line">
-        <span class="label">Km: ${km} × ${fmtPrecio(precioKm)} €</span>
+      return `<div class="calc-line" data-key="km">
+        <span class="label">Km: ${km} × ${fmtPrecio(precioKm)} € ${templates.enlaceNormativa('kilometraje')}</span>
         <span class="leader" aria-hidden="true"></span>
         <span class="amount km">${fmt(totalKm)} €</span>
       </div>`;
@@ -145,8 +110,8 @@
         : '';
       const factorStr = residenciaEventual ? ' × 80%' : '';
 
-      return `<div class="calc-line aloj-line${errorCls}">
-        <span class="label">Alojamiento: <em>[ Máximo: ${noches} × ${fmt(precioNoche)}${factorStr} = ${fmt(maxAmount)} € ]</em></span>
+      return `<div class="calc-line aloj-line${errorCls}" data-key="aloj">
+        <span class="label">Alojamiento: <em>[ Máximo: ${noches} × ${fmt(precioNoche)}${factorStr} = ${fmt(maxAmount)} € ]</em> ${templates.enlaceNormativa('alojamiento')}</span>
         <span class="leader" aria-hidden="true"></span>
         <span class="aloj-user">${warning}<span class="amount aloj-user${amountErrorCls}">${fmt(userAmount)} €</span></span>
       </div>`;
@@ -168,8 +133,8 @@
         ? `Máximo: ${fmt(maxAmountBase)} € × 80% = ${fmt(maxAmount)} €`
         : `Máximo: ${fmt(maxAmount)} €`;
 
-      return `<div class="calc-line aloj-line${errorCls}">
-        <span class="label">Alojamiento: <em>[ ${maxLabel} ]</em></span>
+      return `<div class="calc-line aloj-line${errorCls}" data-key="aloj">
+        <span class="label">Alojamiento: <em>[ ${maxLabel} ]</em> ${templates.enlaceNormativa('alojamiento')}</span>
         <span class="leader" aria-hidden="true"></span>
         <span class="aloj-user">${warning}<span class="amount aloj-user${amountErrorCls}">${fmt(userAmount)} €</span></span>
       </div>`;
@@ -189,7 +154,7 @@
      * Línea de total final.
      */
     total(amount) {
-      return `<div class="calc-total">
+      return `<div class="calc-total" data-key="total">
         <span class="label">Total:</span>
         <span class="amount"><strong class="slight total-val">${fmt(amount)} €</strong></span>
       </div>`;
@@ -200,7 +165,7 @@
      */
     lineaIRPF(amount) {
       if (!amount || amount <= 0) return '';
-      return `<div class="calc-irpf">
+      return `<div class="calc-irpf" data-key="irpf">
         <span class="label">Sujeto a retención por IRPF:</span>
         <span class="amount">${fmt(amount)} €</span>
       </div>`;
@@ -210,20 +175,22 @@
      * Título de sección/segmento.
      */
     tituloSeccion(titulo) {
-      return `<div class="calc-seg-title">${titulo}</div>`;
+      return `<div class="calc-seg-title" data-key="titulo-${titulo}">${titulo}</div>`;
     },
 
     /**
      * Segmento de viaje internacional.
      * Muestra manutención y alojamiento máximo con desglose.
      * El flag residenciaEventual se usa para mostrar "× 80%" en el cálculo.
+     * El índice (opcional) identifica el tramo al parchear el DOM.
      */
-    segmento(seg, residenciaEventual = false) {
+    segmento(seg, residenciaEventual = false, indice = null) {
       const factorStr = residenciaEventual ? ' × 80%' : '';
-      return `<div class="calc-result-segment">
+      const key = indice !== null ? `seg-${indice}` : `seg-${seg.titulo}`;
+      return `<div class="calc-result-segment" data-key="${key}">
         ${templates.tituloSeccion(seg.titulo)}
         <div class="calc-line">
-          <span class="label">Manutención: ${seg.manutenciones} × ${fmt(seg.precioManutencion)} €</span>
+          <span class="label">Manutención: ${seg.manutenciones} × ${fmt(seg.precioManutencion)} € ${templates.enlaceNormativa('extranjero')}</span>
           <span class="leader" aria-hidden="true"></span>
           <span class="amount manut">${fmt(seg.manutencionAmount)} €</span>
         </div>
@@ -298,13 +265,13 @@
 
     // Badge de Residencia Eventual si aplica
     const badgeResEvent = residenciaEventual 
-      ? `<div class="calc-titulo-ResEvent">[ Residencia Eventual ]</div>\n      ` 
+      ? `<div class="calc-titulo-ResEvent" data-key="resevent">[ Residencia Eventual ] ${templates.enlaceNormativa('residenciaEventual')}</div>\n      ` 
       : '';
 
     // Línea de IRPF (sin ajustar por descuento de congreso; el descuento se aplica solo en el total)
     const irpfLine = templates.lineaIRPF(totales.irpfSujeto);
 
-    return `<div class="calc-result" aria-live="polite" data-desp-id="${data.id}">
+    return `<div class="calc-result" aria-live="polite" data-desp-id="${data.id}" data-normativa="${ui.normativa || 'decreto'}">
       ${badgeResEvent}${lines.join('\n      ')}
       ${templates.total(totales.total)}
       ${irpfLine}
@@ -328,7 +295,7 @@
     // Pasar residenciaEventual a cada segmento para mostrar "× 80%" en el desglose
     let segmentosHtml = '';
     if (segmentosValidos) {
-      segmentosHtml = segmentos.map(seg => templates.segmento(seg, residenciaEventual)).join('');
+      segmentosHtml = segmentos.map((seg, i) => templates.segmento(seg, residenciaEventual, i)).join('');
     }
 
     // Líneas de totales (solo las que tienen importe > 0)
@@ -370,11 +337,11 @@
     if (!segmentosHtml && totalLines.length === 0) return '';
 
     // Construir HTML
-    let html = `<div class="calc-result composite" data-desp-id="${data.id}">`;
+    let html = `<div class="calc-result composite" data-desp-id="${data.id}" data-normativa="${ui.normativa || 'decreto'}">`;
 
     // Mostrar título de Residencia Eventual si aplica
     if (residenciaEventual) {
-      html += '<div class="calc-titulo-ResEvent">[ Residencia Eventual ]</div>';
+      html += `<div class="calc-titulo-ResEvent" data-key="resevent">[ Residencia Eventual ] ${templates.enlaceNormativa('residenciaEventual')}</div>`;
     }
 
     if (segmentosHtml) {
@@ -413,12 +380,114 @@
       : renderSimple(salidaData);
   }
 
+  // =========================================================================
+  // PATCH POR CLAVES (DOM vivo ← HTML nuevo)
+  // =========================================================================
+
+  /** Plantilla reutilizable para parsear HTML fuera del documento. */
+  let plantillaParseo = null;
+
+  /**
+   * Parsea un fragmento HTML y devuelve su primer elemento (sin insertarlo).
+   * @param {string} html
+   * @returns {Element|null}
+   */
+  function parsearHtml(html) {
+    if (!plantillaParseo) plantillaParseo = document.createElement('template');
+    plantillaParseo.innerHTML = html;
+    return plantillaParseo.content.firstElementChild;
+  }
+
+  function claveNodo(nodo) {
+    return nodo.nodeType === 1 ? nodo.getAttribute('data-key') : null;
+  }
+
+  function nodosCompatibles(a, b) {
+    return a.nodeType === b.nodeType && (a.nodeType !== 1 || a.tagName === b.tagName);
+  }
+
+  /**
+   * Copia los atributos de `nuevo` en `vivo` (solo los que cambian).
+   */
+  function patchAtributos(vivo, nuevo) {
+    for (let i = vivo.attributes.length - 1; i >= 0; i--) {
+      const nombre = vivo.attributes[i].name;
+      if (!nuevo.hasAttribute(nombre)) vivo.removeAttribute(nombre);
+    }
+    for (let i = 0; i < nuevo.attributes.length; i++) {
+      const { name, value } = nuevo.attributes[i];
+      if (vivo.getAttribute(name) !== value) vivo.setAttribute(name, value);
+    }
+  }
+
+  /**
+   * Reconcilia un nodo vivo con su versión nueva (compatibles).
+   */
+  function patchNodo(vivo, nuevo) {
+    if (vivo.nodeType !== 1) {
+      if (vivo.nodeValue !== nuevo.nodeValue) vivo.nodeValue = nuevo.nodeValue;
+      return;
+    }
+    patchAtributos(vivo, nuevo);
+    patchHijos(vivo, nuevo);
+  }
+
+  /**
+   * Reconcilia los hijos: los elementos con data-key se emparejan por clave
+   * (filas y tramos), el resto por posición. Solo se insertan, mueven o
+   * eliminan los nodos que lo necesitan.
+   */
+  function patchHijos(vivo, nuevo) {
+    const porClave = new Map();
+    const sinClave = [];
+    for (let n = vivo.firstChild; n; n = n.nextSibling) {
+      const clave = claveNodo(n);
+      if (clave !== null) porClave.set(clave, n);
+      else sinClave.push(n);
+    }
+
+    // Nodos anteriores a `posicion` ya están en su sitio definitivo
+    let posicion = vivo.firstChild;
+    let iSinClave = 0;
+
+    Array.from(nuevo.childNodes).forEach(nodoNuevo => {
+      const clave = claveNodo(nodoNuevo);
+      let actual = null;
+      if (clave !== null) {
+        actual = porClave.get(clave) || null;
+        porClave.delete(clave);
+      } else if (iSinClave < sinClave.length) {
+        actual = sinClave[iSinClave++];
+      }
+
+      if (actual && nodosCompatibles(actual, nodoNuevo)) {
+        patchNodo(actual, nodoNuevo);
+      } else {
+        actual = nodoNuevo;
+      }
+
+      if (actual === posicion) {
+        posicion = posicion.nextSibling;
+      } else {
+        vivo.insertBefore(actual, posicion);
+      }
+    });
+
+    // Lo que queda desde `posicion` no tiene correspondencia
+    while (posicion) {
+      const siguiente = posicion.nextSibling;
+      vivo.removeChild(posicion);
+      posicion = siguiente;
+    }
+  }
+
   // =========================================================================
   // FUNCIONES DE MONTAJE DOM
   // =========================================================================
 
   /**
    * Monta el HTML en el elemento DOM.
+   * Si ya hay un resultado montado se parchea en lugar de sustituirlo.
    */
   function mountSalida(despEl, html, salidaData) {
     if (!despEl) return;
@@ -430,7 +499,10 @@
       return;
     }
 
-    if (existing) {
+    const nuevo = existing ? parsearHtml(html) : null;
+    if (existing && nuevo && nodosCompatibles(existing, nuevo)) {
+      patchNodo(existing, nuevo);
+    } else if (existing) {
       existing.outerHTML = html;
     } else {
       despEl.insertAdjacentHTML('beforeend', html);
@@ -467,15 +539,14 @@
         despEl.insertAdjacentHTML('beforeend', justHtml);
       }
     } else {
-      // Actualizar el texto del label con las fechas actuales
+      // Actualizar solo el texto del label con las fechas actuales
+      // (el checkbox se conserva con su estado y foco)
       const label = existingField.querySelector('label');
-      if (label) {
-        const chkExistente = existingField.querySelector(`#justificar-pernocta-${id}`);
-        const wasChecked = chkExistente?.checked || false;
-        label.innerHTML = `
-            <input type="checkbox" id="justificar-pernocta-${id}" ${wasChecked ? 'checked' : ''} />
-            Justifica haber pernoctado la noche del ${desde} al ${hasta}.
-          `;
+      const texto = label && Array.from(label.childNodes)
+        .find(n => n.nodeType === 3 && n.nodeValue.includes('Justifica'));
+      const nuevoTexto = ` Justifica haber pernoctado la noche del ${desde} al ${hasta}.`;
+      if (texto && texto.nodeValue.trim() !== nuevoTexto.trim()) {
+        texto.nodeValue = nuevoTexto;
       }
     }
 
@@ -488,10 +559,8 @@
       chk.checked = true;
     }
 
-    // Handler de cambio
-    if (chk._justHandler) {
-      chk.removeEventListener('change', chk._justHandler);
-    }
+    // Handler de cambio (una sola vez por checkbox)
+    if (chk._justHandler) return;
 
     chk._justHandler = () => {
       if (chk.checked) {
@@ -610,6 +679,23 @@
     };
   }
 
+  // =========================================================================
+  // TRAZAS DE PINTADO
+  // =========================================================================
+
+  /**
+   * Cierra el span 'salida.pintado' (recálculo → pintado) en el siguiente
+   * pintado: el callback de requestAnimationFrame se ejecuta antes de pintar,
+   * el setTimeout posterior justo después.
+   * @param {number} traza - Marca de trazas.inicio()
+   */
+  function trazarPintado(traza) {
+    if (!traza || typeof requestAnimationFrame !== 'function') return;
+    requestAnimationFrame(() => {
+      setTimeout(() => window.trazas?.fin('salida.pintado', traza), 0);
+    });
+  }
+
   // =========================================================================
   // API PÚBLICA
   // =========================================================================
@@ -619,6 +705,8 @@
    * Acepta nueva estructura unificada o formato legacy.
    */
   function renderSalida(despEl, salidaData, legacyCtx) {
+    const traza = window.trazas?.inicio();
+
     // Detectar formato legacy
     if (salidaData && !salidaData.totales && legacyCtx) {
       salidaData = convertLegacyToUnified(salidaData, legacyCtx, despEl);
@@ -631,6 +719,9 @@
 
     const html = renderSalidaHtml(salidaData);
     mountSalida(despEl, html, salidaData);
+
+    window.trazas?.fin('salida.render', traza);
+    trazarPintado(traza);
   }
 
   // =========================================================================
@@ -643,7 +734,10 @@
     mountSalida,
     templates,
     fmt,
-    convertLegacyToUnified
+    convertLegacyToUnified,
+
+    // Para testing
+    _patchNodo: patchNodo
   };
 
 })(typeof window !== 'undefined' ? window : this);
@@ -72,6 +72,8 @@
     } else {
       el.value = valor ?? '';
     }
+    // Escritura por código: no dispara eventos, hay que avisar al estado
+    global.estadoFormulario?.invalidarElemento(el);
   }
 
   /**
@@ -190,78 +192,107 @@
   }
 
   /**
-   * Recopila los datos de todos los desplazamientos
-   * @returns {Array}
+   * IDs de los desplazamientos normales en orden de pantalla.
+   * @returns {number[]}
    */
-  function recopilarDesplazamientos() {
+  function listarIdsDesplazamientos() {
     const contenedor = document.getElementById('desplazamientos-container');
     if (!contenedor) return [];
-
-    const desplazamientos = [];
     // Excluir el desplazamiento especial de la recopilación
     const grupos = contenedor.querySelectorAll('.desplazamiento-grupo:not(.desplazamiento-especial)');
+    return Array.from(grupos, grupo => parseInt(grupo.dataset.desplazamientoId, 10));
+  }
 
-    grupos.forEach(grupo => {
-      const id = parseInt(grupo.dataset.desplazamientoId, 10);
-      
-      // Obtener detalles calculados del registro centralizado
-      const registro = global.__sgtriTotales?.desplazamientos?.[String(id)];
-      const detalles = registro?.detalles || null;
-      
-      desplazamientos.push({
-        id,
-        fechaIda: obtenerValorCampo(`fecha-ida-${id}`),
-        horaIda: obtenerValorCampo(`hora-ida-${id}`),
-        fechaRegreso: obtenerValorCampo(`fecha-regreso-${id}`),
-        horaRegreso: obtenerValorCampo(`hora-regreso-${id}`),
-        ticketCena: obtenerValorCampo(`ticket-cena-${id}`, 'checkbox'),
-        justificaPernocta: obtenerValorCampo(`justificar-pernocta-${id}`, 'checkbox'),
-        origen: obtenerValorCampo(`origen-${id}`),
-        destino: obtenerValorCampo(`destino-${id}`),
-        paisDestino: obtenerValorCampo(`pais-destino-${id}`),
-        cruceIda: obtenerValorCampo(`cruce-ida-${id}`),
-        cruceVuelta: obtenerValorCampo(`cruce-vuelta-${id}`),
-        motivo: obtenerValorCampo(`motivo-${id}`),
-        km: obtenerValorCampo(`km-${id}`),
-        alojamiento: obtenerValorCampo(`alojamiento-${id}`),
-        noManutencion: obtenerValorCampo(`no-manutencion-${id}`, 'checkbox'),
-        otrosGastos: recopilarOtrosGastos(id),
-        // Datos calculados (de salidaDesp)
-        datosCalculados: detalles ? {
-          // Manutención
-          numManutenciones: detalles.numManutenciones,
-          precioManutencion: detalles.precioManutencion,
-          importeManutencion: detalles.importeManutencion,
-          // Alojamiento
-          numNoches: detalles.numNoches,
-          precioNoche: detalles.precioNoche,
-          importeMaxAlojamiento: detalles.importeMaxAlojamiento,
-          excedeMaxAlojamiento: detalles.excedeMaxAlojamiento,
-          // Kilometraje
-          precioPorKm: detalles.precioPorKm,
-          importeKm: detalles.importeKm,
-          // Residencia eventual
-          residenciaEventual: detalles.residenciaEventual,
-          // IRPF
-          irpfSujeto: detalles.irpfSujeto,
-          // Total del desplazamiento
-          importeTotal: detalles.importeTotal,
-          // Segmentos (solo para desplazamientos internacionales)
-          segmentos: detalles.segmentos ? detalles.segmentos.map(seg => ({
-            titulo: seg.titulo,
-            pais: seg.pais,
-            numManutenciones: seg.numManutenciones,
-            precioManutencion: seg.precioManutencion,
-            importeManutencion: seg.importeManutencion,
-            numNoches: seg.numNoches,
-            precioNoche: seg.precioNoche,
-            importeMaxAlojamiento: seg.importeMaxAlojamiento
-          })) : null
-        } : null
-      });
-    });
+  /**
+   * Recopila los campos editables de un desplazamiento.
+   * @param {number|string} id
+   * @returns {Object}
+   */
+  function recopilarCamposDesplazamiento(id) {
+    return {
+      fechaIda: obtenerValorCampo(`fecha-ida-${id}`),
+      horaIda: obtenerValorCampo(`hora-ida-${id}`),
+      fechaRegreso: obtenerValorCampo(`fecha-regreso-${id}`),
+      horaRegreso: obtenerValorCampo(`hora-regreso-${id}`),
+      ticketCena: obtenerValorCampo(`ticket-cena-${id}`, 'checkbox'),
+      justificaPernocta: obtenerValorCampo(`justificar-pernocta-${id}`, 'checkbox'),
+      origen: obtenerValorCampo(`origen-${id}`),
+      destino: obtenerValorCampo(`destino-${id}`),
+      paisDestino: obtenerValorCampo(`pais-destino-${id}`),
+      cruceIda: obtenerValorCampo(`cruce-ida-${id}`),
+      cruceVuelta: obtenerValorCampo(`cruce-vuelta-${id}`),
+      motivo: obtenerValorCampo(`motivo-${id}`),
+      km: obtenerValorCampo(`km-${id}`),
+      alojamiento: obtenerValorCampo(`alojamiento-${id}`),
+      noManutencion: obtenerValorCampo(`no-manutencion-${id}`, 'checkbox'),
+      otrosGastos: recopilarOtrosGastos(id)
+    };
+  }
 
-    return desplazamientos;
+  /**
+   * Detalles calculados de un desplazamiento en el registro centralizado.
+   * @param {number|string} id
+   * @returns {Object|null}
+   */
+  function detallesDesplazamiento(id) {
+    const registro = global.__sgtriTotales?.desplazamientos?.[String(id)];
+    return registro?.detalles || null;
+  }
+
+  /**
+   * Compone la entrada serializada de un desplazamiento.
+   * @param {number|string} id
+   * @param {Object} campos - Resultado de recopilarCamposDesplazamiento()
+   * @param {Object|null} detalles - Resultado de detallesDesplazamiento()
+   * @returns {Object}
+   */
+  function componerDesplazamiento(id, campos, detalles) {
+    return {
+      id: parseInt(id, 10),
+      ...campos,
+      // Datos calculados (de salidaDesp)
+      datosCalculados: detalles ? {
+        // Manutención
+        numManutenciones: detalles.numManutenciones,
+        precioManutencion: detalles.precioManutencion,
+        importeManutencion: detalles.importeManutencion,
+        // Alojamiento
+        numNoches: detalles.numNoches,
+        precioNoche: detalles.precioNoche,
+        importeMaxAlojamiento: detalles.importeMaxAlojamiento,
+        excedeMaxAlojamiento: detalles.excedeMaxAlojamiento,
+        // Kilometraje
+        precioPorKm: detalles.precioPorKm,
+        importeKm: detalles.importeKm,
+        // Residencia eventual
+        residenciaEventual: detalles.residenciaEventual,
+        // IRPF
+        irpfSujeto: detalles.irpfSujeto,
+        // Total del desplazamiento
+        importeTotal: detalles.importeTotal,
+        // Segmentos (solo para desplazamientos internacionales)
+        segmentos: detalles.segmentos ? detalles.segmentos.map(seg => ({
+          titulo: seg.titulo,
+          pais: seg.pais,
+          numManutenciones: seg.numManutenciones,
+          precioManutencion: seg.precioManutencion,
+          importeManutencion: seg.importeManutencion,
+          numNoches: seg.numNoches,
+          precioNoche: seg.precioNoche,
+          importeMaxAlojamiento: seg.importeMaxAlojamiento
+        })) : null
+      } : null
+    };
+  }
+
+  /**
+   * Recopila los datos de todos los desplazamientos directamente del DOM
+   * @returns {Array}
+   */
+  function recopilarDesplazamientos() {
+    return listarIdsDesplazamientos().map(id =>
+      componerDesplazamiento(id, recopilarCamposDesplazamiento(id), detallesDesplazamiento(id))
+    );
   }
 
   /**
@@ -380,7 +411,9 @@
   }
 
   /**
-   * Recopila todos los datos del formulario
+   * Recopila todos los datos del formulario.
+   * Las secciones salen del estado en memoria (estadoFormulario), que solo
+   * vuelve a leer del DOM las que han cambiado desde la última vez.
    * @returns {Object} Objeto con todos los datos serializados
    */
   function recopilarTodo() {
@@ -388,24 +421,26 @@
       ? global.tipoLiquidacion.getTipoActual()
       : normalizarTipoLiquidacion(global.__sgtriTipoLiquidacion);
 
+    const s = global.estadoFormulario ? global.estadoFormulario.instantanea() : recopilarSecciones();
+
     return {
       versionEsquema: VERSION_ESQUEMA,
       guardadoEl: new Date().toISOString(),
       tipoLiquidacion,
       
-      beneficiario: recopilarBeneficiario(),
-      pago: recopilarPago(),
-      proyecto: recopilarProyecto(),
-      desplazamientos: recopilarDesplazamientos(),
-      desplazamientoAECC: recopilarDesplazamientoAECC(),
-      desplazamientoEspecial: recopilarDesplazamientoEspecial(),
-      vehiculo: recopilarVehiculo(),
-      evento: recopilarEvento(),
-      honorarios: recopilarHonorarios(),
-      imputacion: recopilarImputacion(),
-      ajustes: recopilarAjustes(),
-      resultadoLiquidacion: recopilarResultadoLiquidacion(),
-      fechaFirma: recopilarFechaFirma()
+      beneficiario: s.beneficiario,
+      pago: s.pago,
+      proyecto: s.proyecto,
+      desplazamientos: s.desplazamientos,
+      desplazamientoAECC: s.desplazamientoAECC,
+      desplazamientoEspecial: s.desplazamientoEspecial,
+      vehiculo: s.vehiculo,
+      evento: s.evento,
+      honorarios: s.honorarios,
+      imputacion: s.imputacion,
+      ajustes: s.ajustes,
+      resultadoLiquidacion: s.resultadoLiquidacion,
+      fechaFirma: s.fechaFirma
     };
   }
 
@@ -475,6 +510,53 @@
     return [];
   }
 
+  // =========================================================================
+  // ESTADO EN MEMORIA
+  // =========================================================================
+
+  /**
+   * Secciones de recopilarTodo() y sus recopiladores.
+   * cache: false → se leen siempre (ya viven en memoria o se escriben por
+   * código sin eventos); depende → secciones cuyo cambio las invalida.
+   */
+  const SECCIONES = {
+    beneficiario: { recopilar: recopilarBeneficiario },
+    pago: { recopilar: recopilarPago },
+    proyecto: { recopilar: recopilarProyecto },
+    desplazamientoAECC: { recopilar: recopilarDesplazamientoAECC, depende: ['proyecto'] },
+    desplazamientoEspecial: { recopilar: recopilarDesplazamientoEspecial },
+    vehiculo: { recopilar: recopilarVehiculo },
+    evento: { recopilar: recopilarEvento, cache: false },
+    honorarios: { recopilar: recopilarHonorarios },
+    imputacion: { recopilar: recopilarImputacion, cache: false },
+    ajustes: { recopilar: recopilarAjustes },
+    resultadoLiquidacion: { recopilar: recopilarResultadoLiquidacion, cache: false },
+    fechaFirma: { recopilar: recopilarFechaFirma }
+  };
+
+  /**
+   * Recopila todas las secciones directamente del DOM (sin estado en memoria).
+   * @returns {Object}
+   */
+  function recopilarSecciones() {
+    const resultado = { desplazamientos: recopilarDesplazamientos() };
+    Object.keys(SECCIONES).forEach(nombre => { resultado[nombre] = SECCIONES[nombre].recopilar(); });
+    return resultado;
+  }
+
+  if (global.estadoFormulario) {
+    Object.keys(SECCIONES).forEach(nombre => {
+      const { recopilar, ...opciones } = SECCIONES[nombre];
+      global.estadoFormulario.registrarSeccion(nombre, recopilar, opciones);
+    });
+    global.estadoFormulario.registrarColeccion('desplazamientos', {
+      listarIds: listarIdsDesplazamientos,
+      recopilarCampos: recopilarCamposDesplazamiento,
+      calculados: detallesDesplazamiento,
+      componer: componerDesplazamiento
+    });
+  }
+
   // =========================================================================
   // RESTAURACIÓN DE DATOS (Objeto → DOM)
   // =========================================================================
@@ -650,6 +732,11 @@
         return;
       }
 
+      // Retirar los listeners de las fichas actuales antes de quitarlas
+      if (uiDesp && uiDesp.liberarTodos) {
+        uiDesp.liberarTodos();
+      }
+
       // Eliminar todos los desplazamientos existentes antes de crear los nuevos
       const gruposExistentes = contenedor.querySelectorAll('.desplazamiento-grupo');
       gruposExistentes.forEach(grupo => {
@@ -938,6 +1025,16 @@
     // Esta función es un placeholder para mantener consistencia
   }
 
+  /**
+   * Ejecuta una etapa de la restauración dentro del span 'restaurar.<nombre>'.
+   * @param {string} nombre
+   * @param {Function} fn
+   * @returns {*} Resultado de fn (o su promesa)
+   */
+  function etapa(nombre, fn) {
+    return global.trazas ? global.trazas.medir(`restaurar.${nombre}`, fn) : fn();
+  }
+
   /**
    * Restaura todos los datos del formulario
    * @param {Object} datos - Objeto con todos los datos
@@ -949,6 +1046,13 @@
       return false;
     }
 
+    // La versión del esquema y los selects dependen de datos.json
+    try {
+      await global.utils?.cargarDatos?.();
+    } catch (e) {
+      console.warn('[serializacionDatos] datos.json no disponible:', e);
+    }
+
     // Verificar versión del esquema
     if (datos.versionEsquema !== VERSION_ESQUEMA) {
       console.warn(`[serializacionDatos] Versión diferente: archivo=${datos.versionEsquema}, app=${VERSION_ESQUEMA}`);
@@ -991,45 +1095,48 @@
     }
 
     if (global.tipoLiquidacion?.aplicarModoDesdeArchivo) {
-      global.tipoLiquidacion.aplicarModoDesdeArchivo(tipoLiquidacion);
+      // Espera a los módulos propios del modo (AECC, especial) antes de restaurar
+      await global.tipoLiquidacion.aplicarModoDesdeArchivo(tipoLiquidacion);
     }
 
+    const traza = global.trazas?.inicio();
+
     // Limpiar formulario completo antes de restaurar
     if (global.formLogic?.limpiarFormularioCompleto) {
-      global.formLogic.limpiarFormularioCompleto();
+      etapa('limpiar', () => global.formLogic.limpiarFormularioCompleto());
     }
 
     // Restaurar cada sección (orden importante)
-    restaurarBeneficiario(datos.beneficiario);
-    restaurarPago(datos.pago);
-    restaurarProyecto(datos.proyecto);
+    etapa('beneficiario', () => restaurarBeneficiario(datos.beneficiario));
+    etapa('pago', () => restaurarPago(datos.pago));
+    etapa('proyecto', () => restaurarProyecto(datos.proyecto));
     
     // Restaurar desplazamientos (asíncrono)
-    await restaurarDesplazamientos(datos.desplazamientos);
+    await etapa('desplazamientos', () => restaurarDesplazamientos(datos.desplazamientos));
 
     // Restaurar desplazamiento AECC
     if (tieneAECC && global.uiDesplazamientoAecc?.restaurarDatos) {
-      global.uiDesplazamientoAecc.restaurarDatos(datos.desplazamientoAECC[0]);
+      etapa('aecc', () => global.uiDesplazamientoAecc.restaurarDatos(datos.desplazamientoAECC[0]));
     }
     
     // Esperar un poco más para que el DOM se actualice completamente
     await new Promise(resolve => setTimeout(resolve, 100));
     
     // Restaurar evento (después de desplazamientos para tener el mapeo)
-    restaurarEvento(datos.evento);
-    restaurarHonorarios(datos.honorarios);
-    restaurarAjustes(datos.ajustes);
+    etapa('evento', () => restaurarEvento(datos.evento));
+    etapa('honorarios', () => restaurarHonorarios(datos.honorarios));
+    etapa('ajustes', () => restaurarAjustes(datos.ajustes));
 
     // Restaurar desplazamiento especial
     if (datos.desplazamientoEspecial && global.uiDesplazamientoEspecial?.restaurarDatos) {
-      global.uiDesplazamientoEspecial.restaurarDatos(datos.desplazamientoEspecial);
+      etapa('especial', () => global.uiDesplazamientoEspecial.restaurarDatos(datos.desplazamientoEspecial));
     }
 
     // Restaurar resultado de liquidación (recalculará automáticamente)
-    restaurarResultadoLiquidacion(datos.resultadoLiquidacion);
+    etapa('resultado', () => restaurarResultadoLiquidacion(datos.resultadoLiquidacion));
 
     // Restaurar fecha de firma
-    restaurarFechaFirma(datos.fechaFirma);
+    etapa('fechaFirma', () => restaurarFechaFirma(datos.fechaFirma));
 
     // Tareas post-restauración
     setTimeout(() => {
@@ -1039,7 +1146,7 @@
       }
       
       // 2. Restaurar vehículo DESPUÉS de que la ficha esté visible
-      restaurarVehiculo(datos.vehiculo, 100);
+      etapa('vehiculo', () => restaurarVehiculo(datos.vehiculo, 100));
       
       // 3. Desplegar secciones con contenido
       desplegarSeccionesConContenido(datos);
@@ -1067,15 +1174,20 @@
       // 7. Restaurar imputación (después de recalcular para tener el total correcto)
       setTimeout(() => {
         if (global.uiImputacion && typeof global.uiImputacion.restaurarLineas === 'function') {
-          global.uiImputacion.restaurarLineas(datos.imputacion);
+          etapa('imputacion', () => global.uiImputacion.restaurarLineas(datos.imputacion));
         }
+        global.trazas?.fin('restaurar.total', traza);
       }, 100);
       
       // 8. Limpiar mapeo temporal
       delete global.__tempMapeoDesplazamientos;
+
+      // 9. Los módulos restauran valores por código (sin eventos)
+      global.estadoFormulario?.invalidarTodo();
       
     }, 300);
 
+    global.estadoFormulario?.invalidarTodo();
     return true;
   }
 
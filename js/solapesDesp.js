@@ -0,0 +1,437 @@
+/**
+ * solapesDesp.js
+ * ==============
+ * Detección de desplazamientos solapados del mismo beneficiario, dentro del
+ * formulario y frente a liquidaciones anteriores (historial).
+ *
+ * Cada desplazamiento es un intervalo [salida, regreso) en minutos; si falta
+ * la hora se toma el día completo. Regresar y salir a la misma hora no es
+ * solape.
+ *
+ * El historial se indexa por beneficiario con un árbol de intervalos estático
+ * (array ordenado por inicio + máximo fin de cada subárbol), de modo que una
+ * consulta recorre solo las ramas que pueden contener solapes. El historial
+ * se carga con cargarHistorial(), a partir de archivos .dta o de la salida de
+ * `python tools/index_dta.py intervalos`; en el formulario, con el botón
+ * "Historial" de la barra de acciones.
+ *
+ * También funciona sin navegador (auditoría de lotes):
+ *   const { solapesDesp } = require('./js/solapesDesp.js');
+ *   solapesDesp.auditarLote([{ nombre, contenido }]);
+ *
+ * @module solapesDesp
+ */
+(function (global) {
+  'use strict';
+
+  /** Utilidades compartidas (sin navegador se cargan de utils.js) */
+  const utils = global.utils || require('./utils.js').utils;
+  const diaDeFecha = utils.diaDeFecha;
+
+  /** Minutos de un día: inicio y fin por defecto cuando falta la hora */
+  const MINUTOS_DIA = 24 * 60;
+
+  // =========================================================================
+  // INTERVALOS
+  // =========================================================================
+
+  /**
+   * Normaliza un DNI/NIE para compararlo (mayúsculas, sin separadores).
+   * @param {string} dni
+   * @returns {string}
+   */
+  function normalizarDni(dni) {
+    return String(dni || '').replace(/[^0-9a-z]/gi, '').toUpperCase();
+  }
+
+  /**
+   * Minutos desde medianoche de una hora hh:mm.
+   * @param {string} hora
+   * @param {number} porDefecto
+   * @returns {number}
+   */
+  function minutosDeHora(hora, porDefecto) {
+    const partes = String(hora || '').trim().match(/^(\d{1,2}):(\d{2})$/);
+    if (!partes) return porDefecto;
+    const h = +partes[1];
+    const m = +partes[2];
+    return (h > 23 || m > 59) ? porDefecto : h * 60 + m;
+  }
+
+  /**
+   * Intervalo en minutos de un desplazamiento serializado (o de una ficha).
+   * @param {{fechaIda: string, horaIda?: string, fechaRegreso?: string, horaRegreso?: string}} desp
+   * @returns {{inicio: number, fin: number}|null} null si faltan fechas o el orden no es válido
+   */
+  function intervaloDesplazamiento(desp) {
+    if (!desp) return null;
+    const diaIda = diaDeFecha(desp.fechaIda);
+    if (diaIda === null) return null;
+    const diaRegreso = desp.fechaRegreso ? diaDeFecha(desp.fechaRegreso) : diaIda;
+    if (diaRegreso === null) return null;
+    const inicio = diaIda * MINUTOS_DIA + minutosDeHora(desp.horaIda, 0);
+    const fin = diaRegreso * MINUTOS_DIA + minutosDeHora(desp.horaRegreso, MINUTOS_DIA - 1);
+    return fin > inicio ? { inicio, fin } : null;
+  }
+
+  /**
+   * Intervalo de una entrada exportada por index_dta.py ('aaaa-mm-ddThh:mm').
+   * @param {{inicio: string, fin: string}} entrada
+   * @returns {{inicio: number, fin: number}|null}
+   */
+  function intervaloDeEntrada(entrada) {
+    const [fIda, hIda] = String(entrada.inicio || '').split('T');
+    const [fReg, hReg] = String(entrada.fin || '').split('T');
+    return intervaloDesplazamiento({ fechaIda: fIda, horaIda: hIda, fechaRegreso: fReg, horaRegreso: hReg });
+  }
+
+  /**
+   * Intervalos de todos los desplazamientos (normales y AECC) de un .dta.
+   * @param {Object} datos - Contenido del .dta ya parseado
+   * @param {string} archivo - Nombre del archivo (para los informes)
+   * @returns {Array<{dni, archivo, referencia, orden, inicio, fin, fechaIda, fechaRegreso}>}
+   */
+  function intervalosDeDatos(datos, archivo) {
+    const dni = normalizarDni(datos?.beneficiario?.dni);
+    if (!dni) return [];
+    const referencia = datos.proyecto?.referencia || '';
+    const lista = [...(datos.desplazamientos || []), ...(datos.desplazamientoAECC || [])];
+    const intervalos = [];
+    lista.forEach((desp, orden) => {
+      const intervalo = intervaloDesplazamiento(desp);
+      if (!intervalo) return;
+      intervalos.push({
+        dni, archivo, referencia, orden,
+        inicio: intervalo.inicio,
+        fin: intervalo.fin,
+        fechaIda: desp.fechaIda,
+        fechaRegreso: desp.fechaRegreso || desp.fechaIda
+      });
+    });
+    return intervalos;
+  }
+
+  // =========================================================================
+  // ÁRBOL DE INTERVALOS
+  // =========================================================================
+
+  /**
+   * Crea un índice estático de intervalos: array ordenado por inicio visto
+   * como árbol binario implícito (la raíz de [lo, hi] es el punto medio), con
+   * el máximo fin de cada subárbol. Construcción O(n log n); consulta
+   * O(log n + k) salvo intervalos muy anidados.
+   * @param {Array<{inicio: number, fin: number}>} intervalos
+   * @returns {{tamano: number, buscar: Function}}
+   */
+  function crearIndiceIntervalos(intervalos) {
+    const items = intervalos.slice().sort((a, b) => a.inicio - b.inicio);
+    const n = items.length;
+    const inicios = new Float64Array(n);
+    const maxFin = new Float64Array(n);
+    items.forEach((it, i) => { inicios[i] = it.inicio; });
+
+    function construir(lo, hi) {
+      if (lo > hi) return -Infinity;
+      const mid = (lo + hi) >> 1;
+      maxFin[mid] = Math.max(items[mid].fin, construir(lo, mid - 1), construir(mid + 1, hi));
+      return maxFin[mid];
+    }
+    construir(0, n - 1);
+
+    /**
+     * Intervalos que se solapan con [inicio, fin).
+     * @param {number} inicio
+     * @param {number} fin
+     * @returns {Array}
+     */
+    function buscar(inicio, fin) {
+      const resultado = [];
+      (function visitar(lo, hi) {
+        if (lo > hi) return;
+        const mid = (lo + hi) >> 1;
+        // Nada en este subárbol termina después de `inicio`
+        if (maxFin[mid] <= inicio) return;
+        visitar(lo, mid - 1);
+        // El resto del subárbol empieza en `fin` o después
+        if (inicios[mid] >= fin) return;
+        if (items[mid].fin > inicio) resultado.push(items[mid]);
+        visitar(mid + 1, hi);
+      })(0, n - 1);
+      return resultado;
+    }
+
+    return { tamano: n, buscar };
+  }
+
+  // =========================================================================
+  // HISTORIAL (liquidaciones anteriores)
+  // =========================================================================
+
+  /** dni → intervalos del historial */
+  let historial = new Map();
+  /** dni → índice (se construye en la primera consulta de ese beneficiario) */
+  let indices = new Map();
+
+  /**
+   * Carga el historial con el que se comparan las fichas.
+   * @param {Array} entradas - Archivos .dta ({nombre, contenido}) o entradas
+   *   exportadas por `index_dta.py intervalos` ({dni, archivo, inicio, fin, ...})
+   * @returns {number} Número de intervalos cargados
+   */
+  function cargarHistorial(entradas) {
+    historial = new Map();
+    indices = new Map();
+    let total = 0;
+    (entradas || []).forEach(entrada => {
+      let lista;
+      if (entrada && 'contenido' in entrada) {
+        let datos = entrada.contenido;
+        if (typeof datos === 'string') {
+          try { datos = JSON.parse(datos); } catch (e) { return; }
+        }
+        lista = intervalosDeDatos(datos, entrada.nombre);
+      } else {
+        const intervalo = entrada ? intervaloDeEntrada(entrada) : null;
+        if (!intervalo) return;
+        lista = [{
+          ...entrada,
+          dni: normalizarDni(entrada.dni),
+          fechaIda: String(entrada.inicio).replace('T', ' '),
+          fechaRegreso: String(entrada.fin).replace('T', ' '),
+          ...intervalo
+        }];
+      }
+      lista.forEach(it => {
+        if (!historial.has(it.dni)) historial.set(it.dni, []);
+        historial.get(it.dni).push(it);
+        total++;
+      });
+    });
+    return total;
+  }
+
+  function indiceDe(dni) {
+    if (!indices.has(dni)) indices.set(dni, crearIndiceIntervalos(historial.get(dni) || []));
+    return indices.get(dni);
+  }
+
+  // =========================================================================
+  // COMPROBACIÓN
+  // =========================================================================
+
+  /**
+   * Solapes de un desplazamiento con el historial del beneficiario y con
+   * otras fichas del mismo formulario.
+   * @param {string} dni
+   * @param {Object} desp - Desplazamiento (fechaIda, horaIda, fechaRegreso, horaRegreso)
+   * @param {Array<{id, fechaIda, horaIda, fechaRegreso, horaRegreso}>} [otras] - Resto de fichas
+   * @returns {{historial: Array, formulario: Array}}
+   */
+  function comprobarDesplazamiento(dni, desp, otras = []) {
+    const resultado = { historial: [], formulario: [] };
+    const intervalo = intervaloDesplazamiento(desp);
+    if (!intervalo) return resultado;
+
+    const clave = normalizarDni(dni);
+    if (clave && historial.has(clave)) {
+      resultado.historial = indiceDe(clave).buscar(intervalo.inicio, intervalo.fin);
+    }
+    otras.forEach(otra => {
+      const i = intervaloDesplazamiento(otra);
+      if (i && i.inicio < intervalo.fin && intervalo.inicio < i.fin) resultado.formulario.push(otra);
+    });
+    return resultado;
+  }
+
+  /**
+   * Auditoría de un lote de .dta: barrido por beneficiario sobre los
+   * intervalos ordenados, comparando cada uno solo con los que siguen
+   * abiertos. O(n log n + k).
+   * @param {Array<{nombre: string, contenido: string|Object}>} archivos
+   * @param {Object} [opciones]
+   * @param {boolean} [opciones.mismoArchivo=false] - Incluir solapes dentro de una misma liquidación
+   * @returns {Array<{a: Object, b: Object}>}
+   */
+  function auditarLote(archivos, opciones = {}) {
+    const intervalos = [];
+    (archivos || []).forEach(a => {
+      let datos = a.contenido;
+      if (typeof datos === 'string') {
+        try { datos = JSON.parse(datos); } catch (e) { return; }
+      }
+      intervalos.push(...intervalosDeDatos(datos, a.nombre));
+    });
+    intervalos.sort((x, y) => (x.dni < y.dni ? -1 : x.dni > y.dni ? 1 : x.inicio - y.inicio));
+
+    const solapes = [];
+    let activos = [];
+    let dniActual = null;
+    intervalos.forEach(it => {
+      if (it.dni !== dniActual) {
+        dniActual = it.dni;
+        activos = [];
+      }
+      activos = activos.filter(otro => otro.fin > it.inicio);
+      activos.forEach(otro => {
+        if (opciones.mismoArchivo || otro.archivo !== it.archivo) solapes.push({ a: otro, b: it });
+      });
+      activos.push(it);
+    });
+    return solapes;
+  }
+
+  // =========================================================================
+  // AVISO EN EL FORMULARIO
+  // =========================================================================
+
+  /**
+   * Lee las fechas de las fichas del formulario.
+   * @returns {Array<{id, numero, fechaIda, horaIda, fechaRegreso, horaRegreso}>}
+   */
+  function leerFichas() {
+    const valor = id => document.getElementById(id)?.value || '';
+    return [...document.querySelectorAll('.desplazamiento-grupo:not(.desplazamiento-especial)')].map((el, i) => {
+      const id = el.dataset.desplazamientoId;
+      return {
+        id,
+        numero: i + 1,
+        fechaIda: valor(`fecha-ida-${id}`),
+        horaIda: valor(`hora-ida-${id}`),
+        fechaRegreso: valor(`fecha-regreso-${id}`),
+        horaRegreso: valor(`hora-regreso-${id}`)
+      };
+    });
+  }
+
+  function textoSolapes({ historial: h, formulario: f }) {
+    const partes = [];
+    f.forEach(o => partes.push(`desplazamiento ${o.numero} de esta liquidación`));
+    h.forEach(o => partes.push(`${o.archivo}${o.referencia ? ` (${o.referencia})` : ''}, ` +
+      `${o.fechaIda} – ${o.fechaRegreso}`));
+    return partes.length ? `Fechas solapadas con: ${partes.join('; ')}` : '';
+  }
+
+  /**
+   * Comprueba todas las fichas del formulario y muestra u oculta su aviso de
+   * solape (bajo la fila de fechas).
+   * @returns {number} Fichas con solape
+   */
+  function comprobarFormulario() {
+    const dni = document.getElementById('dni')?.value || '';
+    const fichas = leerFichas();
+    let conSolape = 0;
+    fichas.forEach(ficha => {
+      const otras = fichas.filter(o => o !== ficha);
+      const texto = textoSolapes(comprobarDesplazamiento(dni, ficha, otras));
+      const grupo = document.querySelector(`.desplazamiento-grupo[data-desplazamiento-id="${ficha.id}"]`);
+      let aviso = document.getElementById(`solape-aviso-${ficha.id}`);
+      if (texto) conSolape++;
+      if (!texto) {
+        if (aviso) aviso.hidden = true;
+        return;
+      }
+      if (!aviso) {
+        aviso = document.createElement('div');
+        aviso.id = `solape-aviso-${ficha.id}`;
+        aviso.className = 'solape-aviso';
+        aviso.setAttribute('role', 'status');
+        const filaFechas = grupo?.querySelector('.form-row');
+        if (!filaFechas) return;
+        filaFechas.after(aviso);
+      }
+      aviso.textContent = `⚠️ ${texto}`;
+      aviso.hidden = false;
+    });
+    return conSolape;
+  }
+
+  // =========================================================================
+  // CARGA DEL HISTORIAL DESDE ARCHIVOS
+  // =========================================================================
+
+  /**
+   * Lee los archivos elegidos: cada .dta es una liquidación y un .json con
+   * una lista es la salida de `index_dta.py intervalos`.
+   * @param {FileList|File[]} archivos
+   * @returns {Promise<{entradas: Array, errores: string[]}>}
+   */
+  async function leerArchivosHistorial(archivos) {
+    const entradas = [];
+    const errores = [];
+    for (const archivo of archivos) {
+      try {
+        const datos = JSON.parse(await archivo.text());
+        if (Array.isArray(datos)) entradas.push(...datos);
+        else entradas.push({ nombre: archivo.name, contenido: datos });
+      } catch (e) {
+        errores.push(archivo.name);
+      }
+    }
+    return { entradas, errores };
+  }
+
+  /**
+   * Abre el diálogo de archivos para cargar el historial (varios .dta o un
+   * JSON de intervalos) y vuelve a comprobar las fichas del formulario.
+   */
+  function abrirDialogoHistorial() {
+    const input = document.createElement('input');
+    input.type = 'file';
+    input.accept = '.dta,.json';
+    input.multiple = true;
+
+    input.onchange = async (e) => {
+      const archivos = [...(e.target.files || [])];
+      if (archivos.length === 0) return;
+      const { entradas, errores } = await leerArchivosHistorial(archivos);
+      const total = cargarHistorial(entradas);
+      const conSolape = comprobarFormulario();
+      let mensaje = `Historial cargado: ${total} desplazamientos de ${historial.size} beneficiarios.`;
+      if (conSolape) mensaje += `\n${conSolape} desplazamientos del formulario tienen fechas solapadas.`;
+      if (errores.length) mensaje += `\nNo se pudieron leer: ${errores.join(', ')}`;
+      alert(mensaje);
+    };
+
+    input.click();
+  }
+
+  // =========================================================================
+  // INICIALIZACIÓN
+  // =========================================================================
+
+  if (typeof document !== 'undefined') {
+    document.addEventListener('click', (e) => {
+      if (e.target.closest?.('#btn-historial')) abrirDialogoHistorial();
+    });
+
+    // El historial se consulta por beneficiario: al cambiar el DNI cambian
+    // los solapes de todas las fichas
+    document.addEventListener('change', (e) => {
+      if (e.target.id === 'dni') comprobarFormulario();
+    });
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.solapesDesp = {
+    intervaloDesplazamiento,
+    intervalosDeDatos,
+    crearIndiceIntervalos,
+    cargarHistorial,
+    comprobarDesplazamiento,
+    comprobarFormulario,
+    abrirDialogoHistorial,
+    auditarLote,
+    getEstadisticas: () => ({
+      beneficiarios: historial.size,
+      intervalos: [...historial.values()].reduce((n, l) => n + l.length, 0),
+      indicesConstruidos: indices.size
+    }),
+
+    // Para testing
+    _normalizarDni: normalizarDni
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,287 @@
+/**
+ * tarifas.js
+ * ==========
+ * Tarifas con fecha de vigencia (dietas por país, tarifas de km, límites de
+ * IRPF y datos AECC) para recalcular liquidaciones antiguas con los precios
+ * de su fecha.
+ *
+ * assets/data/tarifas/indice.json enumera las versiones por fecha de entrada
+ * en vigor. datos.json es la versión base (vigente desde indice.base.desde);
+ * cada archivo de versión solo contiene las tablas que cambian y hereda el
+ * resto de la versión contigua más cercana a la base: las históricas de la
+ * siguiente y las futuras de la anterior. Las tablas con el mismo contenido
+ * se comparten entre versiones (una sola copia en memoria).
+ *
+ * resolver(fechaIda) localiza la versión con búsqueda binaria sobre las
+ * fechas de vigencia. Es síncrono: si la versión aún no está cargada la pide
+ * en segundo plano, devuelve la vigente de datos.json y, al llegar, recalcula
+ * el formulario. Para auditorías por lotes conviene precargar(fechas) antes.
+ *
+ * También funciona sin navegador:
+ *   const { tarifas } = require('./js/tarifas.js');
+ *   tarifas.configurar({ base: datos, indice, cargar: archivo => leerJSON(archivo) });
+ *
+ * @module tarifas
+ */
+(function (global) {
+  'use strict';
+
+  /** Utilidades compartidas (sin navegador se cargan de utils.js) */
+  const utils = global.utils || require('./utils.js').utils;
+  const diaDeFecha = utils.diaDeFecha;
+
+  /** Claves de datos.json que dependen de la fecha */
+  const CLAVES_TARIFA = ['dietasPorPais', 'kmTarifas', 'limitesIRPF', 'datosAECC', 'reglasDietas'];
+
+  const RUTA_TARIFAS = 'assets/data/tarifas/';
+
+  // =========================================================================
+  // ESTADO
+  // =========================================================================
+
+  /** Datos base (datos.json) */
+  let base = null;
+
+  /** Posición de datos.json en `versiones` */
+  let iBase = 0;
+
+  /**
+   * Versiones ordenadas por vigencia:
+   * { desde, dia, archivo, descripcion, datos, promesa }
+   */
+  let versiones = [];
+
+  /** Días de vigencia en paralelo a `versiones` (para la búsqueda binaria) */
+  let dias = new Float64Array(0);
+
+  /** archivo → Promise<Object> con el contenido de la versión */
+  let cargar = null;
+
+  /** JSON de la tabla → tabla (deduplicación entre versiones) */
+  const tablas = new Map();
+
+  let alCargarVersion = null;
+
+  const estadisticas = { resoluciones: 0, cargas: 0, tablasCompartidas: 0 };
+
+  // =========================================================================
+  // FECHAS
+  // =========================================================================
+
+  /**
+   * Índice de la versión vigente en un día: la última cuya vigencia empieza
+   * ese día o antes (búsqueda binaria). Antes de la primera vigencia rige la
+   * más antigua; sin fecha válida, datos.json.
+   * @param {number|null} dia
+   * @returns {number}
+   */
+  function indiceVersion(dia) {
+    const n = dias.length;
+    if (dia === null || n === 0) return iBase;
+    let lo = 0;
+    let hi = n;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (dias[mid] <= dia) lo = mid + 1; else hi = mid;
+    }
+    return Math.max(0, lo - 1);
+  }
+
+  // =========================================================================
+  // COMPOSICIÓN DE VERSIONES
+  // =========================================================================
+
+  /**
+   * Devuelve la copia compartida de una tabla con el mismo contenido.
+   * @param {*} tabla
+   * @returns {*}
+   */
+  function internar(tabla) {
+    if (!tabla || typeof tabla !== 'object') return tabla;
+    const clave = JSON.stringify(tabla);
+    const previa = tablas.get(clave);
+    if (previa) {
+      if (previa !== tabla) estadisticas.tablasCompartidas++;
+      return previa;
+    }
+    tablas.set(clave, tabla);
+    return tabla;
+  }
+
+  /**
+   * Compone una versión sobre su contigua: las claves de tarifa se mezclan
+   * a nivel de tabla (dietasPorPais.rd462_2002, kmTarifas...) y el resto de
+   * datos.json se toma tal cual. La lista de países no puede cambiar: los
+   * índices de país del formulario apuntan a ella.
+   * @param {Object} contigua
+   * @param {Object} cambios
+   * @returns {Object}
+   */
+  function componer(contigua, cambios) {
+    const datos = { ...contigua };
+    CLAVES_TARIFA.forEach(clave => {
+      const nuevo = cambios?.[clave];
+      if (!nuevo) return;
+      const mezcla = { ...contigua[clave] };
+      Object.keys(nuevo).forEach(tabla => {
+        if (clave === 'dietasPorPais' && tabla === 'paises') return;
+        mezcla[tabla] = internar(nuevo[tabla]);
+      });
+      datos[clave] = mezcla;
+    });
+    return datos;
+  }
+
+  /**
+   * Carga (una sola vez) una versión y las intermedias hasta la base, de
+   * las que hereda.
+   * @param {number} i
+   * @returns {Promise<Object>}
+   */
+  function cargarVersion(i) {
+    const v = versiones[i];
+    if (v.datos) return Promise.resolve(v.datos);
+    if (!v.promesa) {
+      const contigua = cargarVersion(i < iBase ? i + 1 : i - 1);
+      v.promesa = Promise.all([contigua, cargar(v.archivo)])
+        .then(([datosContigua, cambios]) => {
+          v.datos = componer(datosContigua, cambios);
+          estadisticas.cargas++;
+          if (typeof alCargarVersion === 'function') alCargarVersion(v);
+          return v.datos;
+        });
+      // Si falla, se reintentará en la siguiente resolución
+      v.promesa.catch(e => {
+        v.promesa = null;
+        console.warn(`[tarifas] No se pudo cargar ${v.archivo}:`, e);
+      });
+    }
+    return v.promesa;
+  }
+
+  // =========================================================================
+  // API
+  // =========================================================================
+
+  /**
+   * Configura el almacén.
+   * @param {Object} opciones
+   * @param {Object} opciones.base - Contenido de datos.json
+   * @param {{base?: {desde: string}, versiones: Array<{desde: string, archivo: string, descripcion?: string}>}} [opciones.indice]
+   * @param {Function} [opciones.cargar] - (archivo) → Promise<Object>
+   * @param {Function} [opciones.alCargar] - Callback al terminar de cargar una versión
+   */
+  function configurar({ base: datosBase, indice, cargar: cargador, alCargar } = {}) {
+    base = datosBase || null;
+    cargar = cargador || cargar;
+    alCargarVersion = alCargar || alCargarVersion;
+    tablas.clear();
+    if (base) CLAVES_TARIFA.forEach(clave => Object.values(base[clave] || {}).forEach(internar));
+
+    // Sin fecha en el índice, datos.json rige desde siempre
+    const desdeBase = indice?.base?.desde || null;
+    const versionBase = {
+      desde: desdeBase,
+      dia: diaDeFecha(desdeBase) ?? -Infinity,
+      archivo: null,
+      descripcion: 'datos.json',
+      datos: base,
+      promesa: null
+    };
+    const lista = (indice?.versiones || [])
+      .filter(v => v.archivo && diaDeFecha(v.desde) !== null)
+      .map(v => ({ ...v, dia: diaDeFecha(v.desde), datos: null, promesa: null }));
+    versiones = [versionBase, ...lista].sort((a, b) => a.dia - b.dia);
+    iBase = versiones.indexOf(versionBase);
+    dias = Float64Array.from(versiones, v => v.dia);
+  }
+
+  /**
+   * Datos (datos.json con las tarifas de la fecha) vigentes en una fecha.
+   * Síncrono: si la versión no está cargada todavía, la pide y devuelve la
+   * base.
+   * @param {string} [fecha] - Fecha de ida (dd/mm/aa o aaaa-mm-dd)
+   * @returns {Object|null}
+   */
+  function resolver(fecha) {
+    estadisticas.resoluciones++;
+    const actuales = base || global.__sgtriDatos || null;
+    if (versiones.length <= 1) return actuales;
+    const i = indiceVersion(diaDeFecha(fecha));
+    if (versiones[i].datos) return versiones[i].datos;
+    if (cargar) cargarVersion(i).catch(() => {});
+    return actuales;
+  }
+
+  /**
+   * Carga las versiones necesarias para un conjunto de fechas.
+   * @param {string[]} fechas
+   * @returns {Promise<void>}
+   */
+  function precargar(fechas) {
+    const indices = new Set((fechas || []).map(f => indiceVersion(diaDeFecha(f))));
+    return Promise.all([...indices].map(cargarVersion)).then(() => {});
+  }
+
+  /**
+   * Descripción de la versión vigente en una fecha.
+   * @param {string} fecha
+   * @returns {{desde: string|null, descripcion: string, cargada: boolean}}
+   */
+  function versionVigente(fecha) {
+    const v = versiones[indiceVersion(diaDeFecha(fecha))] || versiones[0];
+    return { desde: v?.desde || null, descripcion: v?.descripcion || '', cargada: !!v?.datos };
+  }
+
+  // =========================================================================
+  // INICIALIZACIÓN EN EL NAVEGADOR
+  // =========================================================================
+
+  function cargarJSON(ruta) {
+    return fetch(ruta).then(r => {
+      if (!r.ok) throw new Error(`HTTP ${r.status}`);
+      return r.json();
+    });
+  }
+
+  if (typeof document !== 'undefined' && global.utils?.cargarDatos) {
+    global.utils.cargarDatos()
+      .then(datos => Promise.all([datos, cargarJSON(RUTA_TARIFAS + 'indice.json').catch(() => null)]))
+      .then(([datos, indice]) => {
+        configurar({
+          base: datos,
+          indice,
+          cargar: archivo => cargarJSON(RUTA_TARIFAS + archivo),
+          // Las fichas calculadas con la base mientras llegaba la versión
+          alCargar: () => {
+            global.logicaDesp?.scheduleFullRecalc?.(0);
+            global.uiDesplazamientoAecc?.renderResultado?.();
+            global.computeDescuentoManutencion?.();
+          }
+        });
+      })
+      .catch(() => { /* sin datos.json: resolver() usa __sgtriDatos */ });
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.tarifas = {
+    CLAVES_TARIFA,
+    configurar,
+    resolver,
+    precargar,
+    versionVigente,
+    getEstadisticas: () => ({
+      ...estadisticas,
+      versiones: versiones.length,
+      cargadas: versiones.filter(v => v.datos).length,
+      tablasUnicas: tablas.size
+    }),
+
+    // Para testing
+    _indiceVersion: indiceVersion
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -9,6 +9,9 @@
  * - HONOR: honorarios + 1 desplazamiento
  * - AECC: igual que DESPL pero sin sección de desplazamientos
  * - GNRAL: modo completo
+ *
+ * Los módulos propios de un modo (AECC, desplazamiento especial) se cargan al
+ * aplicarlo, a través de cargaModulos.
  */
 (function (global) {
   'use strict';
@@ -36,6 +39,9 @@
 
   let tipoActual = null;
 
+  /** Contador de aplicaciones de modo (descarta cargas superadas por otra) */
+  let aplicacionActual = 0;
+
   function normalizarTipo(tipo) {
     if (!tipo) return TIPOS.GNRAL;
     const t = String(tipo).trim().toUpperCase();
@@ -153,10 +159,29 @@
     }
   }
 
-  function aplicarModoUI(tipo) {
+  /**
+   * Aplica un tipo de liquidación: carga sus módulos bajo demanda y ajusta
+   * secciones, límites y proyecto. Se traza como 'modo.<TIPO>' y, solo la
+   * carga de módulos, 'modo.<TIPO>.carga' (la primera de cada modo es en frío).
+   * @param {string} tipo
+   * @returns {Promise<boolean>} false si otra llamada posterior la ha superado
+   */
+  async function aplicarModoUI(tipo) {
+    const traza = global.trazas?.inicio();
+    const aplicacion = ++aplicacionActual;
     const tipoNormalizado = normalizarTipo(tipo);
     const cfg = CONFIG[tipoNormalizado];
 
+    if (global.cargaModulos?.cargarTipo) {
+      try {
+        await global.cargaModulos.cargarTipo(tipoNormalizado);
+      } catch (e) {
+        console.warn('[tipoLiquidacion] Error al cargar módulos del modo:', e);
+      }
+    }
+    if (aplicacion !== aplicacionActual) return false;
+    global.trazas?.fin(`modo.${tipoNormalizado}.carga`, traza);
+
     const secEventos = getSectionById('eventos');
     const secHonorarios = getSectionById('honorarios');
     const secDesplazamientos = getSectionById('desplazamientos');
@@ -200,18 +225,24 @@
     }
 
     aplicarRestriccionesProyectoPorTipo(tipoNormalizado);
+    // Las restricciones y los reset del modo cambian campos por código
+    global.estadoFormulario?.invalidarTodo();
 
     tipoActual = tipoNormalizado;
     global.__sgtriTipoLiquidacion = tipoActual;
+
+    global.trazas?.fin(`modo.${tipoNormalizado}`, traza);
+    return true;
   }
 
-  function seleccionarTipo(tipo) {
-    aplicarModoUI(tipo);
+  async function seleccionarTipo(tipo) {
+    if (!(await aplicarModoUI(tipo))) return;
     mostrarFormulario();
+    global.cargaModulos?.recordarTipo?.(tipoActual);
   }
 
   function aplicarModoDesdeArchivo(tipo) {
-    seleccionarTipo(tipo);
+    return seleccionarTipo(tipo);
   }
 
   function getTipoActual() {
@@ -222,6 +253,7 @@
     tipoActual = null;
     delete global.__sgtriTipoLiquidacion;
     mostrarMenuInicial();
+    global.cargaModulos?.precargarEnOcio?.();
   }
 
   function init() {
@@ -271,6 +303,20 @@
         }
       });
     }
+
+    // Precarga: el último modo usado en tiempo ocioso y, por intención, el
+    // modo del botón al que se acerca el usuario (los modos ocultos se
+    // eligen con Mayús + clic sobre DESPL o AECC)
+    const carga = global.cargaModulos;
+    if (carga) {
+      carga.precargarEnOcio();
+      [[btnDespl, TIPOS.GNRAL], [btnAecc, TIPOS.AECC]].forEach(([btn, tipo]) => {
+        if (!btn) return;
+        const precargar = () => carga.precargarTipo(tipo);
+        btn.addEventListener('pointerenter', precargar, { once: true });
+        btn.addEventListener('focus', precargar, { once: true });
+      });
+    }
   }
 
   global.tipoLiquidacion = {
@@ -0,0 +1,403 @@
+/**
+ * trazas.js
+ * =========
+ * Trazas de rendimiento: spans con nombre sobre cálculo, render,
+ * restauración y PDF.
+ *
+ * Desactivadas no cuestan prácticamente nada: inicio() devuelve 0 sin
+ * leer el reloj y fin() sale en la primera comprobación. Activadas, cada span
+ * se emite como performance.measure('sgtri:<nombre>') (visible en la pestaña
+ * Performance de DevTools) y se acumula para calcular p50/p95.
+ *
+ * Activación: `?trazas` en la URL, trazas.activar() desde consola o el botón
+ * del panel de diagnóstico (Ctrl+Alt+D). La preferencia se recuerda.
+ *
+ * Es la única forma de medir tiempos en la aplicación: cálculo, render y
+ * pintado de resultados, secciones del PDF, manejadores de eventos, carga de
+ * módulos y modos, y los hitos de arranque (spans desde el inicio de la
+ * navegación).
+ *
+ * Uso en los módulos:
+ *   const traza = global.trazas?.inicio();
+ *   ...
+ *   global.trazas?.fin('calculo.desplazamiento', traza);
+ *   global.trazas?.arranque('interactivo');
+ *
+ * @module trazas
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // CONFIGURACIÓN
+  // =========================================================================
+
+  /** Clave de localStorage con la preferencia de activación */
+  const CLAVE_ACTIVO = 'sgtri-trazas';
+
+  /** Muestras guardadas por span (las más recientes) */
+  const MAX_MUESTRAS = 512;
+
+  /** Cada cuántas medidas se vacían las del navegador para no acumularlas */
+  const LIMPIAR_MEDIDAS_CADA = 1000;
+
+  // =========================================================================
+  // ESTADO
+  // =========================================================================
+
+  let activo = false;
+
+  /** nombre → { n, totalMs, maxMs, muestras: Float64Array, pos } */
+  let spans = new Map();
+
+  let tareasLargas = { n: 0, totalMs: 0, maxMs: 0 };
+  let observadorTareas = null;
+
+  const ahora = () => performance.now();
+
+  // =========================================================================
+  // SPANS
+  // =========================================================================
+
+  /**
+   * Abre un span.
+   * @returns {number} Marca de inicio (0 si las trazas están desactivadas)
+   */
+  function inicio() {
+    return activo ? ahora() : 0;
+  }
+
+  /**
+   * Cierra un span abierto con inicio().
+   * @param {string} nombre - Nombre del span ('modulo.operacion')
+   * @param {number} marca - Valor devuelto por inicio()
+   */
+  function fin(nombre, marca) {
+    if (!marca || !activo) return;
+    const final = ahora();
+    registrar(nombre, final - marca);
+    try {
+      performance.measure(`sgtri:${nombre}`, { start: marca, end: final });
+    } catch (e) { /* User Timing nivel 3 no disponible */ }
+  }
+
+  /**
+   * Cierra el span de arranque 'arranque.<hito>', que empieza en el inicio
+   * de la navegación (datos listos, selects poblados, interactivo...). Solo
+   * cuenta la primera vez y se registra aunque las trazas estén desactivadas:
+   * son unos pocos hitos y la cronología se incluye en el informe.
+   * @param {string} hito
+   */
+  function arranque(hito) {
+    const nombre = `arranque.${hito}`;
+    if (spans.has(nombre)) return;
+    const final = ahora();
+    registrar(nombre, final);
+    try {
+      performance.measure(`sgtri:${nombre}`, { start: 0, end: final });
+    } catch (e) { /* User Timing nivel 3 no disponible */ }
+  }
+
+  /**
+   * Ejecuta fn dentro de un span. Si devuelve una promesa, el span se
+   * cierra al resolverse.
+   * @param {string} nombre
+   * @param {Function} fn
+   * @returns {*} Resultado de fn
+   */
+  function medir(nombre, fn) {
+    if (!activo) return fn();
+    const marca = ahora();
+    let resultado;
+    try {
+      resultado = fn();
+    } catch (e) {
+      fin(nombre, marca);
+      throw e;
+    }
+    if (resultado && typeof resultado.then === 'function') {
+      return resultado.finally(() => fin(nombre, marca));
+    }
+    fin(nombre, marca);
+    return resultado;
+  }
+
+  function registrar(nombre, ms) {
+    let s = spans.get(nombre);
+    if (!s) {
+      s = { n: 0, totalMs: 0, maxMs: 0, muestras: new Float64Array(MAX_MUESTRAS), pos: 0 };
+      spans.set(nombre, s);
+    }
+    s.n++;
+    s.totalMs += ms;
+    if (ms > s.maxMs) s.maxMs = ms;
+    s.muestras[s.pos] = ms;
+    s.pos = (s.pos + 1) % MAX_MUESTRAS;
+    if (s.n % LIMPIAR_MEDIDAS_CADA === 0) {
+      try { performance.clearMeasures(`sgtri:${nombre}`); } catch (e) { /* ignore */ }
+    }
+  }
+
+  // =========================================================================
+  // TAREAS LARGAS
+  // =========================================================================
+
+  function observarTareasLargas() {
+    if (observadorTareas || typeof PerformanceObserver !== 'function') return;
+    try {
+      observadorTareas = new PerformanceObserver(lista => {
+        lista.getEntries().forEach(e => {
+          tareasLargas.n++;
+          tareasLargas.totalMs += e.duration;
+          if (e.duration > tareasLargas.maxMs) tareasLargas.maxMs = e.duration;
+        });
+      });
+      observadorTareas.observe({ type: 'longtask', buffered: true });
+    } catch (e) {
+      // Navegador sin soporte de longtask
+      observadorTareas = null;
+    }
+  }
+
+  function dejarDeObservarTareasLargas() {
+    if (!observadorTareas) return;
+    observadorTareas.disconnect();
+    observadorTareas = null;
+  }
+
+  // =========================================================================
+  // ACTIVACIÓN
+  // =========================================================================
+
+  /**
+   * Activa o desactiva las trazas y recuerda la preferencia.
+   * @param {boolean} [valor=true]
+   */
+  function activar(valor = true) {
+    activo = !!valor;
+    if (activo) observarTareasLargas(); else dejarDeObservarTareasLargas();
+    try {
+      if (activo) global.localStorage?.setItem(CLAVE_ACTIVO, '1');
+      else global.localStorage?.removeItem(CLAVE_ACTIVO);
+    } catch (e) { /* almacenamiento no disponible */ }
+    if (panel) pintarPanel();
+  }
+
+  function activadoAlCargar() {
+    try {
+      if (/[?&]trazas\b/.test(global.location?.search || '')) return true;
+      return global.localStorage?.getItem(CLAVE_ACTIVO) === '1';
+    } catch (e) {
+      return false;
+    }
+  }
+
+  // =========================================================================
+  // RESUMEN Y EXPORTACIÓN
+  // =========================================================================
+
+  const redondear = ms => Math.round(ms * 100) / 100;
+
+  /**
+   * Percentil (método del rango más cercano) sobre muestras ordenadas.
+   * @param {Float64Array} ordenadas
+   * @param {number} p - 0..100
+   * @returns {number}
+   */
+  function percentil(ordenadas, p) {
+    if (!ordenadas.length) return 0;
+    const i = Math.min(ordenadas.length - 1, Math.max(0, Math.ceil(p / 100 * ordenadas.length) - 1));
+    return ordenadas[i];
+  }
+
+  /**
+   * Resumen por span (p50/p95 sobre las últimas muestras) y tareas largas.
+   * @returns {{activo: boolean, spans: Object, tareasLargas: Object}}
+   */
+  function getResumen() {
+    const resumen = {};
+    [...spans.keys()].sort().forEach(nombre => {
+      const s = spans.get(nombre);
+      const ordenadas = s.muestras.slice(0, Math.min(s.n, MAX_MUESTRAS)).sort();
+      resumen[nombre] = {
+        n: s.n,
+        p50: redondear(percentil(ordenadas, 50)),
+        p95: redondear(percentil(ordenadas, 95)),
+        maxMs: redondear(s.maxMs),
+        mediaMs: redondear(s.totalMs / s.n),
+        totalMs: redondear(s.totalMs)
+      };
+    });
+    return {
+      activo,
+      spans: resumen,
+      tareasLargas: {
+        n: tareasLargas.n,
+        totalMs: redondear(tareasLargas.totalMs),
+        maxMs: redondear(tareasLargas.maxMs)
+      }
+    };
+  }
+
+  /**
+   * Cronología de arranque en ms desde el inicio de la navegación: primer
+   * pintado (del navegador) y los hitos de arranque().
+   * @returns {Object}
+   */
+  function getCronologiaArranque() {
+    const cronologia = {};
+    try {
+      performance.getEntriesByType('paint').forEach(e => {
+        const clave = e.name === 'first-contentful-paint' ? 'primerPintadoContenido' : 'primerPintado';
+        cronologia[clave] = Math.round(e.startTime * 10) / 10;
+      });
+    } catch (e) { /* ignore */ }
+    spans.forEach((s, nombre) => {
+      if (nombre.startsWith('arranque.')) cronologia[nombre.slice(9)] = Math.round(s.maxMs * 10) / 10;
+    });
+    return cronologia;
+  }
+
+  /**
+   * Informe completo para adjuntar a una incidencia de rendimiento.
+   * @returns {Object}
+   */
+  function exportar() {
+    return {
+      fecha: new Date().toISOString(),
+      agente: global.navigator?.userAgent || '',
+      arranque: getCronologiaArranque(),
+      ...getResumen()
+    };
+  }
+
+  /** Descarga el informe como JSON. */
+  function descargar() {
+    const json = JSON.stringify(exportar(), null, 2);
+    const blob = new Blob([json], { type: 'application/json' });
+    const enlace = document.createElement('a');
+    enlace.href = URL.createObjectURL(blob);
+    enlace.download = `trazas_${new Date().toISOString().slice(0, 19).replace(/[:T]/g, '-')}.json`;
+
+    document.body.appendChild(enlace);
+    enlace.click();
+    document.body.removeChild(enlace);
+
+    URL.revokeObjectURL(enlace.href);
+  }
+
+  /** Vacía spans y contadores de tareas largas. */
+  function reset() {
+    // Los hitos de arranque no se repiten: se conservan
+    spans = new Map([...spans].filter(([nombre]) => nombre.startsWith('arranque.')));
+    tareasLargas = { n: 0, totalMs: 0, maxMs: 0 };
+    try { performance.clearMeasures(); } catch (e) { /* ignore */ }
+    if (panel) pintarPanel();
+  }
+
+  // =========================================================================
+  // PANEL DE DIAGNÓSTICO
+  // =========================================================================
+
+  let panel = null;
+  let temporizadorPanel = null;
+
+  function crearPanel() {
+    panel = document.createElement('div');
+    panel.id = 'panel-trazas';
+    panel.className = 'panel-trazas';
+    panel.hidden = true;
+    panel.addEventListener('click', (e) => {
+      const accion = e.target.closest('[data-accion]')?.dataset.accion;
+      if (accion === 'activar') activar(!activo);
+      else if (accion === 'exportar') descargar();
+      else if (accion === 'reset') reset();
+      else if (accion === 'cerrar') ocultarPanel();
+    });
+    document.body.appendChild(panel);
+  }
+
+  function pintarPanel() {
+    if (!panel || panel.hidden) return;
+    const { spans: resumen, tareasLargas: tl } = getResumen();
+    const filas = Object.keys(resumen).map(nombre => {
+      const s = resumen[nombre];
+      return `<tr><td>${nombre}</td><td>${s.n}</td><td>${s.p50.toFixed(2)}</td>` +
+        `<td>${s.p95.toFixed(2)}</td><td>${s.maxMs.toFixed(2)}</td></tr>`;
+    }).join('');
+
+    panel.innerHTML = `
+      <div class="panel-trazas-cabecera">
+        <strong>Diagnóstico de rendimiento</strong>
+        <button type="button" data-accion="cerrar" aria-label="Cerrar">×</button>
+      </div>
+      <div class="panel-trazas-estado">
+        Trazas ${activo ? 'activas' : 'desactivadas'} ·
+        Tareas largas: ${tl.n} (${tl.totalMs.toFixed(0)} ms, máx. ${tl.maxMs.toFixed(0)} ms)
+      </div>
+      <table>
+        <thead><tr><th>Span</th><th>n</th><th>p50 ms</th><th>p95 ms</th><th>máx. ms</th></tr></thead>
+        <tbody>${filas || '<tr><td colspan="5">Sin medidas</td></tr>'}</tbody>
+      </table>
+      <div class="panel-trazas-acciones">
+        <button type="button" data-accion="activar">${activo ? 'Desactivar' : 'Activar'}</button>
+        <button type="button" data-accion="reset">Reiniciar</button>
+        <button type="button" data-accion="exportar">Exportar JSON</button>
+      </div>`;
+  }
+
+  function mostrarPanel() {
+    if (!panel) crearPanel();
+    panel.hidden = false;
+    pintarPanel();
+    if (!temporizadorPanel) temporizadorPanel = setInterval(pintarPanel, 1000);
+  }
+
+  function ocultarPanel() {
+    if (panel) panel.hidden = true;
+    clearInterval(temporizadorPanel);
+    temporizadorPanel = null;
+  }
+
+  function alternarPanel() {
+    if (panel && !panel.hidden) ocultarPanel(); else mostrarPanel();
+  }
+
+  // =========================================================================
+  // INICIALIZACIÓN
+  // =========================================================================
+
+  if (activadoAlCargar()) activar(true);
+
+  document.addEventListener('keydown', (e) => {
+    if (e.ctrlKey && e.altKey && (e.key === 'd' || e.key === 'D')) {
+      e.preventDefault();
+      alternarPanel();
+    }
+  });
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.trazas = {
+    inicio,
+    fin,
+    medir,
+    arranque,
+    activar,
+    estaActivo: () => activo,
+    getResumen,
+    getCronologiaArranque,
+    exportar,
+    descargar,
+    reset,
+    mostrarPanel,
+    ocultarPanel,
+    alternarPanel,
+
+    // Para testing
+    _percentil: percentil
+  };
+
+})(typeof window !== 'undefined' ? window : this);
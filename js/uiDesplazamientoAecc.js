@@ -24,6 +24,8 @@
     esp: [0, 0],
     ext: [0, 0]
   };
+  /** Datos (tarifas.resolver) de los que salen datosAecc y limitesIrpf */
+  let datosTarifas = null;
   let maxOtrosGastosPorDesplazamiento = 10;
   let modoManutencion = 'none';
   let condicionNoPernoctaActiva = false;
@@ -38,15 +40,8 @@
     const select = byId('aecc-pais-destino');
     if (!select) return;
 
-    select.innerHTML = '';
     const lista = Array.isArray(paisesData) ? paisesData : [];
-
-    lista.forEach((pais) => {
-      const option = document.createElement('option');
-      option.value = pais;
-      option.textContent = pais;
-      select.appendChild(option);
-    });
+    global.utils.llenarSelect(select, global.utils.clonarOpciones(lista), { reemplazar: true });
 
     if (lista.indexOf('España') !== -1) {
       select.value = 'España';
@@ -103,9 +98,9 @@
     });
   }
 
-  function setDatosAecc(raw) {
+  function normalizarDatosAecc(raw) {
     const src = raw || {};
-    datosAecc = {
+    return {
       importekm: Number(src.importekm) || 0,
       importedesayunoEsp: Number(src.importedesayunoEsp) || 0,
       importecomidaEsp: Number(src.importecomidaEsp) || 0,
@@ -117,22 +112,42 @@
       alojMaxEspAltaOcupacion: Number(src.alojMaxEspAltaOcupacion) || 0,
       alojMaxExt: Number(src.alojMaxExt) || 0
     };
-    renderResultado();
   }
 
-  function setLimitesIrpf(raw) {
+  function normalizarLimitesIrpf(raw) {
     const src = raw || {};
     const esp = Array.isArray(src.esp) ? src.esp : [0, 0];
     const ext = Array.isArray(src.ext) ? src.ext : [0, 0];
-
-    limitesIrpf = {
+    return {
       esp: [Number(esp[0]) || 0, Number(esp[1]) || 0],
       ext: [Number(ext[0]) || 0, Number(ext[1]) || 0]
     };
+  }
 
+  function setDatosAecc(raw) {
+    datosAecc = normalizarDatosAecc(raw);
+    renderResultado();
+  }
+
+  function setLimitesIrpf(raw) {
+    limitesIrpf = normalizarLimitesIrpf(raw);
     renderResultado();
   }
 
+  /**
+   * Toma los datos AECC y los límites de IRPF vigentes en la fecha de ida
+   * (tarifas.resolver). Sin fecha, o si no se puede resolver, los de
+   * datos.json: nunca se quedan los de una fecha anterior.
+   */
+  function aplicarTarifasFecha() {
+    const fecha = byId('aecc-fecha-ida')?.value || '';
+    const datos = (fecha && global.tarifas?.resolver(fecha)) || global.__sgtriDatos || null;
+    if (!datos || datos === datosTarifas) return;
+    datosTarifas = datos;
+    if (datos.datosAECC) datosAecc = normalizarDatosAecc(datos.datosAECC);
+    if (datos.limitesIRPF) limitesIrpf = normalizarLimitesIrpf(datos.limitesIRPF);
+  }
+
   function setLimites(raw) {
     const src = raw || {};
     const maxOtros = Number(src.maxOtrosGastosPorDesplazamiento);
@@ -192,8 +207,8 @@
     const fechaReg = parseDateStrict(byId('aecc-fecha-regreso')?.value || '');
     const horaReg = parseTimeStrict(byId('aecc-hora-regreso')?.value || '');
 
-    const minutosReg = horaReg ? (horaReg.hh * 60 + horaReg.mm) : -1;
-    const enRangoMadrugada = minutosReg >= 61 && minutosReg <= 419; // 01:01 a 06:59
+    const minutosReg = horaReg ? (horaReg.hh * 60 + horaReg.mm) : null;
+    const enRangoMadrugada = global.reglasDietas.pernoctaAmbigua(minutosReg);
 
     const mostrar = !!fechaReg && enRangoMadrugada;
     row.style.display = mostrar ? '' : 'none';
@@ -223,13 +238,10 @@
     const minutosReg = getMinutosRegreso();
     if (minutosReg < 0) return false;
 
-    // Tramo 00:00 - 01:00 (siempre)
-    if (minutosReg >= 0 && minutosReg <= 60) return true;
-
-    // Tramo 01:01 - 06:59 (solo si NO se justifica pernocta)
-    if (minutosReg >= 61 && minutosReg <= 419) {
-      return !byId('aecc-justificar-pernocta')?.checked;
-    }
+    // Franjas de reglasDietas.pernocta: 'no' siempre, 'ambigua' solo si NO se justifica
+    const clase = global.reglasDietas.pernocta(global.reglasDietas.obtener('decreto'), minutosReg);
+    if (clase === 'no') return true;
+    if (clase === 'ambigua') return !byId('aecc-justificar-pernocta')?.checked;
 
     return false;
   }
@@ -577,6 +589,7 @@
   }
 
   function calcularDatosResultadoAecc() {
+    aplicarTarifasFecha();
     const dias = calcularNumeroDias();
     const modo = getModoManutencionSegunFechas();
     aplicarReglaNoPernoctaEnManutencionUltimoDia();
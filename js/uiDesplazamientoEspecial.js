@@ -25,6 +25,10 @@
   let contenedorLineas = null;
   let contenedorResultado = null;
 
+  // Ámbito de listeners de la sección: reset() los retira todos de una vez
+  const ambitos = global.utils.crearAmbitos();
+  const AMBITO = 'especial';
+
   // =========================================================================
   // UTILIDADES
   // =========================================================================
@@ -90,6 +94,7 @@
     linea.className = 'esp-linea esp-linea-seccion';
     linea.dataset.tipo = 'seccion';
     linea.dataset.id = id;
+    const signal = ambitos.senal(AMBITO);
 
     // Campo descripción (100% menos botón eliminar)
     const inputDesc = document.createElement('input');
@@ -97,7 +102,7 @@
     inputDesc.className = 'esp-desc esp-desc-seccion';
     inputDesc.placeholder = 'Descripción';
     inputDesc.maxLength = 100;
-    inputDesc.addEventListener('blur', actualizarResultado);
+    inputDesc.addEventListener('blur', actualizarResultado, { signal });
 
     // Botón eliminar
     const btnRemove = crearBotonEliminar(linea);
@@ -120,6 +125,7 @@
     linea.className = 'esp-linea esp-linea-normal';
     linea.dataset.tipo = 'normal';
     linea.dataset.id = id;
+    const signal = ambitos.senal(AMBITO);
 
     // Campo descripción (75%)
     const inputDesc = document.createElement('input');
@@ -127,7 +133,7 @@
     inputDesc.className = 'esp-desc';
     inputDesc.placeholder = 'Descripción';
     inputDesc.maxLength = 100;
-    inputDesc.addEventListener('blur', actualizarResultado);
+    inputDesc.addEventListener('blur', actualizarResultado, { signal });
 
     // Contenedor de campos numéricos
     const numWrapper = document.createElement('div');
@@ -147,10 +153,10 @@
     inputImporte.addEventListener('blur', () => {
       formatearCampoImporte(inputImporte);
       recalcularDesdeImporteYCantidad(linea);
-    });
+   }, { signal });
     inputImporte.addEventListener('input', () => {
       recalcularDesdeImporteYCantidad(linea);
-    });
+    }, { signal });
 
     // Símbolo multiplicación
     const multiply = document.createElement('span');
@@ -166,10 +172,10 @@
     inputCantidad.addEventListener('blur', () => {
       formatearCampoCantidad(inputCantidad);
       recalcularDesdeImporteYCantidad(linea);
-    });
+   }, { signal });
     inputCantidad.addEventListener('input', () => {
       recalcularDesdeImporteYCantidad(linea);
-    });
+    }, { signal });
 
     // Corchete derecho
     const bracketR = document.createElement('span');
@@ -190,11 +196,7 @@
     inputTotal.addEventListener('blur', () => {
       formatearCampoImporte(inputTotal);
       recalcularDesdeTotal(linea);
-    });
-    inputTotal.addEventListener('input', () => {
-      // Solo recalcular si el usuario está editando manualmente
-    });
-
+   }, { signal });
     // Botón eliminar
     const btnRemove = crearBotonEliminar(linea);
 
@@ -234,7 +236,7 @@
     btn.addEventListener('click', () => {
       linea.remove();
       actualizarResultado();
-    });
+    }, { signal: ambitos.senal(AMBITO) });
 
     return btn;
   }
@@ -446,6 +448,7 @@
     especialCreado = true;
     lineaCounter = 0;
     seccionCounter = 0;
+    const signal = ambitos.abrir(AMBITO);
 
     // Crear el grupo
     const grupo = document.createElement('div');
@@ -470,7 +473,7 @@
     btnEliminar.className = 'btn-eliminar-desplazamiento';
     btnEliminar.setAttribute('aria-label', 'Eliminar desplazamiento especial');
     btnEliminar.innerHTML = '<span class="btn-icon btn-icon-minus" aria-hidden="true">−</span> Eliminar';
-    btnEliminar.addEventListener('click', eliminarDesplazamientoEspecial);
+    btnEliminar.addEventListener('click', eliminarDesplazamientoEspecial, { signal });
 
     header.appendChild(titulo);
     header.appendChild(btnEliminar);
@@ -488,7 +491,7 @@
       contenedorLineas.appendChild(linea);
       linea.querySelector('.esp-desc')?.focus();
       actualizarResultado();
-    });
+    }, { signal });
 
     const btnAddSeccion = document.createElement('button');
     btnAddSeccion.type = 'button';
@@ -499,7 +502,7 @@
       contenedorLineas.appendChild(linea);
       linea.querySelector('.esp-desc')?.focus();
       actualizarResultado();
-    });
+    }, { signal });
 
     botonesWrapper.appendChild(btnAddLinea);
     botonesWrapper.appendChild(btnAddSeccion);
@@ -526,7 +529,7 @@
         irpfInput.value = '';
       }
       actualizarResultado();
-    });
+    }, { signal });
 
     irpfWrapper.appendChild(irpfLabel);
     irpfWrapper.appendChild(irpfInput);
@@ -596,6 +599,7 @@
    * Pensado para ser llamado desde limpiarFormularioCompleto().
    */
   function resetDesplazamientoEspecial() {
+    ambitos.cerrar(AMBITO);
     const grupo = document.getElementById('desplazamiento-especial');
     if (grupo) {
       grupo.remove();
@@ -27,6 +27,10 @@
   let maxDesplazamientosOverride = null;
   let permitirDesplazamientoEspecial = true;
 
+  // Ámbitos de listeners: uno por ficha (id) y otro para la ficha de vehículo.
+  // Cerrar un ámbito retira de golpe todos los listeners de esa ficha.
+  const ambitos = global.utils.crearAmbitos();
+
   // Callbacks externos (se configuran desde formLogic)
   let onDesplazamientoCreated = null;
   let onDesplazamientoDeleted = null;
@@ -130,8 +134,10 @@
       el.value = el.id === 'veh-matricula' ? cleaned.toUpperCase() : cleaned;
     };
 
+    const signal = ambitos.abrir('vehiculo');
+
     vehiculoContainer.querySelectorAll('.veh-text').forEach(inp => {
-      inp.addEventListener('input', vehTextHandler);
+      inp.addEventListener('input', vehTextHandler, { signal });
     });
 
     // Listener para cambio de tipo de vehículo
@@ -142,7 +148,7 @@
           const id = el.dataset.desplazamientoId;
           if (id) recalculateDesplazamientoById(id);
         });
-      });
+      }, { signal });
     });
   }
 
@@ -197,14 +203,8 @@
    */
   function poblarSelectPaises(selectElement) {
     if (!selectElement) return;
-    selectElement.innerHTML = '';
-    
-    paisesData.forEach(pais => {
-      const option = document.createElement('option');
-      option.value = pais;
-      option.textContent = pais;
-      selectElement.appendChild(option);
-    });
+    // Copia del fragmento de países compilado una vez (una sola inserción)
+    global.utils.llenarSelect(selectElement, global.utils.clonarOpciones(paisesData), { reemplazar: true });
 
     // Seleccionar España por defecto
     try {
@@ -310,7 +310,7 @@
         const hh = parseInt(m[1], 10);
         const mm = parseInt(m[2], 10);
         if (!isNaN(hh) && !isNaN(mm) && hh >= 0 && hh <= 23 && mm >= 0 && mm <= 59) {
-          if ((hh * 60 + mm) > (22 * 60)) mostrar = true;
+          mostrar = global.reglasDietas.muestraTicketCena('rd', hh * 60 + mm);
         }
       }
 
@@ -433,6 +433,8 @@
     }
 
     desplazamientoCounter++;
+    const id = desplazamientoCounter;
+    const signal = ambitos.abrir(id);
     const nuevoDesplazamiento = document.createElement('div');
     nuevoDesplazamiento.className = 'desplazamiento-grupo';
     nuevoDesplazamiento.dataset.desplazamientoId = desplazamientoCounter;
@@ -526,6 +528,9 @@
             </label>
           </div>
           <div class="otros-gastos-right">
+            <button type="button" class="btn-comparar-escenarios" aria-label="Comparar desplazamiento ${desplazamientoCounter} por país y normativa">
+              Comparar países
+            </button>
             <button type="button" class="btn-otros-gastos">
               <span class="btn-icon btn-icon-add" aria-hidden="true">+</span>
               Otros gastos
@@ -547,7 +552,7 @@
     // Animación de entrada
     nuevoDesplazamiento.classList.add('entry');
     desplazamientosContainer.appendChild(nuevoDesplazamiento);
-    nuevoDesplazamiento.addEventListener('transitionend', () => nuevoDesplazamiento.classList.remove('entry'), { once: true });
+    nuevoDesplazamiento.addEventListener('transitionend', () => nuevoDesplazamiento.classList.remove('entry'), { once: true, signal });
 
     // Poblar select de países
     const nuevoSelectPais = document.getElementById(`pais-destino-${desplazamientoCounter}`);
@@ -556,19 +561,19 @@
     // Listener para cambio de país
     if (nuevoSelectPais) {
       nuevoSelectPais.addEventListener('change', () => {
-        manejarCambioPais(desplazamientoCounter);
-      });
+        manejarCambioPais(id);
+      }, { signal });
     }
 
     actualizarNumerosDesplazamientos();
     actualizarBotonAddDesplazamiento();
 
     // Adjuntar listeners de cálculo
-    attachCalcListenersToDesplazamiento(desplazamientoCounter);
+    attachCalcListenersToDesplazamiento(id);
 
     // Callback externo
     if (typeof onDesplazamientoCreated === 'function') {
-      onDesplazamientoCreated(nuevoDesplazamiento, desplazamientoCounter);
+      onDesplazamientoCreated(nuevoDesplazamiento, id);
     }
 
     return nuevoDesplazamiento;
@@ -642,6 +647,11 @@
       }
     } catch (e) { /* ignore */ }
 
+    // Orden de los desplazamientos normales (resuelve 'despN' del congreso)
+    global.resultadoLiquidacion?.registrarOrdenDesplazamientos?.(
+      Array.from(desplazamientosNormales, d => d.dataset.desplazamientoId)
+    );
+
     // Recomputar descuento si existe
     try {
       if (typeof global.computeDescuentoManutencion === 'function') {
@@ -667,6 +677,9 @@
       global.resultadoLiquidacion.eliminarDesplazamiento(id);
     }
 
+    // Retirar sus listeners ya: la ficha deja de responder durante la animación
+    if (id) ambitos.cerrar(id);
+
     // Capturar altura actual y fijarla para poder animarla
     const currentHeight = grupo.offsetHeight;
     grupo.style.height = currentHeight + 'px';
@@ -680,7 +693,10 @@
     grupo.classList.add('exit');
     
     // Esperar a que termine la animación antes de eliminar
+    let eliminado = false;
     const onTransitionEnd = () => {
+      if (eliminado) return;
+      eliminado = true;
       grupo.remove();
       actualizarNumerosDesplazamientos();
       actualizarBotonAddDesplazamiento();
@@ -693,6 +709,7 @@
       // Recalcular y evaluar vehículo
       scheduleFullRecalc(60);
       evaluarKmParaMostrarFicha();
+      global.solapesDesp?.comprobarFormulario();
     };
 
     grupo.addEventListener('transitionend', onTransitionEnd, { once: true });
@@ -762,10 +779,9 @@
     ].join(',');
 
     const nodes = desp.querySelectorAll(selector);
+    const signal = ambitos.senal(id);
 
     nodes.forEach(n => {
-      n.addEventListener('input', () => { /* no recalc on input */ });
-
       if (n.tagName === 'SELECT') {
         if (n.id && n.id.indexOf('pais-destino-') === 0) {
           n.addEventListener('change', () => {
@@ -777,7 +793,7 @@
                 global.computeDescuentoManutencion();
               }
             } catch (e) { /* ignore */ }
-          });
+          }, { signal });
         } else {
           n.addEventListener('change', () => {
             if (val.validateDateTimePairAndUpdateUI) val.validateDateTimePairAndUpdateUI(id);
@@ -787,14 +803,13 @@
                 global.computeDescuentoManutencion();
               }
             } catch (e) { /* ignore */ }
-          });
+          }, { signal });
         }
       } else {
-        n.addEventListener('change', () => { /* defer to blur */ });
         n.addEventListener('blur', () => {
           if (val.validateDateTimePairAndUpdateUI) val.validateDateTimePairAndUpdateUI(id);
           actualizarTicketCena();
-        });
+        }, { signal });
       }
     });
 
@@ -804,7 +819,7 @@
       kmInput.addEventListener('blur', () => {
         evaluarKmParaMostrarFicha();
         actualizarTicketCena();
-      });
+      }, { signal });
     }
 
     // Watch ticket-cena checkbox
@@ -813,14 +828,10 @@
       ticketCheckbox.addEventListener('change', () => {
         if (val.validateDateTimePairAndUpdateUI) val.validateDateTimePairAndUpdateUI(id);
         actualizarTicketCena();
-      });
+      }, { signal });
     }
 
-    // Watch no-manutencion checkbox
-    const noManut = desp.querySelector(`#no-manutencion-${id}`);
-    if (noManut) {
-      noManut.addEventListener('change', () => { /* handled by logicaDesp */ });
-    }
+    // no-manutencion: lo gestiona la delegación de logicaDesp
 
     // Cálculo inicial
     setTimeout(() => {
@@ -833,6 +844,183 @@
     }, 100);
   }
 
+  // =========================================================================
+  // CICLO DE VIDA DE LISTENERS
+  // =========================================================================
+
+  /**
+   * Retira todos los listeners propios de una ficha. Llamar antes de quitarla
+   * del DOM cuando no se hace mediante eliminarDesplazamiento().
+   * @param {string|number} id - ID del desplazamiento
+   */
+  function liberarDesplazamiento(id) {
+    ambitos.cerrar(id);
+  }
+
+  /**
+   * Retira los listeners de todas las fichas de desplazamiento.
+   * Se usa al limpiar el formulario y al restaurar un archivo.
+   */
+  function liberarTodos() {
+    ambitos.getEstadisticas().claves
+      .filter(clave => clave !== 'vehiculo')
+      .forEach(ambitos.cerrar);
+  }
+
+  /**
+   * Vacía la ficha de vehículo y retira sus listeners. La siguiente llamada a
+   * mostrarFichaVehiculo() la vuelve a construir.
+   */
+  function liberarFichaVehiculo() {
+    ambitos.cerrar('vehiculo');
+    if (vehiculoContainer) {
+      vehiculoContainer.innerHTML = '';
+      vehiculoContainer.style.display = 'none';
+    }
+    vehiculoVisible = false;
+  }
+
+  /**
+   * Ámbitos de listeners abiertos y cerrados (diagnóstico de fugas).
+   * @returns {{abiertos: number, cerrados: number, claves: string[]}}
+   */
+  function getEstadisticasListeners() {
+    return ambitos.getEstadisticas();
+  }
+
+  // =========================================================================
+  // COMPARATIVA DE ESCENARIOS
+  // =========================================================================
+
+  const COLUMNAS_COMPARATIVA = [
+    { campo: 'pais', titulo: 'País' },
+    { campo: 'normativa', titulo: 'Normativa' },
+    { campo: 'manutenciones', titulo: 'Manut.', decimales: 1 },
+    { campo: 'manutencion', titulo: 'Manutención (€)' },
+    { campo: 'noches', titulo: 'Noches', decimales: 0 },
+    { campo: 'alojamientoMax', titulo: 'Alojam. máx. (€)' },
+    { campo: 'km', titulo: 'Km (€)' },
+    { campo: 'irpfSujeto', titulo: 'Sujeto IRPF (€)' },
+    { campo: 'total', titulo: 'Total (€)' }
+  ];
+
+  const NOMBRES_NORMATIVA = { decreto: 'Decreto 42/2025', rd: 'R.D. 462/2002' };
+
+  /**
+   * Rellena el cuerpo de la tabla comparativa.
+   * @param {HTMLTableSectionElement} tbody
+   * @param {Array<Object>} filas - Filas de calculoDesp.compararEscenarios
+   * @param {string} paisFicha - País seleccionado en la ficha (se resalta)
+   */
+  function pintarFilasComparativa(tbody, filas, paisFicha) {
+    const fragmento = document.createDocumentFragment();
+    filas.forEach(fila => {
+      const tr = document.createElement('tr');
+      if (fila.pais === paisFicha) tr.className = 'comparativa-actual';
+      COLUMNAS_COMPARATIVA.forEach(col => {
+        const td = document.createElement('td');
+        const valor = fila[col.campo];
+        if (col.campo === 'normativa') {
+          td.textContent = NOMBRES_NORMATIVA[valor] || valor;
+        } else if (typeof valor === 'number') {
+          td.textContent = global.utils.fmt(valor, col.decimales ?? 2);
+          td.className = 'num';
+        } else {
+          td.textContent = valor;
+        }
+        tr.appendChild(td);
+      });
+      fragmento.appendChild(tr);
+    });
+    tbody.replaceChildren(fragmento);
+  }
+
+  /**
+   * Muestra, en un diálogo, la ficha evaluada en todos los países y ambas
+   * normativas (calculoDesp.compararFicha). Las cabeceras ordenan la tabla
+   * con calculoDesp.ordenarComparativa; un segundo clic invierte el orden.
+   * @param {HTMLElement} despEl - Elemento del desplazamiento
+   */
+  function mostrarComparativa(despEl) {
+    const calc = global.calculoDesp || {};
+    if (!despEl || !calc.compararFicha || !calc.ordenarComparativa) return;
+
+    let orden = { campo: 'total', descendente: true };
+    const filas = calc.compararFicha(despEl, { ordenarPor: orden.campo, descendente: orden.descendente });
+    const paisFicha = document.getElementById(`pais-destino-${despEl.dataset.desplazamientoId}`)?.value || '';
+
+    const overlay = document.createElement('div');
+    overlay.className = 'confirm-overlay';
+    overlay.tabIndex = -1;
+    overlay.innerHTML = `
+      <div class="confirm-dialog comparativa-dialog" role="dialog" aria-modal="true" aria-label="Comparativa por país y normativa">
+        <div class="confirm-body">
+          <p class="comparativa-titulo">Importes de este desplazamiento en cada país y normativa</p>
+          <div class="comparativa-scroll"></div>
+        </div>
+        <div class="confirm-actions">
+          <button type="button" class="btn-confirm-no">Cerrar</button>
+        </div>
+      </div>
+    `;
+    const contenedor = overlay.querySelector('.comparativa-scroll');
+
+    if (filas.length === 0) {
+      contenedor.textContent = 'Complete las fechas y horas del desplazamiento para poder comparar.';
+    } else {
+      const tabla = document.createElement('table');
+      tabla.className = 'comparativa-tabla';
+      const trCabecera = document.createElement('tr');
+      COLUMNAS_COMPARATIVA.forEach(col => {
+        const th = document.createElement('th');
+        th.scope = 'col';
+        const boton = document.createElement('button');
+        boton.type = 'button';
+        boton.dataset.campo = col.campo;
+        boton.textContent = col.titulo;
+        th.appendChild(boton);
+        trCabecera.appendChild(th);
+      });
+      tabla.createTHead().appendChild(trCabecera);
+      const tbody = tabla.createTBody();
+      contenedor.appendChild(tabla);
+
+      const marcarOrden = () => {
+        trCabecera.querySelectorAll('th').forEach(th => {
+          const activo = th.firstChild.dataset.campo === orden.campo;
+          th.setAttribute('aria-sort', activo ? (orden.descendente ? 'descending' : 'ascending') : 'none');
+        });
+      };
+
+      trCabecera.addEventListener('click', (e) => {
+        const boton = e.target.closest('button[data-campo]');
+        if (!boton) return;
+        const campo = boton.dataset.campo;
+        orden = { campo, descendente: campo === orden.campo ? !orden.descendente : false };
+        pintarFilasComparativa(tbody, calc.ordenarComparativa(filas, campo, orden.descendente), paisFicha);
+        marcarOrden();
+      });
+
+      pintarFilasComparativa(tbody, filas, paisFicha);
+      marcarOrden();
+    }
+
+    document.body.appendChild(overlay);
+    const originalOverflow = document.body.style.overflow;
+    document.body.style.overflow = 'hidden';
+    requestAnimationFrame(() => overlay.classList.add('visible'));
+
+    const cerrar = () => {
+      overlay.classList.remove('visible');
+      document.body.style.overflow = originalOverflow;
+      setTimeout(() => overlay.remove(), 220);
+    };
+    overlay.querySelector('.btn-confirm-no').addEventListener('click', cerrar);
+    overlay.addEventListener('click', (e) => { if (e.target === overlay) cerrar(); });
+    overlay.addEventListener('keydown', (e) => { if (e.key === 'Escape') cerrar(); });
+    overlay.querySelector('.btn-confirm-no').focus();
+  }
+
   // =========================================================================
   // INICIALIZACIÓN
   // =========================================================================
@@ -901,6 +1089,13 @@
         return;
       }
 
+      // Comparativa por país y normativa
+      const targetComparar = e.target.closest && e.target.closest('.btn-comparar-escenarios');
+      if (targetComparar) {
+        mostrarComparativa(targetComparar.closest('.desplazamiento-grupo'));
+        return;
+      }
+
       // Añadir línea de otros gastos
       const targetAdd = e.target.closest && e.target.closest('.btn-otros-gastos');
       if (targetAdd) {
@@ -1009,11 +1204,20 @@
     // Ticket cena
     actualizarTicketCena,
 
+    // Comparativa
+    mostrarComparativa,
+
     // Recálculo
     scheduleFullRecalc,
     recalculateDesplazamientoById,
     attachCalcListenersToDesplazamiento,
 
+    // Ciclo de vida de listeners
+    liberarDesplazamiento,
+    liberarTodos,
+    liberarFichaVehiculo,
+    getEstadisticasListeners,
+
     // Inicialización
     init,
     getCounter,
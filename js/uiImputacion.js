@@ -15,36 +15,10 @@
   // ESTADO INTERNO
   // =========================================================================
 
-  let lineasImputacion = []; // Array de { id, organica, responsable, importe, readonly }
+  let lineasImputacion = []; // Array de { id, organica, responsable, importe, porcentaje, tope, readonly }
   let nextId = 1;
   let container = null;
-
-  // =========================================================================
-  // LÍMITES CONFIGURABLES
-  // =========================================================================
-
-  /**
-   * Obtiene los límites desde datos.json
-   */
-  function getLimites() {
-    const datos = global.__sgtriDatos || {};
-    return datos.limites || { maxLineasImputacion: 4 };
-  }
-
-  /**
-   * Actualiza la visibilidad del botón de añadir imputación según el límite.
-   */
-  function actualizarBotonAddImputacion() {
-    if (!container) return;
-    const btn = container.querySelector('.btn-add-imputacion');
-    const wrapper = container.querySelector('.btn-add-wrapper');
-    if (!btn && !wrapper) return;
-    const limites = getLimites();
-    const count = lineasImputacion.length;
-    const display = count >= limites.maxLineasImputacion ? 'none' : '';
-    if (wrapper) wrapper.style.display = display;
-    else if (btn) btn.style.display = display;
-  }
+  const filasDom = new Map(); // id de línea → elemento .imputacion-linea renderizado
 
   // =========================================================================
   // UTILIDADES
@@ -136,6 +110,128 @@
     };
   }
 
+  // =========================================================================
+  // REPARTO DE IMPORTES (motor puro, en céntimos)
+  // =========================================================================
+  //
+  // Reglas por línea:
+  //  - Línea principal (readonly): recibe el resto.
+  //  - Importe fijo: se asigna tal cual, limitado por su tope y por lo que
+  //    quede disponible (en orden de línea).
+  //  - Porcentaje: porcentaje del total de la liquidación, con redondeo por
+  //    restos mayores para que la suma de céntimos sea exacta; limitado por su
+  //    tope. Si no cabe en lo disponible se reduce proporcionalmente.
+  // El exceso de cualquier tope va a la línea principal.
+
+  function aCentimos(n) {
+    return Math.round((Number(n) || 0) * 100);
+  }
+
+  /**
+   * Reparte una cantidad entera de céntimos proporcionalmente a unos pesos,
+   * sin superar los topes de cada posición (método de restos mayores).
+   * Lo que no cabe por los topes se redistribuye entre el resto.
+   * @param {number} cantidad - Céntimos a repartir (entero)
+   * @param {Array<number>} pesos
+   * @param {Array<number>} topes - Máximo en céntimos por posición (Infinity = sin tope)
+   * @returns {Array<number>} Céntimos asignados a cada posición
+   */
+  function repartoProporcional(cantidad, pesos, topes) {
+    const asignado = pesos.map(() => 0);
+    let activos = pesos.map((p, i) => i).filter(i => pesos[i] > 0 && topes[i] > 0);
+    let pendiente = cantidad;
+
+    while (pendiente > 0 && activos.length > 0) {
+      const sumaPesos = activos.reduce((acc, i) => acc + pesos[i], 0);
+      const cuotas = activos.map(i => pendiente * pesos[i] / sumaPesos);
+      const partes = cuotas.map(Math.floor);
+      let sobrante = pendiente - partes.reduce((a, b) => a + b, 0);
+
+      // Restos mayores (empate: primera línea)
+      const orden = cuotas
+        .map((c, k) => ({ k, resto: c - partes[k] }))
+        .sort((a, b) => b.resto - a.resto || a.k - b.k);
+      for (let j = 0; j < orden.length && sobrante > 0; j++, sobrante--) {
+        partes[orden[j].k]++;
+      }
+
+      // Fijar las posiciones que superan su tope y repetir con el resto
+      const saturados = [];
+      activos.forEach((i, k) => {
+        if (asignado[i] + partes[k] >= topes[i]) saturados.push(i);
+      });
+
+      if (saturados.length === 0) {
+        activos.forEach((i, k) => { asignado[i] += partes[k]; });
+        pendiente = 0;
+        break;
+      }
+
+      saturados.forEach(i => {
+        pendiente -= topes[i] - asignado[i];
+        asignado[i] = topes[i];
+      });
+      const fijados = new Set(saturados);
+      activos = activos.filter(i => !fijados.has(i));
+    }
+
+    return asignado;
+  }
+
+  /**
+   * Reparte el total de la liquidación entre las líneas de imputación.
+   * @param {number} total - Total de la liquidación (euros)
+   * @param {Array<Object>} lineas - { importe, porcentaje, tope, readonly }
+   * @returns {{importes: Array<number>, sinAsignar: number}} Importes en euros
+   *   (misma posición que lineas) y lo que no se pudo asignar (sin línea principal)
+   */
+  function repartirImporte(total, lineas) {
+    const n = lineas.length;
+    const centimos = new Array(n).fill(0);
+    const topes = lineas.map(l => (Number(l.tope) > 0 ? aCentimos(l.tope) : Infinity));
+    const totalCent = Math.max(0, aCentimos(total));
+    let disponible = totalCent;
+
+    // 1. Importes fijos, en orden
+    lineas.forEach((l, i) => {
+      if (l.readonly || Number(l.porcentaje) > 0) return;
+      const cent = Math.min(Math.max(0, aCentimos(l.importe)), topes[i], disponible);
+      centimos[i] = cent;
+      disponible -= cent;
+    });
+
+    // 2. Porcentajes sobre el total (céntimos exactos por restos mayores)
+    const idxPct = [];
+    lineas.forEach((l, i) => {
+      if (!l.readonly && Number(l.porcentaje) > 0) idxPct.push(i);
+    });
+    if (idxPct.length > 0 && disponible > 0) {
+      const pesos = idxPct.map(i => Number(lineas[i].porcentaje));
+      const sumaPct = pesos.reduce((a, b) => a + b, 0);
+      const objetivo = Math.round(totalCent * Math.min(sumaPct, 100) / 100);
+      const exactos = repartoProporcional(objetivo, pesos, pesos.map(() => Infinity));
+      const limitados = exactos.map((c, k) => Math.min(c, topes[idxPct[k]]));
+      const sumaLimitados = limitados.reduce((a, b) => a + b, 0);
+      const finales = sumaLimitados > disponible
+        ? repartoProporcional(disponible, limitados, limitados)
+        : limitados;
+      finales.forEach((c, k) => { centimos[idxPct[k]] = c; });
+      disponible -= finales.reduce((a, b) => a + b, 0);
+    }
+
+    // 3. Resto a la línea principal
+    const idxPrincipal = lineas.findIndex(l => l.readonly);
+    if (idxPrincipal !== -1) {
+      centimos[idxPrincipal] = disponible;
+      disponible = 0;
+    }
+
+    return {
+      importes: centimos.map(c => c / 100),
+      sinAsignar: disponible / 100
+    };
+  }
+
   // =========================================================================
   // CÁLCULO DE IMPORTES
   // =========================================================================
@@ -159,39 +255,66 @@
   }
 
   /**
-   * Actualiza el importe de la línea principal (readonly).
-   * Si el total de liquidación cambia, ajusta las líneas adicionales para mantener coherencia.
+   * Recalcula los importes de todas las líneas con el motor de reparto.
+   * @returns {Array<number>} Ids de las líneas cuyo importe ha cambiado
    */
   function actualizarLineaPrincipal() {
     const lineaPrincipal = lineasImputacion.find(l => l.readonly);
-    if (!lineaPrincipal) return;
-    
     const total = getTotalLiquidacion();
-    let sumaAdicionales = sumaLineasAdicionales();
-    
-    // Si la suma de adicionales es >= total, poner todas a 0
-    if (sumaAdicionales >= total) {
-      lineasImputacion.forEach(l => {
-        if (!l.readonly) {
-          l.importe = 0;
-        }
-      });
-      sumaAdicionales = 0;
-    }
-    
-    // La línea principal es siempre total - suma de adicionales
-    lineaPrincipal.importe = round2(total - sumaAdicionales);
-    
+    const { importes } = repartirImporte(total, lineasImputacion);
+
+    const cambiadas = [];
+    lineasImputacion.forEach((l, i) => {
+      if (l.importe !== importes[i]) {
+        l.importe = importes[i];
+        cambiadas.push(l.id);
+      }
+    });
+
     // Actualizar también los datos del proyecto
-    const datos = getDatosProyecto();
-    lineaPrincipal.organica = datos.organica;
-    lineaPrincipal.responsable = datos.responsable;
+    if (lineaPrincipal) {
+      const datos = getDatosProyecto();
+      if (lineaPrincipal.organica !== datos.organica || lineaPrincipal.responsable !== datos.responsable) {
+        lineaPrincipal.organica = datos.organica;
+        lineaPrincipal.responsable = datos.responsable;
+        if (!cambiadas.includes(lineaPrincipal.id)) cambiadas.push(lineaPrincipal.id);
+      }
+    }
+
+    return cambiadas;
   }
 
   // =========================================================================
   // RENDERIZADO
   // =========================================================================
 
+  /**
+   * Formatea un porcentaje con coma decimal.
+   */
+  function fmtPorcentaje(p) {
+    return String(round2(p)).replace('.', ',');
+  }
+
+  /**
+   * Texto a mostrar en el campo importe de una línea.
+   * Las líneas por porcentaje muestran el porcentaje y el importe resultante.
+   */
+  function textoImporte(linea) {
+    if (linea.readonly) return `${fmt(linea.importe)} €`;
+    if (Number(linea.porcentaje) > 0) {
+      return `${fmtPorcentaje(linea.porcentaje)} % (${fmt(linea.importe)} €)`;
+    }
+    // Si el importe es 0, usar placeholder en vez de value
+    return round2(linea.importe) === 0 ? '' : `${fmt(linea.importe)} €`;
+  }
+
+  /**
+   * Texto a mostrar en el campo tope de una línea.
+   */
+  function textoTope(linea) {
+    return Number(linea.tope) > 0 ? `${fmt(linea.tope)} €` : '';
+  }
+
   /**
    * Crea el HTML de una línea de imputación.
    * @param {Object} linea - Datos de la línea
@@ -205,14 +328,20 @@
     const readonlyAttr = linea.readonly ? ' readonly' : '';
     const tabindexAttr = linea.readonly ? ' tabindex="-1"' : '';
     
-    // Si el importe es 0, usar placeholder en vez de value (solo para líneas editables)
-    const importeEsCero = round2(linea.importe) === 0 && !linea.readonly;
-    const importeValue = importeEsCero ? '' : `${fmt(linea.importe)} €`;
-    
     // Validar orgánica para clase field-error (solo líneas editables)
     const organicaValida = linea.readonly || validarOrganica(linea.organica);
     const fieldErrorClass = organicaValida ? '' : ' field-error';
 
+    // Tope por orgánica (solo líneas editables)
+    const topeHTML = linea.readonly ? '' : `
+        <input type="text" 
+               class="imputacion-tope" 
+               value="${textoTope(linea)}"
+               placeholder="Tope"
+               maxlength="12"
+               title="Importe máximo imputable a esta orgánica"
+               aria-label="Tope" />`;
+
     // Botón: + para primera línea (añadir), x para el resto (eliminar)
     let botonHTML;
     if (esPrimera) {
@@ -221,7 +350,7 @@
           <button type="button" class="btn-add-imputacion" aria-label="Añadir línea de imputación">
             <span class="btn-icon" aria-hidden="true">+</span>
           </button>
-          <span class="warn-tooltip imputacion-tooltip">Añada líneas adicionales si necesita imputar el importe a diferentes orgánicas. La suma de todos los importes debe igualar el total de la liquidación.</span>
+          <span class="warn-tooltip imputacion-tooltip">Añada líneas adicionales si necesita imputar el importe a diferentes orgánicas. Indique un importe fijo o un porcentaje (p.ej. 25%) y, opcionalmente, un tope. La línea principal recibe el resto.</span>
         </span>`;
     } else {
       botonHTML = `
@@ -252,11 +381,11 @@
       <div class="imputacion-campo imputacion-campo-importe">
         <input type="text" 
                class="imputacion-importe" 
-               value="${linea.readonly ? fmt(linea.importe) + ' €' : importeValue}"
+               value="${textoImporte(linea)}"
                placeholder="0,00 €"
                maxlength="12"
                ${readonlyAttr}${tabindexAttr}
-               aria-label="Importe" />
+               aria-label="Importe" />${topeHTML}
         ${botonHTML}
       </div>
     `;
@@ -275,6 +404,8 @@
 
   /**
    * Renderiza todas las líneas de imputación.
+   * Solo para cambios estructurales (inicio, restauración, reset); los cambios
+   * de importes usan actualizarFilas().
    */
   function renderLineas() {
     if (!container) return;
@@ -286,11 +417,13 @@
 
     // Limpiar contenedor
     container.innerHTML = '';
+    filasDom.clear();
 
     // Renderizar cada línea
     lineasImputacion.forEach((linea, index) => {
       const lineaEl = crearLineaHTML(linea, index === 0);
       container.appendChild(lineaEl);
+      filasDom.set(linea.id, lineaEl);
     });
 
     // Restaurar focus si era en una línea
@@ -303,6 +436,49 @@
     }
   }
 
+  /**
+   * Actualiza en el DOM solo las filas indicadas (importe, tope y, en la
+   * línea principal, orgánica y responsable).
+   * @param {Array<number>} ids - Ids de las líneas a refrescar
+   */
+  function actualizarFilas(ids) {
+    if (!container || !ids || ids.length === 0) return;
+
+    const porId = new Map(lineasImputacion.map(l => [l.id, l]));
+    for (const id of new Set(ids)) {
+      const linea = porId.get(id);
+      if (!linea) continue;
+      const lineaEl = filasDom.get(id);
+      if (!lineaEl) {
+        // Fila sin renderizar: reconstruir todo
+        renderLineas();
+        return;
+      }
+
+      const importeEl = lineaEl.querySelector('.imputacion-importe');
+      if (importeEl) importeEl.value = textoImporte(linea);
+
+      const topeEl = lineaEl.querySelector('.imputacion-tope');
+      if (topeEl) topeEl.value = textoTope(linea);
+
+      if (linea.readonly) {
+        const organicaEl = lineaEl.querySelector('.imputacion-organica');
+        const responsableEl = lineaEl.querySelector('.imputacion-responsable');
+        if (organicaEl) organicaEl.value = linea.organica || '';
+        if (responsableEl) responsableEl.value = linea.responsable || '';
+      }
+    }
+  }
+
+  /**
+   * Recalcula el reparto y refresca las filas afectadas.
+   * @param {Array<number>} [idsExtra] - Ids a refrescar aunque no cambie su importe
+   */
+  function recalcularYActualizar(idsExtra = []) {
+    const cambiadas = actualizarLineaPrincipal();
+    actualizarFilas(idsExtra.concat(cambiadas));
+  }
+
   // =========================================================================
   // EVENTOS
   // =========================================================================
@@ -316,17 +492,25 @@
       organica: '18.',
       responsable: '',
       importe: 0,
+      porcentaje: null,
+      tope: null,
       readonly: false
     };
 
     lineasImputacion.push(newLinea);
-    actualizarLineaPrincipal();
-    renderLineas();
-    actualizarBotonAddImputacion();
+    if (container && filasDom.size > 0) {
+      const lineaEl = crearLineaHTML(newLinea, false);
+      container.appendChild(lineaEl);
+      filasDom.set(newLinea.id, lineaEl);
+      recalcularYActualizar();
+    } else {
+      actualizarLineaPrincipal();
+      renderLineas();
+    }
 
     // Focus en la nueva línea
     setTimeout(() => {
-      const lineaEl = container.querySelector(`[data-imputacion-id="${newLinea.id}"]`);
+      const lineaEl = filasDom.get(newLinea.id);
       if (lineaEl) {
         const organicaInput = lineaEl.querySelector('.imputacion-organica');
         if (organicaInput) organicaInput.focus();
@@ -342,9 +526,11 @@
     if (idx === -1 || lineasImputacion[idx].readonly) return;
 
     lineasImputacion.splice(idx, 1);
-    actualizarLineaPrincipal();
-    renderLineas();
-    actualizarBotonAddImputacion();
+    const lineaEl = filasDom.get(lineaId);
+    if (lineaEl) lineaEl.remove();
+    filasDom.delete(lineaId);
+
+    recalcularYActualizar();
   }
 
   /**
@@ -364,7 +550,7 @@
     linea.organica = formatted;
     
     // Actualizar el input con el valor formateado y validar
-    const lineaEl = container.querySelector(`[data-imputacion-id="${lineaId}"]`);
+    const lineaEl = filasDom.get(lineaId);
     if (lineaEl) {
       const input = lineaEl.querySelector('.imputacion-organica');
       
@@ -394,22 +580,54 @@
 
   /**
    * Maneja el blur en el campo importe.
+   * Un valor con "%" convierte la línea en una línea por porcentaje.
    */
   function onImporteBlur(lineaId, valor) {
     const linea = lineasImputacion.find(l => l.id === lineaId);
     if (!linea || linea.readonly) return;
 
-    let importe = parseNumber(valor);
-    const restante = calcularImportePrincipal() + linea.importe; // Restante sin contar esta línea
+    const texto = String(valor || '');
+    if (texto.includes('%')) {
+      const porcentaje = parseNumber(texto.split('%')[0]);
+      linea.porcentaje = (porcentaje > 0 && porcentaje <= 100) ? round2(porcentaje) : null;
+      if (!linea.porcentaje) linea.importe = 0;
+    } else {
+      linea.porcentaje = null;
+      let importe = parseNumber(texto);
+      const restante = calcularImportePrincipal() + linea.importe; // Restante sin contar esta línea
+
+      // Si el importe es >= restante, poner a 0
+      if (importe >= restante) {
+        importe = 0;
+      }
 
-    // Si el importe es >= restante, poner a 0
-    if (importe >= restante) {
-      importe = 0;
+      linea.importe = round2(importe);
     }
 
-    linea.importe = round2(importe);
-    actualizarLineaPrincipal();
-    renderLineas();
+    recalcularYActualizar([lineaId]);
+  }
+
+  /**
+   * Maneja el blur en el campo tope.
+   */
+  function onTopeBlur(lineaId, valor) {
+    const linea = lineasImputacion.find(l => l.id === lineaId);
+    if (!linea || linea.readonly) return;
+
+    const tope = parseNumber(valor);
+    linea.tope = tope > 0 ? round2(tope) : null;
+    recalcularYActualizar([lineaId]);
+  }
+
+  /**
+   * Muestra el valor editable del importe al entrar en el campo.
+   */
+  function onImporteFocus(lineaId, input) {
+    const linea = lineasImputacion.find(l => l.id === lineaId);
+    if (!linea || linea.readonly) return;
+    if (Number(linea.porcentaje) > 0) {
+      input.value = `${fmtPorcentaje(linea.porcentaje)}%`;
+    }
   }
 
   /**
@@ -437,6 +655,15 @@
       }
     });
 
+    // Entrada en el importe (porcentaje editable)
+    container.addEventListener('focusin', (e) => {
+      const input = e.target;
+      if (!input.matches || !input.matches('.imputacion-importe')) return;
+      const lineaEl = input.closest('.imputacion-linea');
+      if (!lineaEl) return;
+      onImporteFocus(parseInt(lineaEl.dataset.imputacionId, 10), input);
+    });
+
     // Blur en inputs
     container.addEventListener('focusout', (e) => {
       const input = e.target;
@@ -453,18 +680,23 @@
         onResponsableBlur(lineaId, input.value);
       } else if (input.classList.contains('imputacion-importe')) {
         onImporteBlur(lineaId, input.value);
+      } else if (input.classList.contains('imputacion-tope')) {
+        onTopeBlur(lineaId, input.value);
       }
     });
 
-    // Formatear importe mientras se escribe (orgánica se formatea por formLogic.js gracias a clase 'organica')
+    // Formatear importe y tope mientras se escribe (orgánica se formatea por formLogic.js gracias a clase 'organica')
     container.addEventListener('input', (e) => {
       const input = e.target;
       
-      // Formatear importe (solo números, coma y punto)
-      if (input.classList.contains('imputacion-importe')) {
-        let s = (input.value || '').replace(/\./g, ',').replace(/[^0-9,]/g, '');
+      // Importe: números, coma y un "%" final opcional; tope: solo números y coma
+      const esImporte = input.classList.contains('imputacion-importe');
+      if (esImporte || input.classList.contains('imputacion-tope')) {
+        const raw = input.value || '';
+        let s = raw.replace(/\./g, ',').replace(/[^0-9,]/g, '');
         const parts = s.split(',');
         if (parts.length > 2) s = parts[0] + ',' + parts.slice(1).join('');
+        if (esImporte && raw.includes('%')) s += '%';
         if (s !== input.value) input.value = s;
       }
     });
@@ -478,8 +710,7 @@
     const responsableEl = document.getElementById('responsable');
 
     const updateAndRender = () => {
-      actualizarLineaPrincipal();
-      renderLineas();
+      recalcularYActualizar();
     };
 
     if (organicaEl) {
@@ -528,26 +759,30 @@
    * Actualiza la sección de imputación (llamar después de recalcular).
    */
   function actualizar() {
-    actualizarLineaPrincipal();
-    renderLineas();
+    recalcularYActualizar();
   }
 
   /**
    * Obtiene las líneas de imputación para serialización.
-   * @returns {Array} Array de { organica, responsable, importe, readonly }
+   * @returns {Array} Array de { organica, responsable, importe, readonly[, porcentaje][, tope] }
    */
   function obtenerLineas() {
-    return lineasImputacion.map(l => ({
-      organica: l.organica,
-      responsable: l.responsable,
-      importe: l.importe,
-      readonly: l.readonly
-    }));
+    return lineasImputacion.map(l => {
+      const linea = {
+        organica: l.organica,
+        responsable: l.responsable,
+        importe: l.importe,
+        readonly: l.readonly
+      };
+      if (Number(l.porcentaje) > 0) linea.porcentaje = l.porcentaje;
+      if (Number(l.tope) > 0) linea.tope = l.tope;
+      return linea;
+    });
   }
 
   /**
    * Restaura las líneas de imputación desde datos serializados.
-   * @param {Array} lineas - Array de { organica, responsable, importe, readonly }
+   * @param {Array} lineas - Array de { organica, responsable, importe, readonly[, porcentaje][, tope] }
    */
   function restaurarLineas(lineas) {
     if (!Array.isArray(lineas) || lineas.length === 0) {
@@ -567,13 +802,14 @@
         organica: l.organica || '18.',
         responsable: l.responsable || '',
         importe: round2(l.importe || 0),
+        porcentaje: Number(l.porcentaje) > 0 ? round2(l.porcentaje) : null,
+        tope: Number(l.tope) > 0 ? round2(l.tope) : null,
         readonly: !!l.readonly
       }));
     }
 
     actualizarLineaPrincipal();
     renderLineas();
-    actualizarBotonAddImputacion();
   }
 
   /**
@@ -601,7 +837,10 @@
     actualizar,
     obtenerLineas,
     restaurarLineas,
-    reset
+    reset,
+
+    // Para testing
+    _repartirImporte: repartirImporte
   };
 
   global.uiImputacion = uiImputacion;
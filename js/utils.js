@@ -2,7 +2,7 @@
  * utils.js
  * =========
  * Módulo de utilidades compartidas para toda la aplicación.
- * Centraliza funciones de formateo, parsing, debounce y logging.
+ * Centraliza funciones de formateo, parsing, debounce, carga de datos y logging.
  *
  * @module utils
  */
@@ -115,6 +115,31 @@
     return Math.round((n + Number.EPSILON) * 100) / 100;
   }
 
+  // =========================================================================
+  // FECHAS
+  // =========================================================================
+
+  /**
+   * Días desde 1970-01-01 de una fecha dd/mm/aa, dd/mm/aaaa o aaaa-mm-dd.
+   * @param {string} fecha
+   * @returns {number|null}
+   */
+  function diaDeFecha(fecha) {
+    const texto = String(fecha || '').trim();
+    let d, m, a;
+    let partes = texto.match(/^(\d{4})-(\d{2})-(\d{2})/);
+    if (partes) {
+      [a, m, d] = [+partes[1], +partes[2], +partes[3]];
+    } else {
+      partes = texto.match(/^(\d{1,2})\/(\d{1,2})\/(\d{2}|\d{4})$/);
+      if (!partes) return null;
+      [d, m, a] = [+partes[1], +partes[2], +partes[3]];
+      if (a < 100) a += 2000;
+    }
+    if (m < 1 || m > 12 || d < 1 || d > 31) return null;
+    return Date.UTC(a, m - 1, d) / 86400000;
+  }
+
   // =========================================================================
   // DEBOUNCE Y THROTTLE
   // =========================================================================
@@ -150,6 +175,73 @@
     };
   }
 
+  // =========================================================================
+  // ÁMBITOS DE LISTENERS
+  // =========================================================================
+
+  /**
+   * Crea un registro de ámbitos de listeners, uno por clave (ficha, sección).
+   * Cada ámbito es un AbortController: los listeners se registran con
+   * { signal: ambitos.senal(clave) } y cerrar(clave) los quita todos a la vez,
+   * junto con las referencias de sus closures.
+   * @returns {Object} API del registro
+   */
+  function crearAmbitos() {
+    /** @type {Map<string, AbortController>} */
+    const controladores = new Map();
+    let cerrados = 0;
+
+    /**
+     * Abre un ámbito nuevo para la clave (cierra el anterior si existía).
+     * @param {string|number} clave
+     * @returns {AbortSignal}
+     */
+    function abrir(clave) {
+      cerrar(clave);
+      const ctrl = new AbortController();
+      controladores.set(String(clave), ctrl);
+      return ctrl.signal;
+    }
+
+    /**
+     * Señal del ámbito de la clave; lo abre si no existe.
+     * @param {string|number} clave
+     * @returns {AbortSignal}
+     */
+    function senal(clave) {
+      const ctrl = controladores.get(String(clave));
+      return ctrl ? ctrl.signal : abrir(clave);
+    }
+
+    /**
+     * Cierra el ámbito de la clave y retira sus listeners.
+     * @param {string|number} clave
+     * @returns {boolean} true si había un ámbito abierto
+     */
+    function cerrar(clave) {
+      const k = String(clave);
+      const ctrl = controladores.get(k);
+      if (!ctrl) return false;
+      controladores.delete(k);
+      ctrl.abort();
+      cerrados++;
+      return true;
+    }
+
+    /** Cierra todos los ámbitos abiertos. */
+    function cerrarTodos() {
+      Array.from(controladores.keys()).forEach(cerrar);
+    }
+
+    return {
+      abrir,
+      senal,
+      cerrar,
+      cerrarTodos,
+      getEstadisticas: () => ({ abiertos: controladores.size, cerrados, claves: Array.from(controladores.keys()) })
+    };
+  }
+
   // =========================================================================
   // ACCESO A DATOS GLOBALES
   // =========================================================================
@@ -172,6 +264,202 @@
     return datos[section] || (Array.isArray(datos[section]) ? [] : null);
   }
 
+  // =========================================================================
+  // CARGA DE DATOS (promesa de disponibilidad)
+  // =========================================================================
+
+  /** Ruta de datos.json (index.html la precarga con <link rel="preload">) */
+  const RUTA_DATOS = 'assets/data/datos.json';
+
+  let promesaDatos = null;
+
+  /**
+   * Carga datos.json una sola vez y lo expone en window.__sgtriDatos.
+   * Todas las llamadas devuelven la misma promesa: los módulos que necesiten
+   * los datos pueden esperarla en lugar de comprobar el global.
+   * @returns {Promise<Object>} Datos de la aplicación
+   */
+  function cargarDatos() {
+    if (!promesaDatos) {
+      promesaDatos = fetch(RUTA_DATOS)
+        .then(response => {
+          if (!response.ok) throw new Error('No se pudo cargar el JSON');
+          return response.json();
+        })
+        .then(data => {
+          global.__sgtriDatos = data;
+          global.trazas?.arranque('datosListos');
+          return data;
+        });
+      // Evitar avisos de promesa no gestionada: el error lo trata quien espere
+      promesaDatos.catch(() => {});
+    }
+    return promesaDatos;
+  }
+
+  // =========================================================================
+  // SELECTS
+  // =========================================================================
+
+  /**
+   * Crea un fragmento con las opciones de un select.
+   * @param {Array<string|Array>} opciones - Textos, o pares [texto, valor]
+   * @returns {DocumentFragment}
+   */
+  function crearFragmentoOpciones(opciones) {
+    const fragmento = document.createDocumentFragment();
+    (opciones || []).forEach(op => {
+      const [texto, valor] = Array.isArray(op) ? op : [op, op];
+      fragmento.appendChild(new Option(texto, valor));
+    });
+    return fragmento;
+  }
+
+  /**
+   * Rellena un select con una sola inserción en el DOM.
+   * @param {HTMLSelectElement} select
+   * @param {Array<string|Array>|DocumentFragment} opciones - Lista o fragmento ya construido
+   * @param {Object} [config]
+   * @param {boolean} [config.reemplazar=false] - Vaciar antes las opciones existentes
+   */
+  function llenarSelect(select, opciones, config = {}) {
+    if (!select) return;
+    const fragmento = opciones instanceof DocumentFragment ? opciones : crearFragmentoOpciones(opciones);
+    if (config.reemplazar) {
+      select.replaceChildren(fragmento);
+    } else {
+      select.appendChild(fragmento);
+    }
+  }
+
+  /** lista → fragmento plantilla (se clona en cada select) */
+  const plantillasOpciones = new WeakMap();
+
+  /**
+   * Devuelve una copia del fragmento de opciones de una lista, compilado una
+   * sola vez por lista (p.ej. los países: uno por ficha y cambio de modo).
+   * @param {Array<string|Array>} lista
+   * @returns {DocumentFragment}
+   */
+  function clonarOpciones(lista) {
+    let plantilla = plantillasOpciones.get(lista);
+    if (!plantilla) {
+      plantilla = crearFragmentoOpciones(lista);
+      plantillasOpciones.set(lista, plantilla);
+    }
+    return plantilla.cloneNode(true);
+  }
+
+  // =========================================================================
+  // ÍNDICE DE BÚSQUEDA POR PREFIJO (sin acentos)
+  // =========================================================================
+
+  /**
+   * Normaliza un texto para comparar: sin diacríticos, minúsculas y espacios
+   * simples ("Países  Bajos" → "paises bajos").
+   * @param {string} texto
+   * @returns {string}
+   */
+  function normalizarTexto(texto) {
+    return String(texto ?? '')
+      .normalize('NFD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .toLowerCase()
+      .replace(/\s+/g, ' ')
+      .trim();
+  }
+
+  function anadirPrefijos(mapa, texto, desde, indice) {
+    for (let fin = desde + 1; fin <= texto.length; fin++) {
+      const prefijo = texto.slice(desde, fin);
+      const lista = mapa.get(prefijo);
+      if (!lista) {
+        mapa.set(prefijo, [indice]);
+      } else if (!lista.includes(indice)) {
+        lista.push(indice);
+      }
+    }
+  }
+
+  /**
+   * Compila un índice de prefijos sobre una lista de nombres normalizados.
+   * Los nombres se normalizan una sola vez; cada consulta es una búsqueda
+   * directa en un Map.
+   * @param {Array<string>} lista
+   * @param {Object<string, string>} [alias] - Nombre alternativo → nombre de la lista
+   * @returns {{resolver: Function, buscar: Function}}
+   */
+  function crearIndiceTexto(lista, alias = {}) {
+    const exactos = new Map();
+    const porNombre = new Map();
+    const porPalabra = new Map();
+
+    function indexar(texto, i) {
+      const n = normalizarTexto(texto);
+      if (!exactos.has(n)) exactos.set(n, i);
+      anadirPrefijos(porNombre, n, 0, i);
+      for (let pos = n.indexOf(' '); pos !== -1; pos = n.indexOf(' ', pos + 1)) {
+        anadirPrefijos(porPalabra, n, pos + 1, i);
+      }
+    }
+
+    (lista || []).forEach(indexar);
+    Object.keys(alias || {}).forEach(nombre => {
+      const i = exactos.get(normalizarTexto(alias[nombre]));
+      if (i !== undefined) indexar(nombre, i);
+    });
+
+    return {
+      /**
+       * Índice del nombre equivalente (sin acentos ni mayúsculas), o -1.
+       * @param {string} nombre
+       * @returns {number}
+       */
+      resolver(nombre) {
+        const i = exactos.get(normalizarTexto(nombre));
+        return i === undefined ? -1 : i;
+      },
+
+      /**
+       * Índices cuyos nombres empiezan por el prefijo; después, los que
+       * tienen una palabra que empieza por él ("bajos" → Países Bajos).
+       * @param {string} prefijo
+       * @param {number} [limite=10]
+       * @returns {number[]}
+       */
+      buscar(prefijo, limite = 10) {
+        const p = normalizarTexto(prefijo);
+        if (!p) return [];
+        const primero = porNombre.get(p) || [];
+        if (primero.length >= limite) return primero.slice(0, limite);
+        const resultado = primero.slice();
+        for (const i of porPalabra.get(p) || []) {
+          if (resultado.length >= limite) break;
+          if (!resultado.includes(i)) resultado.push(i);
+        }
+        return resultado;
+      }
+    };
+  }
+
+  let indicePaises = null;
+  let indicePaisesLista = null;
+
+  /**
+   * Índice de los países de datos.json, con sus nombres alternativos
+   * (aliasPaises). Se recompila si cambia la lista.
+   * @returns {{resolver: Function, buscar: Function}}
+   */
+  function getIndicePaises() {
+    const datos = getSgtriDatos();
+    const lista = datos.dietasPorPais?.paises || [];
+    if (!indicePaises || indicePaisesLista !== lista) {
+      indicePaises = crearIndiceTexto(lista, datos.aliasPaises);
+      indicePaisesLista = lista;
+    }
+    return indicePaises;
+  }
+
   // =========================================================================
   // LOGGING CENTRALIZADO
   // =========================================================================
@@ -231,13 +519,30 @@
     // Matemáticas
     round2,
 
+    // Fechas
+    diaDeFecha,
+
     // Timing
     debounce,
     throttle,
 
+    // Listeners
+    crearAmbitos,
+
     // Datos globales
     getSgtriDatos,
     getSgtriDatosSection,
+    cargarDatos,
+
+    // Selects
+    crearFragmentoOpciones,
+    clonarOpciones,
+    llenarSelect,
+
+    // Búsqueda
+    normalizarTexto,
+    crearIndiceTexto,
+    getIndicePaises,
 
     // Logging
     logger
@@ -245,4 +550,8 @@
 
   global.utils = utils;
 
+  // Pedir los datos cuanto antes (el preload ya los trae en paralelo al
+  // análisis del resto de scripts)
+  if (typeof fetch === 'function') cargarDatos();
+
 })(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,607 @@
+/**
+ * validacionDatos.js
+ * ==================
+ * Motor de validación de datos obligatorios y formatos (IBAN, SWIFT, DNI,
+ * tarjeta, orgánica).
+ *
+ * Las reglas se declaran en ESQUEMA_VALIDACION y se compilan una sola vez
+ * (rutas troceadas, validadores resueltos). La validación se ejecuta sobre el
+ * objeto de serializacionDatos.recopilarTodo() (o el contenido de un archivo
+ * .dta), no sobre el DOM: el marcado de errores en el formulario se aplica
+ * después en una única pasada (marcarErrores).
+ *
+ * También funciona sin navegador, p.ej. para revisar archivos .dta archivados:
+ *   const { validacionDatos } = require('./js/validacionDatos.js');
+ *   validacionDatos.validarLote([{ nombre, contenido }]);
+ *
+ * @module validacionDatos
+ */
+(function (global) {
+  'use strict';
+
+  // =========================================================================
+  // VALIDADORES DE FORMATO
+  // =========================================================================
+
+  /**
+   * Calcula el dígito de control CCC usando módulo 11.
+   * @param {string} digits - 10 dígitos a validar
+   * @returns {number} Dígito de control (0-10, donde 10 se convierte en 0)
+   */
+  function calcularDigitoControlCCC(digits) {
+    const pesos = [1, 2, 4, 8, 5, 10, 9, 7, 3, 6];
+    let suma = 0;
+    for (let i = 0; i < 10; i++) {
+      suma += parseInt(digits[i], 10) * pesos[i];
+    }
+    const resto = suma % 11;
+    const digito = 11 - resto;
+    return digito === 11 ? 0 : (digito === 10 ? 1 : digito);
+  }
+
+  /**
+   * Valida los dígitos de control del CCC (20 dígitos).
+   * @param {string} ccc - 20 dígitos del CCC
+   * @returns {boolean} true si es válido
+   */
+  function validarCCC(ccc) {
+    if (!/^\d{20}$/.test(ccc)) return false;
+    const entidad = ccc.substring(0, 4);
+    const oficina = ccc.substring(4, 8);
+    const dc1 = parseInt(ccc[8], 10);
+    const dc2 = parseInt(ccc[9], 10);
+    const cuenta = ccc.substring(10, 20);
+
+    // Primer dígito de control: sobre "00" + entidad + oficina
+    if (dc1 !== calcularDigitoControlCCC('00' + entidad + oficina)) return false;
+
+    // Segundo dígito de control: sobre número de cuenta
+    return dc2 === calcularDigitoControlCCC(cuenta);
+  }
+
+  /**
+   * Comprueba los dígitos de control de un IBAN (módulo 97, ISO 13616).
+   * @param {string} iban - IBAN sin espacios, en mayúsculas
+   * @returns {boolean} true si el resto es 1
+   */
+  function ibanModulo97Valido(iban) {
+    // Mover los 4 primeros caracteres al final y convertir letras a números
+    const reordenado = iban.substring(4) + iban.substring(0, 4);
+    let numerico = '';
+    for (const char of reordenado) {
+      if (/\d/.test(char)) {
+        numerico += char;
+      } else {
+        // A=10, B=11, ..., Z=35
+        numerico += (char.charCodeAt(0) - 55).toString();
+      }
+    }
+    // Calcular módulo 97 (en partes para evitar overflow)
+    let resto = 0;
+    for (let i = 0; i < numerico.length; i++) {
+      resto = (resto * 10 + parseInt(numerico[i], 10)) % 97;
+    }
+    return resto === 1;
+  }
+
+  /**
+   * Valida el IBAN español (ES + 2 dígitos + 20 dígitos CCC).
+   * @param {string} iban - 24 caracteres del IBAN
+   * @returns {boolean} true si es válido
+   */
+  function validarIBANEspanol(iban) {
+    if (!/^ES\d{22}$/.test(iban)) return false;
+    if (!validarCCC(iban.substring(4, 24))) return false;
+    return ibanModulo97Valido(iban);
+  }
+
+  /**
+   * Valida una cuenta española: CCC de 20 dígitos o IBAN de 24 caracteres.
+   * @param {string} valor - Sin espacios, en mayúsculas
+   * @returns {boolean}
+   */
+  function validarCuentaEspanola(valor) {
+    if (valor.length === 20) return validarCCC(valor);
+    if (valor.length === 24) return validarIBANEspanol(valor);
+    return false;
+  }
+
+  /**
+   * Valida un IBAN internacional usando módulo 97 (ISO 13616).
+   * @param {string} iban - IBAN sin espacios
+   * @returns {boolean} true si es válido
+   */
+  function validarIBANInternacional(iban) {
+    // Mínimo 15 caracteres, máximo 34
+    if (iban.length < 15 || iban.length > 34) return false;
+    // Código país (2 letras) + dígitos de control (2 dígitos) + resto alfanumérico
+    if (!/^[A-Z]{2}\d{2}[A-Z0-9]+$/.test(iban)) return false;
+    return ibanModulo97Valido(iban);
+  }
+
+  /**
+   * Valida el formato de un código SWIFT/BIC (ISO 9362).
+   * Banco (4 letras) + país (2 letras) + localización (2 alfanuméricos)
+   * + sucursal opcional (3 alfanuméricos).
+   * @param {string} swift - Código SWIFT sin espacios
+   * @returns {boolean} true si el formato es válido
+   */
+  function validarSWIFT(swift) {
+    return /^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$/.test(swift);
+  }
+
+  /**
+   * Valida un número de tarjeta (15-19 dígitos, algoritmo de Luhn).
+   * @param {string} numero - Número sin espacios
+   * @returns {boolean} true si es válido
+   */
+  function validarTarjeta(numero) {
+    if (!/^\d{15,19}$/.test(numero)) return false;
+    let suma = 0;
+    // Iterar desde la derecha hacia la izquierda
+    for (let i = 0; i < numero.length; i++) {
+      let digito = parseInt(numero[numero.length - 1 - i], 10);
+      // Duplicar cada segundo dígito desde la derecha
+      if (i % 2 === 1) {
+        digito *= 2;
+        if (digito > 9) digito -= 9;
+      }
+      suma += digito;
+    }
+    return suma % 10 === 0;
+  }
+
+  /**
+   * Valida un DNI español.
+   * @param {string} dni - DNI introducido (en mayúsculas)
+   * @returns {{valido: boolean, formateado: string}} Resultado de validación y DNI formateado
+   */
+  function validarDNIEspanol(dni) {
+    // Extraer solo dígitos y la letra final
+    const soloDigitos = dni.replace(/[^\d]/g, '');
+    const letras = dni.replace(/[^A-Z]/g, '');
+
+    // Debe tener al menos 1 dígito y exactamente 1 letra al final
+    if (soloDigitos.length === 0 || soloDigitos.length > 8) {
+      return { valido: false, formateado: dni };
+    }
+    if (letras.length !== 1) {
+      return { valido: false, formateado: dni };
+    }
+
+    // La letra debe estar al final
+    const letraUsuario = letras[0];
+    const posLetra = dni.lastIndexOf(letraUsuario);
+    const posUltimoDigito = dni.search(/\d[^\d]*$/);
+    if (posLetra < posUltimoDigito) {
+      return { valido: false, formateado: dni };
+    }
+
+    // Completar con ceros a la izquierda hasta 8 dígitos
+    const numeroCompleto = soloDigitos.padStart(8, '0');
+
+    // Tabla de letras de control
+    const letrasControl = 'TRWAGMYFPDXBNJZSQVHLCKE';
+    const resto = parseInt(numeroCompleto, 10) % 23;
+    const letraCorrecta = letrasControl[resto];
+
+    return {
+      valido: letraUsuario === letraCorrecta,
+      formateado: numeroCompleto + letraCorrecta
+    };
+  }
+
+  /**
+   * Valida una orgánica: 2-7 pares de 2 caracteres separados por puntos,
+   * empezando por "18.".
+   * @param {string} organica
+   * @returns {boolean}
+   */
+  function validarOrganica(organica) {
+    return organica.startsWith('18.') && /^[A-Za-z0-9]{2}(\.[A-Za-z0-9]{2}){1,6}$/.test(organica);
+  }
+
+  /**
+   * Formatos disponibles para el esquema. Reciben el valor sin espacios y en
+   * mayúsculas (salvo DNI, que solo se valida si empieza por número).
+   */
+  const FORMATOS = {
+    cuentaEspanola: validarCuentaEspanola,
+    ibanInternacional: validarIBANInternacional,
+    swift: validarSWIFT,
+    tarjeta: validarTarjeta,
+    organica: validarOrganica,
+    // Si empieza por letra es pasaporte u otro documento: no se valida
+    dni: (valor) => !/^\d/.test(valor) || validarDNIEspanol(valor).valido
+  };
+
+  // =========================================================================
+  // ESQUEMA
+  // =========================================================================
+
+  const PAGO_CUENTA_ESPANOLA = new Set(['CE', 'CuentaEsp', 'Cuenta Española']);
+  const PAGO_CUENTA_EXTRANJERA = new Set(['CI', 'CuentaExtranjera', 'Cuenta Extranjera']);
+  const PAGO_TARJETA = new Set(['TJ', 'TarjetaUEx', 'Tarjeta UEx']);
+
+  /**
+   * Convierte un importe en texto ("1.234,56 €") a número.
+   * @param {string|number} valor
+   * @returns {number}
+   */
+  function importe(valor) {
+    if (typeof valor === 'number') return valor;
+    const limpio = String(valor || '').replace(/[^0-9,\.]/g, '').replace(',', '.');
+    return parseFloat(limpio) || 0;
+  }
+
+  function esExtranjero(desp) {
+    const pais = desp?.paisDestino;
+    return !!pais && pais !== 'España' && pais !== 'ES';
+  }
+
+  function hayKilometraje(datos) {
+    return (datos.desplazamientos || []).some(d => {
+      const km = String(d.km || '').replace(/[^0-9]/g, '');
+      return !!km && parseInt(km, 10) > 0;
+    });
+  }
+
+  /**
+   * Reglas de validación.
+   * Cada grupo: { seccion, cuando?, lista?, campos }.
+   *  - cuando(datos, elemento?): el grupo solo se valida si devuelve true.
+   *  - lista: ruta de un array; los campos se validan por cada elemento.
+   *  - campos: { ruta, campo, formato? }
+   *      ruta: propiedad (relativa al elemento si hay lista) con puntos.
+   *      campo: id del input (o función (elemento, indice) => id), o
+   *             { selector, clase } para filas sin id (índice del elemento).
+   *      formato: clave de FORMATOS (se comprueba si el campo tiene valor).
+   */
+  const ESQUEMA_VALIDACION = [
+    {
+      seccion: 'beneficiario',
+      campos: [
+        { ruta: 'beneficiario.nombre', campo: 'nombre-benef' },
+        { ruta: 'beneficiario.dni', campo: 'dni', formato: 'dni' },
+        { ruta: 'beneficiario.entidad', campo: 'entidad' },
+        { ruta: 'beneficiario.categoria', campo: 'categoria' },
+        { ruta: 'pago.tipo', campo: 'tipo-pago' }
+      ]
+    },
+    {
+      seccion: 'pago',
+      cuando: (datos) => PAGO_CUENTA_ESPANOLA.has(datos.pago?.tipo),
+      campos: [{ ruta: 'pago.iban', campo: 'iban', formato: 'cuentaEspanola' }]
+    },
+    {
+      seccion: 'pago',
+      cuando: (datos) => PAGO_CUENTA_EXTRANJERA.has(datos.pago?.tipo),
+      campos: [
+        { ruta: 'pago.iban', campo: 'iban-ext', formato: 'ibanInternacional' },
+        { ruta: 'pago.swift', campo: 'swift', formato: 'swift' }
+      ]
+    },
+    {
+      seccion: 'pago',
+      cuando: (datos) => PAGO_TARJETA.has(datos.pago?.tipo),
+      campos: [{ ruta: 'pago.tarjeta', campo: 'numero-tarjeta', formato: 'tarjeta' }]
+    },
+    {
+      seccion: 'proyecto',
+      campos: [
+        { ruta: 'proyecto.tipo', campo: 'tipoProyecto' },
+        { ruta: 'proyecto.responsable', campo: 'responsable' },
+        { ruta: 'proyecto.organica', campo: 'organica', formato: 'organica' },
+        { ruta: 'proyecto.referencia', campo: 'referencia' }
+      ]
+    },
+    {
+      seccion: 'desplazamientos',
+      lista: 'desplazamientos',
+      campos: [
+        { ruta: 'fechaIda', campo: (d) => `fecha-ida-${d.id}` },
+        { ruta: 'horaIda', campo: (d) => `hora-ida-${d.id}` },
+        { ruta: 'fechaRegreso', campo: (d) => `fecha-regreso-${d.id}` },
+        { ruta: 'horaRegreso', campo: (d) => `hora-regreso-${d.id}` },
+        { ruta: 'origen', campo: (d) => `origen-${d.id}` },
+        { ruta: 'destino', campo: (d) => `destino-${d.id}` },
+        { ruta: 'paisDestino', campo: (d) => `pais-destino-${d.id}` },
+        { ruta: 'motivo', campo: (d) => `motivo-${d.id}` }
+      ]
+    },
+    {
+      seccion: 'desplazamientos',
+      lista: 'desplazamientos',
+      cuando: (datos, desp) => esExtranjero(desp),
+      campos: [
+        { ruta: 'cruceIda', campo: (d) => `cruce-ida-${d.id}` },
+        { ruta: 'cruceVuelta', campo: (d) => `cruce-vuelta-${d.id}` }
+      ]
+    },
+    {
+      // Si hay kilometraje, los datos del vehículo son obligatorios
+      seccion: 'vehiculo',
+      cuando: (datos) => !!datos.vehiculo && hayKilometraje(datos),
+      campos: [
+        { ruta: 'vehiculo.marca', campo: 'veh-marca' },
+        { ruta: 'vehiculo.modelo', campo: 'veh-modelo' },
+        { ruta: 'vehiculo.matricula', campo: 'veh-matricula' }
+      ]
+    },
+    {
+      seccion: 'aecc',
+      cuando: (datos) => String(datos.tipoLiquidacion || '').toUpperCase() === 'AECC',
+      campos: [
+        { ruta: 'desplazamientoAECC.0.fechaIda', campo: 'aecc-fecha-ida' },
+        { ruta: 'desplazamientoAECC.0.horaIda', campo: 'aecc-hora-ida' },
+        { ruta: 'desplazamientoAECC.0.fechaRegreso', campo: 'aecc-fecha-regreso' },
+        { ruta: 'desplazamientoAECC.0.horaRegreso', campo: 'aecc-hora-regreso' },
+        { ruta: 'desplazamientoAECC.0.origen', campo: 'aecc-origen' },
+        { ruta: 'desplazamientoAECC.0.destino', campo: 'aecc-destino' },
+        { ruta: 'desplazamientoAECC.0.motivo', campo: 'aecc-motivo' }
+      ]
+    },
+    {
+      seccion: 'evento',
+      cuando: (datos) => importe(datos.evento?.gastosInscripcion) > 0,
+      campos: [
+        { ruta: 'evento.nombre', campo: 'evento-nombre' },
+        { ruta: 'evento.lugar', campo: 'evento-lugar' },
+        { ruta: 'evento.fechaDesde', campo: 'evento-del' },
+        { ruta: 'evento.fechaHasta', campo: 'evento-al' }
+      ]
+    },
+    {
+      seccion: 'honorarios',
+      cuando: (datos) => importe(datos.honorarios?.importe) > 0,
+      campos: [
+        { ruta: 'honorarios.importe', campo: 'honorarios-importe' },
+        { ruta: 'honorarios.beneficiario', campo: 'honorarios-beneficiario' },
+        { ruta: 'honorarios.situacion', campo: 'honorarios-situacion' },
+        { ruta: 'honorarios.domicilio', campo: 'honorarios-domicilio' },
+        { ruta: 'honorarios.concepto', campo: 'honorarios-concepto' }
+      ]
+    },
+    {
+      seccion: 'imputacion',
+      lista: 'imputacion',
+      campos: [
+        {
+          ruta: 'organica',
+          campo: { selector: '#imputacion-container .imputacion-linea', clase: '.imputacion-organica' },
+          formato: 'organica'
+        },
+        {
+          ruta: 'responsable',
+          campo: { selector: '#imputacion-container .imputacion-linea', clase: '.imputacion-responsable' }
+        }
+      ]
+    }
+  ];
+
+  // =========================================================================
+  // COMPILACIÓN
+  // =========================================================================
+
+  /**
+   * Crea un lector de una ruta con puntos ('a.0.b'), troceada una sola vez.
+   * @param {string} ruta
+   * @returns {Function} (objeto) => valor
+   */
+  function compilarRuta(ruta) {
+    const partes = ruta.split('.');
+    return (objeto) => {
+      let actual = objeto;
+      for (let i = 0; i < partes.length && actual != null; i++) {
+        actual = actual[partes[i]];
+      }
+      return actual;
+    };
+  }
+
+  function compilarCampo(regla, grupo) {
+    const formato = regla.formato ? FORMATOS[regla.formato] : null;
+    if (regla.formato && !formato) {
+      throw new Error(`[validacionDatos] Formato desconocido: ${regla.formato}`);
+    }
+    const campo = regla.campo;
+    return {
+      ruta: regla.ruta,
+      leer: compilarRuta(regla.ruta),
+      localizador: typeof campo === 'function' ? campo : () => campo,
+      formato,
+      // Los formatos de DNI distinguen mayúsculas pero no espacios
+      normalizar: regla.formato === 'dni'
+        ? (v) => v.trim().toUpperCase()
+        : (regla.formato === 'organica' ? (v) => v.trim() : (v) => v.replace(/\s/g, '').toUpperCase()),
+      seccion: grupo.seccion
+    };
+  }
+
+  /**
+   * Compila un esquema de validación.
+   * @param {Array} esquema - Con la forma de ESQUEMA_VALIDACION
+   * @returns {Function} validar(datos, opciones) => { valido, errores }
+   */
+  function compilarEsquema(esquema) {
+    const grupos = esquema.map(grupo => ({
+      seccion: grupo.seccion,
+      cuando: grupo.cuando || null,
+      leerLista: grupo.lista ? compilarRuta(grupo.lista) : null,
+      lista: grupo.lista || null,
+      campos: grupo.campos.map(regla => compilarCampo(regla, grupo))
+    }));
+
+    function comprobar(campos, base, prefijo, elemento, indice, conFormatos, errores) {
+      for (let c = 0; c < campos.length; c++) {
+        const campo = campos[c];
+        const valor = campo.leer(base);
+        const texto = valor == null ? '' : String(valor).trim();
+        const ruta = prefijo + campo.ruta;
+        const localizador = campo.localizador(elemento, indice);
+
+        if (texto === '' || texto === '18.') {
+          errores.push({ seccion: campo.seccion, ruta, tipo: 'obligatorio', campo: localizador, indice });
+        } else if (conFormatos && campo.formato && !campo.formato(campo.normalizar(texto))) {
+          errores.push({ seccion: campo.seccion, ruta, tipo: 'formato', campo: localizador, indice });
+        }
+      }
+    }
+
+    /**
+     * @param {Object} datos - Estructura de recopilarTodo()
+     * @param {Object} [opciones]
+     * @param {boolean} [opciones.formatos=true] - Comprobar también formatos
+     * @returns {{valido: boolean, errores: Array<{seccion, ruta, tipo, campo, indice}>}}
+     */
+    return function validar(datos, opciones = {}) {
+      const conFormatos = opciones.formatos !== false;
+      const errores = [];
+      const d = datos || {};
+
+      for (let g = 0; g < grupos.length; g++) {
+        const grupo = grupos[g];
+        if (grupo.leerLista) {
+          const lista = grupo.leerLista(d);
+          if (!Array.isArray(lista)) continue;
+          for (let i = 0; i < lista.length; i++) {
+            const elemento = lista[i] || {};
+            if (grupo.cuando && !grupo.cuando(d, elemento)) continue;
+            comprobar(grupo.campos, elemento, `${grupo.lista}.${i}.`, elemento, i, conFormatos, errores);
+          }
+        } else {
+          if (grupo.cuando && !grupo.cuando(d)) continue;
+          comprobar(grupo.campos, d, '', undefined, undefined, conFormatos, errores);
+        }
+      }
+
+      return { valido: errores.length === 0, errores };
+    };
+  }
+
+  /** Validador compilado del esquema por defecto. */
+  const validar = compilarEsquema(ESQUEMA_VALIDACION);
+
+  // =========================================================================
+  // VALIDACIÓN DE ARCHIVOS (.dta)
+  // =========================================================================
+
+  /**
+   * Valida el contenido de un archivo .dta (texto JSON u objeto ya parseado).
+   * @param {string|Object} contenido
+   * @param {Object} [opciones] - Ver validar()
+   * @returns {{valido: boolean, errores: Array, error?: string}}
+   */
+  function validarArchivo(contenido, opciones) {
+    let datos = contenido;
+    if (typeof contenido === 'string') {
+      try {
+        datos = JSON.parse(contenido);
+      } catch (e) {
+        return { valido: false, errores: [], error: 'JSON no válido: ' + e.message };
+      }
+    }
+    if (!datos || typeof datos !== 'object') {
+      return { valido: false, errores: [], error: 'Contenido vacío' };
+    }
+    return validar(datos, opciones);
+  }
+
+  /**
+   * Valida un lote de archivos .dta.
+   * @param {Array<{nombre: string, contenido: string|Object}>} archivos
+   * @param {Object} [opciones] - Ver validar()
+   * @returns {Array<{nombre: string, valido: boolean, errores: Array, error?: string}>}
+   */
+  function validarLote(archivos, opciones) {
+    return (archivos || []).map(a => ({ nombre: a.nombre, ...validarArchivo(a.contenido, opciones) }));
+  }
+
+  // =========================================================================
+  // MARCADO EN EL FORMULARIO
+  // =========================================================================
+
+  /**
+   * Localiza el elemento del formulario asociado a un error.
+   * @param {Object} error
+   * @param {Document} doc
+   * @param {Map} cacheListas - selector → NodeList (una consulta por lote)
+   * @returns {HTMLElement|null}
+   */
+  function localizarElemento(error, doc, cacheListas) {
+    const campo = error.campo;
+    if (typeof campo === 'string') return doc.getElementById(campo);
+    if (campo && campo.selector) {
+      if (!cacheListas.has(campo.selector)) {
+        cacheListas.set(campo.selector, doc.querySelectorAll(campo.selector));
+      }
+      const fila = cacheListas.get(campo.selector)[error.indice];
+      return fila ? fila.querySelector(campo.clase) : null;
+    }
+    return null;
+  }
+
+  /**
+   * Marca los errores en el formulario en una sola pasada: primero se
+   * localizan los campos y se miden las secciones plegadas, después se
+   * escriben clases y estilos.
+   * @param {Array} errores - Errores devueltos por validar()
+   * @param {Document} [doc=document]
+   * @returns {number} Número de campos marcados (los que existen en el DOM)
+   */
+  function marcarErrores(errores, doc = global.document) {
+    if (!doc || !Array.isArray(errores) || errores.length === 0) return 0;
+
+    // Fase de lectura
+    const cacheListas = new Map();
+    const campos = [];
+    const secciones = new Map();
+    errores.forEach(error => {
+      const el = localizarElemento(error, doc, cacheListas);
+      if (!el) return;
+      campos.push(el);
+      const seccion = el.closest('.form-section');
+      if (!seccion || secciones.has(seccion)) return;
+      const toggle = seccion.querySelector('.toggle-section');
+      if (!toggle || toggle.classList.contains('open')) return;
+      const wrapper = seccion.querySelector('.section-content-wrapper');
+      secciones.set(seccion, { toggle, wrapper, altura: wrapper ? wrapper.scrollHeight : 0 });
+    });
+
+    // Fase de escritura
+    campos.forEach(el => el.classList.add('field-error'));
+    secciones.forEach(({ toggle, wrapper, altura }) => {
+      toggle.classList.add('open');
+      if (wrapper) {
+        wrapper.style.maxHeight = altura + 'px';
+        wrapper.style.opacity = '1';
+      }
+    });
+
+    return campos.length;
+  }
+
+  // =========================================================================
+  // EXPORTACIÓN
+  // =========================================================================
+
+  global.validacionDatos = {
+    ESQUEMA_VALIDACION,
+    compilarEsquema,
+    validar,
+    validarArchivo,
+    validarLote,
+    marcarErrores,
+
+    // Validadores de formato
+    validarCCC,
+    validarCuentaEspanola,
+    validarIBANEspanol,
+    validarIBANInternacional,
+    validarSWIFT,
+    validarTarjeta,
+    validarDNIEspanol,
+    validarOrganica
+  };
+
+})(typeof window !== 'undefined' ? window : this);
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+build_docs.py
+=============
+Punto de entrada único para generar la documentación Word (docs/*.docx).
+
+Cada documento lo genera su script tools/generate_*.py; este los lanza en
+paralelo (un proceso por documento) y solo regenera los que tienen alguna
+entrada modificada. Las entradas de cada documento (su script, las
+utilidades comunes, assets/data/datos.json, js/formLogic.js...) se comparan
+por SHA-256 con las de la última generación, guardadas en
+docs/.build_docs.json. Si el .docx no existe se genera siempre.
+
+Las tablas de tarifas de los manuales se leen de datos.json, así que al
+cambiar una tarifa basta con volver a ejecutar este script. Al terminar
+muestra un informe con el estado y la duración de cada documento y las
+tarifas con las que se han generado.
+
+Requisitos: python-docx
+
+Uso:
+    python tools/build_docs.py [DOCUMENTO ...] [--forzar] [--procesos N] [--json]
+
+Ejemplos:
+    python tools/build_docs.py
+    python tools/build_docs.py manual tecnico --forzar
+    python tools/build_docs.py --json > informe_docs.json
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+ROOT = TOOLS.parent
+DOCS_DIR = ROOT / "docs"
+DATOS_PATH = ROOT / "assets" / "data" / "datos.json"
+MANIFIESTO = DOCS_DIR / ".build_docs.json"
+VERSION_MANIFIESTO = 1
+
+# Los generadores se importan por nombre (también en los procesos hijos)
+if str(TOOLS) not in sys.path:
+    sys.path.insert(0, str(TOOLS))
+
+COMUN = "tools/docs_comun.py"
+DATOS = "assets/data/datos.json"
+
+# nombre → módulo, función (recibe la ruta de salida), archivo y entradas
+DOCUMENTOS = {
+    "manual": {
+        "modulo": "generate_manual_calculo",
+        "funcion": "create_manual",
+        "salida": "Calculo_de_desplazamientos.docx",
+        "entradas": ["tools/generate_manual_calculo.py", COMUN, DATOS],
+    },
+    "tecnico": {
+        "modulo": "generate_technical_doc",
+        "funcion": "create_document",
+        "salida": "Logica_interna_calculo_desplazamientos.docx",
+        "entradas": ["tools/generate_technical_doc.py", COMUN, DATOS],
+    },
+    "guia": {
+        "modulo": "generate_docx",
+        "funcion": "create_docx",
+        "salida": "Liquidacion_Desplazamientos.docx",
+        "entradas": ["tools/generate_docx.py"],
+    },
+    "input": {
+        "modulo": "generate_input_schema_docx",
+        "funcion": "create_docx",
+        "salida": "Estructura_Input_Desplazamiento.docx",
+        "entradas": ["tools/generate_input_schema_docx.py"],
+    },
+    "formLogic": {
+        "modulo": "generate_formLogic_docx",
+        "funcion": "create_docx",
+        "salida": "formLogic.docx",
+        "entradas": ["tools/generate_formLogic_docx.py", "js/formLogic.js"],
+    },
+}
+
+
+# =========================================================================
+# HASHES Y MANIFIESTO
+# =========================================================================
+
+def hash_archivo(ruta: Path) -> str | None:
+    """SHA-256 del contenido (None si el archivo no existe)."""
+    try:
+        return hashlib.sha256(ruta.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def hashes_entradas(nombre: str, cache: dict) -> dict:
+    """{ruta relativa: sha256} de las entradas de un documento."""
+    hashes = {}
+    for ruta in DOCUMENTOS[nombre]["entradas"]:
+        if ruta not in cache:
+            cache[ruta] = hash_archivo(ROOT / ruta)
+        hashes[ruta] = cache[ruta]
+    return hashes
+
+
+def leer_manifiesto() -> dict:
+    try:
+        manifiesto = json.loads(MANIFIESTO.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifiesto.get("version") != VERSION_MANIFIESTO:
+        return {}
+    return manifiesto.get("documentos", {})
+
+
+def guardar_manifiesto(documentos: dict, informe: dict) -> None:
+    DOCS_DIR.mkdir(exist_ok=True)
+    contenido = {"version": VERSION_MANIFIESTO, "documentos": documentos, "ultimoInforme": informe}
+    MANIFIESTO.write_text(json.dumps(contenido, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def entradas_cambiadas(hashes: dict, previo: dict | None) -> list[str]:
+    """Entradas cuyo hash difiere del de la última generación."""
+    anteriores = (previo or {}).get("entradas", {})
+    return [ruta for ruta, h in hashes.items() if anteriores.get(ruta) != h]
+
+
+# =========================================================================
+# GENERACIÓN
+# =========================================================================
+
+def _generar(nombre: str) -> dict:
+    """Genera un documento (se ejecuta en un proceso hijo)."""
+    doc = DOCUMENTOS[nombre]
+    salida = DOCS_DIR / doc["salida"]
+    inicio = time.perf_counter()
+    try:
+        modulo = importlib.import_module(doc["modulo"])
+        getattr(modulo, doc["funcion"])(str(salida))
+    except Exception:
+        return {"nombre": nombre, "error": traceback.format_exc(limit=-3),
+                "segundos": round(time.perf_counter() - inicio, 2)}
+    return {"nombre": nombre, "segundos": round(time.perf_counter() - inicio, 2)}
+
+
+def construir(nombres: list[str], forzar: bool = False, procesos: int | None = None) -> dict:
+    """
+    Genera los documentos con entradas modificadas.
+
+    Returns:
+        Informe: {'documentos': [...], 'tarifas': {...}, 'segundos': float}
+    """
+    inicio = time.perf_counter()
+    previos = leer_manifiesto()
+    cache = {}
+    estado = {}
+    pendientes = []
+    for nombre in nombres:
+        hashes = hashes_entradas(nombre, cache)
+        cambiadas = entradas_cambiadas(hashes, previos.get(nombre))
+        existe = (DOCS_DIR / DOCUMENTOS[nombre]["salida"]).exists()
+        estado[nombre] = {"nombre": nombre, "salida": f"docs/{DOCUMENTOS[nombre]['salida']}",
+                          "entradas": hashes, "cambiadas": cambiadas}
+        if forzar or cambiadas or not existe:
+            pendientes.append(nombre)
+        else:
+            estado[nombre]["estado"] = "sin cambios"
+
+    if len(pendientes) > 1 and procesos != 1:
+        procesos = min(procesos or os.cpu_count() or 1, len(pendientes))
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            resultados = list(ejecutor.map(_generar, pendientes))
+    else:
+        resultados = [_generar(nombre) for nombre in pendientes]
+
+    documentos = dict(previos)
+    ahora = datetime.now().isoformat(timespec="seconds")
+    for r in resultados:
+        e = estado[r["nombre"]]
+        e["segundos"] = r["segundos"]
+        if "error" in r:
+            e["estado"] = "error"
+            e["error"] = r["error"]
+            # Se reintentará en la próxima ejecución
+            documentos.pop(r["nombre"], None)
+            continue
+        e["estado"] = "generado"
+        e["bytes"] = (ROOT / e["salida"]).stat().st_size
+        documentos[r["nombre"]] = {"entradas": e["entradas"], "generado": ahora, "segundos": r["segundos"]}
+
+    informe = {
+        "fecha": ahora,
+        "documentos": [estado[n] for n in nombres],
+        "tarifas": resumen_tarifas(),
+        "segundos": round(time.perf_counter() - inicio, 2),
+    }
+    guardar_manifiesto(documentos, informe)
+    return informe
+
+
+# =========================================================================
+# INFORME
+# =========================================================================
+
+def resumen_tarifas() -> dict:
+    """Tarifas de datos.json que aparecen en las tablas de los manuales."""
+    datos = json.loads(DATOS_PATH.read_text(encoding="utf-8"))
+    dietas = datos.get("dietasPorPais", {})
+    espana = {
+        clave: {"manutencion": tabla["manutencion"][0], "alojamiento": tabla["alojamiento"][0]}
+        for clave, tabla in dietas.items() if clave != "paises"
+    }
+    return {
+        "versionEsquema": datos.get("versionEsquema"),
+        "sha256": hash_archivo(DATOS_PATH),
+        "espana": espana,
+        "kmTarifas": datos.get("kmTarifas"),
+        "limitesIRPF": datos.get("limitesIRPF"),
+    }
+
+
+def imprimir_informe(informe: dict) -> None:
+    iconos = {"generado": "✅", "sin cambios": "·", "error": "❌"}
+    for d in informe["documentos"]:
+        detalle = ""
+        if d["estado"] == "generado":
+            detalle = f"{d['segundos']:6.2f} s  {d['bytes'] / 1024:7.1f} KB"
+            if d["cambiadas"]:
+                detalle += "  (" + ", ".join(d["cambiadas"]) + ")"
+        elif d["estado"] == "error":
+            detalle = f"{d['segundos']:6.2f} s"
+        print(f"{iconos[d['estado']]} {d['nombre']:10} {d['estado']:12} {detalle}")
+        if d["estado"] == "error":
+            print("   " + d["error"].strip().replace("\n", "\n   "))
+
+    t = informe["tarifas"]
+    print(f"\nTarifas (datos.json {t['versionEsquema']}, {t['sha256'][:12]}):")
+    for clave, valores in t["espana"].items():
+        print(f"   {clave:16} manutención {valores['manutencion']:>7}  alojamiento {valores['alojamiento']:>7}")
+    print("   km: " + ", ".join(f"{tipo} {tarifa}" for tipo, tarifa in (t["kmTarifas"] or {}).items()))
+    print("   IRPF: " + ", ".join(f"{clave} {valores}" for clave, valores in (t["limitesIRPF"] or {}).items()))
+
+    generados = sum(d["estado"] == "generado" for d in informe["documentos"])
+    print(f"\n{generados} generado(s), {len(informe['documentos']) - generados} sin generar, "
+          f"{informe['segundos']:.2f} s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Genera la documentación Word (docs/*.docx)")
+    parser.add_argument("documentos", nargs="*",
+                        help=f"Documentos a generar: {', '.join(DOCUMENTOS)} (por defecto, todos)")
+    parser.add_argument("--forzar", action="store_true", help="Regenerar aunque no haya cambios")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="Procesos en paralelo (por defecto, uno por CPU)")
+    parser.add_argument("--json", action="store_true", help="Informe en JSON")
+    args = parser.parse_args()
+
+    desconocidos = [n for n in args.documentos if n not in DOCUMENTOS]
+    if desconocidos:
+        print(f"ERROR: Documento(s) desconocido(s): {', '.join(desconocidos)}")
+        return 1
+    informe = construir(args.documentos or list(DOCUMENTOS), args.forzar, args.procesos)
+    if args.json:
+        print(json.dumps(informe, ensure_ascii=False, indent=2))
+    else:
+        imprimir_informe(informe)
+    return 1 if any(d["estado"] == "error" for d in informe["documentos"]) else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+build_normativas.py
+===================
+Índice de búsqueda de las normativas de Normativas/ para el formulario.
+
+Extrae el texto de los PDF (pdf_texto), lo divide en fragmentos por
+artículo, disposición y anexo, y compila un índice invertido con los
+términos sin acentos ni mayúsculas. El resultado,
+assets/data/normativas/indice.json, lo carga js/normativas.js la primera
+vez que se busca o se abre un artículo, y la búsqueda se hace en el
+navegador, sin conexión.
+
+Formato del índice:
+    normas      {clave: {nombre, archivo}}; las claves son las normativas
+                del motor de cálculo ('rd', 'decreto')
+    fragmentos  [[norma, id, título, página, texto], ...]
+    longitudes  términos indexados por fragmento (para BM25)
+    terminos    {término: [fragmento, frecuencia, fragmento, frecuencia...]}
+    reglas      {regla: {norma: [fragmento, frase a resaltar]}}: destino de
+                los enlaces "§" de las explicaciones del cálculo
+    sinonimos   {término: [términos]}: horas y números escritos con letra
+
+La tokenización (plegar()/terminos()) debe coincidir con la de
+js/normativas.js.
+
+Uso:
+    python tools/build_normativas.py [--salida assets/data/normativas/indice.json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+import pdf_texto
+
+ROOT = Path(__file__).resolve().parents[1]
+SALIDA_POR_DEFECTO = ROOT / 'assets' / 'data' / 'normativas' / 'indice.json'
+VERSION_INDICE = 1
+
+# Líneas de cabecera/pie de página que se descartan
+CABECERAS_DOE = [r'NÚMERO \d+', r'(Lunes|Martes|Miércoles|Jueves|Viernes|Sábado|Domingo) \d+ de \w+ de \d{4}', r'\d{5}']
+CABECERAS_BOE = [r'BOLETÍN OFICIAL DEL ESTADO', r'LEGISLACIÓN CONSOLIDADA', r'Página \d+']
+
+NORMAS = {
+    'decreto': {
+        'nombre': 'Decreto 42/2025',
+        'archivo': 'Normativas/Decreto 42-2025_recortado.pdf',
+        'omitir': CABECERAS_DOE,
+    },
+    'rd': {
+        'nombre': 'R.D. 462/2002',
+        'archivo': 'Normativas/RD 462-2002_recortado.pdf',
+        'omitir': CABECERAS_BOE,
+    },
+}
+
+# Enlaces de las explicaciones del cálculo: regla → {norma: (fragmento, frase)}
+REGLAS = {
+    'manutencion': {
+        'decreto': ('art-12', 'catorce horas'),
+        'rd': ('art-12', 'catorce horas'),
+    },
+    'cena': {
+        'decreto': ('art-12', 'veintidós horas'),
+        'rd': ('art-12', 'veintidós horas'),
+    },
+    'alojamiento': {
+        'decreto': ('art-12', 'gastos de alojamiento'),
+        'rd': ('art-12', 'gastos de alojamiento'),
+    },
+    'extranjero': {
+        'decreto': ('art-12', 'frontera'),
+        'rd': ('art-12', 'frontera'),
+    },
+    'residenciaEventual': {
+        'decreto': ('art-14', '80 por 100'),
+        'rd': ('art-16', '80 por 100'),
+    },
+    'kilometraje': {
+        'decreto': ('anexo-iv', 'EUROS/KILÓMETROS'),
+        'rd': ('art-18', 'vehículos particulares'),
+    },
+    'cuantiasNacional': {
+        'decreto': ('anexo-i', ''),
+        'rd': ('anexo-ii', ''),
+    },
+    'cuantiasExtranjero': {
+        'decreto': ('anexo-ii', ''),
+        'rd': ('anexo-iii', ''),
+    },
+}
+
+# Encabezados que abren un fragmento
+ENCABEZADO = re.compile(
+    r'^(Artículo \d+(?: bis)?\.|ANEXO [IVXL]+\b|Anexo [IVXL]+\b|'
+    r'Disposición (?:adicional|transitoria|derogatoria|final) \w+\.)')
+
+PALABRAS_VACIAS = set('''
+a al algo algun alguna algunas alguno algunos ante antes aquel aquella aquellas aquellos
+asi aun cada como con contra cual cuales cuando de del desde donde dos durante e el ella
+ellas ellos en entre era es esa esas ese eso esos esta estas este esto estos fue ha han
+hasta la las le les lo los mas mediante mismo misma mismos mismas muy ni no nos o otra
+otras otro otros para pero por que quien se segun ser si sido sin sobre su sus tal tambien
+tanto todo todos toda todas tras un una unas uno unos y ya
+'''.split())
+
+NUMEROS = ['cero', 'uno', 'dos', 'tres', 'cuatro', 'cinco', 'seis', 'siete', 'ocho', 'nueve',
+           'diez', 'once', 'doce', 'trece', 'catorce', 'quince', 'dieciseis', 'diecisiete',
+           'dieciocho', 'diecinueve', 'veinte', 'veintiuno', 'veintidos', 'veintitres',
+           'veinticuatro']
+
+
+# =========================================================================
+# TEXTO
+# =========================================================================
+
+def plegar(texto: str) -> str:
+    """Minúsculas sin diacríticos (á → a, ñ → n, ü → u)."""
+    descompuesto = unicodedata.normalize('NFD', texto.lower())
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def terminos(texto: str) -> list[str]:
+    """Términos indexables: palabras y números plegados, sin palabras vacías."""
+    return [t for t in re.findall(r'[a-z0-9]+', plegar(texto))
+            if t not in PALABRAS_VACIAS and (len(t) > 1 or t.isdigit())]
+
+
+def limpiar_pagina(texto: str, omitir: list[str]) -> list[str]:
+    patrones = [re.compile(f'^{p}$') for p in omitir]
+    return [l for l in texto.split('\n') if not any(p.match(l) for p in patrones)]
+
+
+def unir_lineas(lineas: list[str]) -> str:
+    """
+    Reconstruye párrafos: une las líneas partidas por la maquetación y
+    las palabras cortadas con guion a final de línea.
+    """
+    parrafos = []
+    actual = ''
+    for linea in lineas:
+        if not actual:
+            actual = linea
+        elif actual.endswith('-') and linea[:1].islower():
+            actual = actual[:-1] + linea
+        else:
+            actual += ' ' + linea
+        if re.search(r'[.:;]$', linea):
+            parrafos.append(actual)
+            actual = ''
+    if actual:
+        parrafos.append(actual)
+    return '\n'.join(parrafos)
+
+
+def id_fragmento(titulo: str) -> str:
+    """'Artículo 12. Criterios...' → 'art-12'; 'ANEXO II' → 'anexo-ii'."""
+    m = re.match(r'Artículo (\d+(?: bis)?)', titulo)
+    if m:
+        return 'art-' + m.group(1).replace(' ', '-')
+    m = re.match(r'(?i)anexo ([ivxl]+)', titulo)
+    if m:
+        return 'anexo-' + m.group(1).lower()
+    cabeza = plegar(titulo.split('.')[0])
+    return re.sub(r'[^a-z0-9]+', '-', cabeza).strip('-')
+
+
+# =========================================================================
+# FRAGMENTOS
+# =========================================================================
+
+def fragmentos_norma(clave: str, norma: dict) -> list[dict]:
+    """
+    Divide el texto de una normativa por artículos, disposiciones y anexos.
+    El texto anterior al primer encabezado (los PDF están recortados) es el
+    fragmento 'inicio'.
+    """
+    fragmentos = []
+    actual = {'id': 'inicio', 'titulo': f"{norma['nombre']} (inicio)", 'pagina': 1, 'lineas': []}
+    for numero, texto in pdf_texto.paginas(ROOT / norma['archivo']):
+        lineas = limpiar_pagina(texto, norma['omitir'])
+        i = 0
+        while i < len(lineas):
+            linea = lineas[i]
+            if ENCABEZADO.match(linea):
+                fragmentos.append(actual)
+                # El título puede seguir en las líneas siguientes (hasta el punto)
+                titulo = linea
+                if titulo.startswith('Artículo') or titulo.startswith('Disposición'):
+                    while not titulo.endswith('.') and i + 1 < len(lineas) and len(titulo) < 300:
+                        i += 1
+                        titulo = titulo[:-1] + lineas[i] if titulo.endswith('-') else f'{titulo} {lineas[i]}'
+                elif i + 1 < len(lineas) and not ENCABEZADO.match(lineas[i + 1]):
+                    # ANEXO II + descripción en la línea siguiente
+                    i += 1
+                    titulo = f'{titulo}. {lineas[i]}'
+                actual = {'id': id_fragmento(titulo), 'titulo': titulo, 'pagina': numero, 'lineas': []}
+            else:
+                actual['lineas'].append(linea)
+            i += 1
+    fragmentos.append(actual)
+
+    resultado = []
+    for f in fragmentos:
+        if not f['lineas']:
+            continue
+        # Las tablas de los anexos conservan sus líneas
+        texto = '\n'.join(f['lineas']) if f['id'].startswith('anexo') else unir_lineas(f['lineas'])
+        resultado.append({'norma': clave, 'id': f['id'], 'titulo': f['titulo'],
+                          'pagina': f['pagina'], 'texto': texto})
+    return resultado
+
+
+# =========================================================================
+# ÍNDICE
+# =========================================================================
+
+def construir_indice() -> dict:
+    fragmentos = []
+    for clave, norma in NORMAS.items():
+        fragmentos.extend(fragmentos_norma(clave, norma))
+
+    indice = {}
+    longitudes = []
+    for i, f in enumerate(fragmentos):
+        frecuencias = {}
+        lista = terminos(f['titulo'] + '\n' + f['texto'])
+        for t in lista:
+            frecuencias[t] = frecuencias.get(t, 0) + 1
+        longitudes.append(len(lista))
+        for t, n in frecuencias.items():
+            indice.setdefault(t, []).extend((i, n))
+
+    posicion = {(f['norma'], f['id']): i for i, f in enumerate(fragmentos)}
+    reglas = {}
+    for regla, por_norma in REGLAS.items():
+        for norma, (id_frag, frase) in por_norma.items():
+            if (norma, id_frag) not in posicion:
+                raise ValueError(f'Regla {regla}: no se encuentra {id_frag} en {NORMAS[norma]["nombre"]}')
+            reglas.setdefault(regla, {})[norma] = [posicion[(norma, id_frag)], frase]
+
+    sinonimos = {str(n): [palabra] for n, palabra in enumerate(NUMEROS) if n > 1}
+    sinonimos['0'] = ['cero']
+    sinonimos = {k: [p for p in v if p in indice] for k, v in sinonimos.items()}
+
+    return {
+        'version': VERSION_INDICE,
+        'normas': {clave: {'nombre': n['nombre'], 'archivo': n['archivo']} for clave, n in NORMAS.items()},
+        'fragmentos': [[f['norma'], f['id'], f['titulo'], f['pagina'], f['texto']] for f in fragmentos],
+        'longitudes': longitudes,
+        'terminos': dict(sorted(indice.items())),
+        'reglas': reglas,
+        'sinonimos': {k: v for k, v in sinonimos.items() if v},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Índice de búsqueda de las normativas')
+    parser.add_argument('--salida', type=Path, default=SALIDA_POR_DEFECTO)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    try:
+        indice = construir_indice()
+    except (OSError, ValueError, pdf_texto.ErrorPDF) as e:
+        print(f'ERROR: {e}')
+        return 1
+    args.salida.parent.mkdir(parents=True, exist_ok=True)
+    contenido = json.dumps(indice, ensure_ascii=False, separators=(',', ':'))
+    args.salida.write_text(contenido, encoding='utf-8')
+
+    print(f'✅ Índice generado: {args.salida}')
+    print(f"   fragmentos: {len(indice['fragmentos'])}")
+    print(f"   términos: {len(indice['terminos'])}")
+    print(f"   tamaño: {len(contenido.encode('utf-8')) / 1024:.1f} KB")
+    print(f'   segundos: {time.perf_counter() - inicio:.2f}', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
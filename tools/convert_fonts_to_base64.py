@@ -93,17 +93,11 @@ def generate_vfs_js(fonts: dict[str, str]) -> str:
         "      bold: 'HelveticaNeue-Bold',",
         "      italics: 'HelveticaNeue-Italic',",
         "      bolditalics: 'HelveticaNeue-Bold'",
-        "    },",
-        "    // Roboto viene incluida en vfs_fonts.js del CDN",
-        "    'Roboto': {",
-        "      normal: 'Roboto-Regular.ttf',",
-        "      bold: 'Roboto-Medium.ttf',",
-        "      italics: 'Roboto-Italic.ttf',",
-        "      bolditalics: 'Roboto-MediumItalic.ttf'",
         "    }",
+        "    // Roboto (vfs_fonts.js) no se registra: las plantillas no la usan",
         "  });",
         "",
-        "  console.log('[pdfFonts] Fuentes Helvetica Neue y Roboto cargadas correctamente');",
+        "  console.log('[pdfFonts] Fuentes Helvetica Neue cargadas correctamente');",
         "",
         "})(typeof window !== 'undefined' ? window : this);",
         ""
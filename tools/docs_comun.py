@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+docs_comun.py
+=============
+Utilidades comunes de los generadores de documentación (tools/generate_*.py).
+
+Reúne el formato de tablas de python-docx que antes se copiaba en cada
+script y las tablas de tarifas, que se leen de assets/data/datos.json en vez
+de escribirse a mano: al cambiar una tarifa basta con volver a generar los
+documentos (tools/build_docs.py).
+
+Requisitos: python-docx
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Cm, Pt, RGBColor
+
+ROOT = Path(__file__).resolve().parents[1]
+DATOS_PATH = ROOT / 'assets' / 'data' / 'datos.json'
+DOCS_DIR = ROOT / 'docs'
+
+# Clave de dietasPorPais → nombre de la normativa en los documentos
+NORMATIVAS = (
+    ('decreto42_2025', 'Decreto 42/2025'),
+    ('rd462_2002', 'R.D. 462/2002'),
+)
+
+# Índice de España en dietasPorPais.paises
+INDICE_ESPANA = 0
+
+
+# =========================================================================
+# DATOS
+# =========================================================================
+
+@lru_cache(maxsize=1)
+def cargar_datos() -> dict:
+    """Contenido de datos.json (se lee una vez por proceso)."""
+    return json.loads(DATOS_PATH.read_text(encoding='utf-8'))
+
+
+def numero(valor: float, decimales: int = 2) -> str:
+    """Número con coma decimal y, al menos, `decimales` decimales (0,106 no se redondea)."""
+    texto = f'{valor:.6f}'.rstrip('0')
+    enteros, _, fraccion = texto.partition('.')
+    fraccion = fraccion.ljust(decimales, '0')
+    return f'{enteros},{fraccion}' if fraccion else enteros
+
+
+def euros(valor: float) -> str:
+    """Importe en formato español: 53,34 €"""
+    return f'{numero(valor)} €'
+
+
+def euros_km(valor: float) -> str:
+    """Tarifa por kilómetro: 0,26 €/km"""
+    return f'{numero(valor)} €/km'
+
+
+def tarifas_espana(datos: dict | None = None) -> dict:
+    """
+    Manutención, media manutención y alojamiento en España por normativa.
+
+    Returns:
+        {clave_normativa: {'nombre', 'manutencion', 'media', 'alojamiento'}}
+    """
+    datos = datos or cargar_datos()
+    dietas = datos['dietasPorPais']
+    tarifas = {}
+    for clave, nombre in NORMATIVAS:
+        manutencion = dietas[clave]['manutencion'][INDICE_ESPANA]
+        tarifas[clave] = {
+            'nombre': nombre,
+            'manutencion': manutencion,
+            'media': round(manutencion / 2, 2),
+            'alojamiento': dietas[clave]['alojamiento'][INDICE_ESPANA],
+        }
+    return tarifas
+
+
+def limites_irpf(datos: dict | None = None) -> dict:
+    """Límites exentos de IRPF: {'esp': (sin pernocta, con pernocta), 'ext': (...)}"""
+    datos = datos or cargar_datos()
+    return {clave: tuple(valores) for clave, valores in datos['limitesIRPF'].items()}
+
+
+def km_tarifas(datos: dict | None = None) -> dict:
+    """Tarifas por km: {'coche': 0.26, 'motocicleta': 0.106}"""
+    datos = datos or cargar_datos()
+    return dict(datos['kmTarifas'])
+
+
+# =========================================================================
+# FORMATO
+# =========================================================================
+
+def set_cell_shading(cell, color):
+    """Aplica color de fondo a una celda."""
+    shading = OxmlElement('w:shd')
+    shading.set(qn('w:fill'), color)
+    cell._tc.get_or_add_tcPr().append(shading)
+
+
+def add_code_block(doc, code_text):
+    """Añade un bloque de código con formato monoespaciado."""
+    p = doc.add_paragraph()
+    p.paragraph_format.left_indent = Cm(1)
+    run = p.add_run(code_text)
+    run.font.name = 'Consolas'
+    run.font.size = Pt(9)
+    run.font.color.rgb = RGBColor(40, 40, 40)
+    return p
+
+
+def configurar_margenes(doc):
+    """Márgenes comunes de los manuales (2 cm arriba/abajo, 2,5 cm laterales)."""
+    for section in doc.sections:
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        section.left_margin = Cm(2.5)
+        section.right_margin = Cm(2.5)
+
+
+def add_tabla(doc, cabecera, filas, color='D9EAD3'):
+    """
+    Añade una tabla con la cabecera sombreada y en negrita.
+
+    Args:
+        doc: Documento de python-docx
+        cabecera: Textos de la primera fila
+        filas: Lista de filas (textos)
+        color: Color de fondo de la cabecera
+    """
+    table = doc.add_table(rows=len(filas) + 1, cols=len(cabecera))
+    table.style = 'Table Grid'
+    for cell, texto in zip(table.rows[0].cells, cabecera):
+        cell.text = texto
+        set_cell_shading(cell, color)
+        cell.paragraphs[0].runs[0].bold = True
+    for row, fila in zip(table.rows[1:], filas):
+        for cell, texto in zip(row.cells, fila):
+            cell.text = texto
+    return table
+
+
+# =========================================================================
+# TABLAS DE TARIFAS (datos.json)
+# =========================================================================
+
+def tabla_manutencion_espana(doc, datos=None):
+    """Normativa | Importe diario | Media manutención (España)."""
+    filas = [(t['nombre'], euros(t['manutencion']), euros(t['media']))
+             for t in tarifas_espana(datos).values()]
+    return add_tabla(doc, ('Normativa', 'Importe diario', 'Media manutención'), filas)
+
+
+def tabla_alojamiento_espana(doc, datos=None):
+    """Normativa | Máximo por noche (España)."""
+    filas = [(t['nombre'], euros(t['alojamiento'])) for t in tarifas_espana(datos).values()]
+    return add_tabla(doc, ('Normativa', 'Máximo por noche'), filas)
+
+
+def tabla_km(doc, datos=None):
+    """Tipo de vehículo | Tarifa por km."""
+    nombres = {'coche': 'Coche', 'motocicleta': 'Motocicleta'}
+    filas = [(nombres.get(tipo, tipo.capitalize()), euros_km(tarifa))
+             for tipo, tarifa in km_tarifas(datos).items()]
+    return add_tabla(doc, ('Tipo de vehículo', 'Tarifa por km'), filas)
+
+
+def tabla_limites_irpf(doc, datos=None, color='CFE2F3'):
+    """Territorio | Sin pernocta | Con pernocta."""
+    nombres = {'esp': 'España', 'ext': 'Extranjero'}
+    filas = [(nombres.get(clave, clave), euros(sin), euros(con))
+             for clave, (sin, con) in limites_irpf(datos).items()]
+    return add_tabla(doc, ('Territorio', 'Sin pernocta', 'Con pernocta'), filas, color)
+
+
+def tabla_precios_referencia(doc, datos=None):
+    """Anexo: manutención, alojamiento y km (coche) por normativa en España."""
+    tarifas = tarifas_espana(datos)
+    coche = euros_km(km_tarifas(datos)['coche'])
+    cabecera = ('Concepto', *(t['nombre'] for t in tarifas.values()))
+    filas = [
+        ('Manutención diaria', *(euros(t['manutencion']) for t in tarifas.values())),
+        ('Alojamiento máximo/noche', *(euros(t['alojamiento']) for t in tarifas.values())),
+        ('Kilometraje (coche)', *(coche for _ in tarifas)),
+    ]
+    return add_tabla(doc, cabecera, filas)
@@ -1,34 +1,264 @@
-# small script to extract text from a .docx (reads word/document.xml inside the .docx zip)
-import zipfile
+#!/usr/bin/env python3
+"""
+extract_docx_text.py
+====================
+Extracción de texto de .docx y .pdf, como biblioteca y como orden de consola.
+
+Los .docx se leen en streaming: word/document.xml, los encabezados
+(word/header*.xml) y los pies (word/footer*.xml) se recorren con iterparse
+directamente desde el zip, y cada párrafo se libera al emitirlo, así que la
+memoria no crece con el tamaño del documento. Los párrafos dentro de tablas
+se emiten como celdas con su posición (tabla, fila, columna). Los .pdf se
+leen página a página con pdf_texto (sin dependencias externas).
+
+Cada bloque de texto es un registro JSON (una línea por registro):
+    {"archivo": "docs/x.docx", "parte": "document", "tipo": "parrafo", "texto": "..."}
+    {"archivo": "docs/x.docx", "parte": "document", "tipo": "celda", "tabla": [0, 2, 1], "texto": "..."}
+    {"archivo": "docs/x.docx", "parte": "header1", "tipo": "parrafo", "texto": "..."}
+    {"archivo": "Normativas/x.pdf", "parte": "pagina", "pagina": 3, "tipo": "pagina", "texto": "..."}
+    {"archivo": "roto.docx", "error": "..."}
+
+Las rutas pueden ser archivos, carpetas (se recorren enteras) o patrones
+glob. Con varios archivos, se reparten entre varios procesos.
+
+Uso:
+    python tools/extract_docx_text.py RUTA [RUTA ...] [--salida texto.jsonl]
+        [--procesos N] [--texto]
+
+Ejemplos:
+    python tools/extract_docx_text.py docs Normativas > corpus.jsonl
+    python tools/extract_docx_text.py "docs/*.docx" --texto
+    python tools/extract_docx_text.py docs/Calculo_de_desplazamientos.docx --salida calculo.jsonl
+
+Uso como biblioteca:
+    from extract_docx_text import extraer, extraer_lote
+    for registro in extraer_lote(['docs', 'Normativas']):
+        ...
+"""
+
+import argparse
+import glob
+import json
+import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
-if len(sys.argv) < 2:
-    print('Usage: python extract_docx_text.py file.docx [out.txt]')
-    sys.exit(2)
-
-infile = sys.argv[1]
-outfile = sys.argv[2] if len(sys.argv) > 2 else infile + '.txt'
-
-with zipfile.ZipFile(infile) as z:
-    if 'word/document.xml' not in z.namelist():
-        print('document.xml not found inside .docx')
-        sys.exit(1)
-    data = z.read('word/document.xml')
-
-# Parse XML and extract text nodes
-root = ET.fromstring(data)
-# Word namespace often used
-ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-texts = []
-for para in root.findall('.//w:p', ns):
-    parts = []
-    for node in para.findall('.//w:t', ns):
-        parts.append(node.text or '')
-    if parts:
-        texts.append(''.join(parts))
-
-with open(outfile, 'w', encoding='utf-8') as f:
-    f.write('\n\n'.join(texts))
-
-print('Extracted to', outfile)
+import pdf_texto
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+P, T, TBL, TR, TC = W + 'p', W + 't', W + 'tbl', W + 'tr', W + 'tc'
+# Elementos que equivalen a un carácter dentro de un párrafo
+CARACTERES = {W + 'tab': '\t', W + 'br': '\n', W + 'cr': '\n', W + 'noBreakHyphen': '-'}
+# Raíz de los bloques de texto en document.xml, header*.xml y footer*.xml
+CONTENEDORES = (W + 'body', W + 'hdr', W + 'ftr')
+
+EXTENSIONES = ('.docx', '.pdf')
+
+
+# =========================================================================
+# DOCX
+# =========================================================================
+
+def _orden_parte(nombre: str):
+    """document.xml primero; después encabezados y pies por número."""
+    m = re.match(r'word/(document|header|footer)(\d*)\.xml$', nombre)
+    return ({'document': 0, 'header': 1, 'footer': 2}[m.group(1)], int(m.group(2) or 0))
+
+
+def partes_docx(z: zipfile.ZipFile) -> list[str]:
+    """Partes con texto del .docx: cuerpo, encabezados y pies."""
+    nombres = [n for n in z.namelist() if re.match(r'word/(document|header\d*|footer\d*)\.xml$', n)]
+    return sorted(nombres, key=_orden_parte)
+
+
+def iter_parte(flujo, archivo: str, parte: str):
+    """
+    Recorre una parte XML de un .docx con iterparse.
+
+    Cada párrafo se emite al cerrarse. Los bloques del cuerpo (párrafos,
+    tablas...) se eliminan del árbol al terminar y las filas de tabla se
+    vacían, de modo que solo se mantiene en memoria el bloque abierto.
+
+    Yields:
+        Registros {'archivo', 'parte', 'tipo', 'texto'[, 'tabla']}
+    """
+    textos = []        # un buffer por párrafo abierto (pueden anidarse en cuadros de texto)
+    tablas = []        # [índice de tabla, fila, columna] por tabla abierta
+    n_tablas = 0
+    profundidad = 0
+    contenedor = None  # w:body, w:hdr o w:ftr
+    nivel_bloques = -1
+
+    for evento, elem in ET.iterparse(flujo, events=('start', 'end')):
+        tag = elem.tag
+        if evento == 'start':
+            profundidad += 1
+            if tag == P:
+                textos.append([])
+            elif tag == TC:
+                if tablas:
+                    tablas[-1][2] += 1
+            elif tag == TR:
+                if tablas:
+                    tablas[-1][1] += 1
+                    tablas[-1][2] = -1
+            elif tag == TBL:
+                tablas.append([n_tablas, -1, -1])
+                n_tablas += 1
+            elif tag in CONTENEDORES and contenedor is None:
+                contenedor = elem
+                nivel_bloques = profundidad + 1
+            continue
+
+        if tag == T:
+            if textos:
+                textos[-1].append(elem.text or '')
+        elif tag == P:
+            texto = ''.join(textos.pop()).strip()
+            if texto:
+                registro = {'archivo': archivo, 'parte': parte, 'tipo': 'celda' if tablas else 'parrafo'}
+                if tablas:
+                    registro['tabla'] = list(tablas[-1])
+                registro['texto'] = texto
+                yield registro
+        elif tag in CARACTERES:
+            if textos:
+                textos[-1].append(CARACTERES[tag])
+        elif tag == TR:
+            elem.clear()
+        elif tag == TBL:
+            tablas.pop()
+
+        # Liberar los bloques del cuerpo ya procesados
+        if profundidad == nivel_bloques:
+            elem.clear()
+            contenedor.remove(elem)
+        profundidad -= 1
+
+
+def iter_docx(ruta):
+    """Registros de texto de un .docx (cuerpo, tablas, encabezados y pies)."""
+    archivo = str(ruta)
+    with zipfile.ZipFile(ruta) as z:
+        partes = partes_docx(z)
+        if not partes:
+            raise ValueError('word/document.xml no encontrado')
+        for nombre in partes:
+            parte = Path(nombre).stem
+            with z.open(nombre) as flujo:
+                yield from iter_parte(flujo, archivo, parte)
+
+
+# =========================================================================
+# PDF
+# =========================================================================
+
+def iter_pdf(ruta):
+    """Registros de texto de un .pdf, uno por página."""
+    archivo = str(ruta)
+    for numero, texto in pdf_texto.paginas(ruta):
+        if texto:
+            yield {'archivo': archivo, 'parte': 'pagina', 'pagina': numero, 'tipo': 'pagina', 'texto': texto}
+
+
+# =========================================================================
+# LOTES
+# =========================================================================
+
+def extraer(ruta):
+    """Registros de texto de un archivo .docx o .pdf."""
+    extension = Path(ruta).suffix.lower()
+    if extension == '.docx':
+        return iter_docx(ruta)
+    if extension == '.pdf':
+        return iter_pdf(ruta)
+    raise ValueError(f'Extensión no soportada: {extension}')
+
+
+def expandir_rutas(rutas) -> list[Path]:
+    """
+    Archivos .docx/.pdf de una lista de archivos, carpetas y patrones glob,
+    sin repetir y en orden. Se omiten los temporales de Word (~$x.docx).
+    """
+    vistos = {}
+    for ruta in rutas:
+        ruta = str(ruta)
+        if any(c in ruta for c in '*?['):
+            candidatos = [Path(r) for r in sorted(glob.glob(ruta, recursive=True))]
+        elif Path(ruta).is_dir():
+            candidatos = sorted(p for p in Path(ruta).rglob('*') if p.suffix.lower() in EXTENSIONES)
+        else:
+            # Un archivo explícito se incluye siempre: si no existe o no es
+            # .docx/.pdf, su error sale como registro
+            vistos.setdefault(Path(ruta).resolve(), Path(ruta))
+            continue
+        for p in candidatos:
+            if p.suffix.lower() in EXTENSIONES and not p.name.startswith('~$') and p.is_file():
+                vistos.setdefault(p.resolve(), p)
+    return list(vistos.values())
+
+
+def _extraer_archivo(ruta) -> list[dict]:
+    """Registros de un archivo (en un proceso hijo); los errores van como registro."""
+    try:
+        return list(extraer(ruta))
+    except (OSError, ValueError, zipfile.BadZipFile, ET.ParseError, pdf_texto.ErrorPDF) as e:
+        return [{'archivo': str(ruta), 'error': f'{type(e).__name__}: {e}'}]
+
+
+def extraer_lote(rutas, procesos: int | None = None):
+    """
+    Extrae el texto de varios archivos, carpetas o patrones.
+
+    Los archivos se reparten entre procesos (procesos=1 los lee en este
+    proceso, en streaming). Los registros salen en el orden de los archivos.
+
+    Yields:
+        Registros de texto (o {'archivo', 'error'} por archivo ilegible)
+    """
+    archivos = expandir_rutas(rutas)
+    if len(archivos) > 1 and procesos != 1:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            for registros in ejecutor.map(_extraer_archivo, archivos):
+                yield from registros
+        return
+    for ruta in archivos:
+        try:
+            yield from extraer(ruta)
+        except (OSError, ValueError, zipfile.BadZipFile, ET.ParseError, pdf_texto.ErrorPDF) as e:
+            yield {'archivo': str(ruta), 'error': f'{type(e).__name__}: {e}'}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Extrae el texto de .docx y .pdf en JSON lines')
+    parser.add_argument('rutas', nargs='+', help='Archivos, carpetas o patrones glob')
+    parser.add_argument('--salida', type=Path, help='Archivo de salida (por defecto, la consola)')
+    parser.add_argument('--procesos', type=int, default=None,
+                        help='Procesos en paralelo (por defecto, uno por CPU)')
+    parser.add_argument('--texto', action='store_true',
+                        help='Texto plano (un bloque por párrafo) en lugar de JSON lines')
+    args = parser.parse_args()
+
+    salida = args.salida.open('w', encoding='utf-8') if args.salida else sys.stdout
+    errores = 0
+    try:
+        for registro in extraer_lote(args.rutas, args.procesos):
+            if 'error' in registro:
+                errores += 1
+                print(f"ERROR: {registro['archivo']}: {registro['error']}", file=sys.stderr)
+                continue
+            if args.texto:
+                salida.write(registro['texto'] + '\n\n')
+            else:
+                salida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+    finally:
+        if args.salida:
+            salida.close()
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -9,26 +9,23 @@ from docx.shared import Pt, Inches, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
 import os
 
-def set_cell_shading(cell, color):
-    """Aplica color de fondo a una celda."""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
+from docs_comun import (
+    DOCS_DIR, cargar_datos, configurar_margenes, euros, km_tarifas, set_cell_shading,
+    tabla_alojamiento_espana, tabla_km, tabla_limites_irpf, tabla_manutencion_espana,
+    tabla_precios_referencia, tarifas_espana,
+)
+
+def create_manual(output_path=None):
+    # Tarifas de los ejemplos y tablas: las de datos.json
+    datos = cargar_datos()
+    decreto = tarifas_espana(datos)['decreto42_2025']['manutencion']
+    coche = km_tarifas(datos)['coche']
 
-def create_manual():
     doc = Document()
     
-    # Configurar márgenes
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Cm(2)
-        section.bottom_margin = Cm(2)
-        section.left_margin = Cm(2.5)
-        section.right_margin = Cm(2.5)
+    configurar_margenes(doc)
     
     # =========================================================================
     # TÍTULO PRINCIPAL
@@ -128,26 +125,7 @@ def create_manual():
     p = doc.add_paragraph()
     p.add_run('Para desplazamientos nacionales (España):')
     
-    table = doc.add_table(rows=3, cols=3)
-    table.style = 'Table Grid'
-    
-    hdr = table.rows[0].cells
-    hdr[0].text = 'Normativa'
-    hdr[1].text = 'Importe diario'
-    hdr[2].text = 'Media manutención'
-    for cell in hdr:
-        set_cell_shading(cell, 'D9EAD3')
-        cell.paragraphs[0].runs[0].bold = True
-    
-    row1 = table.rows[1].cells
-    row1[0].text = 'Decreto 42/2025'
-    row1[1].text = '53,34 €'
-    row1[2].text = '26,67 €'
-    
-    row2 = table.rows[2].cells
-    row2[0].text = 'R.D. 462/2002'
-    row2[1].text = '37,40 €'
-    row2[2].text = '18,70 €'
+    tabla_manutencion_espana(doc, datos)
     
     p = doc.add_paragraph()
     p.add_run('Nota: ').bold = True
@@ -276,7 +254,7 @@ def create_manual():
         'Día 16 (intermedio): → 1 manutención',
         'Día 17 (regreso a las 19:00): Regresa entre 14:00 y 22:00 → 0,5 manutención',
         'Total: 1 + 1 + 0,5 = 2,5 unidades',
-        'Importe: 2,5 × 53,34 € = 133,35 €'
+        f'Importe: 2,5 × {euros(decreto)} = {euros(round(2.5 * decreto, 2))}'
     ]
     
     for b in bullets:
@@ -356,20 +334,7 @@ def create_manual():
     p = doc.add_paragraph()
     p.add_run('Límites para España:')
     
-    table = doc.add_table(rows=3, cols=2)
-    table.style = 'Table Grid'
-    
-    hdr = table.rows[0].cells
-    hdr[0].text = 'Normativa'
-    hdr[1].text = 'Máximo por noche'
-    for cell in hdr:
-        set_cell_shading(cell, 'D9EAD3')
-        cell.paragraphs[0].runs[0].bold = True
-    
-    table.rows[1].cells[0].text = 'Decreto 42/2025'
-    table.rows[1].cells[1].text = '102,56 €'
-    table.rows[2].cells[0].text = 'R.D. 462/2002'
-    table.rows[2].cells[1].text = '65,97 €'
+    tabla_alojamiento_espana(doc, datos)
     
     doc.add_paragraph()
     
@@ -395,20 +360,7 @@ def create_manual():
     
     doc.add_heading('4.1. Tarifas por kilómetro', level=2)
     
-    table = doc.add_table(rows=3, cols=2)
-    table.style = 'Table Grid'
-    
-    hdr = table.rows[0].cells
-    hdr[0].text = 'Tipo de vehículo'
-    hdr[1].text = 'Tarifa por km'
-    for cell in hdr:
-        set_cell_shading(cell, 'D9EAD3')
-        cell.paragraphs[0].runs[0].bold = True
-    
-    table.rows[1].cells[0].text = 'Coche'
-    table.rows[1].cells[1].text = '0,26 €/km'
-    table.rows[2].cells[0].text = 'Motocicleta'
-    table.rows[2].cells[1].text = '0,106 €/km'
+    tabla_km(doc, datos)
     
     doc.add_paragraph()
     
@@ -423,7 +375,7 @@ def create_manual():
     # Ejemplo
     p = doc.add_paragraph()
     p.add_run('Ejemplo: ').bold = True
-    p.add_run('240 km en coche = 240 × 0,26 € = 62,40 €')
+    p.add_run(f'240 km en coche = 240 × {euros(coche)} = {euros(round(240 * coche, 2))}')
     
     doc.add_paragraph()
     
@@ -530,24 +482,7 @@ def create_manual():
     
     doc.add_heading('7.1. Límites exentos diarios', level=2)
     
-    table = doc.add_table(rows=3, cols=3)
-    table.style = 'Table Grid'
-    
-    hdr = table.rows[0].cells
-    hdr[0].text = 'Territorio'
-    hdr[1].text = 'Sin pernocta'
-    hdr[2].text = 'Con pernocta'
-    for cell in hdr:
-        set_cell_shading(cell, 'CFE2F3')
-        cell.paragraphs[0].runs[0].bold = True
-    
-    table.rows[1].cells[0].text = 'España'
-    table.rows[1].cells[1].text = '26,67 €'
-    table.rows[1].cells[2].text = '53,34 €'
-    
-    table.rows[2].cells[0].text = 'Extranjero'
-    table.rows[2].cells[1].text = '48,08 €'
-    table.rows[2].cells[2].text = '91,35 €'
+    tabla_limites_irpf(doc, datos)
     
     doc.add_paragraph()
     
@@ -602,28 +537,7 @@ def create_manual():
     doc.add_page_break()
     doc.add_heading('Anexo: Precios de referencia (España)', level=1)
     
-    table = doc.add_table(rows=4, cols=3)
-    table.style = 'Table Grid'
-    
-    hdr = table.rows[0].cells
-    hdr[0].text = 'Concepto'
-    hdr[1].text = 'Decreto 42/2025'
-    hdr[2].text = 'R.D. 462/2002'
-    for cell in hdr:
-        set_cell_shading(cell, 'D9EAD3')
-        cell.paragraphs[0].runs[0].bold = True
-    
-    table.rows[1].cells[0].text = 'Manutención diaria'
-    table.rows[1].cells[1].text = '53,34 €'
-    table.rows[1].cells[2].text = '37,40 €'
-    
-    table.rows[2].cells[0].text = 'Alojamiento máximo/noche'
-    table.rows[2].cells[1].text = '102,56 €'
-    table.rows[2].cells[2].text = '65,97 €'
-    
-    table.rows[3].cells[0].text = 'Kilometraje (coche)'
-    table.rows[3].cells[1].text = '0,26 €/km'
-    table.rows[3].cells[2].text = '0,26 €/km'
+    tabla_precios_referencia(doc, datos)
     
     doc.add_paragraph()
     
@@ -634,7 +548,7 @@ def create_manual():
     # =========================================================================
     # GUARDAR DOCUMENTO
     # =========================================================================
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'Calculo_de_desplazamientos.docx')
+    output_path = output_path or os.path.join(DOCS_DIR, 'Calculo_de_desplazamientos.docx')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     doc.save(output_path)
     print(f'Documento generado: {output_path}')
@@ -9,35 +9,21 @@ from docx import Document
 from docx.shared import Pt, Inches, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
 import os
 
-def set_cell_shading(cell, color):
-    """Aplica color de fondo a una celda."""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
+from docs_comun import (
+    DOCS_DIR, add_code_block, cargar_datos, configurar_margenes, km_tarifas, limites_irpf,
+    set_cell_shading,
+)
 
-def add_code_block(doc, code_text):
-    """Añade un bloque de código con formato monoespaciado."""
-    p = doc.add_paragraph()
-    p.paragraph_format.left_indent = Cm(1)
-    run = p.add_run(code_text)
-    run.font.name = 'Consolas'
-    run.font.size = Pt(9)
-    run.font.color.rgb = RGBColor(40, 40, 40)
-    return p
+def create_document(output_path=None):
+    datos = cargar_datos()
+    km = km_tarifas(datos)
+    irpf = limites_irpf(datos)
 
-def create_document():
     doc = Document()
     
-    # Configurar márgenes
-    for section in doc.sections:
-        section.top_margin = Cm(2)
-        section.bottom_margin = Cm(2)
-        section.left_margin = Cm(2.5)
-        section.right_margin = Cm(2.5)
+    configurar_margenes(doc)
     
     # =========================================================================
     # TÍTULO
@@ -595,8 +581,8 @@ Extranjero: > 3 meses  → Factor 0.8 (80%)''')
     
     p = doc.add_paragraph('Los límites exentos se leen de datos.json → limitesIRPF:')
     
-    add_code_block(doc, '''España:     [26.67, 53.34]  (sin pernocta, con pernocta)
-Extranjero: [48.08, 91.35]  (sin pernocta, con pernocta)
+    add_code_block(doc, f'''España:     {list(irpf['esp'])}  (sin pernocta, con pernocta)
+Extranjero: {list(irpf['ext'])}  (sin pernocta, con pernocta)
 
 IRPF_día = máx(0, manutención_día - límite_exento)''')
     
@@ -624,7 +610,7 @@ IRPF_día = máx(0, manutención_día - límite_exento)''')
     
     data = [
         ('tiposProyecto', 'Lista de tipos de proyecto con sus códigos'),
-        ('kmTarifas', 'Tarifas por km: coche (0.26), motocicleta (0.106)'),
+        ('kmTarifas', 'Tarifas por km: ' + ', '.join(f'{tipo} ({tarifa})' for tipo, tarifa in km.items())),
         ('dietasPorPais', 'Precios de manutención y alojamiento por país'),
         ('limitesIRPF', 'Límites exentos para España y extranjero'),
         ('normativasPorTipoProyecto', 'Qué normativa aplica a cada tipo')
@@ -824,7 +810,7 @@ Para obtener precio de manutención de Francia (índice 35) con Decreto:
     # =========================================================================
     # GUARDAR
     # =========================================================================
-    output_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'Logica_interna_calculo_desplazamientos.docx')
+    output_path = output_path or os.path.join(DOCS_DIR, 'Logica_interna_calculo_desplazamientos.docx')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     doc.save(output_path)
     print(f'Documento generado: {output_path}')
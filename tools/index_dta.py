@@ -0,0 +1,852 @@
+#!/usr/bin/env python3
+"""
+index_dta.py
+============
+Índice local (SQLite) de un archivo de liquidaciones .dta.
+
+Los .dta son el JSON que genera serializacionDatos.recopilarTodo(). Este
+script los recorre, extrae beneficiario, proyecto, desplazamientos (fechas y
+país) y resultado, y los guarda en una base SQLite con índices para consultar
+en milisegundos sin abrir los archivos uno a uno en el navegador.
+
+La actualización es incremental: un archivo con el mismo tamaño y fecha de
+modificación no se vuelve a leer, y uno cuyo contenido (SHA-256) no ha
+cambiado no se vuelve a analizar. El análisis de los archivos nuevos o
+modificados se reparte entre varios procesos.
+
+Uso:
+    python tools/index_dta.py indexar RUTA_ARCHIVO [--bd indice.sqlite] [--procesos N]
+    python tools/index_dta.py buscar [--bd indice.sqlite] [--dni X] [--nombre X]
+        [--referencia X] [--tipo PEI] [--pais Japón] [--desde 01/07/25]
+        [--hasta 30/09/25] [--limite 100]
+    python tools/index_dta.py solapes [--bd indice.sqlite] [--dni X] [--mismo-archivo]
+    python tools/index_dta.py intervalos [--bd indice.sqlite] [--dni X] > historial.json
+    python tools/index_dta.py resumen [--bd indice.sqlite] [--desde 2025-01] [--hasta 2025-12]
+        [--tipo PEI] [--organica X] [--exportar resumen.csv|resumen.parquet]
+
+Ejemplos:
+    python tools/index_dta.py indexar ~/liquidaciones
+    python tools/index_dta.py buscar --dni 03864429S
+    python tools/index_dta.py buscar --pais japon --tipo PEI --desde 2025-07-01 --hasta 2025-09-30
+    python tools/index_dta.py buscar --referencia GR248959
+    python tools/index_dta.py solapes
+
+`solapes` es la auditoría por lotes de desplazamientos solapados del mismo
+beneficiario en liquidaciones distintas. `intervalos` exporta los intervalos
+en el formato que acepta solapesDesp.cargarHistorial() en el navegador.
+
+`resumen` da los totales mensuales por tipo de proyecto, normativa, orgánica y
+concepto. Se mantienen materializados: al indexar, cada archivo nuevo,
+modificado o eliminado solo resta/suma sus propias aportaciones, sin
+recorrer el resto del archivo. La exportación a Parquet requiere pyarrow
+(pip install pyarrow); sin él, CSV.
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Configuración
+BD_POR_DEFECTO = "indice_dta.sqlite"
+EXTENSION = ".dta"
+VERSION_INDICE = 3
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor TEXT
+);
+
+CREATE TABLE IF NOT EXISTS archivos (
+    id INTEGER PRIMARY KEY,
+    ruta TEXT NOT NULL UNIQUE,
+    hash TEXT NOT NULL,
+    tamano INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    error TEXT,
+    version_esquema TEXT,
+    guardado_el TEXT,
+    tipo_liquidacion TEXT,
+    dni TEXT,
+    nombre TEXT,
+    nombre_norm TEXT,
+    entidad TEXT,
+    tipo_proyecto TEXT,
+    normativa TEXT,
+    responsable TEXT,
+    organica TEXT,
+    referencia TEXT,
+    fecha_primera TEXT,
+    fecha_ultima TEXT,
+    total_liquidacion REAL,
+    irpf_total REAL
+);
+
+CREATE TABLE IF NOT EXISTS desplazamientos (
+    archivo_id INTEGER NOT NULL REFERENCES archivos(id) ON DELETE CASCADE,
+    orden INTEGER NOT NULL,
+    fecha_ida TEXT,
+    fecha_regreso TEXT,
+    inicio TEXT,
+    fin TEXT,
+    origen TEXT,
+    destino TEXT,
+    pais TEXT,
+    pais_norm TEXT,
+    importe_total REAL
+);
+
+-- Importes que aporta cada archivo a cada cubo (mes × tipo × normativa ×
+-- orgánica × concepto), ya repartidos entre las líneas de imputación
+CREATE TABLE IF NOT EXISTS aportaciones (
+    archivo_id INTEGER NOT NULL REFERENCES archivos(id) ON DELETE CASCADE,
+    mes TEXT NOT NULL,
+    tipo_proyecto TEXT NOT NULL,
+    normativa TEXT NOT NULL,
+    organica TEXT NOT NULL,
+    concepto TEXT NOT NULL,
+    importe REAL NOT NULL
+);
+
+-- Agregados materializados: suma de las aportaciones de cada cubo
+CREATE TABLE IF NOT EXISTS agregados (
+    mes TEXT NOT NULL,
+    tipo_proyecto TEXT NOT NULL,
+    normativa TEXT NOT NULL,
+    organica TEXT NOT NULL,
+    concepto TEXT NOT NULL,
+    importe REAL NOT NULL,
+    liquidaciones INTEGER NOT NULL,
+    PRIMARY KEY (mes, tipo_proyecto, normativa, organica, concepto)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_archivos_hash ON archivos(hash);
+CREATE INDEX IF NOT EXISTS idx_archivos_dni ON archivos(dni);
+CREATE INDEX IF NOT EXISTS idx_archivos_referencia ON archivos(referencia);
+CREATE INDEX IF NOT EXISTS idx_archivos_nombre ON archivos(nombre_norm);
+CREATE INDEX IF NOT EXISTS idx_archivos_tipo_fecha ON archivos(tipo_proyecto, fecha_primera);
+CREATE INDEX IF NOT EXISTS idx_desp_pais_fecha ON desplazamientos(pais_norm, fecha_ida);
+CREATE INDEX IF NOT EXISTS idx_desp_fecha ON desplazamientos(fecha_ida);
+CREATE INDEX IF NOT EXISTS idx_desp_archivo ON desplazamientos(archivo_id);
+CREATE INDEX IF NOT EXISTS idx_aportaciones_archivo ON aportaciones(archivo_id);
+"""
+
+# Hora por defecto cuando la ficha no la indica: se cubre el día completo
+HORA_INICIO_DIA = "00:00"
+HORA_FIN_DIA = "23:59"
+
+# Conceptos de los agregados mensuales (orden de las columnas exportadas)
+CONCEPTOS = ("manutencion", "alojamiento", "km", "otros_gastos", "irpf_sujeto", "total", "liquidacion")
+
+COLUMNAS_ARCHIVO = (
+    "version_esquema", "guardado_el", "tipo_liquidacion", "dni", "nombre",
+    "nombre_norm", "entidad", "tipo_proyecto", "normativa", "responsable",
+    "organica", "referencia", "fecha_primera", "fecha_ultima",
+    "total_liquidacion", "irpf_total",
+)
+
+
+# =============================================================================
+# NORMALIZACIÓN
+# =============================================================================
+
+def normalizar_texto(texto) -> str:
+    """Minúsculas y sin acentos (misma idea que utils.normalizarTexto en JS)."""
+    if not texto:
+        return ""
+    descompuesto = unicodedata.normalize("NFD", str(texto))
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).lower().strip()
+
+
+def normalizar_dni(dni) -> str:
+    """DNI/NIE en mayúsculas y sin separadores."""
+    return "".join(c for c in str(dni or "") if c.isalnum()).upper()
+
+
+def fecha_iso(fecha) -> str | None:
+    """
+    Convierte una fecha del formulario (dd/mm/aa o dd/mm/aaaa) o ISO
+    (aaaa-mm-dd) a aaaa-mm-dd. Devuelve None si no se reconoce.
+    """
+    if not fecha:
+        return None
+    texto = str(fecha).strip()
+    if len(texto) >= 10 and texto[4] == "-" and texto[7] == "-":
+        return texto[:10]
+    partes = texto.split("/")
+    if len(partes) != 3:
+        return None
+    try:
+        dia, mes, anio = (int(p) for p in partes)
+    except ValueError:
+        return None
+    if anio < 100:
+        anio += 2000
+    if not (1 <= mes <= 12 and 1 <= dia <= 31):
+        return None
+    return f"{anio:04d}-{mes:02d}-{dia:02d}"
+
+
+def hora_hhmm(hora, por_defecto: str) -> str:
+    """Hora del formulario (h:mm o hh:mm) a hh:mm; `por_defecto` si no es válida."""
+    partes = str(hora or "").strip().split(":")
+    if len(partes) != 2:
+        return por_defecto
+    try:
+        h, m = int(partes[0]), int(partes[1])
+    except ValueError:
+        return por_defecto
+    if not (0 <= h <= 23 and 0 <= m <= 59):
+        return por_defecto
+    return f"{h:02d}:{m:02d}"
+
+
+def importe(valor) -> float | None:
+    """Número JSON o texto con formato español ('1.234,56 €')."""
+    if valor is None or valor == "":
+        return None
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    texto = "".join(c for c in str(valor) if c.isdigit() or c in ",.-")
+    if not texto:
+        return None
+    texto = texto.replace(".", "").replace(",", ".")
+    try:
+        return float(texto)
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# ANÁLISIS DE UN ARCHIVO (se ejecuta en los procesos de trabajo)
+# =============================================================================
+
+def extraer_registro(datos: dict) -> tuple[dict, list[tuple]]:
+    """
+    Extrae del JSON de un .dta la fila de `archivos` y las de `desplazamientos`.
+    """
+    beneficiario = datos.get("beneficiario") or {}
+    proyecto = datos.get("proyecto") or {}
+    resultado = datos.get("resultadoLiquidacion") or {}
+
+    desplazamientos = []
+    listas = [datos.get("desplazamientos") or [], datos.get("desplazamientoAECC") or []]
+    for lista in listas:
+        for desp in lista:
+            if not isinstance(desp, dict):
+                continue
+            calculados = desp.get("datosCalculados") or {}
+            pais = desp.get("paisDestino") or desp.get("pais") or ""
+            ida = fecha_iso(desp.get("fechaIda"))
+            regreso = fecha_iso(desp.get("fechaRegreso")) or ida
+            desplazamientos.append((
+                len(desplazamientos),
+                ida,
+                regreso,
+                f"{ida}T{hora_hhmm(desp.get('horaIda'), HORA_INICIO_DIA)}" if ida else None,
+                f"{regreso}T{hora_hhmm(desp.get('horaRegreso'), HORA_FIN_DIA)}" if regreso else None,
+                desp.get("origen") or "",
+                desp.get("destino") or "",
+                pais,
+                normalizar_texto(pais),
+                importe(calculados.get("importeTotal")),
+            ))
+
+    fechas = sorted(f for d in desplazamientos for f in (d[1], d[2]) if f)
+
+    archivo = {
+        "version_esquema": datos.get("versionEsquema"),
+        "guardado_el": datos.get("guardadoEl"),
+        "tipo_liquidacion": datos.get("tipoLiquidacion"),
+        "dni": normalizar_dni(beneficiario.get("dni")),
+        "nombre": beneficiario.get("nombre") or "",
+        "nombre_norm": normalizar_texto(beneficiario.get("nombre")),
+        "entidad": beneficiario.get("entidad") or "",
+        "tipo_proyecto": (proyecto.get("tipo") or "").upper(),
+        "normativa": proyecto.get("normativa") or "",
+        "responsable": proyecto.get("responsable") or "",
+        "organica": proyecto.get("organica") or "",
+        "referencia": (proyecto.get("referencia") or "").strip().upper(),
+        "fecha_primera": fechas[0] if fechas else None,
+        "fecha_ultima": fechas[-1] if fechas else None,
+        "total_liquidacion": importe(resultado.get("totalLiquidacion")),
+        "irpf_total": importe(resultado.get("irpfTotal")),
+    }
+    return archivo, desplazamientos
+
+
+def extraer_aportaciones(datos: dict, archivo: dict) -> list[tuple]:
+    """
+    Aportaciones del .dta a los agregados mensuales.
+
+    Los conceptos de cada desplazamiento cuentan en el mes de su fecha de ida;
+    el total de la liquidación (resultadoLiquidacion), en el mes del primer
+    desplazamiento. Todo se reparte entre las líneas de imputación en
+    proporción a su importe (sin líneas, a la orgánica del proyecto).
+    Devuelve filas (mes, tipo_proyecto, normativa, organica, concepto, importe)
+    con un solo valor por cubo.
+    """
+    mes_liquidacion = (archivo["fecha_primera"] or archivo["guardado_el"] or "")[:7] or "sin-fecha"
+    por_mes: dict[tuple[str, str], float] = {}
+
+    def sumar(mes, concepto, valor):
+        if valor:
+            por_mes[(mes, concepto)] = por_mes.get((mes, concepto), 0.0) + valor
+
+    for desp in (datos.get("desplazamientos") or []) + (datos.get("desplazamientoAECC") or []):
+        if not isinstance(desp, dict):
+            continue
+        calculados = desp.get("datosCalculados") or {}
+        mes = (fecha_iso(desp.get("fechaIda")) or mes_liquidacion)[:7]
+        if not desp.get("noManutencion"):
+            sumar(mes, "manutencion", importe(calculados.get("importeManutencion")))
+        alojamiento = importe(desp.get("alojamiento")) or 0.0
+        maximo = importe(calculados.get("importeMaxAlojamiento"))
+        sumar(mes, "alojamiento", min(alojamiento, maximo) if maximo is not None else alojamiento)
+        sumar(mes, "km", importe(calculados.get("importeKm")))
+        sumar(mes, "otros_gastos", sum(importe(g.get("importe")) or 0.0
+                                       for g in desp.get("otrosGastos") or [] if isinstance(g, dict)))
+        sumar(mes, "irpf_sujeto", importe(calculados.get("irpfSujeto")))
+        sumar(mes, "total", importe(calculados.get("importeTotal")))
+    sumar(mes_liquidacion, "liquidacion", archivo["total_liquidacion"])
+
+    # Reparto entre líneas de imputación
+    lineas = [(str(l.get("organica") or "").strip(), importe(l.get("importe")) or 0.0)
+              for l in datos.get("imputacion") or [] if isinstance(l, dict)]
+    total_lineas = sum(peso for _, peso in lineas if peso > 0)
+    if total_lineas > 0:
+        reparto: dict[str, float] = {}
+        for organica, peso in lineas:
+            if peso > 0:
+                reparto[organica] = reparto.get(organica, 0.0) + peso / total_lineas
+    else:
+        reparto = {archivo["organica"]: 1.0}
+
+    tipo = archivo["tipo_proyecto"]
+    normativa = archivo["normativa"]
+    return [
+        (mes, tipo, normativa, organica, concepto, valor * fraccion)
+        for (mes, concepto), valor in por_mes.items()
+        for organica, fraccion in reparto.items()
+    ]
+
+
+def analizar_archivo(ruta: str, hash_conocido: str | None = None) -> dict:
+    """
+    Lee, calcula el hash y, si el contenido es nuevo, analiza un .dta.
+    Devuelve un diccionario con ruta, hash, tamano, mtime y, si se analizó,
+    archivo/desplazamientos/aportaciones (o error).
+    """
+    estado = os.stat(ruta)
+    with open(ruta, "rb") as f:
+        contenido = f.read()
+    digest = hashlib.sha256(contenido).hexdigest()
+    resultado = {"ruta": ruta, "hash": digest, "tamano": estado.st_size, "mtime": estado.st_mtime}
+
+    if digest == hash_conocido:
+        return resultado
+
+    try:
+        datos = json.loads(contenido.decode("utf-8-sig"))
+        if not isinstance(datos, dict):
+            raise ValueError("el contenido no es un objeto JSON")
+        resultado["archivo"], resultado["desplazamientos"] = extraer_registro(datos)
+        resultado["aportaciones"] = extraer_aportaciones(datos, resultado["archivo"])
+    except (ValueError, UnicodeDecodeError) as e:
+        resultado["error"] = str(e)[:200]
+    return resultado
+
+
+def _analizar_lote(tareas: list[tuple[str, str | None]]) -> list[dict]:
+    """Analiza un lote de (ruta, hash conocido) en un proceso de trabajo."""
+    resultados = []
+    for ruta, hash_conocido in tareas:
+        try:
+            resultados.append(analizar_archivo(ruta, hash_conocido))
+        except OSError as e:
+            resultados.append({"ruta": ruta, "error_lectura": str(e)})
+    return resultados
+
+
+# =============================================================================
+# BASE DE DATOS
+# =============================================================================
+
+def abrir_bd(ruta_bd: Path) -> sqlite3.Connection:
+    """Abre (y crea si hace falta) la base del índice."""
+    conexion = sqlite3.connect(ruta_bd)
+    conexion.execute("PRAGMA journal_mode = WAL")
+    conexion.execute("PRAGMA synchronous = NORMAL")
+    conexion.execute("PRAGMA foreign_keys = ON")
+    fila = None
+    try:
+        fila = conexion.execute("SELECT valor FROM meta WHERE clave = 'version_indice'").fetchone()
+    except sqlite3.OperationalError:
+        pass
+    if fila and fila[0] != str(VERSION_INDICE):
+        # Esquema antiguo: se reconstruye el índice desde cero
+        conexion.executescript(
+            "DROP TABLE IF EXISTS agregados; DROP TABLE IF EXISTS aportaciones; "
+            "DROP TABLE IF EXISTS desplazamientos; DROP TABLE IF EXISTS archivos;"
+        )
+    conexion.executescript(ESQUEMA)
+    conexion.execute(
+        "INSERT OR REPLACE INTO meta (clave, valor) VALUES ('version_indice', ?)",
+        (str(VERSION_INDICE),),
+    )
+    return conexion
+
+
+def _acumular(conexion: sqlite3.Connection, filas: list[tuple], signo: int) -> None:
+    """Suma (signo=1) o resta (signo=-1) aportaciones en sus cubos agregados."""
+    if not filas:
+        return
+    conexion.executemany(
+        """INSERT INTO agregados (mes, tipo_proyecto, normativa, organica, concepto, importe, liquidaciones)
+           VALUES (?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(mes, tipo_proyecto, normativa, organica, concepto) DO UPDATE SET
+               importe = importe + excluded.importe,
+               liquidaciones = liquidaciones + excluded.liquidaciones""",
+        [(*f[:5], signo * f[5], signo) for f in filas],
+    )
+    if signo < 0:
+        conexion.executemany(
+            """DELETE FROM agregados WHERE mes = ? AND tipo_proyecto = ? AND normativa = ?
+                   AND organica = ? AND concepto = ? AND liquidaciones <= 0""",
+            [f[:5] for f in filas],
+        )
+
+
+def retirar_aportaciones(conexion: sqlite3.Connection, archivo_id: int) -> None:
+    """Descuenta de los agregados lo que aportaba un archivo y borra sus aportaciones."""
+    filas = conexion.execute(
+        """SELECT mes, tipo_proyecto, normativa, organica, concepto, importe
+           FROM aportaciones WHERE archivo_id = ?""",
+        (archivo_id,),
+    ).fetchall()
+    _acumular(conexion, filas, -1)
+    conexion.execute("DELETE FROM aportaciones WHERE archivo_id = ?", (archivo_id,))
+
+
+def eliminar_archivo(conexion: sqlite3.Connection, ruta: str) -> None:
+    """Quita un archivo del índice (y sus aportaciones de los agregados)."""
+    fila = conexion.execute("SELECT id FROM archivos WHERE ruta = ?", (ruta,)).fetchone()
+    if fila:
+        retirar_aportaciones(conexion, fila[0])
+        conexion.execute("DELETE FROM archivos WHERE id = ?", (fila[0],))
+
+
+def guardar_resultado(conexion: sqlite3.Connection, r: dict) -> None:
+    """Inserta o actualiza un archivo analizado y sus desplazamientos."""
+    if "archivo" not in r and "error" not in r:
+        # Mismo contenido: solo cambian tamaño/fecha de modificación
+        conexion.execute(
+            "UPDATE archivos SET tamano = ?, mtime = ? WHERE ruta = ?",
+            (r["tamano"], r["mtime"], r["ruta"]),
+        )
+        return
+
+    previo = conexion.execute("SELECT id FROM archivos WHERE ruta = ?", (r["ruta"],)).fetchone()
+    if previo:
+        retirar_aportaciones(conexion, previo[0])
+
+    archivo = r.get("archivo") or {}
+    valores = [archivo.get(c) for c in COLUMNAS_ARCHIVO]
+    conexion.execute(
+        f"""INSERT INTO archivos (ruta, hash, tamano, mtime, error, {", ".join(COLUMNAS_ARCHIVO)})
+            VALUES (?, ?, ?, ?, ?, {", ".join("?" * len(COLUMNAS_ARCHIVO))})
+            ON CONFLICT(ruta) DO UPDATE SET
+                hash = excluded.hash, tamano = excluded.tamano, mtime = excluded.mtime,
+                error = excluded.error,
+                {", ".join(f"{c} = excluded.{c}" for c in COLUMNAS_ARCHIVO)}""",
+        [r["ruta"], r["hash"], r["tamano"], r["mtime"], r.get("error"), *valores],
+    )
+    archivo_id = conexion.execute("SELECT id FROM archivos WHERE ruta = ?", (r["ruta"],)).fetchone()[0]
+    conexion.execute("DELETE FROM desplazamientos WHERE archivo_id = ?", (archivo_id,))
+    conexion.executemany(
+        """INSERT INTO desplazamientos (archivo_id, orden, fecha_ida, fecha_regreso,
+               inicio, fin, origen, destino, pais, pais_norm, importe_total)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        [(archivo_id, *d) for d in r.get("desplazamientos", [])],
+    )
+    aportaciones = r.get("aportaciones", [])
+    conexion.executemany(
+        """INSERT INTO aportaciones (archivo_id, mes, tipo_proyecto, normativa, organica, concepto, importe)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        [(archivo_id, *a) for a in aportaciones],
+    )
+    _acumular(conexion, aportaciones, 1)
+
+
+# =============================================================================
+# INDEXACIÓN
+# =============================================================================
+
+def buscar_archivos(raiz: Path) -> dict[str, os.stat_result]:
+    """Rutas absolutas de los .dta bajo `raiz` con su stat."""
+    encontrados = {}
+    for carpeta, _, nombres in os.walk(raiz):
+        for nombre in nombres:
+            if nombre.lower().endswith(EXTENSION):
+                ruta = os.path.abspath(os.path.join(carpeta, nombre))
+                try:
+                    encontrados[ruta] = os.stat(ruta)
+                except OSError:
+                    continue
+    return encontrados
+
+
+def indexar(raiz: Path, ruta_bd: Path, procesos: int | None = None, lote: int = 200) -> dict:
+    """
+    Actualiza el índice con los .dta de `raiz`.
+    Devuelve contadores: total, sin_cambios, analizados, mismo_contenido,
+    errores y eliminados.
+    """
+    inicio = time.perf_counter()
+    conexion = abrir_bd(ruta_bd)
+    conocidos = {
+        ruta: (hash_, tamano, mtime)
+        for ruta, hash_, tamano, mtime in conexion.execute(
+            "SELECT ruta, hash, tamano, mtime FROM archivos"
+        )
+    }
+    en_disco = buscar_archivos(raiz)
+
+    # Archivos cuyo tamaño o fecha han cambiado (o nuevos)
+    pendientes = []
+    for ruta, st in en_disco.items():
+        previo = conocidos.get(ruta)
+        if previo and previo[1] == st.st_size and previo[2] == st.st_mtime:
+            continue
+        pendientes.append((ruta, previo[0] if previo else None))
+
+    # Archivos que ya no están bajo la raíz indexada
+    prefijo = os.path.join(os.path.abspath(raiz), "")
+    eliminados = [r for r in conocidos if r.startswith(prefijo) and r not in en_disco]
+
+    contadores = {
+        "total": len(en_disco),
+        "sin_cambios": len(en_disco) - len(pendientes),
+        "analizados": 0,
+        "mismo_contenido": 0,
+        "errores": 0,
+        "eliminados": len(eliminados),
+    }
+
+    lotes = [pendientes[i:i + lote] for i in range(0, len(pendientes), lote)]
+    with conexion:
+        for ruta in eliminados:
+            eliminar_archivo(conexion, ruta)
+        if len(lotes) > 1 and procesos != 1:
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                resultados = ejecutor.map(_analizar_lote, lotes)
+                for resultados_lote in resultados:
+                    _guardar_lote(conexion, resultados_lote, contadores)
+        else:
+            for tareas in lotes:
+                _guardar_lote(conexion, _analizar_lote(tareas), contadores)
+
+    conexion.execute("PRAGMA optimize")
+    conexion.close()
+    contadores["segundos"] = round(time.perf_counter() - inicio, 2)
+    return contadores
+
+
+def _guardar_lote(conexion: sqlite3.Connection, resultados: list[dict], contadores: dict) -> None:
+    for r in resultados:
+        if "error_lectura" in r:
+            contadores["errores"] += 1
+            continue
+        guardar_resultado(conexion, r)
+        if "error" in r:
+            contadores["errores"] += 1
+        elif "archivo" in r:
+            contadores["analizados"] += 1
+        else:
+            contadores["mismo_contenido"] += 1
+
+
+# =============================================================================
+# CONSULTA
+# =============================================================================
+
+def consultar(ruta_bd: Path, dni=None, nombre=None, referencia=None, tipo=None,
+              pais=None, desde=None, hasta=None, limite: int = 100) -> list[sqlite3.Row]:
+    """
+    Busca liquidaciones. Los filtros se combinan con AND; país y fechas se
+    aplican sobre los desplazamientos (basta con que uno cumpla ambos).
+    """
+    conexion = sqlite3.connect(f"file:{ruta_bd}?mode=ro", uri=True)
+    conexion.row_factory = sqlite3.Row
+
+    condiciones = ["a.error IS NULL"]
+    parametros: list = []
+    if dni:
+        condiciones.append("a.dni = ?")
+        parametros.append(normalizar_dni(dni))
+    if nombre:
+        condiciones.append("a.nombre_norm LIKE ?")
+        parametros.append(f"%{normalizar_texto(nombre)}%")
+    if referencia:
+        condiciones.append("a.referencia = ?")
+        parametros.append(referencia.strip().upper())
+    if tipo:
+        condiciones.append("a.tipo_proyecto = ?")
+        parametros.append(tipo.strip().upper())
+
+    condiciones_desp = []
+    if pais:
+        condiciones_desp.append("d.pais_norm = ?")
+        parametros.append(normalizar_texto(pais))
+    if desde:
+        condiciones_desp.append("d.fecha_ida >= ?")
+        parametros.append(fecha_iso(desde) or desde)
+    if hasta:
+        condiciones_desp.append("d.fecha_ida <= ?")
+        parametros.append(fecha_iso(hasta) or hasta)
+    if condiciones_desp:
+        condiciones.append(
+            "EXISTS (SELECT 1 FROM desplazamientos d WHERE d.archivo_id = a.id AND "
+            + " AND ".join(condiciones_desp) + ")"
+        )
+
+    sql = f"""
+        SELECT a.ruta, a.dni, a.nombre, a.tipo_liquidacion, a.tipo_proyecto,
+               a.referencia, a.fecha_primera, a.fecha_ultima, a.total_liquidacion
+        FROM archivos a
+        WHERE {" AND ".join(condiciones)}
+        ORDER BY a.fecha_primera DESC, a.ruta
+        LIMIT ?
+    """
+    parametros.append(limite)
+    filas = conexion.execute(sql, parametros).fetchall()
+    conexion.close()
+    return filas
+
+
+# =============================================================================
+# SOLAPES ENTRE LIQUIDACIONES
+# =============================================================================
+
+def leer_intervalos(ruta_bd: Path, dni=None) -> list[dict]:
+    """
+    Intervalos [inicio, fin) de todos los desplazamientos indexados, ordenados
+    por beneficiario e inicio.
+    """
+    conexion = sqlite3.connect(f"file:{ruta_bd}?mode=ro", uri=True)
+    conexion.row_factory = sqlite3.Row
+    sql = """
+        SELECT a.dni, a.nombre, a.ruta AS archivo, a.referencia, d.orden,
+               d.inicio, d.fin, d.pais
+        FROM desplazamientos d JOIN archivos a ON a.id = d.archivo_id
+        WHERE a.error IS NULL AND a.dni != '' AND d.inicio IS NOT NULL
+    """
+    parametros = []
+    if dni:
+        sql += " AND a.dni = ?"
+        parametros.append(normalizar_dni(dni))
+    sql += " ORDER BY a.dni, d.inicio"
+    filas = [dict(f) for f in conexion.execute(sql, parametros)]
+    conexion.close()
+    return filas
+
+
+def buscar_solapes(intervalos: list[dict], mismo_archivo: bool = False) -> list[tuple[dict, dict]]:
+    """
+    Barrido por beneficiario sobre intervalos ordenados por (dni, inicio): se
+    mantienen los activos en un montículo por fecha de fin y cada intervalo
+    nuevo se compara solo con los que aún no han terminado. O(n log n + k).
+    Dos desplazamientos se solapan si uno empieza antes de que acabe el otro
+    (regresar y salir a la misma hora no es solape).
+    """
+    solapes = []
+    activos: list[tuple[str, int, dict]] = []
+    dni_actual = None
+    for i, intervalo in enumerate(intervalos):
+        if intervalo["dni"] != dni_actual:
+            dni_actual = intervalo["dni"]
+            activos = []
+        while activos and activos[0][0] <= intervalo["inicio"]:
+            heapq.heappop(activos)
+        for _, _, otro in activos:
+            if mismo_archivo or otro["archivo"] != intervalo["archivo"]:
+                solapes.append((otro, intervalo))
+        heapq.heappush(activos, (intervalo["fin"], i, intervalo))
+    return solapes
+
+
+# =============================================================================
+# AGREGADOS MENSUALES
+# =============================================================================
+
+def leer_resumen(ruta_bd: Path, desde=None, hasta=None, tipo=None, organica=None,
+                 normativa=None) -> list[dict]:
+    """
+    Totales mensuales por tipo de proyecto, normativa y orgánica, con una
+    columna por concepto. Lee solo la tabla de agregados materializados.
+    """
+    conexion = sqlite3.connect(f"file:{ruta_bd}?mode=ro", uri=True)
+    condiciones, parametros = [], []
+    for columna, operador, valor in (("mes", ">=", desde), ("mes", "<=", hasta),
+                                     ("tipo_proyecto", "=", tipo and tipo.upper()),
+                                     ("organica", "=", organica), ("normativa", "=", normativa)):
+        if valor:
+            condiciones.append(f"{columna} {operador} ?")
+            parametros.append(valor)
+    sql = "SELECT mes, tipo_proyecto, normativa, organica, concepto, importe, liquidaciones FROM agregados"
+    if condiciones:
+        sql += " WHERE " + " AND ".join(condiciones)
+    sql += " ORDER BY mes, tipo_proyecto, normativa, organica"
+
+    filas: dict[tuple, dict] = {}
+    for mes, tipo_p, norma, org, concepto, valor, n in conexion.execute(sql, parametros):
+        fila = filas.setdefault((mes, tipo_p, norma, org), {
+            "mes": mes, "tipo_proyecto": tipo_p, "normativa": norma, "organica": org,
+            **{c: 0.0 for c in CONCEPTOS}, "liquidaciones": 0,
+        })
+        fila[concepto] = round(valor, 2)
+        fila["liquidaciones"] = max(fila["liquidaciones"], n)
+    conexion.close()
+    return list(filas.values())
+
+
+def exportar_resumen(filas: list[dict], destino: Path) -> None:
+    """Exporta el resumen a CSV o, si la extensión es .parquet, a Parquet (pyarrow)."""
+    columnas = ["mes", "tipo_proyecto", "normativa", "organica", *CONCEPTOS, "liquidaciones"]
+    if destino.suffix.lower() == ".parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        tabla = pa.table({c: [f[c] for f in filas] for c in columnas})
+        pq.write_table(tabla, destino)
+        return
+    import csv
+    with open(destino, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas)
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+
+# =============================================================================
+# LÍNEA DE COMANDOS
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Índice SQLite de archivos .dta")
+    sub = parser.add_subparsers(dest="orden", required=True)
+
+    p_indexar = sub.add_parser("indexar", help="Crear o actualizar el índice")
+    p_indexar.add_argument("raiz", type=Path, help="Carpeta con los .dta (se recorre entera)")
+    p_indexar.add_argument("--bd", type=Path, default=Path(BD_POR_DEFECTO))
+    p_indexar.add_argument("--procesos", type=int, default=None,
+                           help="Procesos de análisis (por defecto, uno por CPU)")
+
+    p_buscar = sub.add_parser("buscar", help="Consultar el índice")
+    p_buscar.add_argument("--bd", type=Path, default=Path(BD_POR_DEFECTO))
+    p_buscar.add_argument("--dni")
+    p_buscar.add_argument("--nombre", help="Parte del nombre (sin distinguir acentos)")
+    p_buscar.add_argument("--referencia")
+    p_buscar.add_argument("--tipo", help="Tipo de proyecto (G24, PEI...)")
+    p_buscar.add_argument("--pais", help="País de destino (sin distinguir acentos)")
+    p_buscar.add_argument("--desde", help="Fecha de ida mínima (dd/mm/aa o aaaa-mm-dd)")
+    p_buscar.add_argument("--hasta", help="Fecha de ida máxima (dd/mm/aa o aaaa-mm-dd)")
+    p_buscar.add_argument("--limite", type=int, default=100)
+    p_buscar.add_argument("--json", action="store_true", help="Salida en JSON")
+
+    p_solapes = sub.add_parser("solapes", help="Desplazamientos solapados del mismo beneficiario")
+    p_solapes.add_argument("--bd", type=Path, default=Path(BD_POR_DEFECTO))
+    p_solapes.add_argument("--dni")
+    p_solapes.add_argument("--mismo-archivo", action="store_true",
+                           help="Incluir solapes dentro de una misma liquidación")
+    p_solapes.add_argument("--json", action="store_true", help="Salida en JSON")
+
+    p_intervalos = sub.add_parser("intervalos", help="Exportar intervalos (JSON) para el navegador")
+    p_intervalos.add_argument("--bd", type=Path, default=Path(BD_POR_DEFECTO))
+    p_intervalos.add_argument("--dni")
+
+    p_resumen = sub.add_parser("resumen", help="Totales mensuales por proyecto, orgánica y normativa")
+    p_resumen.add_argument("--bd", type=Path, default=Path(BD_POR_DEFECTO))
+    p_resumen.add_argument("--desde", help="Mes inicial (aaaa-mm)")
+    p_resumen.add_argument("--hasta", help="Mes final (aaaa-mm)")
+    p_resumen.add_argument("--tipo", help="Tipo de proyecto (G24, PEI...)")
+    p_resumen.add_argument("--organica")
+    p_resumen.add_argument("--normativa", choices=["rd", "decreto"])
+    p_resumen.add_argument("--exportar", type=Path, help="Archivo .csv o .parquet")
+
+    args = parser.parse_args()
+
+    if args.orden == "indexar":
+        if not args.raiz.is_dir():
+            print(f"ERROR: Carpeta no encontrada: {args.raiz}")
+            return 1
+        contadores = indexar(args.raiz, args.bd, args.procesos)
+        print(f"✅ Índice actualizado: {args.bd}")
+        for clave, valor in contadores.items():
+            print(f"   {clave}: {valor}")
+        return 0
+
+    if not args.bd.exists():
+        print(f"ERROR: Índice no encontrado: {args.bd} (ejecute antes 'indexar')")
+        return 1
+    if args.orden == "resumen":
+        inicio = time.perf_counter()
+        filas = leer_resumen(args.bd, args.desde, args.hasta, args.tipo, args.organica, args.normativa)
+        ms = (time.perf_counter() - inicio) * 1000
+        if args.exportar:
+            try:
+                exportar_resumen(filas, args.exportar)
+            except ImportError:
+                print("ERROR: La exportación a Parquet requiere pyarrow (pip install pyarrow)")
+                return 1
+            print(f"✅ {len(filas)} fila(s) exportadas a {args.exportar}")
+        else:
+            print(f"{'mes':7}  {'tipo':8}  {'normativa':8}  {'orgánica':14}  " +
+                  "  ".join(f"{c:>12}" for c in CONCEPTOS))
+            for f in filas:
+                print(f"{f['mes']:7}  {f['tipo_proyecto']:8}  {f['normativa']:8}  {f['organica']:14}  " +
+                      "  ".join(f"{f[c]:>12.2f}" for c in CONCEPTOS))
+        print(f"{len(filas)} fila(s) en {ms:.1f} ms", file=sys.stderr)
+        return 0
+
+    if args.orden == "intervalos":
+        print(json.dumps(leer_intervalos(args.bd, args.dni), ensure_ascii=False))
+        return 0
+
+    if args.orden == "solapes":
+        inicio = time.perf_counter()
+        solapes = buscar_solapes(leer_intervalos(args.bd, args.dni), args.mismo_archivo)
+        ms = (time.perf_counter() - inicio) * 1000
+        if args.json:
+            print(json.dumps([{"a": a, "b": b} for a, b in solapes], ensure_ascii=False, indent=2))
+        else:
+            for a, b in solapes:
+                print(f"{a['dni']:10}  {a['inicio']} – {a['fin']}  {a['referencia'] or '-':12}  ({a['archivo']})")
+                print(f"{'':10}  {b['inicio']} – {b['fin']}  {b['referencia'] or '-':12}  ({b['archivo']})\n")
+        print(f"{len(solapes)} solape(s) en {ms:.1f} ms", file=sys.stderr)
+        return 0
+
+    inicio = time.perf_counter()
+    filas = consultar(args.bd, args.dni, args.nombre, args.referencia, args.tipo,
+                      args.pais, args.desde, args.hasta, args.limite)
+    ms = (time.perf_counter() - inicio) * 1000
+
+    if args.json:
+        print(json.dumps([dict(f) for f in filas], ensure_ascii=False, indent=2))
+    else:
+        for f in filas:
+            total = f"{f['total_liquidacion']:.2f}" if f["total_liquidacion"] is not None else "-"
+            print(f"{f['fecha_primera'] or '-':10}  {f['dni']:10}  {f['tipo_proyecto'] or '-':6}  "
+                  f"{f['referencia'] or '-':12}  {total:>10}  {f['nombre']}  ({f['ruta']})")
+        print(f"\n{len(filas)} resultado(s) en {ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+"""
+pdf_texto.py
+============
+Extracción de texto de PDF sin dependencias externas (solo biblioteca
+estándar), para las normativas de Normativas/.
+
+Cubre lo que usan esos PDF y la mayoría de los generados por procesadores
+de texto: objetos comprimidos en flujos de objetos (/ObjStm), filtros
+FlateDecode/ASCIIHex/ASCII85, fuentes simples (WinAnsi, MacRoman,
+/Differences) y compuestas con /ToUnicode, y formularios (/XObject /Form).
+No hace OCR: un PDF escaneado no tiene texto que extraer. Los PDF cifrados
+se rechazan.
+
+El texto de cada página se reconstruye siguiendo la posición de los glifos:
+un salto vertical es un cambio de línea y un hueco horizontal, un espacio.
+
+Uso como biblioteca:
+    from pdf_texto import paginas
+    for numero, texto in paginas('Normativas/RD 462-2002_recortado.pdf'):
+        ...
+"""
+
+import base64
+import re
+import unicodedata
+import zlib
+from pathlib import Path
+
+
+class ErrorPDF(Exception):
+    """PDF que no se puede leer (cifrado, dañado o con un filtro no soportado)."""
+
+
+# =========================================================================
+# OBJETOS PDF
+# =========================================================================
+
+class Nombre(str):
+    """Nombre PDF (/Type) sin la barra."""
+
+
+class Ref(tuple):
+    """Referencia indirecta (número, generación)."""
+
+    def __new__(cls, numero, generacion):
+        return super().__new__(cls, (numero, generacion))
+
+
+class Operador(str):
+    """Palabra clave de un flujo de contenido (BT, Tj...)."""
+
+
+BLANCOS = b' \t\r\n\f\x00'
+_FIN_TOKEN = re.compile(rb'[\s()<>\[\]{}/%\x00]')
+_NUMERO = re.compile(rb'[+-]?(\d+\.?\d*|\.\d+)$')
+_REF = re.compile(rb'\s+(\d+)\s+R(?![^\s()<>\[\]{}/%])')
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b',
+            ord('f'): b'\f', ord('('): b'(', ord(')'): b')', ord('\\'): b'\\'}
+
+
+def _saltar_blancos(data: bytes, pos: int) -> int:
+    n = len(data)
+    while pos < n:
+        c = data[pos]
+        if c in BLANCOS:
+            pos += 1
+        elif c == 0x25:  # % comentario
+            while pos < n and data[pos] not in b'\r\n':
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _cadena_literal(data: bytes, pos: int) -> tuple[bytes, int]:
+    """Cadena (...) con escapes y paréntesis anidados; pos apunta tras '('."""
+    salida = bytearray()
+    nivel = 1
+    n = len(data)
+    while pos < n:
+        c = data[pos]
+        if c == 0x5C:  # \
+            pos += 1
+            c = data[pos] if pos < n else 0
+            if c in _ESCAPES:
+                salida += _ESCAPES[c]
+                pos += 1
+            elif 0x30 <= c <= 0x37:
+                octal = re.match(rb'[0-7]{1,3}', data[pos:pos + 3]).group()
+                salida.append(int(octal, 8) & 0xFF)
+                pos += len(octal)
+            elif c in b'\r\n':
+                pos += 2 if data[pos:pos + 2] == b'\r\n' else 1
+            else:
+                salida.append(c)
+                pos += 1
+            continue
+        if c == 0x28:
+            nivel += 1
+        elif c == 0x29:
+            nivel -= 1
+            if nivel == 0:
+                return bytes(salida), pos + 1
+        salida.append(c)
+        pos += 1
+    return bytes(salida), pos
+
+
+def leer_objeto(data: bytes, pos: int, referencias: bool = True):
+    """
+    Lee un objeto PDF a partir de `pos`.
+
+    Returns:
+        (objeto, posición siguiente). Al final de los datos, (None, len(data)).
+        Las palabras clave se devuelven como Operador.
+    """
+    pos = _saltar_blancos(data, pos)
+    if pos >= len(data):
+        return None, pos
+    c = data[pos]
+    if c == 0x2F:  # /Nombre
+        m = _FIN_TOKEN.search(data, pos + 1)
+        fin = m.start() if m else len(data)
+        crudo = data[pos + 1:fin]
+        if b'#' in crudo:
+            crudo = re.sub(rb'#([0-9A-Fa-f]{2})', lambda h: bytes([int(h.group(1), 16)]), crudo)
+        return Nombre(crudo.decode('latin-1')), fin
+    if c == 0x28:
+        return _cadena_literal(data, pos + 1)
+    if c == 0x3C:
+        if data[pos + 1:pos + 2] == b'<':
+            dic = {}
+            pos += 2
+            while True:
+                pos = _saltar_blancos(data, pos)
+                if pos >= len(data) or data[pos:pos + 2] == b'>>':
+                    return dic, pos + 2
+                clave, pos = leer_objeto(data, pos, referencias)
+                valor, pos = leer_objeto(data, pos, referencias)
+                if isinstance(clave, Nombre):
+                    dic[str(clave)] = valor
+        fin = data.find(b'>', pos)
+        fin = len(data) if fin < 0 else fin
+        hexa = re.sub(rb'\s', b'', data[pos + 1:fin])
+        if len(hexa) % 2:
+            hexa += b'0'
+        return bytes.fromhex(hexa.decode('ascii', 'replace')), fin + 1
+    if c == 0x5B:  # [
+        lista = []
+        pos += 1
+        while True:
+            pos = _saltar_blancos(data, pos)
+            if pos >= len(data) or data[pos] == 0x5D:
+                return lista, pos + 1
+            valor, pos = leer_objeto(data, pos, referencias)
+            lista.append(valor)
+    if c in b')>]}{':
+        return Operador(chr(c)), pos + 1
+    m = _FIN_TOKEN.search(data, pos)
+    fin = m.start() if m else len(data)
+    if fin == pos:
+        fin += 1
+    palabra = data[pos:fin]
+    if _NUMERO.match(palabra):
+        if referencias and b'.' not in palabra:
+            r = _REF.match(data, fin)
+            if r:
+                return Ref(int(palabra), int(r.group(1))), r.end()
+        return (float(palabra) if b'.' in palabra else int(palabra)), fin
+    if palabra == b'true':
+        return True, fin
+    if palabra == b'false':
+        return False, fin
+    if palabra == b'null':
+        return None, fin
+    return Operador(palabra.decode('latin-1')), fin
+
+
+# =========================================================================
+# DOCUMENTO
+# =========================================================================
+
+_OBJ = re.compile(rb'(?<![0-9])(\d+)\s+(\d+)\s+obj\b')
+_STREAM = re.compile(rb'\s*stream(\r\n|\n|\r)')
+
+
+class Flujo:
+    """Objeto stream: diccionario y datos sin decodificar."""
+
+    __slots__ = ('dic', 'crudo')
+
+    def __init__(self, dic, crudo):
+        self.dic = dic
+        self.crudo = crudo
+
+
+class DocumentoPDF:
+    """Tabla de objetos de un PDF (leída recorriendo el archivo, sin xref)."""
+
+    def __init__(self, data: bytes):
+        if not data.startswith(b'%PDF'):
+            raise ErrorPDF('No es un PDF')
+        self.data = data
+        self.objetos = {}
+        fin_flujo = 0
+        for m in _OBJ.finditer(data):
+            # "N G obj" dentro de los datos binarios de un stream
+            if m.start() < fin_flujo:
+                continue
+            try:
+                obj, fin = leer_objeto(data, m.end())
+            except (ValueError, IndexError):
+                continue
+            ref = Ref(int(m.group(1)), int(m.group(2)))
+            s = _STREAM.match(data, fin) if isinstance(obj, dict) else None
+            if s:
+                obj = Flujo(obj, self._datos_flujo(obj, s.end()))
+                fin_flujo = s.end() + len(obj.crudo)
+            self.objetos[ref] = obj
+            if isinstance(obj, Flujo) and obj.dic.get('Type') == 'ObjStm':
+                self._cargar_objstm(obj)
+        if any(isinstance(o, dict) and 'Encrypt' in o for o in self._diccionarios_trailer()):
+            raise ErrorPDF('PDF cifrado')
+
+    def _datos_flujo(self, dic, inicio):
+        longitud = dic.get('Length')
+        if isinstance(longitud, Ref):
+            longitud = self.objetos.get(longitud)
+        if isinstance(longitud, int) and self.data[inicio + longitud:inicio + longitud + 30].lstrip().startswith(b'endstream'):
+            return self.data[inicio:inicio + longitud]
+        fin = self.data.find(b'endstream', inicio)
+        return self.data[inicio:fin].rstrip(b'\r\n') if fin >= 0 else self.data[inicio:]
+
+    def _cargar_objstm(self, flujo):
+        datos = self.decodificar(flujo)
+        primero = flujo.dic.get('First', 0)
+        cabecera = datos[:primero].split()
+        for i in range(0, min(len(cabecera), 2 * flujo.dic.get('N', 0)), 2):
+            numero, desplazamiento = int(cabecera[i]), int(cabecera[i + 1])
+            obj, _ = leer_objeto(datos, primero + desplazamiento)
+            self.objetos[Ref(numero, 0)] = obj
+
+    def _diccionarios_trailer(self):
+        for m in re.finditer(rb'trailer\s*<<', self.data):
+            yield leer_objeto(self.data, m.end() - 2)[0]
+        for obj in self.objetos.values():
+            if isinstance(obj, Flujo) and obj.dic.get('Type') == 'XRef':
+                yield obj.dic
+
+    def resolver(self, obj):
+        """Sigue referencias indirectas."""
+        vistos = 0
+        while isinstance(obj, Ref) and vistos < 32:
+            obj = self.objetos.get(obj)
+            vistos += 1
+        return obj
+
+    def decodificar(self, flujo: Flujo) -> bytes:
+        """Datos de un stream con sus filtros aplicados."""
+        filtros = self.resolver(flujo.dic.get('Filter'))
+        if filtros is None:
+            return flujo.crudo
+        if not isinstance(filtros, list):
+            filtros = [filtros]
+        datos = flujo.crudo
+        for filtro in filtros:
+            filtro = self.resolver(filtro)
+            if filtro in ('FlateDecode', 'Fl'):
+                d = zlib.decompressobj()
+                try:
+                    datos = d.decompress(datos)
+                except zlib.error:
+                    datos = d.unconsumed_tail or b''
+            elif filtro in ('ASCIIHexDecode', 'AHx'):
+                hexa = re.sub(rb'[^0-9A-Fa-f]', b'', datos.split(b'>')[0])
+                datos = bytes.fromhex((hexa + b'0' * (len(hexa) % 2)).decode())
+            elif filtro in ('ASCII85Decode', 'A85'):
+                datos = base64.a85decode(datos.strip().removesuffix(b'~>').removeprefix(b'<~'))
+            else:
+                raise ErrorPDF(f'Filtro no soportado: {filtro}')
+        return datos
+
+    def catalogo(self) -> dict:
+        for trailer in self._diccionarios_trailer():
+            raiz = self.resolver(trailer.get('Root')) if isinstance(trailer, dict) else None
+            if isinstance(raiz, dict):
+                return raiz
+        for obj in self.objetos.values():
+            if isinstance(obj, dict) and obj.get('Type') == 'Catalog':
+                return obj
+        raise ErrorPDF('Catálogo no encontrado')
+
+    def paginas(self):
+        """Diccionarios de página en orden, con Resources heredados."""
+        vistos = set()
+
+        def recorrer(nodo, recursos):
+            nodo = self.resolver(nodo)
+            if not isinstance(nodo, dict) or id(nodo) in vistos:
+                return
+            vistos.add(id(nodo))
+            recursos = nodo.get('Resources', recursos)
+            if nodo.get('Type') == 'Pages' or 'Kids' in nodo:
+                for hijo in self.resolver(nodo.get('Kids')) or []:
+                    yield from recorrer(hijo, recursos)
+            else:
+                yield nodo, self.resolver(recursos) or {}
+
+        yield from recorrer(self.catalogo().get('Pages'), None)
+
+
+# =========================================================================
+# FUENTES
+# =========================================================================
+
+# Nombres de glifo frecuentes en /Differences (el resto: uniXXXX o acentos)
+GLIFOS = {
+    'space': ' ', 'exclam': '!', 'quotedbl': '"', 'numbersign': '#', 'dollar': '$',
+    'percent': '%', 'ampersand': '&', 'quotesingle': "'", 'quoteright': '’',
+    'quoteleft': '‘', 'parenleft': '(', 'parenright': ')', 'asterisk': '*', 'plus': '+',
+    'comma': ',', 'hyphen': '-', 'period': '.', 'slash': '/', 'colon': ':',
+    'semicolon': ';', 'less': '<', 'equal': '=', 'greater': '>', 'question': '?',
+    'at': '@', 'bracketleft': '[', 'backslash': '\\', 'bracketright': ']',
+    'underscore': '_', 'braceleft': '{', 'bar': '|', 'braceright': '}',
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'endash': '–',
+    'emdash': '—', 'quotedblleft': '“', 'quotedblright': '”', 'guillemotleft': '«',
+    'guillemotright': '»', 'bullet': '•', 'ellipsis': '…', 'ordfeminine': 'ª',
+    'ordmasculine': 'º', 'degree': '°', 'section': '§', 'exclamdown': '¡',
+    'questiondown': '¿', 'Euro': '€', 'euro': '€', 'fi': 'fi', 'fl': 'fl',
+    'germandbls': 'ß', 'periodcentered': '·', 'nbspace': ' ', 'minus': '−',
+}
+_DIACRITICOS = {'acute': 'ACUTE', 'grave': 'GRAVE', 'circumflex': 'CIRCUMFLEX',
+                'dieresis': 'DIAERESIS', 'tilde': 'TILDE', 'cedilla': 'CEDILLA', 'ring': 'RING ABOVE'}
+
+
+def unicode_de_glifo(nombre: str) -> str:
+    """Texto de un nombre de glifo de /Differences ('' si se desconoce)."""
+    if nombre in GLIFOS:
+        return GLIFOS[nombre]
+    if len(nombre) == 1:
+        return nombre
+    m = re.match(r'uni([0-9A-Fa-f]{4})+$', nombre)
+    if m:
+        return ''.join(chr(int(nombre[i:i + 4], 16)) for i in range(3, len(nombre), 4))
+    base, marca = nombre[0], nombre[1:]
+    if marca in _DIACRITICOS and base.isalpha():
+        caso = 'CAPITAL' if base.isupper() else 'SMALL'
+        try:
+            return unicodedata.lookup(f'LATIN {caso} LETTER {base.upper()} WITH {_DIACRITICOS[marca]}')
+        except KeyError:
+            return ''
+    return ''
+
+
+def _utf16(datos: bytes) -> str:
+    return datos.decode('utf-16-be', 'replace') if len(datos) % 2 == 0 else datos.decode('latin-1')
+
+
+def leer_cmap(datos: bytes) -> tuple[dict, int]:
+    """
+    CMap /ToUnicode → ({código: texto}, bytes por código).
+    """
+    mapa = {}
+    anchos = [len(a) for a in re.findall(rb'<([0-9A-Fa-f]+)>\s*<[0-9A-Fa-f]+>',
+                                         b''.join(re.findall(rb'begincodespacerange(.*?)endcodespacerange', datos, re.S)))]
+    bytes_codigo = max(anchos) // 2 if anchos else 1
+    for bloque in re.findall(rb'beginbfchar(.*?)endbfchar', datos, re.S):
+        pos = 0
+        while True:
+            origen, pos = leer_objeto(bloque, pos)
+            destino, pos = leer_objeto(bloque, pos)
+            if origen is None or destino is None:
+                break
+            if isinstance(origen, bytes) and isinstance(destino, bytes):
+                mapa[int.from_bytes(origen, 'big')] = _utf16(destino)
+    for bloque in re.findall(rb'beginbfrange(.*?)endbfrange', datos, re.S):
+        pos = 0
+        while True:
+            inicio, pos = leer_objeto(bloque, pos)
+            fin, pos = leer_objeto(bloque, pos)
+            destino, pos = leer_objeto(bloque, pos)
+            if not isinstance(inicio, bytes) or not isinstance(fin, bytes):
+                break
+            a, b = int.from_bytes(inicio, 'big'), int.from_bytes(fin, 'big')
+            if isinstance(destino, list):
+                for i, d in enumerate(destino[:b - a + 1]):
+                    mapa[a + i] = _utf16(d)
+            elif isinstance(destino, bytes) and b - a < 65536:
+                base = int.from_bytes(destino, 'big')
+                ancho = len(destino)
+                for i in range(b - a + 1):
+                    mapa[a + i] = _utf16((base + i).to_bytes(ancho, 'big'))
+    return mapa, bytes_codigo
+
+
+class Fuente:
+    """Decodificación de códigos de glifo a texto y anchos (milésimas)."""
+
+    def __init__(self, doc: DocumentoPDF, dic: dict):
+        dic = doc.resolver(dic) or {}
+        self.compuesta = dic.get('Subtype') == 'Type0'
+        self.bytes_codigo = 2 if self.compuesta else 1
+        self.mapa = {}
+        self.anchos = {}
+        self.ancho_defecto = 500
+
+        tounicode = doc.resolver(dic.get('ToUnicode'))
+        if isinstance(tounicode, Flujo):
+            try:
+                self.mapa, bytes_cmap = leer_cmap(doc.decodificar(tounicode))
+                if self.compuesta:
+                    self.bytes_codigo = bytes_cmap
+            except ErrorPDF:
+                pass
+
+        if self.compuesta:
+            descendiente = doc.resolver((doc.resolver(dic.get('DescendantFonts')) or [None])[0]) or {}
+            self.ancho_defecto = descendiente.get('DW', 1000)
+            w = doc.resolver(descendiente.get('W')) or []
+            i = 0
+            while i < len(w):
+                primero = doc.resolver(w[i])
+                siguiente = doc.resolver(w[i + 1]) if i + 1 < len(w) else None
+                if isinstance(siguiente, list):
+                    for j, ancho in enumerate(siguiente):
+                        self.anchos[primero + j] = doc.resolver(ancho)
+                    i += 2
+                else:
+                    ultimo, ancho = siguiente, doc.resolver(w[i + 2]) if i + 2 < len(w) else 0
+                    for c in range(primero, (ultimo or primero) + 1):
+                        self.anchos[c] = ancho
+                    i += 3
+            return
+
+        primero = dic.get('FirstChar', 0)
+        for j, ancho in enumerate(doc.resolver(dic.get('Widths')) or []):
+            self.anchos[primero + j] = doc.resolver(ancho)
+        descriptor = doc.resolver(dic.get('FontDescriptor')) or {}
+        self.ancho_defecto = descriptor.get('MissingWidth', 500) if self.anchos else 500
+
+        # Codificación simple: base + /Differences (solo donde falte ToUnicode)
+        codificacion = doc.resolver(dic.get('Encoding'))
+        base = 'cp1252'
+        diferencias = []
+        if isinstance(codificacion, dict):
+            base = {'MacRomanEncoding': 'mac_roman'}.get(codificacion.get('BaseEncoding'), 'cp1252')
+            diferencias = doc.resolver(codificacion.get('Differences')) or []
+        elif codificacion == 'MacRomanEncoding':
+            base = 'mac_roman'
+        for c in range(256):
+            if c not in self.mapa:
+                self.mapa[c] = bytes([c]).decode(base, 'replace') if c >= 32 else ''
+        codigo = 0
+        for d in diferencias:
+            d = doc.resolver(d)
+            if isinstance(d, int):
+                codigo = d
+            elif isinstance(d, Nombre):
+                if tounicode is None or codigo not in self.mapa:
+                    self.mapa[codigo] = unicode_de_glifo(d)
+                codigo += 1
+
+    def codigos(self, cadena: bytes):
+        n = self.bytes_codigo
+        if n == 1:
+            return cadena
+        return [int.from_bytes(cadena[i:i + n], 'big') for i in range(0, len(cadena) - n + 1, n)]
+
+    def texto(self, codigo: int) -> str:
+        return self.mapa.get(codigo, '' if self.compuesta else chr(codigo))
+
+    def ancho(self, codigo: int) -> float:
+        ancho = self.anchos.get(codigo, self.ancho_defecto)
+        return ancho if isinstance(ancho, (int, float)) else self.ancho_defecto
+
+
+# =========================================================================
+# CONTENIDO
+# =========================================================================
+
+def _multiplicar(a, b):
+    return (a[0] * b[0] + a[1] * b[2], a[0] * b[1] + a[1] * b[3],
+            a[2] * b[0] + a[3] * b[2], a[2] * b[1] + a[3] * b[3],
+            a[4] * b[0] + a[5] * b[2] + b[4], a[4] * b[1] + a[5] * b[3] + b[5])
+
+
+IDENTIDAD = (1, 0, 0, 1, 0, 0)
+
+
+class _Texto:
+    """Reconstrucción de líneas a partir de la posición de los glifos."""
+
+    def __init__(self):
+        self.partes = []
+        self.fin = None  # (x, y, tamaño) del final del último texto
+
+    def escribir(self, texto, x, y, tamano, x_fin):
+        if not texto:
+            return
+        if self.fin is not None:
+            fx, fy, ft = self.fin
+            alto = max(tamano, ft, 1)
+            if abs(y - fy) > alto * 0.5:
+                self.partes.append('\n')
+            elif x - fx > alto * 0.15 and not texto[0].isspace() and self.partes and not self.partes[-1][-1:].isspace():
+                self.partes.append(' ')
+        self.partes.append(texto)
+        self.fin = (x_fin, y, tamano)
+
+    def resultado(self) -> str:
+        lineas = ''.join(self.partes).split('\n')
+        return '\n'.join(re.sub(r'[ \t ]+', ' ', l).strip() for l in lineas if l.strip())
+
+
+# Números y operadores (la mayor parte de un flujo de contenido) por regex;
+# el resto de objetos (cadenas, nombres, arrays) con leer_objeto
+_TOKEN_CONTENIDO = re.compile(
+    rb'(?:[\s\x00]|%[^\r\n]*)*(?:(?P<num>[+-]?(?:\d+\.?\d*|\.\d+))(?![^\s()<>\[\]{}/%\x00])'
+    rb'|(?P<op>[A-Za-z\'"*][A-Za-z0-9*\'"]*|(?=.))|$)', re.S)
+_FIN_IMAGEN = re.compile(rb'\sEI(?=\s|$)')
+
+
+def _operaciones(datos: bytes):
+    """Recorre un flujo de contenido: (operador, operandos)."""
+    operandos = []
+    pos = 0
+    n = len(datos)
+    token = _TOKEN_CONTENIDO.match
+    while pos < n:
+        m = token(datos, pos)
+        numero, op = m.group('num', 'op')
+        if numero is not None:
+            operandos.append(float(numero) if b'.' in numero else int(numero))
+            pos = m.end()
+        elif op:
+            pos = m.end()
+            if op == b'BI':
+                # Imagen en línea: saltar hasta EI
+                fin = _FIN_IMAGEN.search(datos, pos)
+                pos = fin.end() if fin else n
+                operandos = []
+                continue
+            yield Operador(op.decode('latin-1')), operandos
+            operandos = []
+        elif m.end() >= n:
+            break
+        else:
+            obj, pos = leer_objeto(datos, m.end(), referencias=False)
+            if isinstance(obj, Operador):
+                operandos = []
+            else:
+                operandos.append(obj)
+
+
+def _interpretar(doc, datos, recursos, salida, ctm, fuentes, profundidad=0):
+    recursos = doc.resolver(recursos) or {}
+    dic_fuentes = doc.resolver(recursos.get('Font')) or {}
+    xobjetos = doc.resolver(recursos.get('XObject')) or {}
+    pila = []
+    fuente = None
+    tfs = 0
+    tc = tw = 0.0
+    th = 1.0
+    tl = 0.0
+    tm = tlm = IDENTIDAD
+
+    def mostrar(cadena):
+        nonlocal tm
+        if fuente is None or not isinstance(cadena, bytes):
+            return
+        trm = _multiplicar(tm, ctm)
+        x0, y0 = trm[4], trm[5]
+        tamano = abs(tfs) * (abs(trm[2]) + abs(trm[3]))
+        texto = []
+        for codigo in fuente.codigos(cadena):
+            texto.append(fuente.texto(codigo))
+            avance = (fuente.ancho(codigo) / 1000 * tfs + tc + (tw if codigo == 32 and fuente.bytes_codigo == 1 else 0)) * th
+            tm = _multiplicar((1, 0, 0, 1, avance, 0), tm)
+        fin = _multiplicar(tm, ctm)
+        salida.escribir(''.join(texto), x0, y0, tamano, fin[4])
+
+    def nueva_linea(tx, ty):
+        nonlocal tm, tlm
+        tlm = _multiplicar((1, 0, 0, 1, tx, ty), tlm)
+        tm = tlm
+
+    for op, args in _operaciones(datos):
+        try:
+            if op == 'q':
+                pila.append(ctm)
+            elif op == 'Q':
+                ctm = pila.pop() if pila else ctm
+            elif op == 'cm' and len(args) == 6:
+                ctm = _multiplicar(tuple(args), ctm)
+            elif op == 'BT':
+                tm = tlm = IDENTIDAD
+            elif op == 'Tf' and len(args) == 2:
+                nombre, tfs = args
+                ref = dic_fuentes.get(nombre)
+                clave = ref if isinstance(ref, Ref) else id(ref)
+                if clave not in fuentes:
+                    fuentes[clave] = Fuente(doc, ref) if ref is not None else None
+                fuente = fuentes[clave]
+            elif op == 'Tc':
+                tc = args[0]
+            elif op == 'Tw':
+                tw = args[0]
+            elif op == 'Tz':
+                th = args[0] / 100
+            elif op == 'TL':
+                tl = args[0]
+            elif op == 'Td':
+                nueva_linea(args[0], args[1])
+            elif op == 'TD':
+                tl = -args[1]
+                nueva_linea(args[0], args[1])
+            elif op == 'Tm' and len(args) == 6:
+                tm = tlm = tuple(args)
+            elif op == 'T*':
+                nueva_linea(0, -tl)
+            elif op == 'Tj':
+                mostrar(args[0])
+            elif op == "'":
+                nueva_linea(0, -tl)
+                mostrar(args[0])
+            elif op == '"':
+                tw, tc = args[0], args[1]
+                nueva_linea(0, -tl)
+                mostrar(args[2])
+            elif op == 'TJ':
+                for elemento in args[0]:
+                    if isinstance(elemento, bytes):
+                        mostrar(elemento)
+                    elif isinstance(elemento, (int, float)):
+                        tm = _multiplicar((1, 0, 0, 1, -elemento / 1000 * tfs * th, 0), tm)
+            elif op == 'Do' and profundidad < 8:
+                xobjeto = doc.resolver(xobjetos.get(args[0]))
+                if isinstance(xobjeto, Flujo) and xobjeto.dic.get('Subtype') == 'Form':
+                    matriz = tuple(doc.resolver(xobjeto.dic.get('Matrix')) or IDENTIDAD)
+                    _interpretar(doc, doc.decodificar(xobjeto), xobjeto.dic.get('Resources', recursos),
+                                 salida, _multiplicar(matriz, ctm), fuentes, profundidad + 1)
+        except (IndexError, TypeError, ValueError, ErrorPDF):
+            continue
+
+
+def texto_pagina(doc: DocumentoPDF, pagina: dict, recursos: dict, fuentes: dict | None = None) -> str:
+    """Texto de una página, línea a línea."""
+    contenidos = doc.resolver(pagina.get('Contents'))
+    if not isinstance(contenidos, list):
+        contenidos = [contenidos]
+    datos = b'\n'.join(doc.decodificar(f) for f in map(doc.resolver, contenidos) if isinstance(f, Flujo))
+    salida = _Texto()
+    _interpretar(doc, datos, recursos, salida, IDENTIDAD, {} if fuentes is None else fuentes)
+    return salida.resultado()
+
+
+def paginas(ruta):
+    """
+    Recorre las páginas de un PDF.
+
+    Yields:
+        (número de página desde 1, texto)
+    """
+    doc = DocumentoPDF(Path(ruta).read_bytes())
+    fuentes = {}
+    for numero, (pagina, recursos) in enumerate(doc.paginas(), start=1):
+        yield numero, texto_pagina(doc, pagina, recursos, fuentes)
@@ -0,0 +1,405 @@
+#!/usr/bin/env node
+/**
+ * bancos.js
+ * =========
+ * Bancos de pruebas de partes concretas de index.html en un navegador sin
+ * interfaz, con el mismo servidor local y la misma preparación de la página
+ * que medir_index.js (sin red, trazas activas). A diferencia de
+ * medir_index.js no tienen línea base: imprimen sus medidas para comparar
+ * variantes de una optimización a mano.
+ *
+ *   cargas    carga el .dta muchas veces seguidas en la misma pestaña, como
+ *             en una sesión larga, y muestrea cada M cargas el heap JS (con
+ *             GC forzado), los ámbitos de listeners abiertos y los nodos del
+ *             DOM; calcula la pendiente del heap por carga
+ *   reparto   imputación con N líneas: motor de reparto, edición de un
+ *             importe (reparto + parche de filas) y re-render completo
+ *   montaje   resultado de una ficha: parche por clave frente a outerHTML
+ *   modos     arranque de cada modo de liquidación, primera y segunda vez
+ *   escritura eventos input en todos los campos con tipo de formLogic de una
+ *             liquidación con N fichas; lee los spans 'evento.input'
+ *   fuentes   PDF con el VFS en base64 (frío) frente al contexto de fuentes
+ *             decodificado de pdfGen (caliente); como mucho 10 documentos
+ *
+ * Requisitos: Node 18+ y Puppeteer (ver medir_index.js).
+ *
+ * Uso:
+ *   node tools/perf/bancos.js [BANCO ...] [--cargas 500] [--muestra-cada 50]
+ *     [--lineas 40] [--iteraciones 50] [--fichas 8] [--datos datos_ejemplo.js]
+ *     [--chrome RUTA] [--json]
+ *
+ * Sin BANCO se ejecutan todos.
+ */
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+
+const {
+  RAIZ, cargarPuppeteer, iniciarServidor, abrirPagina, restaurarEnPagina, liquidacionConFichas
+} = require('./medir_index.js');
+
+// =========================================================================
+// ARGUMENTOS
+// =========================================================================
+
+function leerArgumentos(argv) {
+  const opciones = {
+    bancos: [],
+    cargas: 500,
+    muestraCada: 50,
+    lineas: 40,
+    iteraciones: 50,
+    fichas: 8,
+    datos: path.join(RAIZ, 'datos_ejemplo.js'),
+    chrome: null,
+    json: false
+  };
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const valor = () => {
+      if (i + 1 >= argv.length) throw new Error(`Falta el valor de ${arg}`);
+      return argv[++i];
+    };
+    if (arg === '--cargas') opciones.cargas = Math.max(2, parseInt(valor(), 10));
+    else if (arg === '--muestra-cada') opciones.muestraCada = Math.max(1, parseInt(valor(), 10));
+    else if (arg === '--lineas') opciones.lineas = Math.max(2, parseInt(valor(), 10));
+    else if (arg === '--iteraciones') opciones.iteraciones = Math.max(1, parseInt(valor(), 10));
+    else if (arg === '--fichas') opciones.fichas = Math.max(1, parseInt(valor(), 10));
+    else if (arg === '--datos') opciones.datos = path.resolve(valor());
+    else if (arg === '--chrome') opciones.chrome = path.resolve(valor());
+    else if (arg === '--json') opciones.json = true;
+    else if (arg === '-h' || arg === '--help') opciones.ayuda = true;
+    else if (BANCOS[arg]) opciones.bancos.push(arg);
+    else throw new Error(`Argumento desconocido: ${arg}`);
+  }
+  if (opciones.bancos.length === 0) opciones.bancos = Object.keys(BANCOS);
+  return opciones;
+}
+
+// =========================================================================
+// BANCOS
+// =========================================================================
+
+/**
+ * Pendiente por mínimos cuadrados de `y` frente a `x`.
+ * @param {Array<{x: number, y: number}>} puntos
+ * @returns {number|null}
+ */
+function pendiente(puntos) {
+  if (puntos.length < 2) return null;
+  const n = puntos.length;
+  const mx = puntos.reduce((a, p) => a + p.x, 0) / n;
+  const my = puntos.reduce((a, p) => a + p.y, 0) / n;
+  const sxy = puntos.reduce((a, p) => a + (p.x - mx) * (p.y - my), 0);
+  const sxx = puntos.reduce((a, p) => a + (p.x - mx) ** 2, 0);
+  return sxx ? sxy / sxx : 0;
+}
+
+/**
+ * Cargas repetidas del .dta en la misma pestaña.
+ * @returns {Promise<{muestras: Object[], crecimientoKBPorCarga: number|null}>}
+ */
+async function bancoCargas({ navegador, origen, datos, opciones }) {
+  const json = JSON.stringify(liquidacionConFichas(datos, 1));
+  const { pagina } = await abrirPagina(navegador, origen);
+  const cdp = await pagina.createCDPSession();
+  const muestras = [];
+
+  const muestrear = async (carga) => {
+    await cdp.send('HeapProfiler.collectGarbage');
+    const { metrics } = await cdp.send('Performance.getMetrics');
+    const heap = metrics.find(m => m.name === 'JSHeapUsedSize').value;
+    const estado = await pagina.evaluate(() => ({
+      ambitosAbiertos: window.uiDesplazamientos?.getEstadisticasListeners?.().abiertos ?? null,
+      nodosDom: document.getElementsByTagName('*').length
+    }));
+    muestras.push({ carga, heapMB: Math.round(heap / 10485.76) / 100, ...estado });
+  };
+
+  try {
+    await cdp.send('Performance.enable');
+    await muestrear(0);
+    for (let i = 1; i <= opciones.cargas; i++) {
+      await restaurarEnPagina(pagina, json);
+      if (i % opciones.muestraCada === 0 || i === opciones.cargas) await muestrear(i);
+    }
+  } finally {
+    await cdp.detach().catch(() => {});
+    await pagina.close();
+  }
+
+  const kb = pendiente(muestras.map(m => ({ x: m.carga, y: m.heapMB })));
+  return { muestras, crecimientoKBPorCarga: kb === null ? null : Math.round(kb * 1024 * 100) / 100 };
+}
+
+/**
+ * Reparto de la imputación con muchas líneas: motor de reparto puro, ciclo
+ * de edición de un importe (reparto y parche de filas) y, como referencia,
+ * el re-render completo de todas las líneas. Restaura las líneas al final.
+ * @returns {Promise<{lineas, repartoMs, edicionMs, renderCompletoMs}>} Media por iteración
+ */
+async function bancoReparto({ navegador, origen, datos, opciones }) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  try {
+    await restaurarEnPagina(pagina, JSON.stringify(liquidacionConFichas(datos, 1)));
+    return await pagina.evaluate(({ nLineas, iteraciones }) => {
+      const ui = window.uiImputacion;
+      const copia = ui.obtenerLineas();
+      const media = (fn) => {
+        const t0 = performance.now();
+        for (let k = 0; k < iteraciones; k++) fn(k);
+        return Math.round((performance.now() - t0) / iteraciones * 1000) / 1000;
+      };
+
+      // Líneas sintéticas: mezcla de importes fijos, porcentajes y topes
+      const sinteticas = [{ organica: '18.00.00', responsable: '', importe: 0, readonly: true }];
+      for (let i = 1; i < nLineas; i++) {
+        sinteticas.push({
+          organica: `18.${String(i % 100).padStart(2, '0')}.00`,
+          responsable: `Responsable ${i}`,
+          importe: i % 3 === 0 ? 10 + i : 0,
+          porcentaje: i % 3 === 1 ? 1 + (i % 4) : null,
+          tope: i % 5 === 0 ? 25 : null,
+          readonly: false
+        });
+      }
+      const conId = sinteticas.map((l, i) => ({ id: i + 1, ...l }));
+      const repartoMs = media(k => ui._repartirImporte(10000 + k, conId));
+
+      // Edición de un importe: el mismo camino que al salir del campo
+      ui.restaurarLineas(sinteticas);
+      const filas = document.querySelectorAll('#imputacion-container .imputacion-linea:not(.readonly)');
+      const importe = filas[Math.floor(filas.length / 2)]?.querySelector('.imputacion-importe');
+      const edicionMs = importe ? media(k => {
+        importe.value = k % 2 ? '5' : '0';
+        importe.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+      }) : null;
+
+      const renderCompletoMs = media(() => ui.restaurarLineas(sinteticas));
+
+      ui.restaurarLineas(copia);
+      return { lineas: nLineas, repartoMs, edicionMs, renderCompletoMs };
+    }, { nLineas: opciones.lineas, iteraciones: opciones.iteraciones });
+  } finally {
+    await pagina.close();
+  }
+}
+
+/**
+ * Montaje del resultado de una ficha: parche por clave (mountSalida) frente
+ * a la sustitución completa con outerHTML, con dos variantes del HTML que
+ * solo cambian el importe total, como en un recálculo típico. Fuerza el
+ * layout tras cada montaje y deja la ficha como estaba.
+ * @returns {Promise<{reemplazoMs, parcheMs}|null>} Media por montaje
+ */
+async function bancoMontaje({ navegador, origen, datos, opciones }) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  try {
+    await restaurarEnPagina(pagina, JSON.stringify(liquidacionConFichas(datos, 1)));
+    return await pagina.evaluate((iteraciones) => {
+      const despEl = document.querySelector('.desplazamiento-grupo .calc-result')?.closest('.desplazamiento-grupo');
+      if (!despEl) return null;
+      const original = despEl.querySelector('.calc-result').outerHTML;
+
+      const variantes = ['', ' '].map(sufijo => {
+        const plantilla = document.createElement('template');
+        plantilla.innerHTML = original;
+        const importes = plantilla.content.querySelectorAll('.amount');
+        const total = importes[importes.length - 1];
+        if (total) total.textContent += sufijo;
+        return plantilla.innerHTML;
+      });
+
+      const medir = (montar) => {
+        const t0 = performance.now();
+        for (let i = 0; i < iteraciones; i++) {
+          montar(variantes[i % 2]);
+          void despEl.offsetHeight; // forzar layout
+        }
+        return Math.round((performance.now() - t0) / iteraciones * 1000) / 1000;
+      };
+
+      const reemplazoMs = medir((html) => { despEl.querySelector('.calc-result').outerHTML = html; });
+      const parcheMs = medir((html) => window.salidaDesp.mountSalida(despEl, html, null));
+
+      window.salidaDesp.mountSalida(despEl, original, null);
+      return { reemplazoMs, parcheMs };
+    }, opciones.iteraciones);
+  } finally {
+    await pagina.close();
+  }
+}
+
+/**
+ * Arranque de cada modo de liquidación (aplicarModoUI, con la carga de sus
+ * módulos): primera aplicación en una pestaña recién abierta y segunda, con
+ * los módulos ya cargados. La precarga en tiempo ocioso puede adelantar
+ * módulos antes de la primera. Restaura el modo previo.
+ * @returns {Promise<Object>} tipo → { primeraMs, segundaMs }
+ */
+async function bancoModos({ navegador, origen }) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  try {
+    return await pagina.evaluate(async () => {
+      const tl = window.tipoLiquidacion;
+      const previo = tl.getTipoActual();
+      const resultado = {};
+      for (const ronda of ['primeraMs', 'segundaMs']) {
+        for (const tipo of Object.keys(tl.TIPOS)) {
+          const t0 = performance.now();
+          await tl.aplicarModoUI(tipo);
+          (resultado[tipo] || (resultado[tipo] = {}))[ronda] = Math.round((performance.now() - t0) * 100) / 100;
+        }
+      }
+      await tl.aplicarModoUI(previo);
+      return resultado;
+    });
+  } finally {
+    await pagina.close();
+  }
+}
+
+/**
+ * Escritura con todas las fichas abiertas: dispara `iteraciones` eventos
+ * input en cada campo con tipo de formLogic (los valores ya saneados no
+ * cambian) y devuelve el resumen del span 'evento.input' que trazas.js
+ * registra en el despacho delegado de formLogic.
+ * @returns {Promise<{fichas, campos, n, p50, p95, maxMs, mediaMs}>}
+ */
+async function bancoEscritura({ navegador, origen, datos, opciones }) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  try {
+    await restaurarEnPagina(pagina, JSON.stringify(liquidacionConFichas(datos, opciones.fichas)));
+    const resultado = await pagina.evaluate((iteraciones) => {
+      const campos = Array.from(document.querySelectorAll('input'))
+        .filter(el => window.formLogic._tipoCampo(el));
+      window.trazas.reset();
+      for (let r = 0; r < iteraciones; r++) {
+        campos.forEach(el => el.dispatchEvent(new Event('input', { bubbles: true })));
+      }
+      const span = window.trazas.getResumen().spans['evento.input'] || { n: 0 };
+      return { campos: campos.length, ...span };
+    }, opciones.iteraciones);
+    return { fichas: opciones.fichas, ...resultado };
+  } finally {
+    await pagina.close();
+  }
+}
+
+/**
+ * Tiempo por documento de pdfmake con el VFS global en base64 (frío: cada
+ * documento decodifica las fuentes) y con el contexto de fuentes persistente
+ * de pdfGen (caliente). El documento usa todas las variantes de cada familia
+ * registrada, para que se carguen todos los ficheros de fuente.
+ * @returns {Promise<{frioMs, calienteMs, decodificacionMs}>} Media por documento
+ */
+async function bancoFuentes({ navegador, origen, opciones }) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  try {
+    return await pagina.evaluate(async (iteraciones) => {
+      const t0 = performance.now();
+      const contexto = window.pdfGen.getContextoFuentes();
+      const decodificacionMs = Math.round((performance.now() - t0) * 100) / 100;
+      const content = [];
+      Object.entries(contexto.fuentes).forEach(([font, variantes]) => {
+        Object.keys(variantes).forEach(variante => {
+          content.push({
+            text: `${font} ${variante}: Liquidación de desplazamientos 0123456789 €`,
+            font,
+            bold: variante.startsWith('bold'),
+            italics: variante.endsWith('italics')
+          });
+        });
+      });
+      const documento = { content, defaultStyle: { font: Object.keys(contexto.fuentes)[0] } };
+
+      const medir = async (crear) => {
+        const t0 = performance.now();
+        for (let i = 0; i < iteraciones; i++) {
+          await new Promise(resolve => crear(JSON.parse(JSON.stringify(documento))).getBuffer(resolve));
+        }
+        return Math.round((performance.now() - t0) / iteraciones * 100) / 100;
+      };
+
+      const frioMs = await medir(doc => pdfMake.createPdf(doc));
+      const calienteMs = await medir(doc => pdfMake.createPdf(doc, null, contexto.fuentes, contexto.vfs));
+      return { frioMs, calienteMs, decodificacionMs };
+    }, Math.min(opciones.iteraciones, 10));
+  } finally {
+    await pagina.close();
+  }
+}
+
+/** nombre → { descripcion, ejecutar } */
+const BANCOS = {
+  cargas: { descripcion: 'Cargas repetidas del .dta (heap, listeners, DOM)', ejecutar: bancoCargas },
+  reparto: { descripcion: 'Reparto de la imputación con muchas líneas (ms por iteración)', ejecutar: bancoReparto },
+  montaje: { descripcion: 'Montaje del resultado de una ficha (ms por montaje)', ejecutar: bancoMontaje },
+  modos: { descripcion: 'Arranque de cada modo de liquidación (ms)', ejecutar: bancoModos },
+  escritura: { descripcion: 'Eventos input con todas las fichas abiertas (span evento.input, ms)', ejecutar: bancoEscritura },
+  fuentes: { descripcion: 'Fuentes del PDF: VFS en base64 frente a contexto decodificado (ms por documento)', ejecutar: bancoFuentes }
+};
+
+// =========================================================================
+// PRINCIPAL
+// =========================================================================
+
+function imprimir(nombre, resultado) {
+  console.log(`\n== ${nombre}: ${BANCOS[nombre].descripcion}`);
+  Object.entries(resultado).forEach(([clave, valor]) => {
+    if (valor && typeof valor === 'object') {
+      console.log(`${clave}:`);
+      console.table(valor);
+    } else {
+      console.log(`${clave}: ${valor}`);
+    }
+  });
+}
+
+async function main() {
+  let opciones;
+  try {
+    opciones = leerArgumentos(process.argv.slice(2));
+  } catch (e) {
+    console.error(`ERROR: ${e.message}`);
+    return 2;
+  }
+  if (opciones.ayuda) {
+    console.log(fs.readFileSync(__filename, 'utf8').split('*/')[0]);
+    return 0;
+  }
+
+  const datos = JSON.parse(fs.readFileSync(opciones.datos, 'utf8'));
+  const puppeteer = cargarPuppeteer();
+  const { servidor, origen } = await iniciarServidor();
+  const navegador = await puppeteer.launch({
+    headless: true,
+    executablePath: opciones.chrome || undefined,
+    args: ['--no-sandbox', '--disable-background-timer-throttling', '--disable-renderer-backgrounding',
+      '--disable-backgrounding-occluded-windows']
+  });
+
+  const resultados = {};
+  try {
+    for (const nombre of opciones.bancos) {
+      if (!opciones.json) process.stderr.write(`  ${nombre}…\n`);
+      resultados[nombre] = await BANCOS[nombre].ejecutar({ navegador, origen, datos, opciones });
+      if (!opciones.json) imprimir(nombre, resultados[nombre]);
+    }
+  } finally {
+    await navegador.close();
+    servidor.close();
+  }
+  if (opciones.json) console.log(JSON.stringify(resultados, null, 2));
+  return 0;
+}
+
+if (require.main === module) {
+  main().then(codigo => { process.exitCode = codigo; }, (error) => {
+    console.error(`ERROR: ${error.stack || error.message}`);
+    process.exitCode = 2;
+  });
+}
+
+module.exports = { pendiente };
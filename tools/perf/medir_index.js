@@ -0,0 +1,679 @@
+#!/usr/bin/env node
+/**
+ * medir_index.js
+ * ==============
+ * Pruebas de regresión de rendimiento de index.html en un navegador sin
+ * interfaz (Chrome de Puppeteer).
+ *
+ * Sirve el repositorio desde un servidor HTTP local y bloquea cualquier
+ * petición externa (las fuentes de Google no se descargan), así que solo se
+ * usan los recursos incluidos. Se carga la aplicación con `?trazas` y las
+ * medidas salen de los spans de trazas.js y de los hitos de arranque de
+ * trazas.getCronologiaArranque():
+ *
+ *   arranque.interactivo       navegación → hito 'interactivo' (formLogic)
+ *   restaurar.dta.1ficha       span 'restaurar.total' al cargar el .dta con
+ *   restaurar.dta.8fichas      el diálogo de archivo (incluye las esperas
+ *                              fijas de restaurarTodo, ~500 ms)
+ *   tecla.latencia.p95         keydown → siguiente pintado, por tecla, al
+ *                              escribir en los campos de la ficha
+ *   recalculo.1ficha           cambio de tipo de proyecto (recalcula todas
+ *   recalculo.8fichas          las fichas) → siguiente pintado
+ *   pdf.previsualizacion       clic en "Generar PDF" → fin de 'pdf.render'
+ *   heap.cargas                heap JS tras N cargas del .dta (con GC)
+ *   heap.crecimientoPorCarga   pendiente del heap entre la carga 1 y la N
+ *
+ * De cada medida se toma la mediana de varias repeticiones y se compara con
+ * el umbral de tools/perf/linea_base.json; si alguna lo supera, el proceso
+ * termina con código 1. Con --actualizar se reescribe la línea base con las
+ * medianas actuales y umbrales con margen (conviene hacerlo en la máquina
+ * en la que se van a comparar las ejecuciones: la línea base incluida se
+ * midió en la máquina que indica su campo "entorno"). Las latencias de
+ * pintado incluyen la espera al siguiente fotograma (hasta ~16 ms).
+ *
+ * Los bancos de pruebas de partes concretas (cargas repetidas...) están en
+ * bancos.js, que usa la misma página y servidor.
+ *
+ * La liquidación de prueba es datos_ejemplo.js (mismo formato que un .dta);
+ * la variante de 8 fichas se construye repitiendo sus desplazamientos con
+ * fechas desplazadas para que no se solapen.
+ *
+ * Requisitos: Node 18+ y Puppeteer (npm install -g puppeteer, que descarga
+ * su Chrome; o --chrome RUTA para usar otro).
+ *
+ * Uso:
+ *   node tools/perf/medir_index.js [--repeticiones 5] [--cargas 20]
+ *     [--datos datos_ejemplo.js] [--chrome RUTA] [--actualizar]
+ *     [--salida resultado.json] [--json]
+ */
+'use strict';
+
+const fs = require('fs');
+const http = require('http');
+const os = require('os');
+const path = require('path');
+const { execSync } = require('child_process');
+
+const RAIZ = path.resolve(__dirname, '..', '..');
+const LINEA_BASE = path.join(__dirname, 'linea_base.json');
+const VERSION_LINEA_BASE = 1;
+
+/** Máximo de desplazamientos por liquidación (datos.json → limites) */
+const MAX_FICHAS = 8;
+
+/** Margen de los umbrales al actualizar la línea base */
+const FACTOR_UMBRAL = 1.5;
+const MARGEN_MINIMO = { ms: 25, MB: 5, KB: 50 };
+
+const TIPOS_MIME = {
+  '.html': 'text/html; charset=utf-8',
+  '.js': 'text/javascript; charset=utf-8',
+  '.css': 'text/css; charset=utf-8',
+  '.json': 'application/json; charset=utf-8',
+  '.svg': 'image/svg+xml',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.ico': 'image/x-icon',
+  '.pdf': 'application/pdf',
+  '.ttf': 'font/ttf',
+  '.woff': 'font/woff',
+  '.woff2': 'font/woff2'
+};
+
+// =========================================================================
+// ARGUMENTOS
+// =========================================================================
+
+function leerArgumentos(argv) {
+  const opciones = {
+    repeticiones: 5,
+    cargas: 20,
+    datos: path.join(RAIZ, 'datos_ejemplo.js'),
+    chrome: null,
+    actualizar: false,
+    salida: null,
+    json: false
+  };
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const valor = () => {
+      if (i + 1 >= argv.length) throw new Error(`Falta el valor de ${arg}`);
+      return argv[++i];
+    };
+    if (arg === '--repeticiones') opciones.repeticiones = Math.max(1, parseInt(valor(), 10));
+    else if (arg === '--cargas') opciones.cargas = Math.max(2, parseInt(valor(), 10));
+    else if (arg === '--datos') opciones.datos = path.resolve(valor());
+    else if (arg === '--chrome') opciones.chrome = path.resolve(valor());
+    else if (arg === '--salida') opciones.salida = path.resolve(valor());
+    else if (arg === '--actualizar') opciones.actualizar = true;
+    else if (arg === '--json') opciones.json = true;
+    else if (arg === '-h' || arg === '--help') opciones.ayuda = true;
+    else throw new Error(`Argumento desconocido: ${arg}`);
+  }
+  return opciones;
+}
+
+/**
+ * Puppeteer instalado en el proyecto o, si no, el global de npm.
+ */
+function cargarPuppeteer() {
+  try {
+    return require('puppeteer');
+  } catch (e) {
+    try {
+      const global = execSync('npm root -g', { encoding: 'utf8' }).trim();
+      return require(path.join(global, 'puppeteer'));
+    } catch (e2) {
+      throw new Error('Puppeteer no está instalado (npm install -g puppeteer)');
+    }
+  }
+}
+
+// =========================================================================
+// SERVIDOR LOCAL
+// =========================================================================
+
+/**
+ * Servidor estático del repositorio en 127.0.0.1 (puerto libre).
+ * @returns {Promise<{servidor: http.Server, origen: string}>}
+ */
+function iniciarServidor() {
+  const servidor = http.createServer((req, res) => {
+    const ruta = decodeURIComponent(new URL(req.url, 'http://localhost').pathname);
+    const archivo = path.join(RAIZ, ruta === '/' ? 'index.html' : ruta);
+    if (!archivo.startsWith(RAIZ + path.sep)) {
+      res.writeHead(403).end();
+      return;
+    }
+    fs.readFile(archivo, (error, contenido) => {
+      if (error) {
+        res.writeHead(404).end();
+        return;
+      }
+      const tipo = TIPOS_MIME[path.extname(archivo).toLowerCase()] || 'application/octet-stream';
+      res.writeHead(200, { 'Content-Type': tipo, 'Cache-Control': 'no-cache' });
+      res.end(contenido);
+    });
+  });
+  return new Promise((resolve, reject) => {
+    servidor.once('error', reject);
+    servidor.listen(0, '127.0.0.1', () => {
+      resolve({ servidor, origen: `http://127.0.0.1:${servidor.address().port}` });
+    });
+  });
+}
+
+// =========================================================================
+// LIQUIDACIONES DE PRUEBA
+// =========================================================================
+
+/** 'dd/mm/yy' + días → 'dd/mm/yy' */
+function sumarDias(fecha, dias) {
+  if (!fecha) return fecha;
+  const [d, m, a] = fecha.split('/').map(Number);
+  const f = new Date(Date.UTC(2000 + a, m - 1, d + dias));
+  const dos = n => String(n).padStart(2, '0');
+  return `${dos(f.getUTCDate())}/${dos(f.getUTCMonth() + 1)}/${dos(f.getUTCFullYear() % 100)}`;
+}
+
+/**
+ * Liquidación con `n` fichas: se repiten los desplazamientos de la original
+ * desplazando las fechas 10 días por ficha para que no se solapen.
+ */
+function liquidacionConFichas(datos, n) {
+  const base = datos.desplazamientos || [];
+  if (base.length === 0) throw new Error('La liquidación de prueba no tiene desplazamientos');
+  const copia = JSON.parse(JSON.stringify(datos));
+  copia.tipoLiquidacion = copia.tipoLiquidacion || 'DESPL';
+  copia.desplazamientos = Array.from({ length: n }, (_, i) => {
+    const desp = JSON.parse(JSON.stringify(base[i % base.length]));
+    const dias = 10 * i;
+    ['fechaIda', 'fechaRegreso', 'cruceIda', 'cruceVuelta'].forEach(campo => {
+      desp[campo] = sumarDias(desp[campo], dias);
+    });
+    desp.id = i + 1;
+    delete desp.calculos;
+    return desp;
+  });
+  delete copia.resultados;
+  // La imputación y el evento apuntan a fichas de la liquidación original
+  delete copia.imputacion;
+  delete copia.evento;
+  // Una liquidación DESPL rechaza las secciones de otros modos
+  delete copia.desplazamientoEspecial;
+  delete copia.desplazamientoAECC;
+  return copia;
+}
+
+// =========================================================================
+// NAVEGADOR
+// =========================================================================
+
+/**
+ * Abre index.html en una pestaña nueva con las trazas activas y sin red.
+ * @returns {Promise<{pagina, bloqueadas: string[]}>}
+ */
+async function abrirPagina(navegador, origen) {
+  const pagina = await navegador.newPage();
+  const bloqueadas = [];
+  await pagina.setRequestInterception(true);
+  pagina.on('request', (req) => {
+    const url = req.url();
+    if (url.startsWith(origen) || url.startsWith('data:') || url.startsWith('blob:')) {
+      req.continue();
+    } else {
+      bloqueadas.push(url);
+      req.abort('blockedbyclient');
+    }
+  });
+  // alert/confirm de la aplicación (carga correcta, versión del esquema...)
+  pagina.on('dialog', dialogo => dialogo.accept());
+  await pagina.evaluateOnNewDocument(esperasEnPagina);
+  await pagina.goto(`${origen}/index.html?trazas`, { waitUntil: 'load' });
+  await pagina.waitForFunction(() => window.trazas?.getCronologiaArranque?.().interactivo !== undefined,
+    { timeout: 30000 });
+  return { pagina, bloqueadas };
+}
+
+/**
+ * Utilidades que se instalan en la página antes de sus scripts.
+ * (Se serializa con toString: no puede usar nada del ámbito de Node.)
+ */
+function esperasEnPagina() {
+  /** Resuelve tras el siguiente pintado (rAF + tarea posterior). */
+  window.__perfTrasPintado = () => new Promise(resolve => {
+    requestAnimationFrame(() => {
+      const canal = new MessageChannel();
+      canal.port1.onmessage = () => resolve(performance.now());
+      canal.port2.postMessage(0);
+    });
+  });
+
+  /** Espera la siguiente medida 'sgtri:<nombre>' de trazas.js. */
+  window.__perfEsperarMedida = (nombre, timeoutMs = 30000) => new Promise((resolve, reject) => {
+    const observador = new PerformanceObserver(lista => {
+      const medida = lista.getEntries().find(e => e.name === `sgtri:${nombre}`);
+      if (medida) {
+        observador.disconnect();
+        clearTimeout(temporizador);
+        resolve({ inicio: medida.startTime, fin: medida.startTime + medida.duration, duracion: medida.duration });
+      }
+    });
+    observador.observe({ type: 'measure' });
+    const temporizador = setTimeout(() => {
+      observador.disconnect();
+      reject(new Error(`Sin medida ${nombre} en ${timeoutMs} ms`));
+    }, timeoutMs);
+  });
+
+  /** Latencias keydown → siguiente pintado */
+  window.__perfLatencias = [];
+  document.addEventListener('keydown', (e) => {
+    const t0 = e.timeStamp;
+    window.__perfTrasPintado().then(t1 => window.__perfLatencias.push(t1 - t0));
+  }, true);
+}
+
+/**
+ * Carga un .dta con el botón "Cargar datos" y el diálogo de archivo.
+ * @returns {Promise<number>} Duración de 'restaurar.total' (ms)
+ */
+async function cargarDta(pagina, rutaDta) {
+  const medida = pagina.evaluate(() => window.__perfEsperarMedida('restaurar.total'));
+  const [selector] = await Promise.all([
+    pagina.waitForFileChooser(),
+    pagina.click('#btn-inicio-cargar')
+  ]);
+  await selector.accept([rutaDta]);
+  const { duracion } = await medida;
+  // Deja terminar el recálculo posterior a la restauración
+  await pagina.evaluate(() => window.__perfTrasPintado());
+  return duracion;
+}
+
+/** Restaura desde la propia página (sin diálogo), para las cargas repetidas. */
+async function restaurarEnPagina(pagina, json) {
+  return pagina.evaluate(async (texto) => {
+    const medida = window.__perfEsperarMedida('restaurar.total');
+    await window.serializacionDatos.restaurarTodo(JSON.parse(texto));
+    return (await medida).duracion;
+  }, json);
+}
+
+// =========================================================================
+// MEDIDAS
+// =========================================================================
+
+function mediana(valores) {
+  const v = valores.filter(Number.isFinite).sort((a, b) => a - b);
+  if (v.length === 0) return null;
+  const m = v.length >> 1;
+  return v.length % 2 ? v[m] : (v[m - 1] + v[m]) / 2;
+}
+
+function percentil(valores, p) {
+  const v = valores.filter(Number.isFinite).sort((a, b) => a - b);
+  if (v.length === 0) return null;
+  return v[Math.min(v.length - 1, Math.ceil(p / 100 * v.length) - 1)];
+}
+
+const redondear = (n, decimales = 1) => n === null ? null : Math.round(n * 10 ** decimales) / 10 ** decimales;
+
+/**
+ * Una repetición completa en una pestaña nueva.
+ * @returns {Promise<Object>} nombre de medida → valor
+ */
+async function repeticion(navegador, origen, rutas) {
+  const medidas = {};
+  const { pagina, bloqueadas } = await abrirPagina(navegador, origen);
+  try {
+    const cronologia = await pagina.evaluate(() => window.trazas.getCronologiaArranque());
+    medidas['arranque.interactivo'] = cronologia.interactivo;
+
+    // .dta de 1 ficha desde el menú inicial
+    medidas['restaurar.dta.1ficha'] = await cargarDta(pagina, rutas.unaFicha);
+    medidas['recalculo.1ficha'] = await medirRecalculo(pagina);
+
+    // Latencia de tecleo en los campos de texto de la ficha
+    Object.assign(medidas, await medirTecleo(pagina));
+
+    // Previsualización del PDF
+    medidas['pdf.previsualizacion'] = await medirPdf(navegador, pagina);
+
+    // 8 fichas: recarga de la pestaña y carga desde el menú inicial
+    await pagina.goto(`${origen}/index.html?trazas`, { waitUntil: 'load' });
+    await pagina.waitForFunction(() => window.trazas?.getCronologiaArranque?.().interactivo !== undefined);
+    medidas['restaurar.dta.8fichas'] = await cargarDta(pagina, rutas.ochoFichas);
+    medidas['recalculo.8fichas'] = await medirRecalculo(pagina);
+  } finally {
+    await pagina.close();
+  }
+  medidas.__bloqueadas = bloqueadas.length;
+  return medidas;
+}
+
+/**
+ * Cambio de tipo de proyecto (decreto ↔ R.D., recalcula todas las fichas)
+ * hasta el siguiente pintado. Mediana de varias alternancias.
+ */
+async function medirRecalculo(pagina, veces = 6) {
+  const tiempos = await pagina.evaluate(async (veces) => {
+    const select = document.getElementById('tipoProyecto');
+    const datos = window.__sgtriDatos.normativasPorTipoProyecto;
+    const valores = [datos.rd[0], datos.decreto[0]];
+    const original = select.value;
+    const tiempos = [];
+    for (let i = 0; i < veces; i++) {
+      await window.__perfTrasPintado();
+      const t0 = performance.now();
+      select.value = valores[i % 2];
+      select.dispatchEvent(new Event('input', { bubbles: true }));
+      select.dispatchEvent(new Event('change', { bubbles: true }));
+      tiempos.push(await window.__perfTrasPintado() - t0);
+    }
+    select.value = original;
+    select.dispatchEvent(new Event('change', { bubbles: true }));
+    await window.__perfTrasPintado();
+    return tiempos;
+  }, veces);
+  return mediana(tiempos);
+}
+
+/**
+ * Escribe en los campos de texto de la primera ficha tecla a tecla y
+ * devuelve p50/p95/máximo de keydown → siguiente pintado.
+ */
+async function medirTecleo(pagina) {
+  // Los id de los campos llevan el id de la ficha (liquidacionConFichas numera desde 1)
+  const campos = ['#motivo-1', '#km-1', '#alojamiento-1'];
+  await pagina.evaluate(() => { window.__perfLatencias = []; });
+  for (const campo of campos) {
+    if (!(await pagina.$(campo))) throw new Error(`No existe ${campo} tras restaurar el .dta`);
+    await pagina.click(campo, { clickCount: 3 });
+    await pagina.keyboard.press('Backspace');
+    const texto = campo === '#motivo-1' ? 'Reunion de seguimiento del proyecto' : '1234,56';
+    await pagina.keyboard.type(texto, { delay: 30 });
+    // Salir del campo dispara el formateo y el recálculo (blur)
+    await pagina.keyboard.press('Tab');
+    await pagina.evaluate(() => window.__perfTrasPintado());
+  }
+  const latencias = await pagina.evaluate(() => window.__perfLatencias.slice());
+  return {
+    'tecla.latencia.p50': percentil(latencias, 50),
+    'tecla.latencia.p95': percentil(latencias, 95),
+    'tecla.latencia.max': Math.max(...latencias)
+  };
+}
+
+/**
+ * Clic en "Generar PDF" → fin de 'pdf.render' (maquetación y escritura del
+ * PDF que se abre en otra pestaña). Si aparece el aviso de datos
+ * obligatorios, se elige "Generar PDF".
+ */
+async function medirPdf(navegador, pagina) {
+  await pagina.evaluate(() => {
+    window.__perfClicPdf = null;
+    window.__perfFinPdf = null;
+    document.getElementById('btn-generar-pdf').addEventListener('click', (e) => {
+      window.__perfClicPdf = e.timeStamp;
+    }, { capture: true, once: true });
+    window.__perfEsperarMedida('pdf.render', 60000).then(m => { window.__perfFinPdf = m.fin; });
+  });
+  const pestanasAntes = new Set(await navegador.pages());
+  await pagina.click('#btn-generar-pdf');
+
+  // Termina el PDF o aparece el aviso de datos obligatorios (showConfirm);
+  // el botón se busca por su texto, no por su posición en el diálogo
+  await pagina.waitForFunction(() => window.__perfFinPdf !== null ||
+    document.querySelector('.confirm-overlay .confirm-actions'), { timeout: 60000 });
+  await pagina.evaluate(() => {
+    const acciones = document.querySelector('.confirm-overlay .confirm-actions');
+    if (!acciones) return;
+    const boton = [...acciones.querySelectorAll('button')]
+      .find(b => b.textContent.trim() === 'Generar PDF');
+    if (!boton) throw new Error('El aviso de datos obligatorios no tiene el botón "Generar PDF"');
+    boton.click();
+  });
+  await pagina.waitForFunction(() => window.__perfFinPdf !== null, { timeout: 60000 });
+
+  const ms = await pagina.evaluate(() => window.__perfFinPdf - window.__perfClicPdf);
+  // Cerrar la pestaña del PDF
+  for (const p of await navegador.pages()) {
+    if (!pestanasAntes.has(p)) await p.close().catch(() => {});
+  }
+  return ms;
+}
+
+/**
+ * Heap JS tras cargar el .dta `cargas` veces en la misma pestaña (con GC
+ * forzado antes de cada muestra).
+ */
+async function medirHeap(navegador, origen, json, cargas) {
+  const { pagina } = await abrirPagina(navegador, origen);
+  const cdp = await pagina.createCDPSession();
+  const heapMB = async () => {
+    await cdp.send('HeapProfiler.collectGarbage');
+    const { metrics } = await cdp.send('Performance.getMetrics');
+    return metrics.find(m => m.name === 'JSHeapUsedSize').value / (1024 * 1024);
+  };
+  try {
+    await cdp.send('Performance.enable');
+    await restaurarEnPagina(pagina, json);
+    const primera = await heapMB();
+    for (let i = 2; i <= cargas; i++) {
+      await restaurarEnPagina(pagina, json);
+    }
+    await pagina.evaluate(() => window.__perfTrasPintado());
+    const ultima = await heapMB();
+    return {
+      'heap.cargas': ultima,
+      'heap.crecimientoPorCarga': (ultima - primera) * 1024 / (cargas - 1)
+    };
+  } finally {
+    await cdp.detach().catch(() => {});
+    await pagina.close();
+  }
+}
+
+// =========================================================================
+// LÍNEA BASE
+// =========================================================================
+
+/** Descripción y unidad de cada medida */
+const METRICAS = {
+  'arranque.interactivo': { unidad: 'ms', descripcion: 'Navegación → formulario interactivo' },
+  'restaurar.dta.1ficha': { unidad: 'ms', descripcion: 'Carga de un .dta de 1 ficha (restaurar.total)' },
+  'restaurar.dta.8fichas': { unidad: 'ms', descripcion: 'Carga de un .dta de 8 fichas (restaurar.total)' },
+  'tecla.latencia.p50': { unidad: 'ms', descripcion: 'Tecla → pintado, mediana' },
+  'tecla.latencia.p95': { unidad: 'ms', descripcion: 'Tecla → pintado, percentil 95' },
+  'tecla.latencia.max': { unidad: 'ms', descripcion: 'Tecla → pintado, máximo' },
+  'recalculo.1ficha': { unidad: 'ms', descripcion: 'Cambio de normativa → pintado con 1 ficha' },
+  'recalculo.8fichas': { unidad: 'ms', descripcion: 'Cambio de normativa → pintado con 8 fichas' },
+  'pdf.previsualizacion': { unidad: 'ms', descripcion: 'Clic en Generar PDF → PDF generado' },
+  'heap.cargas': { unidad: 'MB', descripcion: 'Heap JS tras N cargas del .dta' },
+  'heap.crecimientoPorCarga': { unidad: 'KB', descripcion: 'Crecimiento del heap por carga' }
+};
+
+function leerLineaBase() {
+  try {
+    const base = JSON.parse(fs.readFileSync(LINEA_BASE, 'utf8'));
+    return base.version === VERSION_LINEA_BASE ? base : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+function umbralPara(valor, unidad) {
+  const margen = MARGEN_MINIMO[unidad] || 0;
+  return redondear(Math.max(valor * FACTOR_UMBRAL, valor + margen));
+}
+
+/**
+ * Compara con la línea base.
+ * @returns {Array<{nombre, valor, base, umbral, unidad, estado}>}
+ */
+function comparar(resultado, base) {
+  return Object.keys(METRICAS).map(nombre => {
+    const valor = resultado.metricas[nombre];
+    const referencia = base?.metricas?.[nombre];
+    let estado = 'sin base';
+    if (valor === null || valor === undefined) estado = 'sin medida';
+    else if (referencia) estado = valor > referencia.umbral ? 'REGRESIÓN' : 'ok';
+    return {
+      nombre,
+      valor,
+      base: referencia?.valor ?? null,
+      umbral: referencia?.umbral ?? null,
+      unidad: METRICAS[nombre].unidad,
+      estado
+    };
+  });
+}
+
+function nuevaLineaBase(resultado) {
+  const metricas = {};
+  Object.entries(METRICAS).forEach(([nombre, { unidad, descripcion }]) => {
+    const valor = resultado.metricas[nombre];
+    if (valor === null || valor === undefined) return;
+    metricas[nombre] = { valor, umbral: umbralPara(valor, unidad), unidad, descripcion };
+  });
+  return {
+    version: VERSION_LINEA_BASE,
+    generado: resultado.fecha,
+    entorno: resultado.entorno,
+    parametros: resultado.parametros,
+    metricas
+  };
+}
+
+function imprimirInforme(filas, resultado) {
+  const iconos = { ok: '✅', 'REGRESIÓN': '❌', 'sin base': '·', 'sin medida': '?' };
+  const fmt = (n) => n === null || n === undefined ? '—' : String(n);
+  console.log(`${resultado.entorno.navegador} · ${resultado.parametros.repeticiones} repeticiones · ` +
+    `${resultado.parametros.cargas} cargas para el heap`);
+  filas.forEach(f => {
+    console.log(`${iconos[f.estado]} ${f.nombre.padEnd(26)} ${fmt(f.valor).padStart(9)} ${f.unidad.padEnd(2)}` +
+      `  base ${fmt(f.base).padStart(8)}  umbral ${fmt(f.umbral).padStart(8)}  ${f.estado}`);
+  });
+  if (resultado.bloqueadas) {
+    console.log(`\n${resultado.bloqueadas} petición(es) externa(s) bloqueada(s) por carga (sin red)`);
+  }
+}
+
+// =========================================================================
+// PRINCIPAL
+// =========================================================================
+
+async function medir(opciones) {
+  const datos = JSON.parse(fs.readFileSync(opciones.datos, 'utf8'));
+  const json1 = JSON.stringify(liquidacionConFichas(datos, 1));
+  const json8 = JSON.stringify(liquidacionConFichas(datos, MAX_FICHAS));
+
+  // El diálogo de archivo necesita rutas reales
+  const temporal = fs.mkdtempSync(path.join(os.tmpdir(), 'sgtri-perf-'));
+  const rutas = {
+    unaFicha: path.join(temporal, 'perf_1ficha.dta'),
+    ochoFichas: path.join(temporal, 'perf_8fichas.dta')
+  };
+  fs.writeFileSync(rutas.unaFicha, json1);
+  fs.writeFileSync(rutas.ochoFichas, json8);
+
+  const puppeteer = cargarPuppeteer();
+  const { servidor, origen } = await iniciarServidor();
+  const navegador = await puppeteer.launch({
+    headless: true,
+    executablePath: opciones.chrome || undefined,
+    args: ['--no-sandbox', '--disable-background-timer-throttling', '--disable-renderer-backgrounding',
+      '--disable-backgrounding-occluded-windows']
+  });
+
+  try {
+    const repeticiones = [];
+    for (let i = 0; i < opciones.repeticiones; i++) {
+      repeticiones.push(await repeticion(navegador, origen, rutas));
+      if (!opciones.json) process.stderr.write(`  repetición ${i + 1}/${opciones.repeticiones}\n`);
+    }
+    const heap = await medirHeap(navegador, origen, json1, opciones.cargas);
+
+    const metricas = {};
+    Object.keys(METRICAS).forEach(nombre => {
+      const valores = nombre.startsWith('heap.')
+        ? [heap[nombre]]
+        : repeticiones.map(r => r[nombre]);
+      metricas[nombre] = redondear(mediana(valores));
+    });
+
+    return {
+      fecha: new Date().toISOString(),
+      entorno: {
+        navegador: await navegador.version(),
+        node: process.version,
+        cpu: os.cpus()[0]?.model || '',
+        nucleos: os.cpus().length
+      },
+      parametros: { repeticiones: opciones.repeticiones, cargas: opciones.cargas, datos: path.relative(RAIZ, opciones.datos) },
+      metricas,
+      muestras: repeticiones.map(r => {
+        const copia = Object.assign({}, r);
+        delete copia.__bloqueadas;
+        return copia;
+      }),
+      bloqueadas: repeticiones[0]?.__bloqueadas || 0
+    };
+  } finally {
+    await navegador.close();
+    servidor.close();
+    fs.rmSync(temporal, { recursive: true, force: true });
+  }
+}
+
+async function main() {
+  let opciones;
+  try {
+    opciones = leerArgumentos(process.argv.slice(2));
+  } catch (e) {
+    console.error(`ERROR: ${e.message}`);
+    return 2;
+  }
+  if (opciones.ayuda) {
+    console.log(fs.readFileSync(__filename, 'utf8').split('*/')[0]);
+    return 0;
+  }
+
+  const resultado = await medir(opciones);
+  const base = leerLineaBase();
+  const filas = comparar(resultado, base);
+  resultado.comparacion = filas;
+
+  if (opciones.salida) fs.writeFileSync(opciones.salida, JSON.stringify(resultado, null, 2) + '\n');
+  if (opciones.json) console.log(JSON.stringify(resultado, null, 2));
+  else imprimirInforme(filas, resultado);
+
+  if (opciones.actualizar) {
+    fs.writeFileSync(LINEA_BASE, JSON.stringify(nuevaLineaBase(resultado), null, 2) + '\n');
+    if (!opciones.json) console.log(`\nLínea base actualizada: ${path.relative(RAIZ, LINEA_BASE)}`);
+    return 0;
+  }
+  return filas.some(f => f.estado === 'REGRESIÓN') ? 1 : 0;
+}
+
+if (require.main === module) {
+  main().then(codigo => { process.exitCode = codigo; }, (error) => {
+    console.error(`ERROR: ${error.stack || error.message}`);
+    process.exitCode = 2;
+  });
+}
+
+module.exports = {
+  RAIZ,
+  cargarPuppeteer,
+  iniciarServidor,
+  abrirPagina,
+  restaurarEnPagina,
+  liquidacionConFichas,
+  sumarDias,
+  mediana,
+  percentil,
+  comparar,
+  umbralPara
+};